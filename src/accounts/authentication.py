@@ -0,0 +1,91 @@
+from functools import partial
+
+from django.utils.functional import SimpleLazyObject
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import (
+    ROLE_CLAIM,
+    STAFF_CLAIM,
+    TOKEN_VERSION_CLAIM,
+    get_token_version,
+)
+
+
+class TokenClaimsUser(SimpleLazyObject):
+    """
+    JWT 클레임으로 인증/권한 속성을 제공하는 지연 사용자 객체.
+
+    id, role, is_staff, is_authenticated와 수강 권한은 토큰 클레임에서 바로 읽고,
+    그 외 속성에 접근할 때만 DB에서 실제 사용자를 불러옵니다.
+    """
+
+    def __init__(self, func, claims):
+        super().__init__(func)
+        self.__dict__["token_claims"] = claims
+
+    def __bool__(self):
+        return True
+
+    @property
+    def pk(self):
+        return self.token_claims[api_settings.USER_ID_CLAIM]
+
+    id = pk
+
+    @property
+    def role(self):
+        return self.token_claims[ROLE_CLAIM]
+
+    @property
+    def is_staff(self):
+        return self.token_claims.get(STAFF_CLAIM, False)
+
+    @property
+    def is_authenticated(self):
+        return True
+
+    @property
+    def is_anonymous(self):
+        return False
+
+
+class EntitlementJWTAuthentication(JWTAuthentication):
+    """
+    권한 클레임이 포함된 토큰은 사용자 조회 없이 인증하는 JWT 인증 클래스.
+
+    토큰의 버전(tv)이 사용자의 현재 토큰 버전과 다르면 역할이나 수강 정보가 바뀐 것이므로
+    토큰을 거부하여 클라이언트가 토큰을 갱신하도록 합니다.
+    클레임이 없는 토큰은 기존 JWTAuthentication과 동일하게 처리합니다.
+    """
+
+    def get_user(self, validated_token):
+        """
+        검증된 토큰으로 사용자 객체를 반환합니다.
+
+        Args:
+            validated_token (Token): 검증된 토큰.
+
+        Returns:
+            CustomUser | TokenClaimsUser: 인증된 사용자.
+
+        Raises:
+            InvalidToken: 토큰 버전이 현재 버전과 다른 경우 발생합니다.
+        """
+        if TOKEN_VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("토큰에 사용자 식별 정보가 없습니다.")
+
+        if get_token_version(user_id) != validated_token[TOKEN_VERSION_CLAIM]:
+            raise InvalidToken("권한 정보가 변경되었습니다. 토큰을 갱신해주세요.")
+
+        return TokenClaimsUser(
+            partial(JWTAuthentication.get_user, self, validated_token),
+            validated_token.payload,
+        )
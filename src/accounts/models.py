@@ -73,6 +73,8 @@ class CustomUser(AbstractUser):
         email (EmailField): 사용자의 이메일 (고유 필드).
         role (CharField): 사용자의 역할 (학생, 관리자 또는 어드민).
         nickname (CharField): 사용자의 닉네임 (옵션 필드).
+        token_version (PositiveIntegerField): JWT 권한 클레임 버전.
+            역할이나 수강 정보가 바뀌면 증가하여 이전 토큰의 갱신을 강제합니다.
     """
 
     ROLE_CHOICES = [
@@ -88,6 +90,7 @@ class CustomUser(AbstractUser):
     nickname = models.CharField(
         max_length=50, blank=True, null=True, verbose_name="닉네임"
     )
+    token_version = models.PositiveIntegerField(default=0, verbose_name="토큰 버전")
 
     objects = CustomUserManager()
 
@@ -1,9 +1,16 @@
 from django.contrib.auth import authenticate
 
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
 
 from .models import CustomUser, UserActivity
+from .tokens import (
+    EntitlementRefreshToken,
+    add_entitlement_claims,
+    entitlement_claims_enabled,
+)
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -52,7 +59,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         Returns:
             dict: 리프레시 및 액세스 토큰.
         """
-        refresh = RefreshToken.for_user(user)
+        refresh = EntitlementRefreshToken.for_user(user)
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
@@ -105,7 +112,7 @@ class UserLoginSerializer(serializers.Serializer):
         """
         user = authenticate(email=data["email"], password=data["password"])
         if user and user.is_active:
-            refresh = RefreshToken.for_user(user)
+            refresh = EntitlementRefreshToken.for_user(user)
             return {
                 "user": user,
                 "refresh": str(refresh),
@@ -154,7 +161,7 @@ class ManagerCreationSerializer(serializers.ModelSerializer):
         Returns:
             dict: 리프레시 및 액세스 토큰.
         """
-        refresh = RefreshToken.for_user(user)
+        refresh = EntitlementRefreshToken.for_user(user)
         return {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
@@ -178,3 +185,36 @@ class ManagerCreationSerializer(serializers.ModelSerializer):
             role="manager",
         )
         return user
+
+
+class EntitlementTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    토큰 갱신 시 최신 역할/수강 권한 클레임을 액세스 토큰에 다시 채우는 시리얼라이저.
+
+    토큰 버전이 올라가 기존 액세스 토큰이 거부되면 클라이언트는 이 엔드포인트로
+    갱신된 권한이 반영된 새 액세스 토큰을 받습니다.
+    """
+
+    def validate(self, attrs):
+        """
+        리프레시 토큰을 검증하고 최신 클레임이 포함된 액세스 토큰을 반환합니다.
+
+        Args:
+            attrs (dict): 리프레시 토큰을 포함한 입력 데이터.
+
+        Returns:
+            dict: 새 액세스 토큰(및 회전 시 리프레시 토큰).
+        """
+        data = super().validate(attrs)
+        if not entitlement_claims_enabled():
+            return data
+
+        access = AccessToken(data["access"], verify=False)
+        user = CustomUser.objects.filter(
+            pk=access[api_settings.USER_ID_CLAIM], is_active=True
+        ).first()
+        if user is None:
+            raise serializers.ValidationError("유효하지 않은 사용자입니다.")
+
+        data["access"] = str(add_entitlement_claims(access, user))
+        return data
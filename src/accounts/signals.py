@@ -0,0 +1,64 @@
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from .models import CustomUser
+from .tokens import bump_token_version
+
+
+TOKEN_CLAIM_FIELDS = ("role", "is_staff", "is_active")
+
+# 저장 전 값을 비교하는 필드. 다른 앱의 post_save 핸들러도 previous_values로 함께 사용합니다.
+TRACKED_FIELDS = (*TOKEN_CLAIM_FIELDS, "username")
+
+
+def previous_values(instance):
+    """
+    가장 최근 save() 직전에 DB에 있던 추적 필드 값을 반환합니다.
+
+    post_save 핸들러에서 같은 행을 다시 조회하지 않고 변경 여부를 판단할 때 사용합니다.
+
+    Args:
+        instance (CustomUser): 저장된 사용자 인스턴스.
+
+    Returns:
+        dict: {필드 이름: 이전 값}. 새로 생성되었거나 추적 필드를 저장하지 않았으면 빈 딕셔너리.
+    """
+    return instance.__dict__.get("_previous_values") or {}
+
+
+@receiver(pre_save, sender=CustomUser)
+def track_previous_values(sender, instance, update_fields=None, **kwargs):
+    """
+    저장 전 DB의 추적 필드 값을 한 번만 조회해 인스턴스에 보관하고, 토큰 클레임에 포함되는
+    역할/스태프/활성 상태가 바뀌었으면 토큰 버전을 올립니다.
+
+    저장될 인스턴스의 token_version도 함께 올려 save()가 이전 값으로 덮어쓰지 않도록 합니다.
+
+    Args:
+        sender (type): CustomUser 모델.
+        instance (CustomUser): 저장될 사용자 인스턴스.
+        update_fields (frozenset, optional): 저장 대상 필드 목록.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    instance._previous_values = None
+    fields = TRACKED_FIELDS
+    if update_fields is not None:
+        fields = tuple(field for field in TRACKED_FIELDS if field in update_fields)
+    if instance.pk is None or not fields:
+        return
+
+    previous = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    instance._previous_values = previous
+    if previous is None:
+        return
+    if any(
+        previous[field] != getattr(instance, field)
+        for field in TOKEN_CLAIM_FIELDS
+        if field in previous
+    ):
+        bump_token_version(instance.pk)
+        instance.token_version = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("token_version", flat=True)
+            .first()
+        )
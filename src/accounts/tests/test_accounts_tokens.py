@@ -0,0 +1,208 @@
+import pytest
+
+from datetime import timedelta
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import CustomUser
+from accounts.tokens import EntitlementRefreshToken, check_shared_cache
+from courses.models import Enrollment, MajorCategory, MinorCategory
+from courses.services import EntitlementService
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    return CustomUser.objects.create_user(
+        email="token@example.com", username="tokenuser", password="testpassword"
+    )
+
+
+@pytest.fixture
+def enrollment(user):
+    major_category = MajorCategory.objects.create(name="Python", price=10000)
+    return Enrollment.objects.create(
+        user=user,
+        major_category=major_category,
+        expiry_date=timezone.now() + timedelta(days=30),
+        status="active",
+    )
+
+
+def _authenticate(api_client, user):
+    user.refresh_from_db()
+    refresh = EntitlementRefreshToken.for_user(user)
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    return refresh
+
+
+@pytest.mark.django_db
+class TestEntitlementClaims:
+    @pytest.fixture(autouse=True)
+    def enable_claims(self, settings):
+        settings.JWT_ENTITLEMENT_CLAIMS = True
+
+    def test_token_contains_entitlement_claims(self, user, enrollment):
+        # GIVEN
+        user.refresh_from_db()
+
+        # WHEN
+        access = AccessToken(str(EntitlementRefreshToken.for_user(user).access_token))
+
+        # THEN
+        assert access["role"] == "student"
+        assert access["tv"] == user.token_version
+        assert access["ent"] == [
+            [
+                enrollment.major_category_id,
+                "active",
+                int(enrollment.expiry_date.timestamp()),
+            ]
+        ]
+
+    def test_authentication_skips_user_lookup(self, api_client, user):
+        # GIVEN
+        _authenticate(api_client, user)
+        api_client.get(reverse("check-role"))  # 방문 추적 미들웨어 쿼리 제외
+
+        # WHEN
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse("check-role"))
+
+        # THEN
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["role"] == "student"
+        assert not any(
+            CustomUser._meta.db_table in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_enrollment_gated_endpoint_skips_user_lookup(
+        self, api_client, user, enrollment, django_assert_num_queries
+    ):
+        # GIVEN
+        minor_category = MinorCategory.objects.create(
+            name="기초",
+            major_category=enrollment.major_category,
+            content="기초",
+            order=1,
+        )
+        mission = minor_category.missions.first()
+        url = reverse("mission-detail", kwargs={"pk": mission.pk})
+        _authenticate(api_client, user)
+        api_client.get(url)  # 방문 추적 미들웨어 쿼리와 카테고리 구조 캐시 제외
+
+        # WHEN
+        with django_assert_num_queries(2) as queries:  # 세션, 미션
+            response = api_client.get(url)
+
+        # THEN
+        assert response.status_code == status.HTTP_200_OK
+        assert not any(
+            CustomUser._meta.db_table in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_enrollment_change_requires_refresh(self, api_client, user, enrollment):
+        # GIVEN
+        refresh = _authenticate(api_client, user)
+
+        # WHEN
+        enrollment.status = "expired"
+        enrollment.save()
+        response = api_client.get(reverse("check-role"))
+        refreshed = api_client.post(
+            reverse("token_refresh"), {"refresh": str(refresh)}, format="json"
+        )
+
+        # THEN
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert refreshed.status_code == status.HTTP_200_OK
+        access = AccessToken(refreshed.data["access"])
+        assert access["ent"] == []
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        assert api_client.get(reverse("check-role")).status_code == status.HTTP_200_OK
+
+    def test_role_change_bumps_token_version(self, user):
+        # GIVEN
+        version = CustomUser.objects.get(pk=user.pk).token_version
+
+        # WHEN
+        user.role = "manager"
+        user.save()
+
+        # THEN
+        user.refresh_from_db()
+        assert user.token_version == version + 1
+
+    def test_profile_save_reads_previous_row_once(self, user):
+        # GIVEN
+        user = CustomUser.objects.get(pk=user.pk)
+        user.username = "renamed"
+
+        # WHEN
+        with CaptureQueriesContext(connection) as context:
+            user.save()
+
+        # THEN: 토큰 버전과 수료증 시그널이 저장 전 행을 한 번만 함께 읽습니다.
+        selects = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT")
+        ]
+        assert len(selects) == 1
+        assert user.token_version == CustomUser.objects.get(pk=user.pk).token_version
+
+
+class TestSharedCacheCheck:
+    def test_claims_with_process_local_cache_are_refused(self, settings):
+        # GIVEN
+        settings.JWT_ENTITLEMENT_CLAIMS = True
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+
+        # WHEN / THEN
+        with pytest.raises(ImproperlyConfigured):
+            check_shared_cache()
+
+    def test_claims_with_shared_cache_are_allowed(self, settings):
+        # GIVEN
+        settings.JWT_ENTITLEMENT_CLAIMS = True
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://cache:6379/0",
+            }
+        }
+
+        # WHEN / THEN
+        check_shared_cache()
+
+    def test_entitlement_cache_is_short_lived_without_shared_cache(self, settings):
+        # GIVEN
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+
+        # WHEN
+        timeout = EntitlementService.get_cache_timeout()
+
+        # THEN
+        assert (
+            timeout
+            == EntitlementService.LOCAL_CACHE_TIMEOUT
+            < EntitlementService.CACHE_TIMEOUT
+        )
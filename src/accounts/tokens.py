@@ -0,0 +1,151 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import F
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import CustomUser
+
+
+ROLE_CLAIM = "role"
+STAFF_CLAIM = "staff"
+TOKEN_VERSION_CLAIM = "tv"
+ENTITLEMENTS_CLAIM = "ent"
+
+TOKEN_VERSION_CACHE_TIMEOUT = 60 * 60
+
+# 프로세스마다 따로 동작하여 무효화가 다른 워커에 전달되지 않는 캐시 백엔드
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def entitlement_claims_enabled():
+    """
+    JWT에 권한 클레임을 포함할지 여부를 반환합니다.
+
+    Returns:
+        bool: settings.JWT_ENTITLEMENT_CLAIMS 값.
+    """
+    return getattr(settings, "JWT_ENTITLEMENT_CLAIMS", False)
+
+
+def cache_is_shared():
+    """
+    기본 캐시가 여러 워커 프로세스 사이에 공유되는지 반환합니다.
+
+    Returns:
+        bool: 기본 캐시 백엔드가 프로세스 로컬 백엔드가 아니면 True.
+    """
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def check_shared_cache():
+    """
+    권한 클레임을 켰다면 기본 캐시가 워커 간에 공유되는지 확인합니다.
+
+    토큰 버전과 수강 권한 무효화는 캐시로 전달되므로, 프로세스 로컬 캐시에서는
+    권한 회수나 역할 변경이 변경을 처리한 워커에만 반영됩니다.
+
+    Raises:
+        ImproperlyConfigured: JWT_ENTITLEMENT_CLAIMS가 켜져 있는데 기본 캐시가
+            프로세스 로컬 백엔드인 경우.
+    """
+    if entitlement_claims_enabled() and not cache_is_shared():
+        backend = settings.CACHES["default"]["BACKEND"]
+        raise ImproperlyConfigured(
+            "JWT_ENTITLEMENT_CLAIMS requires a shared cache; "
+            f"set CACHE_URL to redis or memcached instead of {backend}."
+        )
+
+
+def token_version_cache_key(user_id):
+    return f"accounts:token_version:{user_id}"
+
+
+def get_token_version(user_id):
+    """
+    사용자의 현재 토큰 버전을 반환합니다. 캐시에 없을 때만 DB를 조회합니다.
+
+    Args:
+        user_id (int): 사용자 ID.
+
+    Returns:
+        int | None: 토큰 버전. 사용자가 없거나 비활성 상태이면 None.
+    """
+    key = token_version_cache_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            CustomUser.objects.filter(pk=user_id, is_active=True)
+            .values_list("token_version", flat=True)
+            .first()
+        )
+        if version is None:
+            return None
+        cache.set(key, version, TOKEN_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def bump_token_version(user_id):
+    """
+    사용자의 토큰 버전을 증가시켜 이전에 발급된 권한 클레임 토큰을 무효화합니다.
+
+    Args:
+        user_id (int): 사용자 ID.
+    """
+    CustomUser.objects.filter(pk=user_id).update(token_version=F("token_version") + 1)
+    cache.delete(token_version_cache_key(user_id))
+
+
+def add_entitlement_claims(token, user):
+    """
+    토큰에 역할, 토큰 버전, 수강 중인 대분류 목록 클레임을 추가합니다.
+
+    수강 클레임은 [대분류 ID, 수강 상태, 만료 시각(timestamp)] 목록이며,
+    접근 가능한 상태(active, completed)이고 만료되지 않은 수강 신청만 포함합니다.
+
+    Args:
+        token (Token): 클레임을 추가할 토큰.
+        user (CustomUser): 토큰의 사용자.
+
+    Returns:
+        Token: 클레임이 추가된 토큰.
+    """
+    from courses.models import Enrollment
+    from courses.services import EntitlementService
+
+    now = time.time()
+    token[ROLE_CLAIM] = user.role
+    token[STAFF_CLAIM] = user.is_staff
+    token[TOKEN_VERSION_CLAIM] = user.token_version
+    token[ENTITLEMENTS_CLAIM] = [
+        [major_category_id, status, int(expiry_date.timestamp())]
+        for major_category_id, status, expiry_date in Enrollment.objects.filter(
+            user_id=user.pk,
+            major_category__isnull=False,
+            status__in=EntitlementService.ACCESSIBLE_STATUSES,
+        ).values_list("major_category_id", "status", "expiry_date")
+        if expiry_date.timestamp() > now
+    ]
+    return token
+
+
+class EntitlementRefreshToken(RefreshToken):
+    """
+    권한 클레임을 포함하는 리프레시 토큰.
+
+    JWT_ENTITLEMENT_CLAIMS 설정이 켜져 있으면 발급 시 권한 클레임을 추가하며,
+    이 토큰에서 만든 액세스 토큰도 같은 클레임을 가집니다.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        if entitlement_claims_enabled():
+            add_entitlement_claims(token, user)
+        return token
@@ -17,13 +17,16 @@ from .serializers import (
     ManagerCreationSerializer,
 )
 from .permissions import IsManagerOrAdminUser, IsAdminUser
+from .tokens import EntitlementRefreshToken
+
 
 class StandardResultsSetPagination(PageNumberPagination):
     """
     페이지네이션 설정 클래스.
-    
+
     기본적으로 페이지당 10개의 결과를 반환하며, 요청에 따라 페이지 크기를 조정할 수 있습니다.
     """
+
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -32,9 +35,10 @@ class StandardResultsSetPagination(PageNumberPagination):
 class UserManagementViewSet(viewsets.ModelViewSet):
     """
     사용자 관리를 위한 ViewSet입니다.
-    
+
     관리자는 모든 사용자에 접근할 수 있으며, 매니저는 학생만 볼 수 있습니다.
     """
+
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
@@ -42,7 +46,7 @@ class UserManagementViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         요청자의 역할에 따라 사용자 목록을 필터링합니다.
-        
+
         Returns:
             QuerySet: 필터링된 사용자 목록.
         """
@@ -57,7 +61,7 @@ class UserManagementViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         """
         요청하는 액션에 따라 권한을 설정합니다.
-        
+
         Returns:
             list: 해당 요청에 대한 권한 클래스 목록.
         """
@@ -73,9 +77,10 @@ class UserManagementViewSet(viewsets.ModelViewSet):
 class RegisterView(generics.CreateAPIView):
     """
     새로운 사용자를 등록하는 뷰입니다.
-    
+
     등록 성공 시 사용자 정보와 함께 액세스 토큰과 리프레시 토큰을 반환합니다.
     """
+
     queryset = CustomUser.objects.all()
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny]
@@ -83,7 +88,7 @@ class RegisterView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         """
         사용자를 등록하고, 사용자 정보와 토큰을 반환합니다.
-        
+
         Args:
             request (Request): 사용자 등록 요청 데이터.
 
@@ -93,7 +98,7 @@ class RegisterView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
-        refresh = RefreshToken.for_user(user)
+        refresh = EntitlementRefreshToken.for_user(user)
         return Response(
             {
                 "user": UserSerializer(user).data,
@@ -107,15 +112,16 @@ class RegisterView(generics.CreateAPIView):
 class LoginView(APIView):
     """
     사용자 로그인을 처리하는 뷰입니다.
-    
+
     로그인 성공 시 사용자 정보와 함께 액세스 토큰과 리프레시 토큰을 반환합니다.
     """
+
     permission_classes = [AllowAny]
 
     def post(self, request):
         """
         사용자의 로그인 요청을 처리합니다.
-        
+
         Args:
             request (Request): 로그인 요청 데이터.
 
@@ -125,7 +131,7 @@ class LoginView(APIView):
         serializer = UserLoginSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data["user"]
-        refresh = RefreshToken.for_user(user)
+        refresh = EntitlementRefreshToken.for_user(user)
         return Response(
             {
                 "user": UserSerializer(user).data,
@@ -139,15 +145,16 @@ class LoginView(APIView):
 class LogoutView(APIView):
     """
     사용자 로그아웃을 처리하는 뷰입니다.
-    
+
     로그아웃 성공 시 리프레시 토큰을 블랙리스트에 추가합니다.
     """
+
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
         """
         사용자의 로그아웃 요청을 처리하고, 리프레시 토큰을 블랙리스트에 추가합니다.
-        
+
         Args:
             request (Request): 로그아웃 요청 데이터.
 
@@ -169,13 +176,14 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     """
     현재 로그인한 사용자의 프로필 정보를 조회하거나 수정하는 뷰입니다.
     """
+
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
     def get_object(self):
         """
         현재 로그인한 사용자 객체를 반환합니다.
-        
+
         Returns:
             User: 현재 요청의 사용자 객체.
         """
@@ -186,13 +194,14 @@ class UserActivityListView(generics.ListAPIView):
     """
     현재 로그인한 사용자의 활동 기록을 조회하는 뷰입니다.
     """
+
     serializer_class = UserActivitySerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         """
         현재 로그인한 사용자의 활동 기록을 반환합니다.
-        
+
         Returns:
             QuerySet: 현재 사용자의 활동 기록 리스트.
         """
@@ -203,12 +212,13 @@ class DeleteAccountView(APIView):
     """
     현재 로그인한 사용자의 계정을 삭제하는 뷰입니다.
     """
+
     permission_classes = [IsAuthenticated]
 
     def delete(self, request):
         """
         현재 로그인한 사용자의 계정을 삭제합니다.
-        
+
         Args:
             request (Request): 계정 삭제 요청.
 
@@ -227,12 +237,13 @@ class ManagerCreationView(APIView):
     """
     새로운 매니저 계정을 생성하는 뷰입니다. 관리자만 접근 가능합니다.
     """
+
     permission_classes = [IsAdminUser]
 
     def post(self, request):
         """
         새로운 매니저 계정을 생성합니다.
-        
+
         Args:
             request (Request): 매니저 계정 생성 요청 데이터.
 
@@ -242,7 +253,9 @@ class ManagerCreationView(APIView):
         serializer = ManagerCreationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()  # 매니저 계정 생성
-            refresh = RefreshToken.for_user(user)  # 사용자 리프레시 토큰 생성
+            refresh = EntitlementRefreshToken.for_user(
+                user
+            )  # 사용자 리프레시 토큰 생성
             return Response(
                 {
                     "message": "Manager user created successfully",
@@ -259,12 +272,13 @@ class ChangeUserRoleView(APIView):
     """
     특정 사용자의 역할을 변경하는 뷰입니다. 관리자만 접근 가능합니다.
     """
+
     permission_classes = [IsAdminUser]
 
     def patch(self, request, user_id):
         """
         특정 사용자의 역할을 변경합니다.
-        
+
         Args:
             request (Request): 역할 변경 요청 데이터.
             user_id (int): 역할을 변경할 사용자 ID.
@@ -465,7 +479,7 @@ class RegisterView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
-        refresh = RefreshToken.for_user(user)
+        refresh = EntitlementRefreshToken.for_user(user)
         return Response(
             {
                 "user": UserSerializer(user).data,
@@ -508,7 +522,7 @@ class LoginView(APIView):
         serializer = UserLoginSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data["user"]
-        refresh = RefreshToken.for_user(user)
+        refresh = EntitlementRefreshToken.for_user(user)
         return Response(
             {
                 "user": UserSerializer(user).data,
@@ -660,7 +674,9 @@ class ManagerCreationView(APIView):
         serializer = ManagerCreationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()  # 매니저 계정 생성
-            refresh = RefreshToken.for_user(user)  # 사용자 리프레시 토큰 생성
+            refresh = EntitlementRefreshToken.for_user(
+                user
+            )  # 사용자 리프레시 토큰 생성
             return Response(
                 {
                     "message": "Manager user created successfully",
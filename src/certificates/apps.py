@@ -1,6 +1,30 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
 
 
 class CertificatesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "certificates"
+
+    def ready(self):
+        """
+        시그널을 등록하고, CERTIFICATE_PRELOAD_TEMPLATE가 켜져 있으면 수료증 템플릿과 폰트를
+        미리 디코딩하여, 워커의 첫 수료증 요청이 파일을 읽고 디코딩하는 시간을 기다리지 않도록
+        합니다.
+        (gunicorn --preload이면 fork 전에 한 번 읽어 워커들이 함께 사용합니다.)
+        """
+        import certificates.signals  # noqa
+
+        if not settings.CERTIFICATE_PRELOAD_TEMPLATE:
+            return
+        from certificates.services import get_certificate_template
+
+        try:
+            get_certificate_template()
+        except FileNotFoundError:
+            logger.warning("수료증 템플릿을 미리 불러오지 못했습니다.", exc_info=True)
@@ -0,0 +1,63 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from certificates.services import (
+    clear_certificate_template_cache,
+    generate_certificate_image,
+    generate_certificate_pdf,
+)
+
+
+class Command(BaseCommand):
+    """
+    수료증 렌더링 지연 시간을 템플릿 캐시 없이(요청마다 템플릿과 폰트를 디코딩) 렌더링할 때와
+    프로세스별 템플릿 캐시를 사용할 때로 나누어 비교하는 명령어.
+    """
+
+    help = "수료증 PNG/PDF 렌더링 지연 시간(템플릿 캐시 전 vs 후)을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=20, help="모드별 렌더링 횟수")
+        parser.add_argument("--user-name", default="홍길동", help="수료증에 넣을 이름")
+        parser.add_argument(
+            "--course-name", default="파이썬 기초", help="수료증에 넣을 코스 이름"
+        )
+
+    def handle(self, *args, **options):
+        runs = options["runs"]
+        user_name = options["user_name"]
+        course_name = options["course_name"]
+        renders = (
+            ("png", lambda: generate_certificate_image(user_name, course_name)),
+            (
+                "pdf",
+                lambda: generate_certificate_pdf(user_name, course_name, "benchmark"),
+            ),
+        )
+
+        for file_format, render in renders:
+            cold = self._measure(render, runs, clear_certificate_template_cache)
+            render()  # 캐시 예열
+            warm = self._measure(render, runs)
+            for mode, latencies in (("cold", cold), ("cached", warm)):
+                self.stdout.write(
+                    f"{file_format} {mode:>6}: mean {statistics.fmean(latencies):7.2f} ms, "
+                    f"p50 {statistics.median(latencies):7.2f} ms, max {max(latencies):7.2f} ms"
+                )
+        clear_certificate_template_cache()
+
+    def _measure(self, render, runs, before=None):
+        """
+        render를 runs번 실행하고 실행별 지연 시간(밀리초) 목록을 반환합니다.
+        before가 주어지면 매 실행 전에 호출하며, 그 시간은 재지 않습니다.
+        """
+        latencies = []
+        for _ in range(runs):
+            if before is not None:
+                before()
+            start = time.perf_counter()
+            render()
+            latencies.append((time.perf_counter() - start) * 1000)
+        return latencies
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from certificates.services import clear_rendered_certificates
+
+
+class Command(BaseCommand):
+    """
+    저장소에 캐시된 렌더링한 수료증 파일을 삭제하는 명령어.
+
+    템플릿 이미지나 폰트를 바꾸면 캐시 키가 바뀌어 이전 파일은 더 이상 쓰이지 않으므로,
+    배포 후 이 명령어로 정리합니다.
+    """
+
+    help = "렌더링한 수료증 파일 캐시를 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id", type=int, help="이 사용자의 파일만 삭제합니다."
+        )
+
+    def handle(self, *args, **options):
+        deleted = clear_rendered_certificates(options["user_id"])
+        self.stdout.write(f"수료증 파일 {deleted}개를 삭제했습니다.")
@@ -1,10 +1,16 @@
+import hashlib
+import json
 import os
+import threading
 from base64 import b64encode, b64decode
+from dataclasses import dataclass
 from io import BytesIO
 
 import qrcode
 
 from django.conf import settings
+from django.core.files.base import File
+from django.core.files.storage import default_storage
 from django.db.models import Count, Q, F
 from django.contrib.contenttypes.models import ContentType
 
@@ -42,33 +48,102 @@ def get_course_name(course_id, course_type):
         raise ValueError("유효하지 않은 과정 유형입니다.")
 
 
-def load_image_and_fonts():
+# 인증서 템플릿 이미지와 폰트 파일 (STATICFILES_DIRS[0] 기준 경로)과 폰트 크기
+TEMPLATE_IMAGE_PATH = os.path.join("img", "certificate_template.png")
+TEMPLATE_FONT_PATH = os.path.join("fonts", "SongMyung-Regular.ttf")
+NAME_FONT_SIZE = 90
+COURSE_FONT_SIZE = 40
+
+
+@dataclass(frozen=True)
+class CertificateTemplate:
     """
-    인증서 생성에 필요한 이미지 템플릿과 폰트를 로드합니다.
+    디코딩한 인증서 템플릿 이미지와 폰트.
+
+    Attributes:
+        image (Image): 템플릿 이미지 원본. 그리지 말고 copy()한 이미지에 그려야 합니다.
+        name_font (FreeTypeFont): 이름 폰트.
+        course_font (FreeTypeFont): 코스 이름 폰트.
+        version (str): 템플릿 이미지와 폰트 파일 내용의 SHA-256 해시.
+    """
+
+    image: Image.Image
+    name_font: ImageFont.FreeTypeFont
+    course_font: ImageFont.FreeTypeFont
+    version: str
+
+
+_template = None
+_template_lock = threading.Lock()
+
+
+def get_certificate_template():
+    """
+    현재 프로세스의 인증서 템플릿을 반환합니다. 처음 호출될 때 파일에서 읽어 디코딩합니다.
 
     Returns:
-        tuple: 이미지 객체, 이름 폰트, 코스 이름 폰트를 포함한 튜플.
+        CertificateTemplate: 인증서 템플릿.
 
     Raises:
         FileNotFoundError: 이미지 파일이나 폰트 파일을 찾을 수 없는 경우 발생합니다.
     """
-    image_path = os.path.join(
-        settings.STATICFILES_DIRS[0], "img", "certificate_template.png"
-    )
-    font_path = os.path.join(
-        settings.STATICFILES_DIRS[0], "fonts", "SongMyung-Regular.ttf"
-    )
+    global _template
+    with _template_lock:
+        if _template is None:
+            _template = _load_certificate_template()
+        return _template
+
+
+def clear_certificate_template_cache():
+    """
+    현재 프로세스에 캐시된 인증서 템플릿을 지워, 다음 호출 때 파일에서 다시 읽도록 합니다.
+    """
+    global _template
+    with _template_lock:
+        _template = None
+
+
+def _load_certificate_template():
+    image_path = os.path.join(settings.STATICFILES_DIRS[0], TEMPLATE_IMAGE_PATH)
+    font_path = os.path.join(settings.STATICFILES_DIRS[0], TEMPLATE_FONT_PATH)
 
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
     if not os.path.exists(font_path):
         raise FileNotFoundError(f"폰트 파일을 찾을 수 없습니다: {font_path}")
 
-    image = Image.open(image_path)
-    name_font = ImageFont.truetype(font_path, 90)
-    course_font = ImageFont.truetype(font_path, 40)
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as f:
+        image_data = f.read()
+    digest.update(image_data)
+    with open(font_path, "rb") as f:
+        digest.update(f.read())
+
+    image = Image.open(BytesIO(image_data))
+    image.load()
+    return CertificateTemplate(
+        image=image,
+        name_font=ImageFont.truetype(font_path, NAME_FONT_SIZE),
+        course_font=ImageFont.truetype(font_path, COURSE_FONT_SIZE),
+        version=digest.hexdigest(),
+    )
 
-    return image, name_font, course_font
+
+def load_image_and_fonts():
+    """
+    인증서 생성에 필요한 이미지 템플릿과 폰트를 로드합니다.
+
+    템플릿과 폰트는 프로세스마다 한 번만 디코딩하고, 이미지는 캐시된 원본을 복사하여 반환하므로
+    반환된 이미지에 바로 그려도 됩니다.
+
+    Returns:
+        tuple: 이미지 객체, 이름 폰트, 코스 이름 폰트를 포함한 튜플.
+
+    Raises:
+        FileNotFoundError: 이미지 파일이나 폰트 파일을 찾을 수 없는 경우 발생합니다.
+    """
+    template = get_certificate_template()
+    return template.image.copy(), template.name_font, template.course_font
 
 
 def calculate_text_position(draw, text, font, image_width, y_position):
@@ -198,6 +273,106 @@ def generate_certificate_qr(certificate_id):
     return buffer
 
 
+# 렌더링한 수료증 파일을 저장하는 저장소 경로 (사용자별 디렉터리 아래 "해시.형식")
+RENDERED_CERTIFICATE_DIR = "certificates/rendered"
+CERTIFICATE_FORMAT_PNG = "png"
+CERTIFICATE_FORMAT_PDF = "pdf"
+CERTIFICATE_CONTENT_TYPES = {
+    CERTIFICATE_FORMAT_PNG: "image/png",
+    CERTIFICATE_FORMAT_PDF: "application/pdf",
+}
+
+
+def get_rendered_certificate_key(user_name, course_name, certificate_id, file_format):
+    """
+    렌더링 결과를 결정하는 입력으로 수료증 파일의 내용 주소(해시)를 계산합니다.
+
+    이름, 코스 이름, 인증서 ID, 템플릿 버전(템플릿 이미지와 폰트의 해시), QR 코드 주소, 파일
+    형식이 같으면 렌더링 결과도 같으므로, 이 값을 캐시 키와 ETag로 사용합니다. 이름이나
+    템플릿이 바뀌면 키도 바뀌어 이전 파일을 사용하지 않습니다.
+
+    Args:
+        user_name (str): 인증서에 표시할 사용자 이름.
+        course_name (str): 인증서에 표시할 코스 이름.
+        certificate_id (str | None): 인증서 ID (미리보기는 None).
+        file_format (str): png 또는 pdf.
+
+    Returns:
+        str: SHA-256 해시(16진수).
+    """
+    payload = [
+        user_name,
+        course_name,
+        None if certificate_id is None else str(certificate_id),
+        get_certificate_template().version,
+        getattr(settings, "FRONTEND_HOST", "http://localhost:5500"),
+        file_format,
+    ]
+    return hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def get_rendered_certificate(user, course_name, certificate_id, file_format, key):
+    """
+    렌더링한 수료증 파일을 저장소에서 찾고, 없으면 렌더링하여 저장합니다.
+
+    Args:
+        user (User): 수료증을 받은 사용자.
+        course_name (str): 인증서에 표시할 코스 이름.
+        certificate_id (str | None): 인증서 ID (미리보기는 None).
+        file_format (str): png 또는 pdf.
+        key (str): get_rendered_certificate_key로 계산한 내용 해시.
+
+    Returns:
+        str: 저장소 안의 파일 경로.
+    """
+    path = f"{RENDERED_CERTIFICATE_DIR}/{user.pk}/{key}.{file_format}"
+    if default_storage.exists(path):
+        return path
+
+    if file_format == CERTIFICATE_FORMAT_PDF:
+        buffer = generate_certificate_pdf(user.username, course_name, certificate_id)
+    else:
+        buffer = generate_certificate_image(user.username, course_name)
+    saved = default_storage.save(path, File(buffer, name=path))
+    if saved != path:
+        # 동시에 렌더링한 다른 요청이 먼저 저장한 경우. 내용이 같으므로 먼저 저장된 파일을 씁니다.
+        default_storage.delete(saved)
+    return path
+
+
+def clear_rendered_certificates(user_id=None):
+    """
+    저장소에 캐시된 수료증 파일을 삭제합니다.
+
+    Args:
+        user_id (int, optional): 이 사용자의 파일만 삭제합니다. 없으면 모든 사용자의 파일을 삭제합니다.
+
+    Returns:
+        int: 삭제한 파일 수.
+    """
+    if user_id is None:
+        user_dirs = _list_storage_dir(RENDERED_CERTIFICATE_DIR)[0]
+    else:
+        user_dirs = [str(user_id)]
+
+    deleted = 0
+    for user_dir in user_dirs:
+        directory = f"{RENDERED_CERTIFICATE_DIR}/{user_dir}"
+        for name in _list_storage_dir(directory)[1]:
+            default_storage.delete(f"{directory}/{name}")
+            deleted += 1
+    return deleted
+
+
+def _list_storage_dir(path):
+    try:
+        return default_storage.listdir(path)
+    except FileNotFoundError:
+        return [], []
+
+
 def get_course_model(course_type):
     """
     주어진 코스 유형에 따라 해당 코스 모델을 반환합니다.
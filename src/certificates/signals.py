@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from accounts.signals import previous_values
+
+from .services import clear_rendered_certificates
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def clear_rendered_certificates_on_username_change(
+    sender, instance, created=False, **kwargs
+):
+    """
+    사용자 이름이 바뀌면 이전 이름으로 렌더링해 둔 수료증 파일을 커밋 후에 삭제합니다.
+
+    캐시 키에 이름이 포함되므로 바뀐 이름의 수료증은 새로 렌더링되며, 이 핸들러는 더 이상
+    쓰이지 않을 파일을 정리합니다. 이전 이름은 accounts의 pre_save 핸들러가 저장 전에 한 번
+    읽어 둔 값을 사용하므로 사용자 행을 다시 조회하지 않습니다.
+
+    Args:
+        sender (type): 사용자 모델.
+        instance (User): 저장된 사용자 인스턴스.
+        created (bool): 새로 생성된 사용자인지 여부.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    if created:
+        return
+    previous = previous_values(instance).get("username")
+    if previous is not None and previous != instance.username:
+        user_id = instance.pk
+        transaction.on_commit(lambda: clear_rendered_certificates(user_id))
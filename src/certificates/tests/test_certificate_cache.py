@@ -0,0 +1,106 @@
+import pytest
+
+from django.core.files.storage import default_storage
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from certificates import services
+from courses.models import MajorCategory, MinorCategory
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def user(db):
+    return CustomUser.objects.create_user(
+        email="student@example.com", username="student", password="password"
+    )
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def minor_category(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    return MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+    for name in ("generate_certificate_image", "generate_certificate_pdf"):
+        original = getattr(services, name)
+
+        def counted(*args, original=original, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(services, name, counted)
+    return calls
+
+
+@pytest.mark.django_db
+class TestRenderedCertificateCache:
+    def test_download_is_rendered_once_and_revalidated_by_etag(
+        self, client, minor_category, renders
+    ):
+        # GIVEN
+        url = reverse(
+            "certificate_download",
+            kwargs={"course_type": "minor", "course_id": minor_category.pk},
+        )
+
+        # WHEN
+        first = client.get(url)
+        second = client.get(url)
+        revalidated = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # THEN
+        assert first.status_code == second.status_code == 200
+        assert first["Content-Type"] == "application/pdf"
+        assert "attachment" in first["Content-Disposition"]
+        assert b"".join(first.streaming_content) == b"".join(second.streaming_content)
+        assert first["ETag"] == second["ETag"]
+        assert revalidated.status_code == 304
+        assert len(renders) == 1
+
+    def test_username_change_renders_new_preview_and_removes_old_file(
+        self, client, user, minor_category, renders, django_capture_on_commit_callbacks
+    ):
+        # GIVEN
+        url = reverse(
+            "certificate_preview",
+            kwargs={"course_type": "minor", "course_id": minor_category.pk},
+        )
+        before = client.get(url)
+        old_files = default_storage.listdir(
+            f"{services.RENDERED_CERTIFICATE_DIR}/{user.pk}"
+        )[1]
+
+        # WHEN
+        with django_capture_on_commit_callbacks(execute=True):
+            user.username = "renamed"
+            user.save()
+        after = client.get(url, HTTP_IF_NONE_MATCH=before["ETag"])
+
+        # THEN
+        assert after.status_code == 200
+        assert after["ETag"] != before["ETag"]
+        assert len(renders) == 2
+        new_files = default_storage.listdir(
+            f"{services.RENDERED_CERTIFICATE_DIR}/{user.pk}"
+        )[1]
+        assert len(old_files) == len(new_files) == 1
+        assert old_files != new_files
@@ -0,0 +1,45 @@
+import io
+
+from django.core.management import call_command
+
+from certificates.services import (
+    clear_certificate_template_cache,
+    generate_certificate,
+    get_certificate_template,
+    load_image_and_fonts,
+)
+
+
+def test_template_is_decoded_once_and_copied_per_render():
+    # GIVEN
+    clear_certificate_template_cache()
+    template = get_certificate_template()
+    original = template.image.tobytes()
+
+    # WHEN
+    image, name_font, course_font = load_image_and_fonts()
+    generate_certificate("홍길동", "파이썬 기초", "certificate-id")
+
+    # THEN
+    assert get_certificate_template() is template
+    assert image is not template.image
+    assert name_font is template.name_font and course_font is template.course_font
+    assert template.image.tobytes() == original  # 원본 템플릿에는 그리지 않습니다.
+    assert len(template.version) == 64
+
+
+def test_benchmark_command_reports_cold_and_cached_latency():
+    # GIVEN
+    stdout = io.StringIO()
+
+    # WHEN
+    call_command("benchmark_certificate_render", "--runs=1", stdout=stdout)
+
+    # THEN
+    lines = stdout.getvalue().splitlines()
+    assert [line.split(":")[0].split() for line in lines] == [
+        ["png", "cold"],
+        ["png", "cached"],
+        ["pdf", "cold"],
+        ["pdf", "cached"],
+    ]
@@ -1,6 +1,8 @@
 from django.shortcuts import get_object_or_404
 from django.contrib.contenttypes.models import ContentType
-from django.http import HttpResponse
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -13,15 +15,57 @@ from certificates.serializers import (
     SimpleMinorCategorySerializer,
 )
 from certificates.services import (
+    CERTIFICATE_CONTENT_TYPES,
+    CERTIFICATE_FORMAT_PDF,
+    CERTIFICATE_FORMAT_PNG,
     decrypt_certificate_data,
-    generate_certificate_image,
-    generate_certificate_pdf,
     get_course_name,
     get_available_certificates,
     get_course_model,
+    get_rendered_certificate,
+    get_rendered_certificate_key,
 )
 
 
+def certificate_file_response(
+    request, user, course_name, certificate_id, file_format, filename=None
+):
+    """
+    렌더링한 수료증 파일을 강한 ETag와 함께 스트리밍하는 응답을 만듭니다.
+
+    요청의 If-None-Match가 내용 해시와 같으면 렌더링이나 저장소 조회 없이 304를 반환하고,
+    저장소에 렌더링한 파일이 있으면 다시 렌더링하지 않고 파일을 그대로 보냅니다.
+
+    Args:
+        request (HttpRequest): 요청 객체.
+        user (User): 수료증을 받은 사용자.
+        course_name (str): 인증서에 표시할 코스 이름.
+        certificate_id (str | None): 인증서 ID (미리보기는 None).
+        file_format (str): png 또는 pdf.
+        filename (str, optional): 주어지면 이 이름의 첨부 파일로 내려받게 합니다.
+
+    Returns:
+        HttpResponse: 수료증 파일 응답(200) 또는 304 응답.
+    """
+    key = get_rendered_certificate_key(
+        user.username, course_name, certificate_id, file_format
+    )
+    etag = f'"{key}"'
+    # 다른 사용자와 공유되지 않도록 private으로, 매번 ETag로 다시 확인하도록 no-cache로 보냅니다.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        return HttpResponseNotModified(headers=headers)
+
+    path = get_rendered_certificate(user, course_name, certificate_id, file_format, key)
+    return FileResponse(
+        default_storage.open(path, "rb"),
+        content_type=CERTIFICATE_CONTENT_TYPES[file_format],
+        as_attachment=filename is not None,
+        filename=filename or "",
+        headers=headers,
+    )
+
+
 class AvailableCertificatesAPIView(APIView):
     """
     사용자가 완료한 MinorCategory와 MajorCategory의 인증서를 조회하는 API 뷰입니다.
@@ -70,7 +114,7 @@ class CertificatePreviewAPIView(APIView):
             course_id (int): 코스의 ID.
 
         Returns:
-            HttpResponse: 생성된 인증서의 PNG 이미지를 반환합니다. 성공 시 HTTP 200 응답을 반환하며, 코스를 찾지 못하거나 이미지 생성 중 오류가 발생한 경우 각각 HTTP 404, 500 응답을 반환합니다.
+            HttpResponse: 생성된 인증서의 PNG 이미지를 반환합니다. 한 번 렌더링한 이미지는 저장소에서 ETag와 함께 보내며, If-None-Match가 같으면 HTTP 304 응답을 반환합니다. 성공 시 HTTP 200 응답을 반환하며, 코스를 찾지 못하거나 이미지 생성 중 오류가 발생한 경우 각각 HTTP 404, 500 응답을 반환합니다.
         """
         user = request.user
 
@@ -80,13 +124,12 @@ class CertificatePreviewAPIView(APIView):
             return Response({"detail": str(e)}, status=404)
 
         try:
-            image_buffer = generate_certificate_image(user.username, course_name)
+            return certificate_file_response(
+                request, user, course_name, None, CERTIFICATE_FORMAT_PNG
+            )
         except Exception:
             return Response({"detail": "인증서 생성 중 오류 발생"}, status=500)
 
-        response = HttpResponse(image_buffer, content_type="image/png")
-        return response
-
 
 class CertificateDownloadAPIView(APIView):
     """
@@ -105,7 +148,7 @@ class CertificateDownloadAPIView(APIView):
             course_id (int): 코스의 ID.
 
         Returns:
-            HttpResponse: 생성된 인증서의 PDF를 반환합니다.
+            HttpResponse: 생성된 인증서의 PDF를 반환합니다. 한 번 렌더링한 PDF는 저장소에서 ETag와 함께 보내며, If-None-Match가 같으면 HTTP 304 응답을 반환합니다.
         """
         user = request.user
 
@@ -126,18 +169,17 @@ class CertificateDownloadAPIView(APIView):
             certificate.generate_certificate()
 
         try:
-            pdf_buffer = generate_certificate_pdf(
-                user.username, course_name, certificate.certificate_id
+            return certificate_file_response(
+                request,
+                user,
+                course_name,
+                certificate.certificate_id,
+                CERTIFICATE_FORMAT_PDF,
+                filename=f"certificate_{course_id}_{course_type}.pdf",
             )
         except Exception:
             return Response({"detail": "인증서 생성 중 오류 발생"}, status=500)
 
-        response = HttpResponse(pdf_buffer, content_type="application/pdf")
-        response["Content-Disposition"] = (
-            f'attachment; filename="certificate_{course_id}_{course_type}.pdf"'
-        )
-        return response
-
 
 class VerifyCertificateAPIView(APIView):
     """
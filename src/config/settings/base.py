@@ -36,6 +36,7 @@ PROJECTS_APPS = [
     "missions",
     "payment",
     "progress",
+    "search",
     "videos",
 ]
 
@@ -92,6 +93,11 @@ DATABASES = {
     }
 }
 
+# CACHE_URL(예: redis://host:6379/0)로 여러 워커가 공유하는 캐시를 지정합니다.
+# 지정하지 않으면 프로세스 로컬 캐시를 사용하며, 이때 수강 권한 캐시는 짧게만 보관되고
+# JWT_ENTITLEMENT_CLAIMS는 시작 단계에서 거부됩니다.
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -119,12 +125,15 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 
+MEDIA_URL = "/media/"
+MEDIA_ROOT = env.str("MEDIA_ROOT", default=str(BASE_DIR / "media"))
+
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.EntitlementJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -154,8 +163,12 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": True,
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.EntitlementTokenRefreshSerializer",
 }
 
+# 토큰에 역할/수강 권한 클레임을 포함하여 요청마다 사용자 조회를 생략할지 여부
+JWT_ENTITLEMENT_CLAIMS = env.bool("JWT_ENTITLEMENT_CLAIMS", default=False)
+
 # AWS S3 settings
 AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = env("AWS_SECRET_ACCESS_KEY")
@@ -170,6 +183,56 @@ IAMPORT = {
     "IMP_REST_API_KEY": env("IMP_REST_API_KEY"),
 }
 
+# 채점 워커 풀 설정 (워커 수가 0이면 실행마다 인터프리터를 새로 띄웁니다)
+JUDGE_WORKER_POOL_SIZE = env.int("JUDGE_WORKER_POOL_SIZE", default=2)
+JUDGE_WORKER_MAX_RUNS = env.int("JUDGE_WORKER_MAX_RUNS", default=200)
+# 제출 하나에서 동시에 실행할 테스트 케이스 수
+JUDGE_MAX_PARALLEL_CASES = env.int("JUDGE_MAX_PARALLEL_CASES", default=2)
+# True이면 채점 요청을 대기열에 넣고 run_judge_worker 명령어가 채점합니다.
+JUDGE_ASYNC = env.bool("JUDGE_ASYNC", default=True)
+# True이면 같은 코드/테스트 케이스/제한으로 채점한 이전 결과를 재사용합니다.
+JUDGE_RESULT_CACHE = env.bool("JUDGE_RESULT_CACHE", default=True)
+# 실행당 표준 출력 최대 크기(KB)와 결과에 보관할 출력 크기(KB)
+JUDGE_OUTPUT_LIMIT_KB = env.int("JUDGE_OUTPUT_LIMIT_KB", default=16384)
+JUDGE_OUTPUT_CAPTURE_KB = env.int("JUDGE_OUTPUT_CAPTURE_KB", default=64)
+# 실행별 임시 작업 디렉터리 위치(비어 있으면 /dev/shm 또는 시스템 임시 디렉터리)와 파일 크기 제한(KB)
+JUDGE_SCRATCH_DIR = env.str("JUDGE_SCRATCH_DIR", default="")
+JUDGE_FILE_SIZE_LIMIT_KB = env.int("JUDGE_FILE_SIZE_LIMIT_KB", default=1024)
+# 제출 코드 샌드박스 백엔드(auto, rlimit, cgroup). auto이면 JUDGE_CGROUP_ROOT에 위임된 cgroup v2가
+# 있을 때 cgroup 백엔드를, 없으면 rlimit 백엔드를 사용합니다.
+JUDGE_SANDBOX_BACKEND = env.str("JUDGE_SANDBOX_BACKEND", default="auto")
+JUDGE_CGROUP_ROOT = env.str("JUDGE_CGROUP_ROOT", default="/sys/fs/cgroup/judge")
+# 제출 코드의 최대 프로세스 수(0이면 rlimit 백엔드에서 제한하지 않음, cgroup 백엔드는 64),
+# 파일 디스크립터 수, nice 값
+JUDGE_PROCESS_LIMIT = env.int("JUDGE_PROCESS_LIMIT", default=0)
+JUDGE_OPEN_FILES_LIMIT = env.int("JUDGE_OPEN_FILES_LIMIT", default=64)
+JUDGE_NICE = env.int("JUDGE_NICE", default=10)
+# 호스트 전체에서 동시에 실행할 제출 수(0이면 CPU 수)와 실행 슬롯 잠금 파일 위치, 슬롯 대기 시간(초)
+JUDGE_HOST_CONCURRENCY = env.int("JUDGE_HOST_CONCURRENCY", default=0)
+JUDGE_SLOT_DIR = env.str("JUDGE_SLOT_DIR", default="")
+JUDGE_SLOT_TIMEOUT = env.float("JUDGE_SLOT_TIMEOUT", default=30)
+# 이 크기(KB)보다 큰 테스트 케이스 입출력은 DB 대신 파일 저장소에 저장합니다.
+TEST_CASE_INLINE_LIMIT_KB = env.int("TEST_CASE_INLINE_LIMIT_KB", default=64)
+# 문제 은행 ZIP 가져오기에서 허용하는 압축을 푼 크기(MB)
+QUESTION_BANK_MAX_IMPORT_MB = env.int("QUESTION_BANK_MAX_IMPORT_MB", default=256)
+# 이 유사도 이상인 다른 사용자의 코드 제출 쌍을 표절 의심으로 저장합니다.
+PLAGIARISM_SIMILARITY_THRESHOLD = env.float("PLAGIARISM_SIMILARITY_THRESHOLD", default=0.5)
+# 미션 요청 종류별 동시 처리 한도(0이면 제한 없음). 한도를 넘는 요청은 503과 Retry-After로 거절합니다.
+MISSION_ADMISSION_LIMITS = {
+    "mission_read": env.int("MISSION_ADMISSION_READ_LIMIT", default=64),
+    "mission_submit": env.int("MISSION_ADMISSION_SUBMIT_LIMIT", default=32),
+}
+# 처리 슬롯 임대 시간(초, 요청을 처리하던 프로세스가 죽어도 이 시간이 지나면 슬롯이 반환됨)과
+# 거절한 요청에 알려 줄 재시도 대기 시간(초)
+MISSION_ADMISSION_LEASE = env.int("MISSION_ADMISSION_LEASE", default=60)
+MISSION_ADMISSION_RETRY_AFTER = env.int("MISSION_ADMISSION_RETRY_AFTER", default=2)
+# 사용자 한 명이 채점 대기열에 동시에 올려 둘 수 있는 제출 수(0이면 제한 없음)
+JUDGE_MAX_QUEUED_PER_USER = env.int("JUDGE_MAX_QUEUED_PER_USER", default=3)
+# True이면 앱을 불러올 때(AppConfig.ready) 수료증 템플릿 이미지와 폰트를 미리 디코딩합니다.
+CERTIFICATE_PRELOAD_TEMPLATE = env.bool("CERTIFICATE_PRELOAD_TEMPLATE", default=False)
+# 5지선다형 미션 통과 점수(100점 만점). 코드 제출형 미션은 모든 문제를 통과해야 합니다.
+MISSION_PASS_SCORE = env.float("MISSION_PASS_SCORE", default=60)
+
 
 LOGGING = {
     "version": 1,
@@ -17,6 +17,7 @@ urlpatterns = [
     path("missions/", include("missions.urls")),
     path("payment/", include("payment.urls")),
     path("progress/", include("progress.urls")),
+    path("search/", include("search.urls")),
     path("videos/", include("videos.urls")),
 ]
 
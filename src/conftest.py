@@ -0,0 +1,12 @@
+import pytest
+
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    테스트 간 캐시(수강 권한 등)가 공유되지 않도록 매 테스트 전에 캐시를 비웁니다.
+    """
+    cache.clear()
+    yield
@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 
-from courses.models import Enrollment
+from courses.services import EntitlementService
 
 
 class IsEnrolledInCourse(BasePermission):
@@ -33,13 +33,7 @@ class IsEnrolledInCourse(BasePermission):
         Returns:
             bool: 사용자가 해당 강의에 등록되었는지 여부.
         """
-        try:
-            enrollment = Enrollment.objects.get(
-                user=request.user, major_category=obj.major_category
-            )
-            return True
-        except Enrollment.DoesNotExist:
-            return False
+        return EntitlementService.can_access(request.user, obj)
 
 
 class IsAdminUser(BasePermission):
@@ -100,12 +94,4 @@ class IsEnrolledOrAdmin(BasePermission):
         if request.user.role == "admin":
             return True
 
-        try:
-            enrollment = Enrollment.objects.get(
-                user=request.user, major_category=obj.minor_category.major_category
-            )
-            return True
-        except Enrollment.DoesNotExist:
-            return False
-        except AttributeError:
-            return False  # minor_category가 없거나 잘못된 접근일 경우
+        return EntitlementService.can_access(request.user, obj)
@@ -11,6 +11,7 @@ class MajorCategoryAdmin(admin.ModelAdmin):
     Admin 화면에서 MajorCategory 객체의 이름과 가격을 표시하고,
     이름으로 검색할 수 있습니다.
     """
+
     list_display = ("name", "price")  # Admin 리스트에서 보여줄 필드
     search_fields = ("name",)  # 검색할 필드
 
@@ -23,11 +24,22 @@ class MinorCategoryAdmin(admin.ModelAdmin):
     Admin 화면에서 MinorCategory 객체의 이름, 관련 MajorCategory, 순서, 진행률을 표시하고,
     이름과 MajorCategory로 검색할 수 있으며, MajorCategory로 필터링할 수 있습니다.
     """
+
     list_display = ("name", "major_category", "order", "progress_percent")
     search_fields = ("name", "major_category__name")
     list_filter = ("major_category",)
     ordering = ("order",)
 
+    def get_queryset(self, request):
+        """
+        진행률을 목록 쿼리에서 함께 계산하도록 user_progress를 주석 처리합니다.
+        """
+        return super().get_queryset(request).with_progress(request.user)
+
+    @admin.display(description="진행률", ordering="user_progress")
+    def progress_percent(self, obj):
+        return obj.user_progress
+
 
 @admin.register(Enrollment)
 class EnrollmentAdmin(admin.ModelAdmin):
@@ -38,6 +50,7 @@ class EnrollmentAdmin(admin.ModelAdmin):
     사용자 이름과 MajorCategory 이름으로 검색할 수 있으며, 상태와 날짜로 필터링할 수 있습니다.
     수강 신청 날짜 기준으로 계층적 날짜 탐색을 할 수 있습니다.
     """
+
     list_display = (
         "user",
         "major_category",
@@ -1,3 +1,5 @@
+import warnings
+
 from django.conf import settings
 from django.db import models
 from django.core.exceptions import ValidationError
@@ -6,16 +8,60 @@ from django.utils import timezone
 from .services import ProgressService
 
 
+class MajorCategoryQuerySet(models.QuerySet):
+    """
+    MajorCategory 쿼리셋.
+    """
+
+    def with_progress(self, user):
+        """
+        사용자별 학습 진행률(0 ~ 100)을 user_progress 필드로 주석 처리합니다.
+
+        Args:
+            user (CustomUser): 진행률을 계산할 사용자.
+
+        Returns:
+            QuerySet: user_progress가 주석 처리된 쿼리셋.
+        """
+        return self.annotate(
+            user_progress=ProgressService.progress_expression(
+                user, "minor_category__major_category"
+            )
+        )
+
+
+class MinorCategoryQuerySet(models.QuerySet):
+    """
+    MinorCategory 쿼리셋.
+    """
+
+    def with_progress(self, user):
+        """
+        사용자별 학습 진행률(0 ~ 100)을 user_progress 필드로 주석 처리합니다.
+
+        Args:
+            user (CustomUser): 진행률을 계산할 사용자.
+
+        Returns:
+            QuerySet: user_progress가 주석 처리된 쿼리셋.
+        """
+        return self.annotate(
+            user_progress=ProgressService.progress_expression(user, "minor_category")
+        )
+
+
 class MajorCategory(models.Model):
     """
     대분류 모델
-    
+
     교육 과정의 대분류를 나타냅니다. 예를 들어 웹 개발, 데이터 분석 등 다양한 과정을 포함할 수 있습니다.
     """
 
     name = models.CharField(max_length=100, verbose_name="대분류명")
     price = models.PositiveIntegerField(verbose_name="강의가격", default=0)
 
+    objects = MajorCategoryQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -28,16 +74,26 @@ class MajorCategory(models.Model):
         """
         대분류의 학습 진행률을 계산하여 반환합니다.
 
+        Deprecated:
+            객체마다 집계 쿼리를 실행하고 사용자 구분이 없으므로,
+            `objects.with_progress(user)`의 user_progress 주석을 사용하세요.
+
         Returns:
             float: 대분류의 학습 진행률 (0 ~ 100).
         """
+        warnings.warn(
+            "MajorCategory.progress_percent는 더 이상 사용되지 않습니다. "
+            "MajorCategory.objects.with_progress(user)를 사용하세요.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return ProgressService.calculate_major_category_progress(self)
 
 
 class MinorCategory(models.Model):
     """
     소분류 모델
-    
+
     대분류에 속하는 세부 과목을 나타냅니다. 예를 들어 HTML/CSS, JavaScript, Python 등의 과목이 포함될 수 있습니다.
     """
 
@@ -51,6 +107,8 @@ class MinorCategory(models.Model):
     content = models.TextField(verbose_name="내용")
     order = models.PositiveIntegerField(verbose_name="순서")
 
+    objects = MinorCategoryQuerySet.as_manager()
+
     class Meta:
         ordering = ["order"]
         verbose_name = "소분류"
@@ -64,16 +122,26 @@ class MinorCategory(models.Model):
         """
         소분류의 학습 진행률을 계산하여 반환합니다.
 
+        Deprecated:
+            객체마다 집계 쿼리를 실행하고 사용자 구분이 없으므로,
+            `objects.with_progress(user)`의 user_progress 주석을 사용하세요.
+
         Returns:
             float: 소분류의 학습 진행률 (0 ~ 100).
         """
+        warnings.warn(
+            "MinorCategory.progress_percent는 더 이상 사용되지 않습니다. "
+            "MinorCategory.objects.with_progress(user)를 사용하세요.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return ProgressService.calculate_category_progress(self)
 
 
 class Enrollment(models.Model):
     """
     수강 신청 모델
-    
+
     사용자가 특정 대분류 과정을 수강하는 정보를 저장합니다.
     """
 
@@ -124,11 +192,19 @@ class Enrollment(models.Model):
         if self.expiry_date and self.expiry_date < now:
             raise ValidationError("수강 만료일은 현재 시간 이후여야 합니다.")
 
-        if self.expiry_date and self.enrollment_date and self.expiry_date < self.enrollment_date:
+        if (
+            self.expiry_date
+            and self.enrollment_date
+            and self.expiry_date < self.enrollment_date
+        ):
             raise ValidationError("수강 만료일은 수강 신청일 이후여야 합니다.")
 
         max_duration = timezone.timedelta(days=365 * 2)
-        if self.expiry_date and self.enrollment_date and (self.expiry_date - self.enrollment_date) > max_duration:
+        if (
+            self.expiry_date
+            and self.enrollment_date
+            and (self.expiry_date - self.enrollment_date) > max_duration
+        ):
             raise ValidationError("수강 기간은 2년을 초과할 수 없습니다.")
 
     def save(self, *args, **kwargs):
@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from .services import EntitlementService
+
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     """
@@ -44,15 +46,7 @@ class IsEnrolledOrAdmin(permissions.BasePermission):
         if request.user and request.user.is_staff:
             return True
 
-        if hasattr(obj, "enrollments"):
-            return obj.enrollments.filter(user=request.user, status="active").exists()
-
-        if hasattr(obj, "major_category"):
-            return obj.major_category.enrollments.filter(
-                user=request.user, status="active"
-            ).exists()
-
-        return False
+        return EntitlementService.can_access(request.user, obj, statuses=("active",))
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
@@ -113,4 +107,7 @@ class IsAdminOrManagerOnly(permissions.BasePermission):
         Returns:
             bool: 사용자 역할이 admin 또는 manager인지 여부.
         """
-        return request.user.is_authenticated and request.user.role in ["admin", "manager"]
+        return request.user.is_authenticated and request.user.role in [
+            "admin",
+            "manager",
+        ]
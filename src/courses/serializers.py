@@ -5,11 +5,46 @@ from .models import MajorCategory, MinorCategory, Enrollment
 from videos.serializers import VideoSerializer
 
 
-class MajorCategorySerializer(serializers.ModelSerializer):
+class ProgressPercentMixin(serializers.Serializer):
+    """
+    요청 사용자의 학습 진행률(progress_percent)을 제공하는 시리얼라이저 믹스인.
+
+    쿼리셋에 `with_progress(user)`로 주석 처리된 user_progress 값을 우선 사용하며,
+    주석이 없는 단일 객체(생성 응답 등)에 한해 해당 객체의 진행률을 한 번 조회합니다.
+    """
+
+    progress_percent = serializers.SerializerMethodField()
+
+    def get_progress_percent(self, obj):
+        """
+        요청 사용자의 학습 진행률을 반환합니다.
+
+        Args:
+            obj (MajorCategory | MinorCategory): 현재 직렬화하는 카테고리 객체.
+
+        Returns:
+            float: 학습 진행률 (0 ~ 100).
+        """
+        if hasattr(obj, "user_progress"):
+            return obj.user_progress
+
+        request = self.context.get("request")
+        user = request.user if request else None
+        return (
+            type(obj)
+            .objects.with_progress(user)
+            .filter(pk=obj.pk)
+            .values_list("user_progress", flat=True)
+            .first()
+            or 0.0
+        )
+
+
+class MajorCategorySerializer(ProgressPercentMixin, serializers.ModelSerializer):
     """
     MajorCategory(대분류) 모델을 위한 시리얼라이저.
-    
-    대분류 강의의 모든 필드를 직렬화/역직렬화합니다.
+
+    대분류 강의의 모든 필드와 요청 사용자의 학습 진행률을 직렬화/역직렬화합니다.
     """
 
     class Meta:
@@ -17,11 +52,12 @@ class MajorCategorySerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class MinorCategorySerializer(serializers.ModelSerializer):
+class MinorCategorySerializer(ProgressPercentMixin, serializers.ModelSerializer):
     """
     MinorCategory(소분류) 모델을 위한 시리얼라이저.
-    
-    소분류의 id, 이름, 관련 대분류, 내용, 순서, 그리고 해당 소분류에 포함된 비디오 정보를 직렬화합니다.
+
+    소분류의 id, 이름, 관련 대분류, 내용, 순서, 해당 소분류에 포함된 비디오 정보,
+    그리고 요청 사용자의 학습 진행률을 직렬화합니다.
     """
 
     videos = VideoSerializer(many=True, read_only=True)
@@ -35,12 +71,13 @@ class MinorCategorySerializer(serializers.ModelSerializer):
             "order",
             "videos",
             "major_category",
+            "progress_percent",
         )
 
     def get_videos(self, obj):
         """
         해당 소분류에 속한 비디오들을 필터링하여 직렬화된 데이터를 반환합니다.
-        
+
         Args:
             obj (MinorCategory): 현재 직렬화하는 MinorCategory 객체.
 
@@ -54,7 +91,7 @@ class MinorCategorySerializer(serializers.ModelSerializer):
 class EnrollmentSerializer(serializers.ModelSerializer):
     """
     Enrollment(수강 신청) 모델을 위한 시리얼라이저.
-    
+
     수강 신청의 id, 사용자, 대분류, 등록일, 만료일, 상태 정보를 직렬화/역직렬화하며,
     대분류 정보는 MajorCategorySerializer를 통해 중첩하여 제공합니다.
     """
@@ -1,5 +1,37 @@
-from django.db.models import Sum, F, FloatField, ExpressionWrapper
-from django.db.models.functions import Coalesce
+import time
+
+from django.core.cache import cache
+from django.db.models import (
+    Sum,
+    F,
+    FloatField,
+    ExpressionWrapper,
+    Func,
+    OuterRef,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce, NullIf
+
+
+class DurationSeconds(Func):
+    """
+    DurationField 값을 초 단위 실수로 변환하는 DB 함수.
+
+    PostgreSQL은 interval 타입을, 그 외 DB(SQLite 등)는 마이크로초 정수를 저장하므로
+    DB 종류에 따라 다른 SQL을 생성합니다.
+    """
+
+    template = "(%(expressions)s / 1000000.0)"
+    output_field = FloatField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="EXTRACT(EPOCH FROM %(expressions)s)::double precision",
+            **extra_context,
+        )
 
 
 class ProgressService:
@@ -7,6 +39,59 @@ class ProgressService:
     학습 진행률을 계산하는 서비스 클래스입니다.
     """
 
+    @staticmethod
+    def progress_expression(user, category_path):
+        """
+        카테고리별 사용자 학습 진행률을 계산하는 쿼리 표현식을 반환합니다.
+
+        동영상 길이로 가중 평균한 진행률(0 ~ 100)을 상관 서브쿼리로 계산하므로,
+        목록 조회 쿼리 하나에서 모든 카테고리의 진행률을 함께 가져올 수 있습니다.
+
+        Args:
+            user (CustomUser): 진행률을 계산할 사용자. 비로그인 사용자는 0을 반환합니다.
+            category_path (str): Video에서 카테고리까지의 lookup 경로
+                (예: "minor_category", "minor_category__major_category").
+
+        Returns:
+            Expression: 진행률을 계산하는 쿼리 표현식.
+        """
+        from progress.models import UserProgress
+        from videos.models import Video
+
+        if user is None or not user.is_authenticated:
+            return Value(0.0, output_field=FloatField())
+
+        total_duration = Subquery(
+            Video.objects.filter(**{category_path: OuterRef("pk")})
+            .order_by()
+            .values(category_path)
+            .annotate(total=Sum(DurationSeconds("duration")))
+            .values("total"),
+            output_field=FloatField(),
+        )
+        weighted_progress = Subquery(
+            UserProgress.objects.filter(
+                user=user, **{f"video__{category_path}": OuterRef("pk")}
+            )
+            .order_by()
+            .values(f"video__{category_path}")
+            .annotate(
+                total=Sum(
+                    F("progress_percent") * DurationSeconds("video__duration"),
+                    output_field=FloatField(),
+                )
+            )
+            .values("total"),
+            output_field=FloatField(),
+        )
+        return Coalesce(
+            ExpressionWrapper(
+                Coalesce(weighted_progress, 0.0) / NullIf(total_duration, 0.0),
+                output_field=FloatField(),
+            ),
+            0.0,
+        )
+
     @staticmethod
     def calculate_category_progress(category):
         """
@@ -88,3 +173,249 @@ class ProgressService:
             else 0
         )
         return total_progress / total_minor_duration
+
+
+class EntitlementService:
+    """
+    사용자의 수강 권한(Entitlement)을 조회하는 서비스 클래스입니다.
+
+    사용자의 {대분류 ID: (수강 상태, 만료 시각)} 맵을 요청당 한 번만 불러오고,
+    요청 간에는 캐시에 보관합니다. 카테고리 구조(소분류/미션 → 대분류)도 캐시하므로
+    권한 클래스는 추가 쿼리 없이 대분류, 소분류, 동영상, 미션 접근 여부를 판단할 수 있습니다.
+    캐시는 Enrollment, MinorCategory, Mission, Video 변경 시그널로 무효화됩니다.
+    """
+
+    CACHE_TIMEOUT = 60 * 10
+    # 프로세스 로컬 캐시에서는 다른 워커의 무효화가 전달되지 않으므로 짧게 보관합니다.
+    LOCAL_CACHE_TIMEOUT = 30
+    ACCESSIBLE_STATUSES = ("active", "completed")
+    CATALOG_CACHE_KEY = "entitlements:catalog"
+
+    @classmethod
+    def get_cache_timeout(cls):
+        """
+        권한 캐시 보관 시간을 반환합니다.
+
+        Returns:
+            int: 공유 캐시이면 CACHE_TIMEOUT, 프로세스 로컬 캐시이면 LOCAL_CACHE_TIMEOUT (초).
+        """
+        from accounts.tokens import cache_is_shared
+
+        return cls.CACHE_TIMEOUT if cache_is_shared() else cls.LOCAL_CACHE_TIMEOUT
+
+    @staticmethod
+    def user_cache_key(user_id):
+        return f"entitlements:user:{user_id}"
+
+    @staticmethod
+    def video_cache_key(video_id):
+        return f"entitlements:video:{video_id}"
+
+    @classmethod
+    def get_entitlements(cls, user):
+        """
+        사용자의 수강 권한 맵을 반환합니다.
+
+        토큰에 수강 클레임이 있으면 클레임을 사용하고, 없으면 요청 간에는 캐시 값을 재사용합니다.
+        같은 요청 안에서는 사용자 객체에 저장된 값을 재사용합니다. 지연 사용자(TokenClaimsUser)가
+        DB에서 사용자를 불러오지 않도록 값은 getattr/setattr 대신 인스턴스 __dict__로 읽고 씁니다.
+
+        Args:
+            user (CustomUser): 권한을 조회할 사용자.
+
+        Returns:
+            dict: {대분류 ID: (수강 상태, 만료 시각 timestamp)} 형태의 맵.
+        """
+        if user is None or not user.is_authenticated:
+            return {}
+
+        attributes = vars(user)
+        entitlements = attributes.get("_entitlements")
+        if entitlements is not None:
+            return entitlements
+
+        claims = attributes.get("token_claims")
+        if claims is not None and "ent" in claims:
+            # 토큰에 포함된 수강 클레임을 사용하여 캐시/DB 조회를 생략합니다.
+            entitlements = {
+                major_category_id: (status, expiry)
+                for major_category_id, status, expiry in claims["ent"]
+            }
+        else:
+            key = cls.user_cache_key(user.pk)
+            entitlements = cache.get(key)
+            if entitlements is None:
+                from .models import Enrollment
+
+                entitlements = {
+                    major_category_id: (status, expiry_date.timestamp())
+                    for major_category_id, status, expiry_date in Enrollment.objects.filter(
+                        user_id=user.pk, major_category__isnull=False
+                    ).values_list("major_category_id", "status", "expiry_date")
+                }
+                cache.set(key, entitlements, cls.get_cache_timeout())
+
+        attributes["_entitlements"] = entitlements
+        return entitlements
+
+    @classmethod
+    def invalidate_user(cls, user_id):
+        """
+        사용자의 수강 권한 캐시를 제거합니다.
+
+        Args:
+            user_id (int): 사용자 ID.
+        """
+        cache.delete(cls.user_cache_key(user_id))
+
+    @classmethod
+    def get_catalog(cls):
+        """
+        소분류와 미션이 속한 대분류 ID 맵을 반환합니다.
+
+        Returns:
+            dict: {"minor": {소분류 ID: 대분류 ID}, "mission": {미션 ID: 대분류 ID}}.
+        """
+        catalog = cache.get(cls.CATALOG_CACHE_KEY)
+        if catalog is None:
+            from missions.models import Mission
+            from .models import MinorCategory
+
+            catalog = {
+                "minor": dict(
+                    MinorCategory.objects.values_list("id", "major_category_id")
+                ),
+                "mission": dict(
+                    Mission.objects.values_list(
+                        "id", "minor_category__major_category_id"
+                    )
+                ),
+            }
+            cache.set(cls.CATALOG_CACHE_KEY, catalog, cls.get_cache_timeout())
+        return catalog
+
+    @classmethod
+    def invalidate_catalog(cls):
+        """
+        카테고리 구조 캐시를 제거합니다.
+        """
+        cache.delete(cls.CATALOG_CACHE_KEY)
+
+    @classmethod
+    def get_video_major_category_id(cls, video_id):
+        """
+        동영상 ID로 해당 동영상이 속한 대분류 ID를 반환합니다.
+
+        Args:
+            video_id (int): 동영상 ID.
+
+        Returns:
+            int | None: 대분류 ID. 동영상이 존재하지 않으면 None.
+        """
+        from videos.models import Video
+
+        key = cls.video_cache_key(video_id)
+        major_category_id = cache.get(key)
+        if major_category_id is None:
+            minor_category_id = (
+                Video.objects.filter(id=video_id)
+                .values_list("minor_category_id", flat=True)
+                .first()
+            )
+            if minor_category_id is None:
+                return None
+            major_category_id = cls.get_catalog()["minor"].get(minor_category_id)
+            cache.set(key, major_category_id, cls.get_cache_timeout())
+        return major_category_id
+
+    @classmethod
+    def invalidate_video(cls, video_id):
+        """
+        동영상의 대분류 캐시를 제거합니다.
+
+        Args:
+            video_id (int): 동영상 ID.
+        """
+        cache.delete(cls.video_cache_key(video_id))
+
+    @classmethod
+    def resolve_major_category_id(cls, obj):
+        """
+        객체가 속한 대분류 ID를 추가 쿼리 없이 구합니다.
+
+        대분류, 소분류, 동영상, 미션, 그리고 mission 외래키를 가진 객체
+        (5지선다형 문제, 코드 제출형 문제 등)를 지원합니다.
+
+        Args:
+            obj (Model): 대분류 ID를 구할 객체.
+
+        Returns:
+            int | None: 대분류 ID. 구할 수 없으면 None.
+        """
+        model_name = obj._meta.model_name
+        if model_name == "majorcategory":
+            return obj.pk
+        if model_name == "minorcategory":
+            return obj.major_category_id
+        if model_name == "mission":
+            return cls.get_catalog()["mission"].get(obj.pk)
+        if hasattr(obj, "minor_category_id"):
+            return cls.get_catalog()["minor"].get(obj.minor_category_id)
+        if hasattr(obj, "mission_id"):
+            return cls.get_catalog()["mission"].get(obj.mission_id)
+        if hasattr(obj, "video_id"):
+            return cls.get_video_major_category_id(obj.video_id)
+        return None
+
+    @classmethod
+    def has_access(cls, user, major_category_id, statuses=ACCESSIBLE_STATUSES):
+        """
+        사용자가 대분류에 대해 유효한 수강 권한을 가지고 있는지 확인합니다.
+
+        Args:
+            user (CustomUser): 확인할 사용자.
+            major_category_id (int): 대분류 ID.
+            statuses (tuple): 접근을 허용할 수강 상태 목록.
+
+        Returns:
+            bool: 수강 상태가 허용 목록에 있고 만료되지 않았으면 True.
+        """
+        if major_category_id is None:
+            return False
+        entitlement = cls.get_entitlements(user).get(major_category_id)
+        if entitlement is None:
+            return False
+        status, expiry = entitlement
+        return status in statuses and expiry > time.time()
+
+    @classmethod
+    def has_any_access(cls, user, statuses=ACCESSIBLE_STATUSES):
+        """
+        사용자가 하나 이상의 대분류에 대해 유효한 수강 권한을 가지고 있는지 확인합니다.
+
+        Args:
+            user (CustomUser): 확인할 사용자.
+            statuses (tuple): 접근을 허용할 수강 상태 목록.
+
+        Returns:
+            bool: 유효한 수강 권한이 하나라도 있으면 True.
+        """
+        return any(
+            cls.has_access(user, major_category_id, statuses)
+            for major_category_id in cls.get_entitlements(user)
+        )
+
+    @classmethod
+    def can_access(cls, user, obj, statuses=ACCESSIBLE_STATUSES):
+        """
+        사용자가 대분류/소분류/동영상/미션 객체에 접근할 수 있는지 확인합니다.
+
+        Args:
+            user (CustomUser): 확인할 사용자.
+            obj (Model): 접근하려는 객체.
+            statuses (tuple): 접근을 허용할 수강 상태 목록.
+
+        Returns:
+            bool: 접근 가능하면 True.
+        """
+        return cls.has_access(user, cls.resolve_major_category_id(obj), statuses)
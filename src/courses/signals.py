@@ -1,15 +1,18 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from missions.models import Mission  
-from .models import MinorCategory  
+from accounts.tokens import bump_token_version
+from missions.models import Mission
+from videos.models import Video
+from .models import Enrollment, MinorCategory
+from .services import EntitlementService
 
 
 @receiver(post_save, sender=MinorCategory)
 def create_default_missions(sender, instance, created, **kwargs):
     """
     MinorCategory가 생성될 때 자동으로 4개의 기본 Mission 객체를 생성하는 함수.
-    
+
     새로운 MinorCategory가 생성되면, 해당 카테고리에 중간고사 및 기말고사 미션을 자동으로 생성합니다.
     각 미션은 5지선다형 문제와 코드 제출형 문제로 구성됩니다.
 
@@ -55,3 +58,45 @@ def create_default_missions(sender, instance, created, **kwargs):
             mission_type="code_submission",
             is_final=True,
         )
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def invalidate_enrollment_entitlements(sender, instance, **kwargs):
+    """
+    Enrollment가 생성, 수정, 삭제되면 해당 사용자의 수강 권한 캐시를 제거하고
+    토큰 버전을 올려 기존 권한 클레임 토큰을 무효화합니다.
+
+    Args:
+        sender (type): Enrollment 모델.
+        instance (Enrollment): 변경된 Enrollment 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    EntitlementService.invalidate_user(instance.user_id)
+    bump_token_version(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=MinorCategory)
+@receiver([post_save, post_delete], sender=Mission)
+def invalidate_catalog_entitlements(sender, instance, **kwargs):
+    """
+    MinorCategory 또는 Mission이 변경되면 카테고리 구조 캐시를 제거합니다.
+
+    Args:
+        sender (type): MinorCategory 또는 Mission 모델.
+        instance (Model): 변경된 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    EntitlementService.invalidate_catalog()
+
+
+@receiver([post_save, post_delete], sender=Video)
+def invalidate_video_entitlements(sender, instance, **kwargs):
+    """
+    Video가 변경되면 해당 동영상의 대분류 캐시를 제거합니다.
+
+    Args:
+        sender (type): Video 모델.
+        instance (Video): 변경된 Video 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    EntitlementService.invalidate_video(instance.pk)
@@ -0,0 +1,131 @@
+import pytest
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory, Enrollment
+from courses.services import EntitlementService
+from missions.models import Mission
+from videos.models import Video
+
+
+@pytest.mark.django_db
+class TestEntitlementService:
+    """
+    수강 권한 서비스(EntitlementService)의 조회, 캐시, 무효화 동작을 테스트하는 클래스입니다.
+    """
+
+    @pytest.fixture
+    def user(self):
+        """테스트용 일반 사용자를 생성하는 fixture입니다."""
+        return CustomUser.objects.create_user(
+            username="student", email="student@example.com", password="testpass123"
+        )
+
+    @pytest.fixture
+    def major_categories(self):
+        """테스트용 MajorCategory 2개를 생성하는 fixture입니다."""
+        return [
+            MajorCategory.objects.create(name=f"Major {i}", price=10000)
+            for i in range(2)
+        ]
+
+    @pytest.fixture
+    def minor_category(self, major_categories):
+        """첫 번째 대분류에 속한 MinorCategory를 생성하는 fixture입니다."""
+        return MinorCategory.objects.create(
+            name="Minor", major_category=major_categories[0], content="c", order=1
+        )
+
+    @pytest.fixture
+    def video(self, minor_category):
+        """테스트용 Video를 생성하는 fixture입니다."""
+        return Video.objects.create(
+            name="Video",
+            description="d",
+            video_url="https://example.com/video.mp4",
+            minor_category=minor_category,
+            duration=timedelta(minutes=5),
+        )
+
+    def _enroll(self, user, major_category, status="active"):
+        return Enrollment.objects.create(
+            user=user,
+            major_category=major_category,
+            expiry_date=timezone.now() + timedelta(days=30),
+            status=status,
+        )
+
+    def test_access_checks_run_without_queries_once_loaded(
+        self, user, major_categories, minor_category, video, django_assert_num_queries
+    ):
+        """
+        권한 맵과 카테고리 구조가 캐시된 뒤에는 접근 확인에 쿼리가 발생하지 않는지 테스트합니다.
+        """
+        self._enroll(user, major_categories[0])
+        mission = Mission.objects.filter(minor_category=minor_category).first()
+
+        assert EntitlementService.can_access(user, video)
+        user = CustomUser.objects.get(pk=user.pk)  # 새 요청의 사용자 객체
+
+        with django_assert_num_queries(0):
+            assert EntitlementService.can_access(user, major_categories[0])
+            assert EntitlementService.can_access(user, minor_category)
+            assert EntitlementService.can_access(user, video)
+            assert EntitlementService.can_access(user, mission)
+            assert not EntitlementService.can_access(user, major_categories[1])
+
+    def test_cache_invalidated_on_enrollment_change(self, user, major_categories):
+        """
+        Enrollment 변경 시 캐시가 무효화되어 새로운 권한이 반영되는지 테스트합니다.
+        """
+        enrollment = self._enroll(user, major_categories[0])
+        assert EntitlementService.has_access(
+            CustomUser.objects.get(pk=user.pk), major_categories[0].id
+        )
+
+        enrollment.status = "expired"
+        enrollment.save()
+        assert not EntitlementService.has_access(
+            CustomUser.objects.get(pk=user.pk), major_categories[0].id
+        )
+
+    def test_video_retrieve_with_multiple_enrollments(
+        self, user, major_categories, video
+    ):
+        """
+        수강 신청이 여러 개인 사용자도 동영상 상세 조회 권한 확인이 정상 동작하는지 테스트합니다.
+        """
+        self._enroll(user, major_categories[0])
+        self._enroll(user, major_categories[1])
+
+        other_minor = MinorCategory.objects.create(
+            name="Other", major_category=major_categories[1], content="c", order=2
+        )
+        other_video = Video.objects.create(
+            name="Other",
+            description="d",
+            video_url="https://example.com/other.mp4",
+            minor_category=other_minor,
+            duration=timedelta(minutes=5),
+        )
+        Enrollment.objects.filter(major_category=major_categories[1]).update(
+            status="expired"
+        )
+        EntitlementService.invalidate_user(user.id)
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("videos.views.get_presigned_url", lambda url: url)
+            response = client.get(reverse("video-detail", kwargs={"pk": video.pk}))
+            assert response.status_code == status.HTTP_200_OK
+            response = client.get(
+                reverse("video-detail", kwargs={"pk": other_video.pk})
+            )
+            assert response.status_code == status.HTTP_403_FORBIDDEN
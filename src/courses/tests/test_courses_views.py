@@ -1,6 +1,8 @@
 import pytest
 from datetime import timedelta
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.urls import reverse
 
@@ -9,6 +11,8 @@ from rest_framework.test import APIClient
 
 from accounts.models import CustomUser
 from courses.models import MajorCategory, MinorCategory, Enrollment
+from progress.models import UserProgress
+from videos.models import Video
 
 
 @pytest.mark.django_db
@@ -179,3 +183,80 @@ class TestCoursesViews:
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 1
+
+    def _create_minor_with_videos(self, major_category, order):
+        """소분류와 10분, 30분 길이의 동영상 2개를 생성합니다."""
+        minor = MinorCategory.objects.create(
+            name=f"Minor {order}",
+            major_category=major_category,
+            content="content",
+            order=order,
+        )
+        videos = [
+            Video.objects.create(
+                name=f"Video {order}-{minutes}",
+                description="description",
+                video_url="https://example.com/video.mp4",
+                minor_category=minor,
+                duration=timedelta(minutes=minutes),
+            )
+            for minutes in (10, 30)
+        ]
+        return minor, videos
+
+    def test_with_progress_is_weighted_and_user_scoped(
+        self, user, admin_user, major_category, enrollment
+    ):
+        """
+        with_progress가 동영상 길이로 가중 평균한 사용자별 진행률을 계산하는지 테스트합니다.
+        """
+        minor, (short_video, long_video) = self._create_minor_with_videos(
+            major_category, 1
+        )
+        UserProgress.objects.create(
+            user=user, video=short_video, enrollment=enrollment, progress_percent=100
+        )
+        UserProgress.objects.create(
+            user=user, video=long_video, enrollment=enrollment, progress_percent=50
+        )
+
+        # (100 * 10 + 50 * 30) / 40 = 62.5
+        minor = MinorCategory.objects.with_progress(user).get(pk=minor.pk)
+        assert minor.user_progress == pytest.approx(62.5)
+        major = MajorCategory.objects.with_progress(user).get(pk=major_category.pk)
+        assert major.user_progress == pytest.approx(62.5)
+
+        other = MinorCategory.objects.with_progress(admin_user).get(pk=minor.pk)
+        assert other.user_progress == 0
+
+    def test_category_list_query_count_is_constant(
+        self, api_client, user, major_category, enrollment
+    ):
+        """
+        카테고리 목록 조회 쿼리 수가 카테고리 수와 무관하게 일정한지 테스트합니다.
+        """
+        api_client.force_authenticate(user=user)
+        minor, videos = self._create_minor_with_videos(major_category, 1)
+        UserProgress.objects.create(
+            user=user, video=videos[0], enrollment=enrollment, progress_percent=100
+        )
+
+        def count_queries(url_name):
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(reverse(url_name))
+            assert response.status_code == status.HTTP_200_OK
+            return len(context.captured_queries), response
+
+        # 방문 추적 미들웨어의 첫 요청 쿼리를 측정에서 제외합니다.
+        count_queries("majorcategory-list")
+        minor_queries, response = count_queries("minorcategory-list")
+        assert response.data[0]["progress_percent"] == pytest.approx(25.0)
+        major_queries, response = count_queries("majorcategory-list")
+        assert response.data[0]["progress_percent"] == pytest.approx(25.0)
+
+        for order in range(2, 7):
+            other_major = MajorCategory.objects.create(name=f"Major {order}")
+            self._create_minor_with_videos(other_major, order)
+
+        assert count_queries("minorcategory-list")[0] == minor_queries
+        assert count_queries("majorcategory-list")[0] == major_queries
@@ -10,7 +10,11 @@ from dateutil.relativedelta import relativedelta
 from drf_spectacular.utils import extend_schema_view, extend_schema
 
 from .models import MajorCategory, MinorCategory, Enrollment
-from .serializers import MajorCategorySerializer, MinorCategorySerializer, EnrollmentSerializer
+from .serializers import (
+    MajorCategorySerializer,
+    MinorCategorySerializer,
+    EnrollmentSerializer,
+)
 from videos.models import Video
 from .permissions import (
     IsAdminOrReadOnly,
@@ -45,6 +49,15 @@ class MajorCategoryViewSet(viewsets.ModelViewSet):
     queryset = MajorCategory.objects.all()
     serializer_class = MajorCategorySerializer
 
+    def get_queryset(self):
+        """
+        요청 사용자의 학습 진행률이 주석 처리된 MajorCategory 목록을 반환합니다.
+
+        Returns:
+            QuerySet: user_progress가 주석 처리된 MajorCategory 목록.
+        """
+        return MajorCategory.objects.with_progress(self.request.user)
+
     def get_permissions(self):
         """
         요청하는 액션에 따라 권한을 설정합니다.
@@ -111,6 +124,17 @@ class MinorCategoryViewSet(viewsets.ModelViewSet):
     queryset = MinorCategory.objects.all()
     serializer_class = MinorCategorySerializer
 
+    def get_queryset(self):
+        """
+        요청 사용자의 학습 진행률이 주석 처리되고 동영상이 미리 로드된 MinorCategory 목록을 반환합니다.
+
+        Returns:
+            QuerySet: user_progress가 주석 처리된 MinorCategory 목록.
+        """
+        return MinorCategory.objects.with_progress(self.request.user).prefetch_related(
+            "videos"
+        )
+
     def get_permissions(self):
         """
         요청하는 액션에 따라 권한을 설정합니다.
@@ -136,7 +160,11 @@ class MinorCategoryViewSet(viewsets.ModelViewSet):
         Returns:
             QuerySet: 필터링된 MinorCategory 목록.
         """
-        return self.queryset.filter(major_category_id=major_category_id).order_by("order")
+        return (
+            self.get_queryset()
+            .filter(major_category_id=major_category_id)
+            .order_by("order")
+        )
 
     def list(self, request, *args, **kwargs):
         """
@@ -152,7 +180,7 @@ class MinorCategoryViewSet(viewsets.ModelViewSet):
         if major_category_id:
             queryset = self.get_major_category_queryset(major_category_id)
         else:
-            queryset = self.queryset
+            queryset = self.get_queryset()
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -14,12 +14,13 @@ from .models import (
 class MissionAdmin(admin.ModelAdmin):
     """
     Admin 화면에서 Mission 모델을 관리하기 위한 클래스.
-    
+
     Attributes:
         list_display (tuple): Mission 리스트에서 표시할 필드들.
         search_fields (tuple): 검색 가능 필드들.
         list_filter (tuple): 필터로 사용할 필드들.
     """
+
     list_display = ("title", "minor_category", "mission_type", "is_midterm", "is_final")
     search_fields = ("title", "description", "minor_category__name")
     list_filter = ("mission_type", "is_midterm", "is_final", "minor_category")
@@ -29,12 +30,13 @@ class MissionAdmin(admin.ModelAdmin):
 class MultipleChoiceQuestionAdmin(admin.ModelAdmin):
     """
     Admin 화면에서 MultipleChoiceQuestion 모델을 관리하기 위한 클래스.
-    
+
     Attributes:
         list_display (tuple): MultipleChoiceQuestion 리스트에서 표시할 필드들.
         search_fields (tuple): 검색 가능 필드들.
         list_filter (tuple): 필터로 사용할 필드들.
     """
+
     list_display = ("mission", "question", "correct_option")
     search_fields = ("question",)
     list_filter = ("mission__title",)
@@ -44,18 +46,20 @@ class MultipleChoiceQuestionAdmin(admin.ModelAdmin):
 class CodeSubmissionAdmin(admin.ModelAdmin):
     """
     Admin 화면에서 CodeSubmission 모델을 관리하기 위한 클래스.
-    
+
     Attributes:
         list_display (tuple): CodeSubmission 리스트에서 표시할 필드들.
         search_fields (tuple): 검색 가능 필드들.
         list_filter (tuple): 필터로 사용할 필드들.
     """
+
     list_display = (
         "mission",
         "problem_statement",
         "time_limit",
         "memory_limit",
         "language",
+        "compare_mode",
     )
     search_fields = ("problem_statement",)
     list_filter = ("mission__title", "language")
@@ -65,13 +69,14 @@ class CodeSubmissionAdmin(admin.ModelAdmin):
 class TestCaseAdmin(admin.ModelAdmin):
     """
     Admin 화면에서 TestCase 모델을 관리하기 위한 클래스.
-    
+
     Attributes:
         list_display (tuple): TestCase 리스트에서 표시할 필드들.
         search_fields (tuple): 검색 가능 필드들.
         list_filter (tuple): 필터로 사용할 필드들.
     """
-    list_display = ("code_submission", "input_data", "expected_output", "is_sample")
+
+    list_display = ("code_submission", "input_size", "expected_size", "is_sample")
     search_fields = ("input_data", "expected_output")
     list_filter = ("code_submission__problem_statement", "is_sample")
 
@@ -80,12 +85,13 @@ class TestCaseAdmin(admin.ModelAdmin):
 class MultipleChoiceSubmissionAdmin(admin.ModelAdmin):
     """
     Admin 화면에서 MultipleChoiceSubmission 모델을 관리하기 위한 클래스.
-    
+
     Attributes:
         list_display (tuple): MultipleChoiceSubmission 리스트에서 표시할 필드들.
         search_fields (tuple): 검색 가능 필드들.
         list_filter (tuple): 필터로 사용할 필드들.
     """
+
     list_display = ("user", "question", "selected_option", "is_correct", "submitted_at")
     search_fields = ("user__username", "question__question")
     list_filter = ("is_correct", "submitted_at")
@@ -95,12 +101,13 @@ class MultipleChoiceSubmissionAdmin(admin.ModelAdmin):
 class CodeSubmissionRecordAdmin(admin.ModelAdmin):
     """
     Admin 화면에서 CodeSubmissionRecord 모델을 관리하기 위한 클래스.
-    
+
     Attributes:
         list_display (tuple): CodeSubmissionRecord 리스트에서 표시할 필드들.
         search_fields (tuple): 검색 가능 필드들.
         list_filter (tuple): 필터로 사용할 필드들.
     """
+
     list_display = (
         "user",
         "code_submission",
@@ -108,6 +115,7 @@ class CodeSubmissionRecordAdmin(admin.ModelAdmin):
         "submission_time",
         "execution_time",
         "memory_usage",
+        "cache_hit",
     )
     search_fields = ("user__username", "code_submission__problem_statement")
     list_filter = ("is_passed", "submission_time")
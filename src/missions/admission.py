@@ -0,0 +1,252 @@
+"""
+시험 시간대 미션 요청의 수용 제어(admission control).
+
+중간/기말 미션이 시작하고 끝날 때 몰리는 문제 조회와 답안 제출 요청이 동영상 진행률이나
+대시보드 요청과 같은 웹 워커를 모두 차지하지 않도록, 요청 종류(scope)별로 동시에 처리할 수 있는
+요청 수를 제한합니다.
+
+- 종류별 한도만큼의 처리 슬롯을 공유 캐시에 두고, 요청은 빈 슬롯 하나를 임대(lease)하여 처리한
+  뒤 반환합니다. 슬롯은 임대 시간이 지나면 저절로 비워지므로 요청을 처리하던 프로세스가 죽어도
+  한도가 줄어들지 않습니다. 캐시가 Redis처럼 공유되면 한도는 서버 전체에, locmem이면 프로세스별로
+  적용됩니다.
+- 빈 슬롯이 없으면 503과 Retry-After로 바로 거절하여, 요청이 대기하다 시간 초과되지 않고
+  클라이언트가 잠시 뒤 다시 시도하도록 합니다. 재시도가 한꺼번에 몰리지 않도록 대기 시간에
+  무작위 값을 더합니다.
+- 채점 대기열은 사용자별 대기 제출 수를 제한하고(429), 공정 대기열 순번(queue_round)으로 여러
+  사용자의 제출을 번갈아 채점합니다.
+
+허용/거절 횟수와 현재 사용 중인 슬롯 수, 채점 대기열 길이는 get_admission_metrics로 조회합니다.
+"""
+
+import random
+import secrets
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from rest_framework import status
+from rest_framework.exceptions import APIException, Throttled
+
+from .models import CodeSubmissionRecord
+
+
+SCOPE_READ = "mission_read"
+SCOPE_SUBMIT = "mission_submit"
+# 사용자별 채점 대기열 한도 (지표 이름으로만 사용)
+SCOPE_JUDGE_QUEUE = "judge_queue"
+
+METRIC_ADMITTED = "admitted"
+METRIC_REJECTED = "rejected"
+
+# 빈 슬롯을 임대하려고 시도하는 최대 횟수 (다른 요청과 같은 슬롯을 두고 경쟁한 경우)
+LEASE_ATTEMPTS = 3
+
+
+class MissionOverloaded(APIException):
+    """
+    처리 한도를 넘어 요청을 거절할 때 발생하는 예외 (503, Retry-After 헤더 포함).
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = (
+        "요청이 많아 지금은 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."
+    )
+    default_code = "overloaded"
+
+    def __init__(self, wait, detail=None):
+        super().__init__(detail)
+        # DRF 예외 처리기가 wait 속성으로 Retry-After 헤더를 붙입니다.
+        self.wait = wait
+
+
+@dataclass(frozen=True)
+class Lease:
+    """
+    임대한 처리 슬롯.
+    """
+
+    key: str
+    token: str
+
+
+def retry_after() -> int:
+    """
+    거절한 요청에 알려 줄 재시도 대기 시간(초)을 반환합니다.
+
+    Returns:
+        int: MISSION_ADMISSION_RETRY_AFTER와 그 두 배 사이의 무작위 값.
+    """
+    base = max(settings.MISSION_ADMISSION_RETRY_AFTER, 1)
+    return random.randint(base, base * 2)
+
+
+def metric_key(scope: str, name: str) -> str:
+    return f"admission:{scope}:{name}"
+
+
+def increment_metric(scope: str, name: str) -> None:
+    key = metric_key(scope, name)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:  # 그 사이에 캐시에서 지워진 경우
+        cache.add(key, 1, None)
+
+
+class AdmissionController:
+    """
+    요청 종류 하나의 처리 슬롯을 관리합니다.
+
+    Attributes:
+        scope (str): 요청 종류.
+        capacity (int): 동시에 처리할 수 있는 요청 수. 0이면 제한하지 않습니다.
+    """
+
+    def __init__(self, scope: str, capacity: int = None):
+        self.scope = scope
+        self.capacity = (
+            settings.MISSION_ADMISSION_LIMITS.get(scope, 0)
+            if capacity is None
+            else capacity
+        )
+
+    def slot_keys(self) -> list:
+        return [
+            f"admission:{self.scope}:slot:{index}" for index in range(self.capacity)
+        ]
+
+    def acquire(self):
+        """
+        빈 처리 슬롯 하나를 임대합니다.
+
+        Returns:
+            Lease | None: 임대한 슬롯. 한도가 없으면 None.
+
+        Raises:
+            MissionOverloaded: 빈 슬롯이 없는 경우 발생.
+        """
+        if not self.capacity:
+            return None
+
+        keys = self.slot_keys()
+        held = cache.get_many(keys)
+        free = [key for key in keys if key not in held]
+        # 여러 요청이 같은 슬롯을 두고 경쟁하지 않도록 무작위로 고릅니다.
+        random.shuffle(free)
+        token = secrets.token_hex(8)
+        for key in free[:LEASE_ATTEMPTS]:
+            if cache.add(key, token, settings.MISSION_ADMISSION_LEASE):
+                increment_metric(self.scope, METRIC_ADMITTED)
+                return Lease(key, token)
+
+        increment_metric(self.scope, METRIC_REJECTED)
+        raise MissionOverloaded(retry_after())
+
+    @staticmethod
+    def release(lease) -> None:
+        """
+        임대한 슬롯을 반환합니다. 임대 시간이 지나 다른 요청이 가져간 슬롯은 건드리지 않습니다.
+
+        Args:
+            lease (Lease | None): acquire가 반환한 슬롯.
+        """
+        if lease is not None and cache.get(lease.key) == lease.token:
+            cache.delete(lease.key)
+
+    def in_flight(self) -> int:
+        """
+        현재 임대 중인 슬롯 수를 반환합니다.
+
+        Returns:
+            int: 처리 중인 요청 수.
+        """
+        return len(cache.get_many(self.slot_keys())) if self.capacity else 0
+
+
+class AdmissionControlMixin:
+    """
+    APIView에 요청 종류별 처리 한도를 적용하는 믹스인.
+
+    인증과 권한 확인이 끝난 뒤 admission_scope의 처리 슬롯을 임대하고, 응답을 만든 뒤
+    (예외가 발생해도) 반환합니다.
+
+    Attributes:
+        admission_scope (str): 요청 종류 (mission_read, mission_submit). None이면 제한하지 않습니다.
+    """
+
+    admission_scope = None
+
+    def dispatch(self, request, *args, **kwargs):
+        self.admission_lease = None
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            AdmissionController.release(self.admission_lease)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.admission_scope is not None:
+            self.admission_lease = AdmissionController(self.admission_scope).acquire()
+
+
+def check_judge_queue(user) -> None:
+    """
+    사용자가 채점 대기열에 더 제출할 수 있는지 확인합니다.
+
+    Args:
+        user (User): 제출한 사용자.
+
+    Raises:
+        Throttled: 채점을 기다리거나 채점 중인 제출이 JUDGE_MAX_QUEUED_PER_USER 이상인 경우
+            발생 (429, Retry-After 헤더 포함).
+    """
+    limit = settings.JUDGE_MAX_QUEUED_PER_USER
+    if not limit:
+        return
+    pending = CodeSubmissionRecord.objects.filter(
+        user=user, status__in=("queued", "running")
+    ).count()
+    if pending >= limit:
+        increment_metric(SCOPE_JUDGE_QUEUE, METRIC_REJECTED)
+        raise Throttled(
+            wait=retry_after(),
+            detail=f"채점을 기다리는 제출이 {limit}개 이상입니다. 채점이 끝난 뒤 다시 제출해 주세요.",
+        )
+
+
+def get_admission_metrics() -> dict:
+    """
+    수용 제어 지표를 반환합니다.
+
+    Returns:
+        dict: 요청 종류별 capacity, in_flight, admitted, rejected와
+            채점 대기열의 queued, running, rejected를 담은 딕셔너리.
+    """
+    scopes = {}
+    for scope in settings.MISSION_ADMISSION_LIMITS:
+        controller = AdmissionController(scope)
+        scopes[scope] = {
+            "capacity": controller.capacity,
+            "in_flight": controller.in_flight(),
+            METRIC_ADMITTED: cache.get(metric_key(scope, METRIC_ADMITTED), 0),
+            METRIC_REJECTED: cache.get(metric_key(scope, METRIC_REJECTED), 0),
+        }
+
+    counts = dict(
+        CodeSubmissionRecord.objects.filter(status__in=("queued", "running"))
+        .order_by()
+        .values_list("status")
+        .annotate(count=Count("id"))
+    )
+    return {
+        "scopes": scopes,
+        SCOPE_JUDGE_QUEUE: {
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "max_per_user": settings.JUDGE_MAX_QUEUED_PER_USER,
+            METRIC_REJECTED: cache.get(
+                metric_key(SCOPE_JUDGE_QUEUE, METRIC_REJECTED), 0
+            ),
+        },
+    }
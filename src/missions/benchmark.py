@@ -0,0 +1,367 @@
+"""
+채점 처리량 벤치마크.
+
+대표적인 제출 코드 묶음(corpus)을 실제 채점 경로(CodeJudgeFactory와 judge_test_case)로
+지정한 동시 실행 수만큼 반복 채점하여, 처리량과 지연 시간 백분위수(p50/p95/p99),
+판정 정확도를 JSON으로 저장할 수 있는 딕셔너리로 보고합니다. 이전 보고서와 비교하여
+성능이 기준 이상 떨어졌는지도 확인할 수 있습니다.
+"""
+
+import math
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from .services import CASE_PASSED, CodeJudgeFactory, judge_test_case
+
+
+# 케이스 분류
+CATEGORY_TRIVIAL = "trivial"
+CATEGORY_CPU = "cpu"
+CATEGORY_MEMORY = "memory"
+CATEGORY_OUTPUT = "output"
+CATEGORY_TIMEOUT = "timeout"
+CATEGORIES = (
+    CATEGORY_TRIVIAL,
+    CATEGORY_CPU,
+    CATEGORY_MEMORY,
+    CATEGORY_OUTPUT,
+    CATEGORY_TIMEOUT,
+)
+
+# 언어별 실행 파일. 없는 언어의 케이스는 건너뜁니다.
+LANGUAGE_RUNTIMES = {"python": "python3", "javascript": "node"}
+
+OUTPUT_LINES = 100000
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    벤치마크에 사용하는 제출 코드 하나와 기대 판정.
+    """
+
+    name: str
+    language: str
+    category: str
+    code: str
+    input_data: str
+    expected_output: str
+    expected_status: str = CASE_PASSED
+    time_limit: int = 2
+    memory_limit: int = 128
+
+
+BENCHMARK_CORPUS = (
+    BenchmarkCase(
+        "python-sum",
+        "python",
+        CATEGORY_TRIVIAL,
+        "a, b = map(int, input().split())\nprint(a + b)\n",
+        "1 2\n",
+        "3",
+    ),
+    BenchmarkCase(
+        "python-loop",
+        "python",
+        CATEGORY_CPU,
+        "s = 0\nfor i in range(1000000):\n    s = (s + i * i) % 1000003\nprint(s)\n",
+        "",
+        "999989",
+    ),
+    BenchmarkCase(
+        "python-list",
+        "python",
+        CATEGORY_MEMORY,
+        "numbers = list(range(1000000))\nprint(len(numbers))\n",
+        "",
+        "1000000",
+    ),
+    BenchmarkCase(
+        "python-memory-limit",
+        "python",
+        CATEGORY_MEMORY,
+        "data = bytearray(512 * 1024 * 1024)\n",
+        "",
+        "",
+        expected_status="memory_limit",
+    ),
+    BenchmarkCase(
+        "python-print",
+        "python",
+        CATEGORY_OUTPUT,
+        f"for i in range({OUTPUT_LINES}):\n    print(i)\n",
+        "",
+        "\n".join(map(str, range(OUTPUT_LINES))),
+    ),
+    BenchmarkCase(
+        "python-infinite-loop",
+        "python",
+        CATEGORY_TIMEOUT,
+        "while True:\n    pass\n",
+        "",
+        "",
+        expected_status="time_limit",
+        time_limit=1,
+    ),
+    BenchmarkCase(
+        "javascript-sum",
+        "javascript",
+        CATEGORY_TRIVIAL,
+        "const [a, b] = require('fs').readFileSync(0, 'utf8').trim().split(' ').map(Number);\n"
+        "console.log(a + b);\n",
+        "1 2\n",
+        "3",
+    ),
+    BenchmarkCase(
+        "javascript-loop",
+        "javascript",
+        CATEGORY_CPU,
+        "let s = 0;\nfor (let i = 0; i < 10000000; i++) s = (s + i * i) % 1000003;\n"
+        "console.log(s);\n",
+        "",
+        "990548",
+    ),
+    BenchmarkCase(
+        "javascript-array",
+        "javascript",
+        CATEGORY_MEMORY,
+        "const a = Array.from({ length: 2000000 }, (_, i) => i);\nconsole.log(a.length);\n",
+        "",
+        "2000000",
+    ),
+    BenchmarkCase(
+        "javascript-print",
+        "javascript",
+        CATEGORY_OUTPUT,
+        f"const lines = [];\nfor (let i = 0; i < {OUTPUT_LINES}; i++) lines.push(i);\n"
+        "console.log(lines.join('\\n'));\n",
+        "",
+        "\n".join(map(str, range(OUTPUT_LINES))),
+    ),
+    BenchmarkCase(
+        "javascript-infinite-loop",
+        "javascript",
+        CATEGORY_TIMEOUT,
+        "while (true) {}\n",
+        "",
+        "",
+        expected_status="time_limit",
+        time_limit=1,
+    ),
+)
+
+
+def select_cases(languages=None, categories=None, corpus=BENCHMARK_CORPUS):
+    """
+    언어와 분류로 벤치마크 케이스를 고릅니다. 실행 파일이 없는 언어는 제외합니다.
+
+    Args:
+        languages (Iterable[str], optional): 포함할 언어. 없으면 모든 언어.
+        categories (Iterable[str], optional): 포함할 분류. 없으면 모든 분류.
+        corpus (Iterable[BenchmarkCase]): 케이스 목록.
+
+    Returns:
+        tuple: (선택한 케이스 목록, 실행 파일이 없어 건너뛴 언어 목록) 튜플.
+    """
+    cases = [
+        case
+        for case in corpus
+        if (not languages or case.language in languages)
+        and (not categories or case.category in categories)
+    ]
+    missing = sorted(
+        {
+            case.language
+            for case in cases
+            if shutil.which(LANGUAGE_RUNTIMES[case.language]) is None
+        }
+    )
+    return [case for case in cases if case.language not in missing], missing
+
+
+def percentile(sorted_values, q):
+    """
+    정렬된 값 목록의 백분위수를 선형 보간으로 계산합니다.
+
+    Args:
+        sorted_values (list): 오름차순으로 정렬된 값 목록.
+        q (float): 백분위 (0~100).
+
+    Returns:
+        float | None: 백분위수. 값이 없으면 None.
+    """
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    fraction = position - lower
+    return (
+        sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+    )
+
+
+def summarize_latencies(latencies):
+    """
+    지연 시간(초) 목록을 밀리초 단위 통계로 요약합니다.
+
+    Args:
+        latencies (list): 지연 시간 목록 (초 단위).
+
+    Returns:
+        dict: mean, p50, p95, p99, max (밀리초 단위).
+    """
+    values = sorted(latency * 1000 for latency in latencies)
+    if not values:
+        return {"mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+    return {
+        "mean": round(sum(values) / len(values), 2),
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "p99": round(percentile(values, 99), 2),
+        "max": round(values[-1], 2),
+    }
+
+
+def judge_case(case):
+    """
+    벤치마크 케이스 하나를 채점하고 (판정, 지연 시간) 튜플을 반환합니다.
+
+    Args:
+        case (BenchmarkCase): 채점할 케이스.
+
+    Returns:
+        tuple: (judge_test_case가 반환한 status, 지연 시간(초)) 튜플.
+    """
+    test_case = {
+        "id": None,
+        "input": case.input_data,
+        "expected": case.expected_output,
+        "input_file": None,
+        "expected_file": None,
+        "is_sample": False,
+        "time_limit": case.time_limit,
+        "memory_limit": case.memory_limit,
+        "compare": {"mode": "trim_trailing", "tolerance": 1e-6},
+    }
+    started = time.perf_counter()
+    result = judge_test_case(
+        CodeJudgeFactory.get_judge(case.language), case.code, test_case
+    )
+    return result["status"], time.perf_counter() - started
+
+
+def run_benchmark(cases, runs=10, concurrency=4, warmup=1):
+    """
+    케이스들을 runs번씩 동시에 채점하고 결과 보고서를 만듭니다.
+
+    케이스를 번갈아 제출하므로 실행 중에는 여러 종류의 제출이 섞여 채점됩니다.
+    warmup 횟수만큼의 실행은 워커 풀과 디스크 캐시를 데우는 데만 사용하고 통계에서 제외합니다.
+
+    Args:
+        cases (list): 채점할 BenchmarkCase 목록.
+        runs (int): 케이스별 채점 횟수.
+        concurrency (int): 동시에 채점할 제출 수.
+        warmup (int): 케이스별 예열 실행 횟수.
+
+    Returns:
+        dict: config, total(runs, elapsed, throughput, correct, accuracy, latency_ms)과
+            케이스별 결과 목록 cases를 담은 보고서.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(judge_case, [case for _ in range(warmup) for case in cases]))
+
+        schedule = [case for _ in range(runs) for case in cases]
+        started = time.perf_counter()
+        outcomes = list(executor.map(judge_case, schedule))
+        elapsed = time.perf_counter() - started
+
+    per_case = {case.name: {"statuses": {}, "latencies": []} for case in cases}
+    for case, (status, latency) in zip(schedule, outcomes):
+        stats = per_case[case.name]
+        stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+        stats["latencies"].append(latency)
+
+    case_reports = []
+    for case in cases:
+        stats = per_case[case.name]
+        correct = stats["statuses"].get(case.expected_status, 0)
+        case_reports.append(
+            {
+                "name": case.name,
+                "language": case.language,
+                "category": case.category,
+                "expected_status": case.expected_status,
+                "runs": len(stats["latencies"]),
+                "correct": correct,
+                "statuses": stats["statuses"],
+                "latency_ms": summarize_latencies(stats["latencies"]),
+            }
+        )
+
+    total_runs = len(schedule)
+    total_correct = sum(report["correct"] for report in case_reports)
+    return {
+        "config": {
+            "runs": runs,
+            "concurrency": concurrency,
+            "warmup": warmup,
+            "sandbox": settings.JUDGE_SANDBOX_BACKEND,
+            "worker_pool_size": settings.JUDGE_WORKER_POOL_SIZE,
+            "host_concurrency": settings.JUDGE_HOST_CONCURRENCY,
+        },
+        "total": {
+            "runs": total_runs,
+            "elapsed": round(elapsed, 4),
+            "throughput": round(total_runs / elapsed, 2) if elapsed else None,
+            "correct": total_correct,
+            "accuracy": round(total_correct / total_runs, 4) if total_runs else None,
+            "latency_ms": summarize_latencies([latency for _, latency in outcomes]),
+        },
+        "cases": case_reports,
+    }
+
+
+def compare_reports(report, baseline, tolerance=0.2):
+    """
+    보고서를 기준 보고서와 비교하여 성능 저하와 잘못된 판정을 찾습니다.
+
+    Args:
+        report (dict): run_benchmark가 반환한 보고서.
+        baseline (dict): 비교할 이전 보고서.
+        tolerance (float): 허용할 성능 저하 비율. 0.2이면 처리량이 20% 넘게 줄거나
+            p95/p99 지연 시간이 20% 넘게 늘면 저하로 봅니다.
+
+    Returns:
+        list: 발견한 문제 설명 목록. 문제가 없으면 빈 목록.
+    """
+    problems = []
+    for case in report["cases"]:
+        if case["correct"] != case["runs"]:
+            problems.append(
+                f"{case['name']}: 기대 판정 {case['expected_status']}, 실제 {case['statuses']}"
+            )
+
+    throughput = report["total"]["throughput"]
+    baseline_throughput = baseline["total"]["throughput"]
+    if (
+        throughput
+        and baseline_throughput
+        and throughput < baseline_throughput * (1 - tolerance)
+    ):
+        problems.append(f"처리량 저하: {baseline_throughput} -> {throughput} runs/s")
+
+    for key in ("p95", "p99"):
+        latency = report["total"]["latency_ms"][key]
+        baseline_latency = baseline["total"]["latency_ms"][key]
+        if (
+            latency
+            and baseline_latency
+            and latency > baseline_latency * (1 + tolerance)
+        ):
+            problems.append(f"{key} 지연 시간 증가: {baseline_latency} -> {latency} ms")
+    return problems
@@ -0,0 +1,537 @@
+"""
+제출 코드의 출력을 예상 출력과 비교하는 스트리밍 비교기.
+
+출력 전체를 메모리에 모으지 않고 조각(chunk) 단위로 받아 비교하며, 첫 불일치가 발견되면
+바로 알려 실행을 중단할 수 있도록 합니다. 예상 출력도 파일에서 비교에 필요한 만큼만 조각 단위로
+읽으므로, 큰 예상 출력 파일을 메모리에 올리지 않습니다. 표준 라이브러리만 사용합니다.
+
+비교 모드:
+    exact: 줄바꿈(CRLF/LF) 차이만 무시하고 글자 단위로 같아야 합니다.
+    trim_trailing: 줄 끝 공백과 마지막 빈 줄을 무시하고 줄 단위로 비교합니다.
+    token: 공백으로 나눈 토큰 단위로 비교합니다.
+    float: 토큰 단위로 비교하되, 숫자 토큰은 허용 오차 안이면 같은 것으로 봅니다.
+
+float를 제외한 모드는 출력과 예상 출력을 모드별 정규형으로 바꾸어 앞에서부터 비교합니다
+(StreamComparator). 예상 출력의 정규형 해시와 길이를 미리 계산해 두면(normalized_digests),
+채점할 때 예상 출력 대신 해시만으로 비교할 수 있습니다(HashComparator).
+"""
+
+import contextlib
+import hashlib
+import math
+import re
+from collections import deque
+
+
+COMPARE_EXACT = "exact"
+COMPARE_TRIM_TRAILING = "trim_trailing"
+COMPARE_TOKEN = "token"
+COMPARE_FLOAT = "float"
+
+COMPARE_MODES = (COMPARE_EXACT, COMPARE_TRIM_TRAILING, COMPARE_TOKEN, COMPARE_FLOAT)
+# 정규형 해시로 비교할 수 있는 모드. float는 허용 오차 때문에 해시로 비교할 수 없습니다.
+HASHABLE_MODES = (COMPARE_EXACT, COMPARE_TRIM_TRAILING, COMPARE_TOKEN)
+
+DEFAULT_FLOAT_TOLERANCE = 1e-6
+
+# 아직 끝나지 않은 토큰을 예상보다 이만큼 더 길게까지 기다린 뒤 불일치로 판정합니다.
+PARTIAL_SLACK = 1024
+
+# 예상 출력을 한 번에 읽는 글자 수
+EXPECTED_CHUNK_SIZE = 64 * 1024
+
+# 공백이 아닌 글자들 또는 공백 글자들의 연속 (str.split과 같은 공백 기준)
+WORD_OR_SPACE_PATTERN = re.compile(r"\S+|\s+")
+
+
+class ExpectedSource:
+    """
+    예상 출력을 조각 단위로 읽습니다. 문자열 또는 파일 경로를 받습니다.
+    """
+
+    def __init__(self, expected=None, path=None):
+        self.text = expected or ""
+        self.offset = 0
+        self.file = None
+        if path is not None:
+            self.file = open(path, encoding="utf-8", errors="replace", newline="")
+
+    def read(self):
+        """
+        예상 출력의 다음 조각을 반환합니다.
+
+        Returns:
+            str: 다음 조각. 예상 출력이 끝났으면 빈 문자열.
+        """
+        if self.file is not None:
+            chunk = self.file.read(EXPECTED_CHUNK_SIZE)
+            if not chunk:
+                self.close()
+            return chunk
+        chunk = self.text[self.offset : self.offset + EXPECTED_CHUNK_SIZE]
+        self.offset += len(chunk)
+        return chunk
+
+    def close(self):
+        """
+        열어 둔 예상 출력 파일을 닫습니다.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class TokenComparator:
+    """
+    공백으로 나눈 토큰 단위로 비교합니다. tolerance가 주어지면 숫자 토큰을 오차 범위로 비교합니다.
+
+    예상 출력 토큰은 비교할 차례가 되었을 때 ExpectedSource에서 조각 단위로 읽습니다.
+    """
+
+    def __init__(self, source, tolerance=None):
+        self.source = source
+        self.tolerance = tolerance
+        self.expected = deque()
+        self.expected_buffer = ""
+        self.expected_done = False
+        self.buffer = ""
+        self.matched = True
+
+    def feed(self, text):
+        """
+        출력 조각을 비교합니다. 완성된 토큰만 비교하고 마지막 미완성 토큰은 보관합니다.
+
+        Args:
+            text (str): 출력 조각.
+
+        Returns:
+            bool: 지금까지의 출력이 예상 출력과 일치할 수 있으면 True.
+        """
+        if not self.matched:
+            return False
+        text = self.buffer + text
+        tokens = text.split()
+        self.buffer = tokens.pop() if tokens and not text[-1].isspace() else ""
+        for token in tokens:
+            if not self._compare_token(token):
+                return False
+
+        if len(self.buffer) > len(self._peek_expected() or "") + PARTIAL_SLACK:
+            self._mismatch()
+        return self.matched
+
+    def _peek_expected(self):
+        """
+        다음에 비교할 예상 출력 토큰을 반환합니다. 필요하면 예상 출력을 더 읽습니다.
+
+        Returns:
+            str | None: 예상 출력 토큰. 남은 토큰이 없으면 None.
+        """
+        while not self.expected and not self.expected_done:
+            chunk = self.source.read()
+            if not chunk:
+                self.expected_done = True
+                if self.expected_buffer:
+                    self.expected.append(self.expected_buffer)
+                    self.expected_buffer = ""
+                break
+            text = self.expected_buffer + chunk
+            tokens = text.split()
+            self.expected_buffer = (
+                tokens.pop() if tokens and not text[-1].isspace() else ""
+            )
+            self.expected.extend(tokens)
+        return self.expected[0] if self.expected else None
+
+    def _compare_token(self, token):
+        expected = self._peek_expected()
+        if expected is None or not self._equal(expected, token):
+            self._mismatch()
+            return False
+        self.expected.popleft()
+        return True
+
+    def _mismatch(self):
+        self.matched = False
+        self.close()
+
+    def _equal(self, expected, actual):
+        if expected == actual:
+            return True
+        if self.tolerance is None:
+            return False
+        try:
+            expected_value = float(expected)
+            actual_value = float(actual)
+        except ValueError:
+            return False
+        if not (math.isfinite(expected_value) and math.isfinite(actual_value)):
+            return expected_value == actual_value
+        return math.isclose(
+            actual_value, expected_value, rel_tol=self.tolerance, abs_tol=self.tolerance
+        )
+
+    def finish(self):
+        """
+        출력이 끝났을 때 최종 일치 여부를 반환합니다.
+
+        Returns:
+            bool: 출력 전체가 예상 출력과 일치하면 True.
+        """
+        if self.matched and self.buffer:
+            self._compare_token(self.buffer)
+            self.buffer = ""
+        matched = self.matched and self._peek_expected() is None
+        self.close()
+        return matched
+
+    def close(self):
+        """
+        예상 출력 파일을 닫습니다.
+        """
+        self.source.close()
+
+
+class OutputNormalizer:
+    """
+    출력 조각을 비교 모드의 정규형으로 바꾸어 내보냅니다.
+
+    정규형은 exact이면 CRLF를 LF로 바꾼 출력, trim_trailing이면 줄 끝 공백과 끝의 빈 줄을
+    지우고 LF로 이은 줄들, token이면 공백 하나로 이은 토큰들입니다. 정규형이 확정되는 대로
+    write로 넘기며, write가 없으면 SHA-256 해시에 누적합니다. 줄 끝 공백처럼 뒤에 내용이 이어질
+    때만 정규형에 들어가는 부분만 보관하고, 줄이나 토큰 전체를 모아 두지 않습니다.
+
+    Attributes:
+        length (int): 지금까지 정규형으로 확정된 글자 수.
+        pending_length (int): 아직 확정되지 않았지만 반드시 정규형에 더해질 글자 수.
+    """
+
+    def __init__(self, mode, write=None):
+        if mode not in HASHABLE_MODES:
+            raise ValueError(f"해시로 비교할 수 없는 비교 모드입니다: {mode}")
+        self.mode = mode
+        self.hash = hashlib.sha256()
+        self.write = write if write is not None else self._update_hash
+        self.length = 0
+        self.pending_length = 0
+        self.buffer = ""
+        self.blank_lines = 0
+        self.started = False
+        self.in_line = False
+
+    def feed(self, text):
+        """
+        출력 조각을 정규형으로 바꾸어 내보냅니다.
+
+        Args:
+            text (str): 출력 조각.
+        """
+        if self.mode == COMPARE_EXACT:
+            text = self.buffer + text
+            # 조각이 \r로 끝나면 다음 조각의 \n과 합쳐질 수 있으므로 보류합니다.
+            self.buffer = "\r" if text.endswith("\r") else ""
+            self._emit(text[: len(text) - len(self.buffer)].replace("\r\n", "\n"))
+            self.pending_length = len(self.buffer)
+        elif self.mode == COMPARE_TRIM_TRAILING:
+            *lines, rest = text.split("\n")
+            for line in lines:
+                self._feed_line(line)
+                self._end_line()
+            self._feed_line(rest)
+        else:
+            for match in WORD_OR_SPACE_PATTERN.finditer(text):
+                part = match.group()
+                if part[0].isspace():
+                    self.in_line = False
+                    continue
+                if not self.in_line:
+                    part = (" " if self.started else "") + part
+                    self.started = True
+                    self.in_line = True
+                self._emit(part)
+
+    def _update_hash(self, text):
+        self.hash.update(text.encode("utf-8"))
+
+    def _emit(self, text):
+        if text:
+            self.write(text)
+            self.length += len(text)
+
+    def _feed_line(self, part):
+        content = part.rstrip()
+        if not content:
+            # 공백만 있으면 뒤에 내용이 이어질 때만 정규형에 넣습니다.
+            self.buffer += part
+            return
+        prefix = ""
+        if not self.in_line:
+            # 빈 줄도 뒤에 내용이 이어질 때만 정규형에 넣습니다.
+            prefix = ("\n" if self.started else "") + "\n" * self.blank_lines
+            self.blank_lines = 0
+            self.started = True
+            self.in_line = True
+        self._emit(prefix + self.buffer + content)
+        self.buffer = part[len(content) :]
+
+    def _end_line(self):
+        if not self.in_line:
+            self.blank_lines += 1
+        self.in_line = False
+        self.buffer = ""
+
+    def finish(self):
+        """
+        남은 출력을 확정하고 정규형의 해시를 반환합니다.
+
+        Returns:
+            str: 정규형의 SHA-256 해시(16진수). write를 지정한 경우에는 의미가 없습니다.
+        """
+        if self.mode == COMPARE_EXACT:
+            self._emit(self.buffer)
+        self.buffer = ""
+        self.pending_length = 0
+        return self.hash.hexdigest()
+
+
+class StreamComparator:
+    """
+    출력과 예상 출력을 같은 정규형으로 바꾸어 앞에서부터 비교합니다.
+
+    예상 출력은 비교할 출력이 생길 때마다 필요한 만큼만 ExpectedSource에서 읽어 정규형으로
+    바꾸므로, 메모리에는 예상 출력의 한 조각만 남습니다. 출력이 예상 출력과 달라지는 즉시
+    불일치로 판정합니다.
+    """
+
+    def __init__(self, source, mode=COMPARE_TRIM_TRAILING):
+        self.source = source
+        self.expected = OutputNormalizer(mode, self._buffer_expected)
+        self.output = OutputNormalizer(mode, self._compare)
+        self.buffer = ""
+        self.position = 0
+        self.expected_done = False
+        self.matched = True
+
+    def feed(self, text):
+        """
+        출력 조각을 비교합니다.
+
+        Args:
+            text (str): 출력 조각.
+
+        Returns:
+            bool: 지금까지의 출력이 예상 출력과 일치할 수 있으면 True.
+        """
+        if self.matched:
+            self.output.feed(text)
+        return self.matched
+
+    def _buffer_expected(self, text):
+        self.buffer += text
+
+    def _fill(self, size):
+        """
+        비교하지 않은 예상 출력 정규형이 size 글자 이상이 되거나 예상 출력이 끝날 때까지 읽습니다.
+        """
+        if len(self.buffer) - self.position >= size:
+            return
+        self.buffer = self.buffer[self.position :]
+        self.position = 0
+        while len(self.buffer) < size and not self.expected_done:
+            chunk = self.source.read()
+            if chunk:
+                self.expected.feed(chunk)
+            else:
+                self.expected.finish()
+                self.expected_done = True
+
+    def _compare(self, text):
+        if not self.matched:
+            return
+        self._fill(len(text))
+        if not self.buffer.startswith(text, self.position):
+            self.matched = False
+            self.close()
+            return
+        self.position += len(text)
+
+    def finish(self):
+        """
+        출력이 끝났을 때 최종 일치 여부를 반환합니다.
+
+        Returns:
+            bool: 출력 전체가 예상 출력과 일치하면 True.
+        """
+        if self.matched:
+            self.output.finish()
+        if self.matched:
+            self._fill(1)
+            self.matched = self.position == len(self.buffer)
+        self.close()
+        return self.matched
+
+    def close(self):
+        """
+        예상 출력 파일을 닫습니다.
+        """
+        self.source.close()
+
+
+class HashComparator:
+    """
+    출력의 정규형 해시를 예상 출력의 정규형 해시와 비교합니다.
+
+    예상 출력 내용 없이 해시와 길이만으로 비교하므로 예상 출력을 읽지 않아도 됩니다.
+    출력이 예상 출력보다 길어지는 즉시 불일치로 판정하지만, 같은 길이 안의 불일치는 출력이
+    끝나야 알 수 있습니다.
+    """
+
+    def __init__(self, expected_digest, expected_length, mode=COMPARE_TRIM_TRAILING):
+        self.normalizer = OutputNormalizer(mode)
+        self.expected_digest = expected_digest
+        self.expected_length = expected_length
+        self.matched = True
+
+    def feed(self, text):
+        """
+        출력 조각을 정규형 해시에 더합니다.
+
+        Args:
+            text (str): 출력 조각.
+
+        Returns:
+            bool: 지금까지의 출력이 예상 출력과 일치할 수 있으면 True.
+        """
+        if not self.matched:
+            return False
+        normalizer = self.normalizer
+        normalizer.feed(text)
+        if normalizer.length + normalizer.pending_length > self.expected_length:
+            self.matched = False
+        return self.matched
+
+    def finish(self):
+        """
+        출력이 끝났을 때 최종 일치 여부를 반환합니다.
+
+        Returns:
+            bool: 출력의 정규형 해시가 예상 출력과 같으면 True.
+        """
+        if not self.matched:
+            return False
+        digest = self.normalizer.finish()
+        return (
+            self.normalizer.length == self.expected_length
+            and digest == self.expected_digest
+        )
+
+    def close(self):
+        """
+        해시 비교에는 열어 둔 파일이 없으므로 아무것도 하지 않습니다.
+        """
+
+
+def normalized_digests(text):
+    """
+    예상 출력의 모드별 정규형 해시와 길이를 계산합니다.
+
+    Args:
+        text (str): 예상 출력.
+
+    Returns:
+        dict: {모드: [정규형 SHA-256 해시, 정규형 길이]} 형식의 딕셔너리 (float 모드 제외).
+    """
+    digests = {}
+    for mode in HASHABLE_MODES:
+        normalizer = OutputNormalizer(mode)
+        normalizer.feed(text)
+        digests[mode] = [normalizer.finish(), normalizer.length]
+    return digests
+
+
+def create_comparator(
+    expected=None,
+    mode=COMPARE_TRIM_TRAILING,
+    tolerance=None,
+    expected_path=None,
+    expected_digest=None,
+    expected_length=None,
+):
+    """
+    비교 모드에 맞는 스트리밍 비교기를 생성합니다.
+
+    expected_path가 주어지면 파일을 열어 두고 비교하면서 조각 단위로 읽습니다. 비교기는
+    finish가 끝나거나 불일치가 확인되면 파일을 닫으며, 그 전에 사용을 멈추면 close를 호출해야
+    합니다(open_comparator).
+
+    Args:
+        expected (str, optional): 예상 출력.
+        mode (str): 비교 모드 (exact, trim_trailing, token, float).
+        tolerance (float, optional): float 모드의 허용 오차. 없으면 기본값을 사용합니다.
+        expected_path (str, optional): 예상 출력 파일 경로. 주어지면 expected 대신 파일에서 읽습니다.
+        expected_digest (str, optional): 예상 출력의 정규형 해시. expected_length와 함께 주어지고
+            모드가 해시로 비교할 수 있으면 예상 출력 대신 해시로 비교합니다.
+        expected_length (int, optional): 예상 출력의 정규형 길이.
+
+    Returns:
+        StreamComparator | TokenComparator | HashComparator: 비교기.
+
+    Raises:
+        ValueError: 지원하지 않는 비교 모드인 경우 발생.
+    """
+    if mode not in COMPARE_MODES:
+        raise ValueError(f"지원하지 않는 비교 모드입니다: {mode}")
+    if (
+        expected_digest is not None
+        and expected_length is not None
+        and mode in HASHABLE_MODES
+    ):
+        return HashComparator(expected_digest, expected_length, mode)
+    source = ExpectedSource(expected, expected_path)
+    if mode == COMPARE_FLOAT:
+        return TokenComparator(
+            source, DEFAULT_FLOAT_TOLERANCE if tolerance is None else tolerance
+        )
+    return StreamComparator(source, mode)
+
+
+@contextlib.contextmanager
+def open_comparator(compare):
+    """
+    출력 비교 조건으로 비교기를 만들고, 사용이 끝나면 예상 출력 파일을 닫습니다.
+
+    Args:
+        compare (dict | None): create_comparator에 넘길 출력 비교 조건.
+
+    Yields:
+        비교기. compare가 없으면 None.
+    """
+    comparator = create_comparator(**compare) if compare else None
+    try:
+        yield comparator
+    finally:
+        if comparator is not None:
+            comparator.close()
+
+
+def compare_output(
+    actual, expected=None, mode=COMPARE_TRIM_TRAILING, tolerance=None, **kwargs
+):
+    """
+    이미 모아 둔 출력 전체를 예상 출력과 비교합니다.
+
+    Args:
+        actual (str): 실제 출력.
+        expected (str, optional): 예상 출력.
+        mode (str): 비교 모드.
+        tolerance (float, optional): float 모드의 허용 오차.
+        **kwargs: create_comparator의 expected_path, expected_digest, expected_length.
+
+    Returns:
+        bool: 일치하면 True.
+    """
+    with open_comparator(
+        dict(expected=expected, mode=mode, tolerance=tolerance, **kwargs)
+    ) as comparator:
+        comparator.feed(actual)
+        return comparator.finish()
@@ -0,0 +1,225 @@
+"""
+5지선다형 문제의 문항 분석(item analysis).
+
+미션의 답안 제출 기록으로 문항별 난이도(p-value), 변별도(점-이연 상관계수), 선택지별 선택 비율과
+미션 전체의 신뢰도(Cronbach's alpha)를 계산합니다. 모든 통계를 답안을 한 번 훑으며 모은 합계로
+계산하므로, 제출 수에 비례하는 시간과 학생 수에 비례하는 메모리만 사용합니다.
+
+각 학생의 문항별 답안은 마지막 제출을 사용하며, 총점은 맞힌 문항 수입니다. 답하지 않은 문항은
+Cronbach's alpha 계산에서 오답(0점)으로 봅니다. 미션별 분석 결과는 제출이 바뀔 때까지 캐시합니다.
+"""
+
+import math
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .models import Mission, MultipleChoiceQuestion, MultipleChoiceSubmission
+from .question_sets import QuestionSetService
+
+
+OPTIONS = (1, 2, 3, 4, 5)
+
+# 문항 검토가 필요하다고 표시하는 기준
+TOO_EASY_DIFFICULTY = 0.9
+TOO_HARD_DIFFICULTY = 0.2
+LOW_DISCRIMINATION = 0.2
+
+FLAG_TOO_EASY = "too_easy"
+FLAG_TOO_HARD = "too_hard"
+FLAG_LOW_DISCRIMINATION = "low_discrimination"
+FLAG_MISLEADING_DISTRACTOR = "misleading_distractor"
+
+# 문항 분석 결과 캐시 유지 시간(초)
+ITEM_ANALYSIS_CACHE_TIMEOUT = 60 * 60
+
+
+def point_biserial(count, correct, rest_sum, rest_square_sum, rest_correct_sum):
+    """
+    문항 점수(0/1)와 나머지 문항 총점의 점-이연 상관계수를 합계로 계산합니다.
+
+    자기 자신을 뺀 총점(rest score)을 사용하여 문항 수가 적을 때 변별도가 부풀려지지 않도록 합니다.
+
+    Args:
+        count (int): 응답 수.
+        correct (int): 정답 수.
+        rest_sum (int): 응답자 나머지 총점의 합.
+        rest_square_sum (int): 응답자 나머지 총점 제곱의 합.
+        rest_correct_sum (int): 정답자 나머지 총점의 합.
+
+    Returns:
+        float | None: 상관계수. 모두 맞혔거나 모두 틀렸거나 총점 분산이 0이면 None.
+    """
+    if not 0 < correct < count:
+        return None
+    mean = rest_sum / count
+    variance = rest_square_sum / count - mean * mean
+    if variance <= 0:
+        return None
+    p = correct / count
+    return (
+        (rest_correct_sum / correct - mean)
+        / math.sqrt(variance)
+        * math.sqrt(p / (1 - p))
+    )
+
+
+def analyze_items(answer_key, responses):
+    """
+    답안 제출 기록으로 문항 분석 결과를 계산합니다.
+
+    Args:
+        answer_key (dict): {문제 ID: 정답 번호} 형식의 정답표.
+        responses (Iterable[tuple]): 제출 순서대로 정렬된 (사용자 ID, 문제 ID, 선택한 답안) 목록.
+            정답표에 없는 문제의 답안은 무시합니다.
+
+    Returns:
+        dict: {"students": int, "mean_score": float, "cronbach_alpha": float | None, "items": list}.
+              items는 문제 ID 순의 {"question_id", "responses", "difficulty", "discrimination",
+              "options", "flags"} 목록입니다.
+    """
+    latest = {}
+    for user_id, question_id, option in responses:
+        if question_id in answer_key:
+            latest[user_id, question_id] = option
+
+    totals = {}
+    for (user_id, question_id), option in latest.items():
+        totals[user_id] = totals.get(user_id, 0) + (option == answer_key[question_id])
+
+    # 문항별 [응답 수, 정답 수, 나머지 총점 합, 나머지 총점 제곱 합, 정답자 나머지 총점 합, 선택지 1~5 선택 수]
+    sums = {question_id: [0] * 10 for question_id in answer_key}
+    for (user_id, question_id), option in latest.items():
+        correct = option == answer_key[question_id]
+        rest = totals[user_id] - correct
+        item = sums[question_id]
+        item[0] += 1
+        item[2] += rest
+        item[3] += rest * rest
+        if correct:
+            item[1] += 1
+            item[4] += rest
+        if option in OPTIONS:
+            item[4 + option] += 1
+
+    students = len(totals)
+    items = []
+    for question_id in sorted(answer_key):
+        count, correct, rest_sum, rest_square_sum, rest_correct_sum, *option_counts = (
+            sums[question_id]
+        )
+        correct_option = answer_key[question_id]
+        difficulty = correct / count if count else None
+        discrimination = point_biserial(
+            count, correct, rest_sum, rest_square_sum, rest_correct_sum
+        )
+
+        flags = []
+        if difficulty is not None:
+            if difficulty >= TOO_EASY_DIFFICULTY:
+                flags.append(FLAG_TOO_EASY)
+            elif difficulty <= TOO_HARD_DIFFICULTY:
+                flags.append(FLAG_TOO_HARD)
+        if discrimination is not None and discrimination < LOW_DISCRIMINATION:
+            flags.append(FLAG_LOW_DISCRIMINATION)
+        if any(
+            selected > correct
+            for option, selected in zip(OPTIONS, option_counts)
+            if option != correct_option
+        ):
+            flags.append(FLAG_MISLEADING_DISTRACTOR)
+
+        items.append(
+            {
+                "question_id": question_id,
+                "responses": count,
+                "difficulty": round(difficulty, 4) if difficulty is not None else None,
+                "discrimination": (
+                    round(discrimination, 4) if discrimination is not None else None
+                ),
+                "options": [
+                    {
+                        "option": option,
+                        "count": selected,
+                        "rate": round(selected / count, 4) if count else 0.0,
+                        "is_correct": option == correct_option,
+                    }
+                    for option, selected in zip(OPTIONS, option_counts)
+                ],
+                "flags": flags,
+            }
+        )
+
+    return {
+        "students": students,
+        "mean_score": round(sum(totals.values()) / students, 4) if students else 0.0,
+        "cronbach_alpha": cronbach_alpha(
+            [sums[question_id][1] for question_id in answer_key], totals.values()
+        ),
+        "items": items,
+    }
+
+
+def cronbach_alpha(correct_counts, totals):
+    """
+    문항별 정답 수와 학생별 총점으로 Cronbach's alpha(KR-20)를 계산합니다.
+
+    Args:
+        correct_counts (list): 문항별 정답 수.
+        totals (Iterable[int]): 학생별 총점.
+
+    Returns:
+        float | None: 신뢰도 계수. 문항이 2개 미만이거나 총점 분산이 0이면 None.
+    """
+    totals = list(totals)
+    items = len(correct_counts)
+    students = len(totals)
+    if items < 2 or not students:
+        return None
+    mean = sum(totals) / students
+    total_variance = sum(total * total for total in totals) / students - mean * mean
+    if total_variance <= 0:
+        return None
+    item_variance = sum(
+        (correct / students) * (1 - correct / students) for correct in correct_counts
+    )
+    return round(items / (items - 1) * (1 - item_variance / total_variance), 4)
+
+
+def get_item_analysis(mission: Mission) -> dict:
+    """
+    미션의 5지선다형 문항 분석 결과를 반환합니다.
+
+    결과는 (문제 세트 버전, 마지막 제출 ID, 제출 수)를 키로 캐시하므로, 문제가 바뀌거나 제출이
+    추가/삭제되면 다음 조회에서 다시 계산합니다. 캐시 확인에는 집계 쿼리 한 번만 사용합니다.
+
+    Args:
+        mission (Mission): 분석할 5지선다형 미션.
+
+    Returns:
+        dict: analyze_items의 결과에 미션 ID를 더한 문항 분석 결과.
+    """
+    submissions = MultipleChoiceSubmission.objects.filter(question__mission=mission)
+    watermark = submissions.aggregate(last_id=Max("id"), count=Count("id"))
+    key = "item_analysis:{}:{}:{}:{}".format(
+        mission.pk,
+        QuestionSetService.get_version(mission.pk),
+        watermark["last_id"],
+        watermark["count"],
+    )
+    result = cache.get(key)
+    if result is None:
+        answer_key = dict(
+            MultipleChoiceQuestion.objects.filter(mission=mission).values_list(
+                "id", "correct_option"
+            )
+        )
+        result = analyze_items(
+            answer_key,
+            submissions.order_by("id")
+            .values_list("user_id", "question_id", "selected_option")
+            .iterator(chunk_size=10000),
+        )
+        result["mission"] = mission.pk
+        cache.set(key, result, ITEM_ANALYSIS_CACHE_TIMEOUT)
+    return result
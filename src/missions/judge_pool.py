@@ -0,0 +1,305 @@
+import atexit
+import base64
+import codecs
+import json
+import os
+import queue
+import struct
+import subprocess
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+from .comparator import open_comparator
+from .sandbox import (
+    STATUS_MEMORY_LIMIT,
+    STATUS_OK,
+    STATUS_RUNTIME_ERROR,
+    STATUS_WRONG_ANSWER,
+)
+
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "judge_worker.py"
+
+# judge_worker.py와 같은 프레임 헤더 형식 (4바이트 big-endian 길이)
+HEADER = struct.Struct(">I")
+
+# 워커가 응답하지 않을 때를 대비해 요청 제한 시간에 더하는 여유 시간 (초 단위)
+RESPONSE_GRACE_SECONDS = 5
+
+# 이 상태로 끝난 실행 뒤에는 워커를 새로 교체합니다.
+RECYCLE_STATUSES = ("time_limit", "memory_limit", "internal_error")
+
+# 출력을 끝까지 받은 것으로 보고 예상 출력과의 최종 일치 여부를 판정하는 상태
+FINISHED_STATUSES = (STATUS_OK, STATUS_RUNTIME_ERROR, STATUS_MEMORY_LIMIT)
+
+
+class JudgeWorkerError(Exception):
+    """
+    채점 워커가 비정상 종료되었거나 응답하지 않을 때 발생하는 예외.
+    """
+
+
+class JudgeWorker:
+    """
+    미리 띄워 둔 채점 워커 프로세스 하나를 감싸는 클래스.
+
+    워커는 judge_worker.py를 실행하는 파이썬 인터프리터이며, 파이프로 채점 요청을 받아
+    요청마다 fork한 자식 프로세스에서 제출 코드를 실행합니다. 제출 코드가 워커의 메모리를 읽을 수
+    있으므로 예상 출력은 워커에 보내지 않고, 워커가 흘려보내는 출력을 이 프로세스에서 비교합니다.
+
+    Attributes:
+        process (Popen): 워커 프로세스.
+        runs (int): 이 워커가 처리한 실행 횟수.
+    """
+
+    def __init__(self, executable="python3"):
+        self.process = subprocess.Popen(
+            [executable, "-u", str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd="/",
+            close_fds=True,
+        )
+        self.runs = 0
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    def run(self, code, input_data, time_limit, memory_limit, compare=None, **options):
+        """
+        워커에 코드를 보내 실행하고 결과를 반환합니다.
+
+        compare가 주어지면 워커가 output 프레임으로 흘려보내는 표준 출력을 받는 대로 예상 출력과
+        비교하고, 불일치가 확인되면 stop 프레임을 보내 실행을 중단시킵니다.
+
+        Args:
+            code (str): 실행할 코드.
+            input_data (str): 코드에 제공할 입력 데이터.
+            time_limit (float): 실행 제한 시간 (초 단위).
+            memory_limit (int): 메모리 제한 (MB 단위).
+            compare (dict, optional): create_comparator에 넘길 출력 비교 조건. 워커에는 보내지 않습니다.
+            **options: 요청에 함께 보낼 output_limit, capture_limit, file_size, input_path.
+
+        Returns:
+            dict: status, stdout, stderr, exit_code와 matched(예상 출력 일치 여부)를 담은 실행 결과.
+
+        Raises:
+            JudgeWorkerError: 워커가 응답하지 않거나 종료된 경우 발생합니다.
+        """
+        body = json.dumps(
+            {
+                "code": code,
+                "input": input_data or "",
+                "time_limit": time_limit,
+                "memory_limit": memory_limit,
+                **options,
+            }
+        ).encode("utf-8")
+        with open_comparator(compare) as comparator:
+            response, mismatched = self.exchange(body, time_limit, comparator)
+            self.runs += 1
+            if comparator is None:
+                response["matched"] = None
+            elif mismatched:
+                # 중단 요청이 닿기 전에 실행이 끝났으면 상태는 ok로 남고 matched로 오답을 알립니다.
+                response["matched"] = False
+            elif response["status"] in FINISHED_STATUSES:
+                response["matched"] = comparator.finish()
+            else:
+                response["matched"] = None
+        return response
+
+    def exchange(self, body, time_limit, comparator):
+        """
+        요청을 보내고 결과 프레임을 받을 때까지 output 프레임을 비교기에 넘깁니다.
+
+        Args:
+            body (bytes): 요청 프레임 본문.
+            time_limit (float): 실행 제한 시간 (초 단위).
+            comparator (optional): 출력 비교기. None이면 output 프레임을 버립니다.
+
+        Returns:
+            tuple: (결과 프레임, 불일치로 실행을 중단시켰는지 여부).
+
+        Raises:
+            JudgeWorkerError: 워커가 응답하지 않거나 종료된 경우 발생합니다.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        mismatched = False
+        timer = threading.Timer(time_limit + RESPONSE_GRACE_SECONDS, self.kill)
+        timer.start()
+        try:
+            self.send(body)
+            while True:
+                response = self.receive()
+                if "output" not in response:
+                    break
+                if comparator is None or mismatched:
+                    continue
+                chunk = base64.b64decode(response["output"])
+                if not comparator.feed(decoder.decode(chunk)):
+                    mismatched = True
+                    self.send(json.dumps({"stop": STATUS_WRONG_ANSWER}).encode("utf-8"))
+        except (BrokenPipeError, ValueError) as e:
+            raise JudgeWorkerError(f"채점 워커와의 통신에 실패했습니다: {e}")
+        finally:
+            timer.cancel()
+        if comparator is not None and not mismatched:
+            comparator.feed(decoder.decode(b"", final=True))
+        return response, mismatched
+
+    def send(self, body):
+        self.process.stdin.write(HEADER.pack(len(body)) + body)
+        self.process.stdin.flush()
+
+    def receive(self):
+        header = self.process.stdout.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise JudgeWorkerError("채점 워커가 응답 없이 종료되었습니다.")
+        (length,) = HEADER.unpack(header)
+        return json.loads(self.process.stdout.read(length).decode("utf-8"))
+
+    def kill(self):
+        """
+        워커 프로세스를 종료합니다.
+        """
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class JudgeWorkerPool:
+    """
+    언어별로 미리 띄워 둔 채점 워커를 관리하는 풀.
+
+    인터프리터를 실행마다 새로 띄우지 않고 대기 중인 워커를 재사용하며,
+    워커가 max_runs 번 실행했거나 제한 위반(시간/메모리 초과)이 발생하면 새 워커로 교체합니다.
+
+    Attributes:
+        size (int): 유지할 워커 수.
+        max_runs (int): 워커 하나가 교체되기 전까지 처리할 최대 실행 횟수.
+    """
+
+    def __init__(self, size, max_runs, executable="python3"):
+        self.size = size
+        self.max_runs = max_runs
+        self.executable = executable
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(JudgeWorker(executable))
+
+    def run(self, code, input_data, time_limit, memory_limit, timeout=None, **options):
+        """
+        대기 중인 워커에서 코드를 실행하고 결과를 반환합니다.
+
+        모든 워커가 사용 중이면 워커가 반환될 때까지 기다립니다.
+
+        Args:
+            code (str): 실행할 코드.
+            input_data (str): 코드에 제공할 입력 데이터.
+            time_limit (float): 실행 제한 시간 (초 단위).
+            memory_limit (int): 메모리 제한 (MB 단위).
+            timeout (float, optional): 워커를 기다릴 최대 시간 (초 단위).
+            **options: JudgeWorker.run에 넘길 compare, output_limit, capture_limit, file_size,
+                input_path.
+
+        Returns:
+            dict: status, stdout, stderr, exit_code를 담은 실행 결과.
+
+        Raises:
+            JudgeWorkerError: 워커를 얻지 못했거나 워커가 비정상 종료된 경우 발생합니다.
+        """
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise JudgeWorkerError("사용 가능한 채점 워커가 없습니다.")
+
+        recycle = True
+        try:
+            if not worker.alive:
+                worker.kill()
+                worker = JudgeWorker(self.executable)
+            result = worker.run(code, input_data, time_limit, memory_limit, **options)
+            recycle = (
+                worker.runs >= self.max_runs or result["status"] in RECYCLE_STATUSES
+            )
+            return result
+        finally:
+            self._release(worker, recycle)
+
+    def _release(self, worker, recycle):
+        """
+        워커를 풀에 반환합니다. 교체 대상이면 종료하고 새 워커를 띄웁니다.
+        """
+        with self._lock:
+            closed = self._closed
+        if recycle or closed:
+            worker.kill()
+            if closed:
+                return
+            worker = JudgeWorker(self.executable)
+        self._idle.put(worker)
+
+    def close(self):
+        """
+        풀의 모든 대기 중인 워커를 종료합니다.
+        """
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                break
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(language):
+    """
+    현재 프로세스의 언어별 채점 워커 풀을 반환합니다. 처음 호출될 때 생성됩니다.
+
+    Args:
+        language (str): 프로그래밍 언어. 현재 'python'만 지원합니다.
+
+    Returns:
+        JudgeWorkerPool | None: 워커 풀. 풀을 사용할 수 없는 환경이면 None.
+    """
+    if language != "python" or os.name == "nt" or settings.JUDGE_WORKER_POOL_SIZE <= 0:
+        return None
+
+    with _pools_lock:
+        pool = _pools.get(language)
+        if pool is None:
+            pool = JudgeWorkerPool(
+                size=settings.JUDGE_WORKER_POOL_SIZE,
+                max_runs=settings.JUDGE_WORKER_MAX_RUNS,
+            )
+            _pools[language] = pool
+        return pool
+
+
+def close_worker_pools():
+    """
+    현재 프로세스의 모든 채점 워커 풀을 종료합니다.
+    """
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+atexit.register(close_worker_pools)
@@ -0,0 +1,287 @@
+"""
+채점 워커 프로세스의 실행 스크립트.
+
+judge_pool.JudgeWorker가 `python3 judge_worker.py`로 실행하는 독립 스크립트이며,
+Django를 임포트하지 않습니다. 인터프리터를 한 번만 띄워 둔 채로 표준 입력 파이프에서
+채점 요청을 읽고, 요청마다 fork한 자식 프로세스를 샌드박스(rlimit 또는 cgroup)에 넣은 뒤
+제출 코드를 실행하여 그 결과를 표준 출력 파이프로 돌려줍니다.
+
+제출 코드는 이 프로세스를 fork한 자식에서 실행되므로 이 프로세스의 메모리를 모두 볼 수
+있습니다. 그래서 예상 출력(내용, 파일 경로, 해시)은 워커에 보내지 않습니다. 워커는 자식의
+표준 출력을 조각마다 output 프레임으로 부모에게 흘려보내고, 부모(JudgeWorker)가 예상 출력과
+비교하다가 불일치를 발견하면 stop 프레임을 보내 실행을 중단시킵니다.
+
+요청/응답은 4바이트 길이(big-endian) 뒤에 UTF-8 JSON이 오는 프레임 형식입니다.
+"""
+
+import base64
+import json
+import os
+import struct
+import sys
+import time
+import traceback
+
+from sandbox import (
+    MEMORY_ERROR_EXIT_CODE,
+    STATUS_INTERNAL_ERROR,
+    SANDBOX_AUTO,
+    OutputSink,
+    build_result,
+    communicate,
+    create_sandbox,
+    open_input,
+    wait_for_exit,
+)
+
+# 제출 코드가 워커 디렉터리(missions 앱)의 모듈을 임포트하지 못하도록 경로에서 제거합니다.
+del sys.path[0]
+
+
+HEADER = struct.Struct(">I")
+
+# 요청(과 실행 중의 stop 프레임)을 읽는 파이프와 응답을 쓰는 파이프
+REQUEST_FD = 0
+RESPONSE_FD = 1
+
+# 제출 코드가 자주 사용하는 모듈을 미리 임포트해 두어 fork된 자식이 바로 사용하도록 합니다.
+PRELOAD_MODULES = (
+    "bisect",
+    "collections",
+    "functools",
+    "heapq",
+    "itertools",
+    "math",
+    "re",
+    "string",
+)
+
+
+def read_exact(fd, size):
+    """
+    파일 디스크립터에서 size 바이트를 읽습니다.
+
+    실행 중에 같은 파이프에서 stop 프레임을 읽으므로, 미리 읽어 두는 버퍼 없이 필요한 만큼만
+    읽습니다.
+
+    Args:
+        fd (int): 읽을 파일 디스크립터.
+        size (int): 읽을 바이트 수.
+
+    Returns:
+        bytes: 읽은 데이터. 파이프가 닫혔으면 size보다 짧을 수 있습니다.
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = os.read(fd, size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return bytes(data)
+
+
+def read_frame(fd):
+    """
+    파이프에서 프레임 하나를 읽어 딕셔너리로 반환합니다.
+
+    Args:
+        fd (int): 읽을 파일 디스크립터.
+
+    Returns:
+        dict | None: 요청 딕셔너리. 파이프가 닫혔으면 None.
+    """
+    header = read_exact(fd, HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    (length,) = HEADER.unpack(header)
+    return json.loads(read_exact(fd, length).decode("utf-8"))
+
+
+def write_frame(fd, payload):
+    """
+    딕셔너리를 프레임으로 직렬화하여 파이프에 씁니다.
+
+    Args:
+        fd (int): 쓸 파일 디스크립터.
+        payload (dict): 보낼 데이터.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    view = memoryview(HEADER.pack(len(body)) + body)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+class ForwardingSink(OutputSink):
+    """
+    자식 프로세스의 표준 출력을 output 프레임으로 부모에게 흘려보내는 OutputSink.
+
+    출력 크기 제한과 앞부분 보관은 워커에서 하고, 예상 출력과의 비교는 부모가 합니다.
+    부모가 불일치를 발견하면 요청 파이프로 보내는 stop 프레임을 control()에서 받아 실행을 중단합니다.
+    """
+
+    control_fd = REQUEST_FD
+
+    def feed(self, chunk):
+        stopped = super().feed(chunk)
+        if stopped is None:
+            write_frame(
+                RESPONSE_FD, {"output": base64.b64encode(chunk).decode("ascii")}
+            )
+        return stopped
+
+    def control(self):
+        frame = read_frame(REQUEST_FD)
+        if frame is None:  # 부모가 파이프를 닫은 경우
+            return STATUS_INTERNAL_ERROR
+        return frame.get("stop")
+
+
+def run_child(code, sandbox):
+    """
+    fork된 자식 프로세스에서 제출 코드를 실행합니다. 반환하지 않습니다.
+
+    Args:
+        code (str): 실행할 파이썬 코드.
+        sandbox (RlimitSandbox): 자식 프로세스에 적용할 샌드박스.
+    """
+    exit_code = 0
+    try:
+        sandbox.setup_child()
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+        exec(compile(code, "<submission>", "exec"), {"__name__": "__main__"})
+    except MemoryError:
+        traceback.print_exc()
+        exit_code = MEMORY_ERROR_EXIT_CODE
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            sys.stderr.write(f"{e.code}\n")
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except BaseException:
+            exit_code = exit_code or 1
+        os._exit(exit_code)
+
+
+def handle(request):
+    """
+    채점 요청 하나를 처리하고 응답 딕셔너리를 반환합니다.
+
+    Args:
+        request (dict): code, input(또는 input_path), time_limit, memory_limit과 선택적으로
+            output_limit, capture_limit, file_size, sandbox, processes, open_files, cgroup_root,
+            nice를 담은 요청.
+
+    Returns:
+        dict: status(ok, runtime_error, time_limit, memory_limit, output_limit, 부모가 중단시킨
+            경우 그 사유), stdout, stderr, exit_code와 측정한 wall_time, cpu_time, memory_kb를 담은 응답.
+    """
+    time_limit = float(request["time_limit"])
+    memory_limit = int(request["memory_limit"])
+    sink = ForwardingSink(request.get("output_limit"), request.get("capture_limit"))
+
+    stdin_r, stdin_w = os.pipe()
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+
+    limits = {
+        key: request[key]
+        for key in ("processes", "open_files", "nice")
+        if key in request
+    }
+    with create_sandbox(
+        request.get("sandbox", SANDBOX_AUTO),
+        request.get("cgroup_root"),
+        time_limit=time_limit,
+        memory_limit=memory_limit,
+        file_size=request.get("file_size"),
+        **limits,
+    ) as sandbox:
+        pid = os.fork()
+        if pid == 0:
+            os.dup2(stdin_r, 0)
+            os.dup2(stdout_w, 1)
+            os.dup2(stderr_w, 2)
+            for fd in (stdin_r, stdin_w, stdout_r, stdout_w, stderr_r, stderr_w):
+                os.close(fd)
+            run_child(request["code"], sandbox)
+
+        sandbox.attach(pid)
+        started = time.monotonic()
+        deadline = started + time_limit
+        for fd in (stdin_r, stdout_w, stderr_w):
+            os.close(fd)
+
+        try:
+            with open_input(
+                request.get("input"), request.get("input_path")
+            ) as input_buffer:
+                stderr, timed_out, stopped = communicate(
+                    sandbox,
+                    stdin_w,
+                    stdout_r,
+                    stderr_r,
+                    input_buffer,
+                    deadline,
+                    sink,
+                )
+        finally:
+            os.close(stdout_r)
+            os.close(stderr_r)
+        wait_status, rusage, reap_timed_out = wait_for_exit(sandbox, pid, deadline)
+        timed_out = timed_out or reap_timed_out
+        wall_time = time.monotonic() - started
+        oom_killed = sandbox.memory_exceeded()
+
+    return build_result(
+        sink,
+        stderr,
+        os.waitstatus_to_exitcode(wait_status),
+        timed_out,
+        stopped,
+        wall_time,
+        rusage,
+        time_limit,
+        memory_limit,
+        oom_killed,
+    )
+
+
+def main():
+    """
+    요청 프레임을 읽어 처리하는 루프를 실행합니다. 부모가 파이프를 닫으면 종료합니다.
+    """
+    for module in PRELOAD_MODULES:
+        __import__(module)
+
+    sys.stdout = sys.stderr  # 응답 파이프에 다른 출력이 섞이지 않도록 합니다.
+
+    while True:
+        request = read_frame(REQUEST_FD)
+        if request is None:
+            break
+        if "stop" in request:  # 실행이 이미 끝난 뒤 도착한 stop 프레임
+            continue
+        try:
+            response = handle(request)
+        except Exception as e:
+            response = {
+                "status": STATUS_INTERNAL_ERROR,
+                "stdout": "",
+                "stderr": f"{type(e).__name__}: {e}",
+                "exit_code": -1,
+            }
+        write_frame(RESPONSE_FD, response)
+
+
+if __name__ == "__main__":
+    main()
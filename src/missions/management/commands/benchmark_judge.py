@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from missions.judge_pool import JudgeWorkerPool
+from missions.services import PythonCodeJudge
+
+
+BENCHMARK_CODE = "a, b = map(int, input().split())\nprint(a + b)\n"
+BENCHMARK_INPUT = "1 2\n"
+
+
+class Command(BaseCommand):
+    """
+    실행마다 인터프리터를 띄우는 방식과 채점 워커 풀 방식의 처리량을 비교하는 명령어.
+    """
+
+    help = "파이썬 채점 처리량(subprocess 방식 vs 워커 풀)을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=200, help="모드별 실행 횟수")
+        parser.add_argument("--concurrency", type=int, default=2, help="동시 실행 수")
+        parser.add_argument(
+            "--time-limit", type=float, default=2, help="실행 제한 시간(초)"
+        )
+        parser.add_argument(
+            "--memory-limit", type=int, default=256, help="메모리 제한(MB)"
+        )
+
+    def handle(self, *args, **options):
+        runs = options["runs"]
+        concurrency = options["concurrency"]
+        limits = (options["time_limit"], options["memory_limit"])
+        judge = PythonCodeJudge()
+
+        def run_subprocess(_):
+            return judge.run_code_in_subprocess(
+                BENCHMARK_CODE, BENCHMARK_INPUT, *limits
+            )
+
+        pool = JudgeWorkerPool(size=concurrency, max_runs=runs)
+
+        def run_pool(_):
+            return pool.run(BENCHMARK_CODE, BENCHMARK_INPUT, *limits)["stdout"].strip()
+
+        try:
+            for name, func in (("subprocess", run_subprocess), ("pool", run_pool)):
+                elapsed, outputs = self._measure(func, runs, concurrency)
+                correct = sum(output == "3" for output in outputs)
+                self.stdout.write(
+                    f"{name:>10}: {runs / elapsed:8.1f} runs/s, "
+                    f"{elapsed / runs * 1000:7.2f} ms/run, {correct}/{runs} correct"
+                )
+        finally:
+            pool.close()
+
+    def _measure(self, func, runs, concurrency):
+        """
+        func를 runs번 동시 실행하고 (경과 시간, 결과 목록)을 반환합니다.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            outputs = list(executor.map(func, range(runs)))
+            return time.perf_counter() - start, outputs
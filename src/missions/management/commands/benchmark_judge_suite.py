@@ -0,0 +1,69 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.benchmark import CATEGORIES, compare_reports, run_benchmark, select_cases
+
+
+class Command(BaseCommand):
+    """
+    대표 제출 코드 묶음으로 채점 처리량, 지연 시간 백분위수, 판정 정확도를 측정하는 명령어.
+
+    결과는 JSON으로 출력하며, --baseline으로 이전 결과를 주면 판정이 틀렸거나 성능이
+    --max-regression 비율 넘게 떨어졌을 때 실패(종료 코드 1)합니다.
+    """
+
+    help = "채점 부하 테스트를 실행하고 결과를 JSON으로 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=10, help="케이스별 채점 횟수")
+        parser.add_argument("--concurrency", type=int, default=4, help="동시 채점 수")
+        parser.add_argument(
+            "--warmup", type=int, default=1, help="케이스별 예열 실행 횟수"
+        )
+        parser.add_argument(
+            "--language",
+            action="append",
+            choices=("python", "javascript"),
+            help="측정할 언어 (여러 번 지정 가능, 기본값: 모두)",
+        )
+        parser.add_argument(
+            "--category",
+            action="append",
+            choices=CATEGORIES,
+            help="측정할 케이스 분류 (여러 번 지정 가능, 기본값: 모두)",
+        )
+        parser.add_argument("--output", help="결과 JSON을 저장할 파일 경로")
+        parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일 경로")
+        parser.add_argument(
+            "--max-regression",
+            type=float,
+            default=0.2,
+            help="허용할 처리량/지연 시간 저하 비율",
+        )
+
+    def handle(self, *args, **options):
+        cases, skipped = select_cases(options["language"], options["category"])
+        if not cases:
+            raise CommandError("실행할 벤치마크 케이스가 없습니다.")
+
+        report = run_benchmark(
+            cases, options["runs"], options["concurrency"], options["warmup"]
+        )
+        report["skipped_languages"] = skipped
+
+        if options["baseline"]:
+            with open(options["baseline"], encoding="utf-8") as f:
+                baseline = json.load(f)
+            report["problems"] = compare_reports(
+                report, baseline, options["max_regression"]
+            )
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(output)
+        self.stdout.write(output)
+
+        if report.get("problems"):
+            raise CommandError("\n".join(report["problems"]))
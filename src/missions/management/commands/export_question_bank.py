@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.models import Mission
+from missions.question_bank import FORMATS, export_question_bank, guess_format
+
+
+class Command(BaseCommand):
+    """
+    미션의 문제 은행을 CSV, JSON, ZIP 파일로 내보내는 명령어.
+    """
+
+    help = "미션의 문제 은행을 파일로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("mission_id", type=int, help="내보낼 미션 ID")
+        parser.add_argument("path", help="저장할 파일 경로")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=FORMATS,
+            help="파일 형식 (기본값: 확장자로 판단, 알 수 없으면 json)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            mission = Mission.objects.get(pk=options["mission_id"])
+        except Mission.DoesNotExist:
+            raise CommandError(f"미션이 없습니다: {options['mission_id']}")
+        file_format = options["file_format"] or guess_format(options["path"]) or "json"
+
+        with open(options["path"], "wb") as f:
+            for chunk in export_question_bank(mission, file_format):
+                f.write(chunk)
+        self.stdout.write(self.style.SUCCESS(f"{options['path']}에 저장했습니다."))
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from missions.models import Mission
+from missions.question_bank import (
+    FORMATS,
+    QuestionBankError,
+    guess_format,
+    import_question_bank,
+)
+
+
+class Command(BaseCommand):
+    """
+    문제 은행 파일(CSV, JSON, ZIP)로 미션의 문제를 한 번에 추가하거나 수정하는 명령어.
+    """
+
+    help = "문제 은행 파일로 미션의 문제를 가져옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("mission_id", type=int, help="문제를 가져올 미션 ID")
+        parser.add_argument("path", help="문제 은행 파일 경로")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=FORMATS,
+            help="파일 형식 (기본값: 확장자로 판단)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            mission = Mission.objects.get(pk=options["mission_id"])
+        except Mission.DoesNotExist:
+            raise CommandError(f"미션이 없습니다: {options['mission_id']}")
+        file_format = options["file_format"] or guess_format(options["path"])
+        if file_format is None:
+            raise CommandError("--format으로 파일 형식을 지정해 주세요.")
+
+        try:
+            with open(options["path"], "rb") as f:
+                result = import_question_bank(mission, f, file_format)
+        except QuestionBankError as e:
+            details = "\n".join(
+                f"{error.get('row', '-')}: {error['errors']}" for error in e.errors
+            )
+            raise CommandError(f"{e}\n{details}" if details else str(e))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"문제 {result['created']}개를 추가하고 {result['updated']}개를 수정했습니다. "
+                f"(테스트 케이스 {result['test_cases']}개)"
+            )
+        )
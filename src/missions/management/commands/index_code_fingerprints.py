@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from missions.plagiarism import index_pending_fingerprints
+
+
+class Command(BaseCommand):
+    """
+    아직 색인하지 않은 코드 제출 기록의 표절 검사 지문을 모두 색인하는 명령어.
+
+    새 제출은 run_judge_worker가 대기열이 비어 있을 때 색인하므로, 기존 제출을 처음 색인하거나
+    워커 없이 색인할 때 사용합니다.
+    """
+
+    help = "코드 제출 기록의 표절 검사 지문을 색인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=100, help="한 번에 색인할 제출 기록 수"
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            indexed = index_pending_fingerprints(options["batch_size"])
+            if not indexed:
+                break
+            total += indexed
+        self.stdout.write(self.style.SUCCESS(f"{total}개의 제출 기록을 색인했습니다."))
@@ -0,0 +1,78 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max, Q
+
+from missions.models import (
+    CodeSubmissionRecord,
+    MissionResult,
+    MultipleChoiceSubmission,
+)
+from missions.results import get_code_mission_score, get_multiple_choice_score
+
+
+class Command(BaseCommand):
+    """
+    제출 기록으로 사용자별 미션 결과(MissionResult)를 다시 만드는 명령어.
+
+    미션 결과는 제출할 때마다 갱신되므로, 기존 제출 기록으로 처음 채우거나 결과가 어긋났을 때
+    사용합니다. 이전 제출들의 점수는 남아 있지 않으므로 최고 점수는 현재 제출 기록 기준 점수로
+    계산합니다. 5지선다형은 답안지(attempt_id) 하나와 문제별 제출 하나를 각각 제출 1회로 셉니다.
+    """
+
+    help = "제출 기록으로 사용자별 미션 결과를 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        results = []
+
+        multiple_choice = (
+            MultipleChoiceSubmission.objects.values("user_id", "question__mission_id")
+            .annotate(
+                last_submitted_at=Max("submitted_at"),
+                single=Count("id", filter=Q(attempt_id__isnull=True)),
+                sheets=Count("attempt_id", distinct=True),
+            )
+            .order_by()
+        )
+        for row in multiple_choice:
+            score = get_multiple_choice_score(
+                row["user_id"], row["question__mission_id"]
+            )
+            results.append(
+                MissionResult(
+                    user_id=row["user_id"],
+                    mission_id=row["question__mission_id"],
+                    best_score=score,
+                    attempts=row["single"] + row["sheets"],
+                    last_submitted_at=row["last_submitted_at"],
+                    passed=score >= settings.MISSION_PASS_SCORE,
+                )
+            )
+
+        code = (
+            CodeSubmissionRecord.objects.filter(status="done")
+            .values("user_id", "code_submission__mission_id")
+            .annotate(last_submitted_at=Max("submission_time"), attempts=Count("id"))
+            .order_by()
+        )
+        for row in code:
+            score = get_code_mission_score(
+                row["user_id"], row["code_submission__mission_id"]
+            )
+            results.append(
+                MissionResult(
+                    user_id=row["user_id"],
+                    mission_id=row["code_submission__mission_id"],
+                    best_score=score,
+                    attempts=row["attempts"],
+                    last_submitted_at=row["last_submitted_at"],
+                    passed=score >= 100,
+                )
+            )
+
+        with transaction.atomic():
+            MissionResult.objects.all().delete()
+            MissionResult.objects.bulk_create(results, batch_size=1000)
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(results)}개의 미션 결과를 만들었습니다.")
+        )
@@ -0,0 +1,87 @@
+import signal
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from missions.plagiarism import index_pending_fingerprints
+from missions.services import process_next_submission, requeue_stale_submissions
+
+
+class Command(BaseCommand):
+    """
+    채점 대기열(queued 상태의 CodeSubmissionRecord)을 처리하는 채점 워커 명령어.
+
+    여러 프로세스를 동시에 실행할 수 있으며, 각 워커는 SELECT ... FOR UPDATE SKIP LOCKED로
+    서로 다른 제출 기록을 가져갑니다. 대기열이 비어 있을 때는 새 제출 기록의 표절 검사 지문을
+    색인합니다. SIGTERM/SIGINT를 받으면 진행 중인 채점을 마치고 종료합니다.
+    """
+
+    help = "채점 대기열의 코드 제출을 채점합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="대기열이 비었을 때 확인 주기(초)",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=300,
+            help="이 시간(초) 이상 running 상태인 기록을 다시 대기열에 넣습니다.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기열이 빌 때까지 처리한 뒤 종료합니다.",
+        )
+
+    def handle(self, *args, **options):
+        self.running = True
+        previous_handlers = {
+            signum: signal.signal(signum, self._stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            processed = self._run(options)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+        self.stdout.write(self.style.SUCCESS(f"{processed}개의 제출을 채점했습니다."))
+
+    def _run(self, options):
+        """
+        종료 신호를 받거나 (--once일 때) 대기열이 빌 때까지 채점하고, 처리한 제출 수를 반환합니다.
+        """
+        stale_after = timedelta(seconds=options["stale_after"])
+        processed = 0
+        last_requeue = None
+
+        while self.running:
+            if (
+                last_requeue is None
+                or time.monotonic() - last_requeue >= stale_after.total_seconds()
+            ):
+                requeued = requeue_stale_submissions(stale_after)
+                if requeued:
+                    self.stdout.write(
+                        f"{requeued}개의 중단된 채점을 다시 대기열에 넣었습니다."
+                    )
+                last_requeue = time.monotonic()
+
+            close_old_connections()
+            if process_next_submission():
+                processed += 1
+                continue
+            if index_pending_fingerprints():
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["poll_interval"])
+        return processed
+
+    def _stop(self, signum, frame):
+        self.running = False
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="case_results",
+            field=models.JSONField(
+                blank=True, default=list, verbose_name="테스트 케이스별 결과"
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="memory_limit",
+            field=models.IntegerField(
+                blank=True, null=True, verbose_name="케이스별 메모리 제한(MB)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="time_limit",
+            field=models.IntegerField(
+                blank=True, null=True, verbose_name="케이스별 시간 제한(초)"
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0002_codesubmissionrecord_case_results_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="fail_fast",
+            field=models.BooleanField(
+                default=False, verbose_name="첫 실패 시 중단 여부"
+            ),
+        ),
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="finished_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="채점 완료 시간"
+            ),
+        ),
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="started_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="채점 시작 시간"
+            ),
+        ),
+        # 기존 제출 기록은 이미 동기 채점이 끝난 상태이므로 done으로 채운 뒤 기본값을 queued로 바꿉니다.
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "채점 대기"),
+                    ("running", "채점 중"),
+                    ("done", "채점 완료"),
+                    ("failed", "채점 실패"),
+                ],
+                default="done",
+                max_length=10,
+                verbose_name="채점 상태",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="codesubmissionrecord",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "채점 대기"),
+                    ("running", "채점 중"),
+                    ("done", "채점 완료"),
+                    ("failed", "채점 실패"),
+                ],
+                default="queued",
+                max_length=10,
+                verbose_name="채점 상태",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="codesubmissionrecord",
+            index=models.Index(
+                fields=["status", "id"], name="missions_co_status_66d282_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0003_codesubmissionrecord_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="codesubmission",
+            name="test_case_version",
+            field=models.PositiveIntegerField(
+                default=1, verbose_name="테스트 케이스 버전"
+            ),
+        ),
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="cache_hit",
+            field=models.BooleanField(default=False, verbose_name="캐시 재사용 여부"),
+        ),
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="cache_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                max_length=64,
+                verbose_name="채점 결과 캐시 키",
+            ),
+        ),
+    ]
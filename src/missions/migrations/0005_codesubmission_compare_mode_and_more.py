@@ -0,0 +1,32 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0004_codesubmission_test_case_version_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="codesubmission",
+            name="compare_mode",
+            field=models.CharField(
+                choices=[
+                    ("exact", "정확히 일치"),
+                    ("trim_trailing", "줄 끝 공백 무시"),
+                    ("token", "토큰 단위 비교"),
+                    ("float", "실수 오차 허용"),
+                ],
+                default="trim_trailing",
+                max_length=20,
+                verbose_name="출력 비교 방식",
+            ),
+        ),
+        migrations.AddField(
+            model_name="codesubmission",
+            name="float_tolerance",
+            field=models.FloatField(default=1e-06, verbose_name="실수 허용 오차"),
+        ),
+    ]
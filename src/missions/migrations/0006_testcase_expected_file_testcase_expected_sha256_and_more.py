@@ -0,0 +1,96 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:12
+
+import hashlib
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import migrations, models
+
+
+def move_large_payloads_to_storage(apps, schema_editor):
+    """
+    기존 테스트 케이스의 크기와 해시를 채우고, 인라인 한도를 넘는 입출력은 파일 저장소로 옮깁니다.
+    """
+    TestCase = apps.get_model("missions", "TestCase")
+    limit = settings.TEST_CASE_INLINE_LIMIT_KB * 1024
+    for test_case in TestCase.objects.iterator():
+        for text_field, file_field, size_field, hash_field in (
+            ("input_data", "input_file", "input_size", "input_sha256"),
+            ("expected_output", "expected_file", "expected_size", "expected_sha256"),
+        ):
+            data = getattr(test_case, text_field).encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()
+            setattr(test_case, size_field, len(data))
+            setattr(test_case, hash_field, digest)
+            if len(data) > limit:
+                getattr(test_case, file_field).save(
+                    f"{digest}.txt", ContentFile(data), save=False
+                )
+                setattr(test_case, text_field, "")
+        test_case.save()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0005_codesubmission_compare_mode_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="testcase",
+            name="expected_file",
+            field=models.FileField(
+                blank=True,
+                upload_to="missions/test_cases/",
+                verbose_name="예상 출력 파일",
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="expected_sha256",
+            field=models.CharField(
+                blank=True, max_length=64, verbose_name="예상 출력 해시"
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="expected_size",
+            field=models.PositiveBigIntegerField(
+                default=0, verbose_name="예상 출력 크기"
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="input_file",
+            field=models.FileField(
+                blank=True,
+                upload_to="missions/test_cases/",
+                verbose_name="입력 데이터 파일",
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="input_sha256",
+            field=models.CharField(
+                blank=True, max_length=64, verbose_name="입력 데이터 해시"
+            ),
+        ),
+        migrations.AddField(
+            model_name="testcase",
+            name="input_size",
+            field=models.PositiveBigIntegerField(
+                default=0, verbose_name="입력 데이터 크기"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="testcase",
+            name="expected_output",
+            field=models.TextField(blank=True, verbose_name="예상 출력"),
+        ),
+        migrations.AlterField(
+            model_name="testcase",
+            name="input_data",
+            field=models.TextField(blank=True, verbose_name="입력 데이터"),
+        ),
+        migrations.RunPython(move_large_payloads_to_storage, migrations.RunPython.noop),
+    ]
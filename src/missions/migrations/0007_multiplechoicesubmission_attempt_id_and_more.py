@@ -0,0 +1,27 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0006_testcase_expected_file_testcase_expected_sha256_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="multiplechoicesubmission",
+            name="attempt_id",
+            field=models.UUIDField(blank=True, null=True, verbose_name="응시 ID"),
+        ),
+        migrations.AddConstraint(
+            model_name="multiplechoicesubmission",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("attempt_id__isnull", False)),
+                fields=("user", "attempt_id", "question"),
+                name="unique_multiple_choice_attempt_answer",
+            ),
+        ),
+    ]
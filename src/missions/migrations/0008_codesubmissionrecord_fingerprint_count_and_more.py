@@ -0,0 +1,133 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0007_multiplechoicesubmission_attempt_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="fingerprint_count",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="표절 검사 지문 수"
+            ),
+        ),
+        migrations.CreateModel(
+            name="CodeFingerprint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hash", models.BigIntegerField(verbose_name="지문 해시")),
+                (
+                    "code_submission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fingerprints",
+                        to="missions.codesubmission",
+                        verbose_name="코드 제출 문제",
+                    ),
+                ),
+                (
+                    "record",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fingerprints",
+                        to="missions.codesubmissionrecord",
+                        verbose_name="제출 기록",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "코드 지문",
+                "verbose_name_plural": "코드 지문들",
+                "indexes": [
+                    models.Index(
+                        fields=["code_submission", "hash"],
+                        name="missions_co_code_su_a37f92_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("record", "hash"), name="unique_code_fingerprint"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SimilarityPair",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "shared_fingerprints",
+                    models.PositiveIntegerField(verbose_name="공유 지문 수"),
+                ),
+                ("similarity", models.FloatField(verbose_name="유사도")),
+                (
+                    "detected_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="검출 시간"),
+                ),
+                (
+                    "code_submission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="similarity_pairs",
+                        to="missions.codesubmission",
+                        verbose_name="코드 제출 문제",
+                    ),
+                ),
+                (
+                    "record_a",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="missions.codesubmissionrecord",
+                        verbose_name="제출 기록 A",
+                    ),
+                ),
+                (
+                    "record_b",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="missions.codesubmissionrecord",
+                        verbose_name="제출 기록 B",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "유사 제출 쌍",
+                "verbose_name_plural": "유사 제출 쌍들",
+                "indexes": [
+                    models.Index(
+                        fields=["code_submission", "similarity"],
+                        name="missions_si_code_su_74ec40_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("record_a", "record_b"), name="unique_similarity_pair"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0008_codesubmissionrecord_fingerprint_count_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MissionResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("best_score", models.FloatField(default=0, verbose_name="최고 점수")),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="제출 횟수"),
+                ),
+                (
+                    "last_submitted_at",
+                    models.DateTimeField(verbose_name="마지막 제출 시간"),
+                ),
+                (
+                    "passed",
+                    models.BooleanField(default=False, verbose_name="통과 여부"),
+                ),
+                (
+                    "mission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="results",
+                        to="missions.mission",
+                        verbose_name="미션",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="mission_results",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "미션 결과",
+                "verbose_name_plural": "미션 결과들",
+                "indexes": [
+                    models.Index(
+                        fields=["mission", "-best_score", "id"],
+                        name="missions_mi_mission_5ab021_idx",
+                    ),
+                    models.Index(
+                        fields=["user", "-last_submitted_at", "-id"],
+                        name="missions_mi_user_id_fc1c30_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "mission"), name="unique_mission_result"
+                    )
+                ],
+            },
+        ),
+    ]
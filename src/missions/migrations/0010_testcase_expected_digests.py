@@ -0,0 +1,36 @@
+# Generated by Django 5.1.1 on 2026-10-19 15:02
+
+from django.db import migrations, models
+
+from missions.comparator import normalized_digests
+
+
+def fill_expected_digests(apps, schema_editor):
+    """
+    기존 테스트 케이스의 예상 출력 정규형 해시를 채웁니다.
+    """
+    TestCase = apps.get_model("missions", "TestCase")
+    for test_case in TestCase.objects.iterator():
+        expected = test_case.expected_output
+        if not expected and test_case.expected_file:
+            with test_case.expected_file.open("rb") as f:
+                expected = f.read().decode("utf-8", errors="replace")
+        test_case.expected_digests = normalized_digests(expected)
+        test_case.save(update_fields=["expected_digests"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0009_missionresult"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="testcase",
+            name="expected_digests",
+            field=models.JSONField(
+                blank=True, default=dict, verbose_name="예상 출력 정규형 해시"
+            ),
+        ),
+        migrations.RunPython(fill_expected_digests, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.1 on 2026-10-19 13:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0010_testcase_expected_digests"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="codesubmissionrecord",
+            name="missions_co_status_66d282_idx",
+        ),
+        migrations.AddField(
+            model_name="codesubmissionrecord",
+            name="queue_round",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="공정 대기열 순번"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="codesubmissionrecord",
+            index=models.Index(
+                fields=["status", "queue_round", "id"],
+                name="missions_co_status_bf44ea_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+UNCACHEABLE_CASE_STATUSES = ("internal_error", "time_limit", "memory_limit")
+
+
+def clear_load_dependent_cache_keys(apps, schema_editor):
+    """
+    시간 초과/메모리 초과가 포함된 기존 채점 결과가 재사용되지 않도록 캐시 키를 지웁니다.
+    """
+    CodeSubmissionRecord = apps.get_model("missions", "CodeSubmissionRecord")
+    records = (
+        CodeSubmissionRecord.objects.exclude(cache_key="")
+        .only("case_results")
+        .iterator()
+    )
+    stale_ids = [
+        record.pk
+        for record in records
+        if any(
+            result.get("status") in UNCACHEABLE_CASE_STATUSES
+            for result in record.case_results or []
+        )
+    ]
+    CodeSubmissionRecord.objects.filter(pk__in=stale_ids).update(cache_key="")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("missions", "0011_codesubmissionrecord_queue_round"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            clear_load_dependent_cache_keys, migrations.RunPython.noop
+        ),
+    ]
@@ -1,8 +1,13 @@
+import hashlib
+
+from django.core.files.base import ContentFile
 from django.db import models
 from django.conf import settings
 
 from courses.models import MinorCategory
 
+from .comparator import normalized_digests
+
 
 class Mission(models.Model):
     """
@@ -99,9 +104,19 @@ class CodeSubmission(models.Model):
         time_limit (int): 시간 제한(초).
         memory_limit (int): 메모리 제한(MB).
         language (str): 프로그래밍 언어.
+        compare_mode (str): 출력 비교 방식 (exact, trim_trailing, token, float).
+        float_tolerance (float): float 비교 방식의 허용 오차.
+        test_case_version (int): 테스트 케이스 구성 버전. 테스트 케이스나 입출력 예시가
+            바뀔 때마다 증가하며, 채점 결과 캐시 키에 포함됩니다.
     """
 
     LANGUAGE_CHOICES = [("python", "Python"), ("javascript", "JavaScript")]
+    COMPARE_MODE_CHOICES = [
+        ("exact", "정확히 일치"),
+        ("trim_trailing", "줄 끝 공백 무시"),
+        ("token", "토큰 단위 비교"),
+        ("float", "실수 오차 허용"),
+    ]
 
     mission = models.ForeignKey(
         Mission,
@@ -117,6 +132,16 @@ class CodeSubmission(models.Model):
     language = models.CharField(
         max_length=20, choices=LANGUAGE_CHOICES, verbose_name="프로그래밍 언어"
     )
+    compare_mode = models.CharField(
+        max_length=20,
+        choices=COMPARE_MODE_CHOICES,
+        default="trim_trailing",
+        verbose_name="출력 비교 방식",
+    )
+    float_tolerance = models.FloatField(default=1e-6, verbose_name="실수 허용 오차")
+    test_case_version = models.PositiveIntegerField(
+        default=1, verbose_name="테스트 케이스 버전"
+    )
 
     class Meta:
         verbose_name = "코드 제출형 문제"
@@ -131,30 +156,148 @@ class TestCase(models.Model):
     테스트 케이스 모델
 
     코드 제출형 문제에 대한 테스트 케이스를 저장합니다.
+    입출력 데이터가 TEST_CASE_INLINE_LIMIT_KB보다 크면 저장할 때 파일 저장소로 옮기고,
+    행에는 크기와 해시만 남깁니다. 예상 출력은 비교 모드별 정규형 해시도 함께 기록하여,
+    채점할 때 예상 출력 전체를 읽지 않고 해시로 비교할 수 있게 합니다.
 
     Attributes:
         code_submission (ForeignKey): 코드 제출 문제와의 관계.
-        input_data (str): 입력 데이터.
-        expected_output (str): 예상 출력 데이터.
+        input_data (str): 입력 데이터. 파일 저장소로 옮겨졌으면 빈 문자열.
+        expected_output (str): 예상 출력 데이터. 파일 저장소로 옮겨졌으면 빈 문자열.
+        input_file (FileField): 파일 저장소에 저장된 입력 데이터.
+        expected_file (FileField): 파일 저장소에 저장된 예상 출력 데이터.
+        input_size (int): 입력 데이터 크기(바이트).
+        expected_size (int): 예상 출력 데이터 크기(바이트).
+        input_sha256 (str): 입력 데이터의 SHA-256 해시.
+        expected_sha256 (str): 예상 출력 데이터의 SHA-256 해시.
+        expected_digests (dict): 예상 출력의 비교 모드별 [정규형 SHA-256 해시, 정규형 길이].
         is_sample (bool): 샘플 테스트 여부.
+        time_limit (int): 케이스별 시간 제한(초). 비어 있으면 문제의 제한을 사용합니다.
+        memory_limit (int): 케이스별 메모리 제한(MB). 비어 있으면 문제의 제한을 사용합니다.
     """
 
+    # (인라인 텍스트 필드, 파일 필드, 크기 필드, 해시 필드)
+    PAYLOAD_FIELDS = (
+        ("input_data", "input_file", "input_size", "input_sha256"),
+        ("expected_output", "expected_file", "expected_size", "expected_sha256"),
+    )
+
     code_submission = models.ForeignKey(
         CodeSubmission,
         on_delete=models.CASCADE,
         related_name="test_cases",
         verbose_name="코드 제출 문제",
     )
-    input_data = models.TextField(verbose_name="입력 데이터")
-    expected_output = models.TextField(verbose_name="예상 출력")
+    input_data = models.TextField(blank=True, verbose_name="입력 데이터")
+    expected_output = models.TextField(blank=True, verbose_name="예상 출력")
+    input_file = models.FileField(
+        upload_to="missions/test_cases/", blank=True, verbose_name="입력 데이터 파일"
+    )
+    expected_file = models.FileField(
+        upload_to="missions/test_cases/", blank=True, verbose_name="예상 출력 파일"
+    )
+    input_size = models.PositiveBigIntegerField(
+        default=0, verbose_name="입력 데이터 크기"
+    )
+    expected_size = models.PositiveBigIntegerField(
+        default=0, verbose_name="예상 출력 크기"
+    )
+    input_sha256 = models.CharField(
+        max_length=64, blank=True, verbose_name="입력 데이터 해시"
+    )
+    expected_sha256 = models.CharField(
+        max_length=64, blank=True, verbose_name="예상 출력 해시"
+    )
+    expected_digests = models.JSONField(
+        default=dict, blank=True, verbose_name="예상 출력 정규형 해시"
+    )
     is_sample = models.BooleanField(default=False, verbose_name="샘플 테스트 여부")
+    time_limit = models.IntegerField(
+        null=True, blank=True, verbose_name="케이스별 시간 제한(초)"
+    )
+    memory_limit = models.IntegerField(
+        null=True, blank=True, verbose_name="케이스별 메모리 제한(MB)"
+    )
 
     class Meta:
         verbose_name = "테스트 케이스"
         verbose_name_plural = "테스트 케이스들"
 
     def __str__(self):
-        return f"입력: {self.input_data} / 예상 출력: {self.expected_output}"
+        return f"입력: {self.input_size}바이트 / 예상 출력: {self.expected_size}바이트"
+
+    def save(self, *args, **kwargs):
+        """
+        입출력 데이터의 크기와 해시를 기록하고, 인라인 한도를 넘는 데이터는 파일 저장소로 옮깁니다.
+        """
+        update_fields = kwargs.get("update_fields")
+        changed = self.store_payloads(update_fields)
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *changed}
+        super().save(*args, **kwargs)
+
+    def store_payloads(self, update_fields=None):
+        """
+        입출력 데이터의 크기와 해시(예상 출력은 정규형 해시 포함)를 계산하고, 인라인 한도를 넘는
+        데이터는 파일 저장소에 씁니다.
+
+        save()를 거치지 않는 bulk_create/bulk_update 전에도 호출합니다.
+
+        Args:
+            update_fields (Iterable[str], optional): 저장 대상 필드 목록. 주어지면 이 목록에 있는
+                입출력 필드만 처리합니다.
+
+        Returns:
+            list: 값이 바뀐 파일, 크기, 해시 필드 이름 목록.
+        """
+        changed = []
+        for text_field, file_field, size_field, hash_field in self.PAYLOAD_FIELDS:
+            if update_fields is not None and text_field not in update_fields:
+                continue
+            text = getattr(self, text_field)
+            stored = getattr(self, file_field)
+            if not text and stored:  # 이미 파일 저장소에 있는 데이터
+                continue
+
+            data = text.encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()
+            setattr(self, size_field, len(data))
+            setattr(self, hash_field, digest)
+            if text_field == "expected_output":
+                self.expected_digests = normalized_digests(text)
+                changed.append("expected_digests")
+            if stored:
+                stored.delete(save=False)
+            if len(data) > settings.TEST_CASE_INLINE_LIMIT_KB * 1024:
+                stored.save(f"{digest}.txt", ContentFile(data), save=False)
+                setattr(self, text_field, "")
+            changed.extend((file_field, size_field, hash_field))
+        return changed
+
+    def read_input(self):
+        """
+        입력 데이터를 문자열로 반환합니다. 파일 저장소에 있으면 파일에서 읽습니다.
+
+        Returns:
+            str: 입력 데이터.
+        """
+        return self._read_payload(self.input_data, self.input_file)
+
+    def read_expected_output(self):
+        """
+        예상 출력 데이터를 문자열로 반환합니다. 파일 저장소에 있으면 파일에서 읽습니다.
+
+        Returns:
+            str: 예상 출력 데이터.
+        """
+        return self._read_payload(self.expected_output, self.expected_file)
+
+    @staticmethod
+    def _read_payload(text, stored):
+        if not stored:
+            return text
+        with stored.open("rb") as f:
+            return f.read().decode("utf-8", errors="replace")
 
 
 class MultipleChoiceSubmission(models.Model):
@@ -169,6 +312,7 @@ class MultipleChoiceSubmission(models.Model):
         selected_option (int): 선택한 답안.
         is_correct (bool): 정답 여부.
         submitted_at (datetime): 제출 시간.
+        attempt_id (UUID): 답안지 단위로 제출한 경우의 응시 ID.
     """
 
     user = models.ForeignKey(
@@ -189,10 +333,19 @@ class MultipleChoiceSubmission(models.Model):
     )
     is_correct = models.BooleanField(verbose_name="정답 여부")
     submitted_at = models.DateTimeField(auto_now_add=True, verbose_name="제출 시간")
+    attempt_id = models.UUIDField(null=True, blank=True, verbose_name="응시 ID")
 
     class Meta:
         verbose_name = "5지선다형 제출 기록"
         verbose_name_plural = "5지선다형 제출 기록들"
+        constraints = [
+            # 같은 응시에서 한 문제의 답안은 한 번만 저장합니다.
+            models.UniqueConstraint(
+                fields=["user", "attempt_id", "question"],
+                condition=models.Q(attempt_id__isnull=False),
+                name="unique_multiple_choice_attempt_answer",
+            )
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.question.question}"
@@ -210,12 +363,29 @@ class CodeSubmissionRecord(models.Model):
         submitted_code (str): 제출된 코드.
         submission_time (datetime): 제출 시간.
         test_results (str): 테스트 결과.
+        case_results (list): 테스트 케이스별 채점 결과.
+        status (str): 채점 상태 (queued, running, done, failed).
+        queue_round (int): 공정 대기열 순번. 제출할 때 같은 사용자의 대기 중인 제출 수로 정하며,
+            채점 워커는 순번이 낮은 제출부터 가져가므로 여러 사용자의 제출이 번갈아 채점됩니다.
+        fail_fast (bool): 첫 실패 이후 남은 테스트 케이스를 건너뛸지 여부.
+        started_at (datetime): 채점 시작 시간.
+        finished_at (datetime): 채점 완료 시간.
         result_summary (str): 결과 요약.
         is_passed (bool): 통과 여부.
         execution_time (float): 실행 시간(초).
         memory_usage (int): 메모리 사용량(KB).
+        cache_key (str): 채점 결과 캐시 키 (정규화한 코드, 언어, 테스트 케이스 버전, 제한의 해시).
+        cache_hit (bool): 이전 채점 결과를 재사용했는지 여부.
+        fingerprint_count (int): 표절 검사 지문 수. 아직 색인하지 않았으면 None.
     """
 
+    STATUS_CHOICES = [
+        ("queued", "채점 대기"),
+        ("running", "채점 중"),
+        ("done", "채점 완료"),
+        ("failed", "채점 실패"),
+    ]
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -231,6 +401,9 @@ class CodeSubmissionRecord(models.Model):
     submitted_code = models.TextField(verbose_name="제출된 코드")
     submission_time = models.DateTimeField(auto_now_add=True, verbose_name="제출 시간")
     test_results = models.TextField(blank=True, verbose_name="테스트 결과")
+    case_results = models.JSONField(
+        default=list, blank=True, verbose_name="테스트 케이스별 결과"
+    )
     result_summary = models.CharField(
         max_length=255, blank=True, verbose_name="결과 요약"
     )
@@ -241,10 +414,178 @@ class CodeSubmissionRecord(models.Model):
     memory_usage = models.IntegerField(
         null=True, blank=True, verbose_name="메모리 사용량(KB)"
     )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default="queued",
+        verbose_name="채점 상태",
+    )
+    queue_round = models.PositiveIntegerField(
+        default=0, verbose_name="공정 대기열 순번"
+    )
+    fail_fast = models.BooleanField(default=False, verbose_name="첫 실패 시 중단 여부")
+    started_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="채점 시작 시간"
+    )
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="채점 완료 시간"
+    )
+    cache_key = models.CharField(
+        max_length=64, blank=True, db_index=True, verbose_name="채점 결과 캐시 키"
+    )
+    cache_hit = models.BooleanField(default=False, verbose_name="캐시 재사용 여부")
+    fingerprint_count = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name="표절 검사 지문 수"
+    )
 
     class Meta:
         verbose_name = "코드 제출 기록"
         verbose_name_plural = "코드 제출 기록들"
+        indexes = [models.Index(fields=["status", "queue_round", "id"])]
 
     def __str__(self):
         return f"{self.user.username} - {self.code_submission.problem_statement}"
+
+
+class CodeFingerprint(models.Model):
+    """
+    코드 제출 기록의 winnowing 지문 역색인 모델
+
+    같은 문제에서 지문 해시로 제출 기록을 찾을 수 있도록 (문제, 해시)로 색인합니다.
+
+    Attributes:
+        record (ForeignKey): 지문을 가진 제출 기록.
+        code_submission (ForeignKey): 제출 기록의 코드 제출형 문제.
+        hash (int): 지문 해시.
+    """
+
+    record = models.ForeignKey(
+        CodeSubmissionRecord,
+        on_delete=models.CASCADE,
+        related_name="fingerprints",
+        verbose_name="제출 기록",
+    )
+    code_submission = models.ForeignKey(
+        CodeSubmission,
+        on_delete=models.CASCADE,
+        related_name="fingerprints",
+        verbose_name="코드 제출 문제",
+    )
+    hash = models.BigIntegerField(verbose_name="지문 해시")
+
+    class Meta:
+        verbose_name = "코드 지문"
+        verbose_name_plural = "코드 지문들"
+        indexes = [models.Index(fields=["code_submission", "hash"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["record", "hash"], name="unique_code_fingerprint"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.record_id} - {self.hash}"
+
+
+class SimilarityPair(models.Model):
+    """
+    유사도가 높은 코드 제출 기록 쌍 모델
+
+    같은 문제에 대한 서로 다른 사용자의 제출 중 유사도가 기준 이상인 쌍을 저장합니다.
+    record_a는 항상 record_b보다 ID가 작습니다.
+
+    Attributes:
+        code_submission (ForeignKey): 코드 제출형 문제.
+        record_a (ForeignKey): ID가 작은 제출 기록.
+        record_b (ForeignKey): ID가 큰 제출 기록.
+        shared_fingerprints (int): 공유 지문 수.
+        similarity (float): Jaccard 유사도 (0~1).
+        detected_at (datetime): 검출 시간.
+    """
+
+    code_submission = models.ForeignKey(
+        CodeSubmission,
+        on_delete=models.CASCADE,
+        related_name="similarity_pairs",
+        verbose_name="코드 제출 문제",
+    )
+    record_a = models.ForeignKey(
+        CodeSubmissionRecord,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="제출 기록 A",
+    )
+    record_b = models.ForeignKey(
+        CodeSubmissionRecord,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="제출 기록 B",
+    )
+    shared_fingerprints = models.PositiveIntegerField(verbose_name="공유 지문 수")
+    similarity = models.FloatField(verbose_name="유사도")
+    detected_at = models.DateTimeField(auto_now_add=True, verbose_name="검출 시간")
+
+    class Meta:
+        verbose_name = "유사 제출 쌍"
+        verbose_name_plural = "유사 제출 쌍들"
+        indexes = [models.Index(fields=["code_submission", "similarity"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["record_a", "record_b"], name="unique_similarity_pair"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.record_a_id} - {self.record_b_id} ({self.similarity:.2f})"
+
+
+class MissionResult(models.Model):
+    """
+    사용자별 미션 결과 모델
+
+    5지선다형 답안이나 코드가 제출될 때마다 갱신되는 사용자별 미션 결과 요약입니다.
+    점수판과 내 결과 조회는 제출 기록 대신 이 테이블을 읽습니다.
+
+    Attributes:
+        user (ForeignKey): 사용자.
+        mission (ForeignKey): 미션.
+        best_score (float): 최고 점수 (0~100).
+        attempts (int): 제출 횟수.
+        last_submitted_at (datetime): 마지막 제출 시간.
+        passed (bool): 통과 여부.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="mission_results",
+        verbose_name="사용자",
+    )
+    mission = models.ForeignKey(
+        Mission,
+        on_delete=models.CASCADE,
+        related_name="results",
+        verbose_name="미션",
+    )
+    best_score = models.FloatField(default=0, verbose_name="최고 점수")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="제출 횟수")
+    last_submitted_at = models.DateTimeField(verbose_name="마지막 제출 시간")
+    passed = models.BooleanField(default=False, verbose_name="통과 여부")
+
+    class Meta:
+        verbose_name = "미션 결과"
+        verbose_name_plural = "미션 결과들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "mission"], name="unique_mission_result"
+            )
+        ]
+        indexes = [
+            # 점수판: 미션별 최고 점수 순
+            models.Index(fields=["mission", "-best_score", "id"]),
+            # 내 결과: 최근 제출 순
+            models.Index(fields=["user", "-last_submitted_at", "-id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.mission.title} ({self.best_score})"
@@ -0,0 +1,118 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    정렬 키 기반(keyset) 페이지네이션 클래스.
+
+    OFFSET 대신 이전 페이지 마지막 행의 정렬 값보다 뒤에 있는 행을 조회하므로, 몇 번째 페이지든
+    인덱스를 따라 page_size개만 읽습니다. 정렬은 뷰의 keyset_ordering을 따르며, 행을 유일하게
+    구분할 수 있도록 마지막 정렬 필드는 "id" 또는 "-id"여야 합니다.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        커서 다음 위치부터 한 페이지 분량의 객체를 반환합니다.
+
+        Args:
+            queryset (QuerySet): 페이지네이션할 쿼리셋.
+            request (Request): HTTP 요청 객체.
+            view (APIView): keyset_ordering 속성을 가진 뷰.
+
+        Returns:
+            list: 현재 페이지의 객체 목록.
+
+        Raises:
+            NotFound: 커서 형식이 잘못된 경우 발생.
+        """
+        self.request = request
+        self.ordering = view.keyset_ordering
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self.after(cursor))
+
+        page_size = self.get_page_size(request)
+        page = list(queryset[: page_size + 1])
+        self.next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            self.next_cursor = self.encode_cursor(page[-1])
+        return page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def after(self, values):
+        """
+        정렬 순서에서 values보다 뒤에 있는 행을 고르는 조건을 만듭니다.
+
+        (a, b, id) 순 정렬이면 a 뒤 OR (a 같고 b 뒤) OR (a, b 같고 id 뒤) 조건이 됩니다.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def encode_cursor(self, obj):
+        values = []
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip("-"))
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,388 @@
+"""
+제출 코드 표절 검사를 위한 토큰화와 winnowing 지문(fingerprint) 계산.
+
+코드를 토큰으로 나눈 뒤 식별자, 숫자, 문자열을 하나의 기호로 바꿔 변수 이름 변경이나 값 변경에
+영향을 받지 않도록 합니다. 연속한 k개 토큰(k-gram)의 해시 중 window 크기 구간마다 최솟값만
+골라(winnowing) 지문으로 사용하므로, 두 코드가 window + k - 1개 이상의 토큰을 연속으로 공유하면
+반드시 같은 지문을 하나 이상 가집니다.
+
+제출 기록의 지문은 CodeFingerprint 역색인에 저장하고, 지문을 많이 공유하는 제출 쌍을
+SimilarityPair로 기록합니다.
+
+참고: Schleimer, Wilkerson, Aiken. "Winnowing: Local Algorithms for Document Fingerprinting" (2003).
+"""
+
+import hashlib
+import keyword
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+
+from .models import (
+    CodeFingerprint,
+    CodeSubmission,
+    CodeSubmissionRecord,
+    SimilarityPair,
+)
+
+
+KGRAM_SIZE = 5
+WINNOW_WINDOW = 4
+
+# 역색인을 조회할 때 한 쿼리에 넘기는 지문 수 (DB 쿼리 파라미터 수 제한)
+FINGERPRINT_QUERY_CHUNK = 500
+# 색인된 제출이 이 수 이상이면, 절반이 넘는 제출에 나타나는 지문은 공통 코드로 보고 무시합니다.
+COMMON_FINGERPRINT_MIN_RECORDS = 10
+COMMON_FINGERPRINT_RATIO = 0.5
+
+PYTHON_KEYWORDS = frozenset(keyword.kwlist)
+JAVASCRIPT_KEYWORDS = frozenset(
+    (
+        "async await break case catch class const continue debugger default delete do "
+        "else export extends false finally for function if import in instanceof let new "
+        "null of return static super switch this throw true try typeof undefined var "
+        "void while with yield"
+    ).split()
+)
+
+PYTHON_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<comment>\#[^\n]*)
+    |(?P<string>[rRbBuUfF]{0,2}(?:'''[\s\S]*?'''|\"\"\"[\s\S]*?\"\"\"
+        |'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"))
+    |(?P<number>\d[\w.]*)
+    |(?P<name>[A-Za-z_]\w*)
+    |(?P<operator>\S)
+    """,
+    re.VERBOSE,
+)
+
+JAVASCRIPT_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+    |(?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)
+    |(?P<number>\d[\w.]*)
+    |(?P<name>[A-Za-z_$][\w$]*)
+    |(?P<operator>\S)
+    """,
+    re.VERBOSE,
+)
+
+LANGUAGE_SYNTAX = {
+    "python": (PYTHON_TOKEN_PATTERN, PYTHON_KEYWORDS),
+    "javascript": (JAVASCRIPT_TOKEN_PATTERN, JAVASCRIPT_KEYWORDS),
+}
+
+
+def tokenize_code(code, language):
+    """
+    코드를 정규화된 토큰 목록으로 변환합니다.
+
+    주석은 버리고, 예약어와 연산자는 그대로 두며, 식별자는 "v", 숫자는 "0", 문자열은 '"'로
+    바꿉니다. 문법 오류가 있는 코드도 토큰화할 수 있도록 정규식으로 나눕니다.
+
+    Args:
+        code (str): 제출된 코드.
+        language (str): 코드 언어 (python, javascript).
+
+    Returns:
+        list: 정규화된 토큰 목록.
+
+    Raises:
+        ValueError: 지원하지 않는 언어인 경우 발생.
+    """
+    try:
+        pattern, keywords = LANGUAGE_SYNTAX[language]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 언어입니다: {language}")
+
+    tokens = []
+    for match in pattern.finditer(code):
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        if kind == "string":
+            tokens.append('"')
+        elif kind == "number":
+            tokens.append("0")
+        elif kind == "name":
+            text = match.group()
+            tokens.append(text if text in keywords else "v")
+        else:
+            tokens.append(match.group())
+    return tokens
+
+
+def hash_kgram(tokens):
+    """
+    k-gram을 DB의 BigIntegerField에 저장할 수 있는 부호 있는 64비트 정수로 해시합니다.
+
+    Args:
+        tokens (Sequence[str]): k-gram 토큰.
+
+    Returns:
+        int: 해시값.
+    """
+    digest = hashlib.blake2b("\x00".join(tokens).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def winnow(hashes, window=WINNOW_WINDOW):
+    """
+    k-gram 해시 목록에서 window 구간마다 최솟값(같으면 가장 오른쪽)을 골라 지문으로 반환합니다.
+
+    Args:
+        hashes (Sequence[int]): k-gram 해시 목록.
+        window (int): winnowing 구간 크기.
+
+    Returns:
+        set: 선택된 지문 해시 집합.
+    """
+    if len(hashes) <= window:
+        return {min(hashes)} if hashes else set()
+
+    fingerprints = set()
+    selected = None
+    for start in range(len(hashes) - window + 1):
+        position = start
+        for index in range(start + 1, start + window):
+            if hashes[index] <= hashes[position]:
+                position = index
+        if position != selected:
+            fingerprints.add(hashes[position])
+            selected = position
+    return fingerprints
+
+
+def fingerprint_code(code, language, kgram_size=KGRAM_SIZE, window=WINNOW_WINDOW):
+    """
+    코드의 winnowing 지문 집합을 계산합니다.
+
+    Args:
+        code (str): 제출된 코드.
+        language (str): 코드 언어.
+        kgram_size (int): k-gram 토큰 수.
+        window (int): winnowing 구간 크기.
+
+    Returns:
+        set: 지문 해시 집합. 토큰이 kgram_size보다 적으면 빈 집합.
+    """
+    tokens = tokenize_code(code, language)
+    hashes = [
+        hash_kgram(tokens[start : start + kgram_size])
+        for start in range(len(tokens) - kgram_size + 1)
+    ]
+    return winnow(hashes, window)
+
+
+def jaccard_similarity(shared, size_a, size_b):
+    """
+    공유 지문 수와 각 지문 집합 크기로 Jaccard 유사도를 계산합니다.
+
+    Args:
+        shared (int): 공유 지문 수.
+        size_a (int): 첫 번째 지문 집합 크기.
+        size_b (int): 두 번째 지문 집합 크기.
+
+    Returns:
+        float: 0 이상 1 이하의 유사도.
+    """
+    union = size_a + size_b - shared
+    return shared / union if union else 0.0
+
+
+def find_similar_records(record: CodeSubmissionRecord, hashes: set) -> list:
+    """
+    역색인에서 지문을 공유하는 같은 문제의 다른 사용자 제출을 찾아 유사 제출 쌍을 만듭니다.
+
+    지문별로 색인을 조회하므로 비용은 전체 제출 수가 아니라 공유 지문 수에 비례합니다.
+    많은 제출에 공통으로 나타나는 지문(입력 처리 등 뼈대 코드)은 유사도 계산에서 제외합니다.
+
+    Args:
+        record (CodeSubmissionRecord): 새로 색인한 제출 기록.
+        hashes (set): 제출 기록의 지문 해시 집합.
+
+    Returns:
+        list: 유사도가 PLAGIARISM_SIMILARITY_THRESHOLD 이상인 SimilarityPair 목록 (저장 전).
+    """
+    code_submission_id = record.code_submission_id
+    index = CodeFingerprint.objects.filter(
+        code_submission_id=code_submission_id
+    ).exclude(record_id=record.pk)
+    indexed = CodeSubmissionRecord.objects.filter(
+        code_submission_id=code_submission_id, fingerprint_count__gt=0
+    ).count()
+    common_limit = (
+        indexed * COMMON_FINGERPRINT_RATIO
+        if indexed >= COMMON_FINGERPRINT_MIN_RECORDS
+        else None
+    )
+
+    shared = Counter()
+    hashes = sorted(hashes)
+    for start in range(0, len(hashes), FINGERPRINT_QUERY_CHUNK):
+        chunk = hashes[start : start + FINGERPRINT_QUERY_CHUNK]
+        if common_limit is not None:
+            common = set(
+                index.filter(hash__in=chunk)
+                .values("hash")
+                .annotate(records=Count("record_id"))
+                .filter(records__gt=common_limit)
+                .values_list("hash", flat=True)
+            )
+            chunk = [value for value in chunk if value not in common]
+        shared.update(
+            index.filter(hash__in=chunk)
+            .exclude(record__user_id=record.user_id)
+            .values_list("record_id", flat=True)
+        )
+    if not shared:
+        return []
+
+    sizes = dict(
+        CodeSubmissionRecord.objects.filter(pk__in=shared).values_list(
+            "id", "fingerprint_count"
+        )
+    )
+    pairs = []
+    for other_id, count in shared.items():
+        similarity = jaccard_similarity(count, len(hashes), sizes[other_id])
+        if similarity >= settings.PLAGIARISM_SIMILARITY_THRESHOLD:
+            record_a_id, record_b_id = sorted((record.pk, other_id))
+            pairs.append(
+                SimilarityPair(
+                    code_submission_id=code_submission_id,
+                    record_a_id=record_a_id,
+                    record_b_id=record_b_id,
+                    shared_fingerprints=count,
+                    similarity=similarity,
+                )
+            )
+    return pairs
+
+
+def index_record_fingerprints(record: CodeSubmissionRecord) -> int:
+    """
+    제출 기록의 winnowing 지문을 역색인에 저장하고 유사 제출 쌍을 기록합니다.
+
+    fingerprint_count를 조건부 UPDATE로 먼저 채워, 여러 워커가 같은 기록을 중복 색인하지 않도록 합니다.
+
+    Args:
+        record (CodeSubmissionRecord): 색인할 제출 기록.
+
+    Returns:
+        int: 새로 찾은 유사 제출 쌍 수. 다른 워커가 이미 색인했으면 0.
+    """
+    hashes = fingerprint_code(record.submitted_code, record.code_submission.language)
+    with transaction.atomic():
+        claimed = CodeSubmissionRecord.objects.filter(
+            pk=record.pk, fingerprint_count__isnull=True
+        ).update(fingerprint_count=len(hashes))
+        if not claimed:
+            return 0
+        CodeFingerprint.objects.bulk_create(
+            [
+                CodeFingerprint(
+                    record_id=record.pk,
+                    code_submission_id=record.code_submission_id,
+                    hash=value,
+                )
+                for value in hashes
+            ],
+            batch_size=FINGERPRINT_QUERY_CHUNK,
+            ignore_conflicts=True,
+        )
+        pairs = find_similar_records(record, hashes)
+        SimilarityPair.objects.bulk_create(pairs, ignore_conflicts=True)
+    record.fingerprint_count = len(hashes)
+    return len(pairs)
+
+
+def index_pending_fingerprints(limit: int = 100) -> int:
+    """
+    아직 색인하지 않은 제출 기록을 제출 순서대로 색인합니다.
+
+    Args:
+        limit (int): 한 번에 색인할 최대 기록 수.
+
+    Returns:
+        int: 처리한 기록 수.
+    """
+    records = list(
+        CodeSubmissionRecord.objects.filter(fingerprint_count__isnull=True)
+        .select_related("code_submission")
+        .order_by("id")[:limit]
+    )
+    for record in records:
+        index_record_fingerprints(record)
+    return len(records)
+
+
+def find_similarity_clusters(code_submission: CodeSubmission, threshold: float) -> list:
+    """
+    유사도가 기준 이상인 제출 쌍을 사용자 단위로 묶어 클러스터 목록을 만듭니다.
+
+    유사 제출 쌍으로 연결된 사용자들을 union-find로 하나의 클러스터로 묶습니다.
+
+    Args:
+        code_submission (CodeSubmission): 코드 제출형 문제.
+        threshold (float): 클러스터에 포함할 최소 유사도.
+
+    Returns:
+        list: {"users": [...], "max_similarity": float, "pairs": [...]} 형식의 클러스터 목록.
+              사용자 수가 많은 클러스터, 유사도가 높은 클러스터 순으로 정렬됩니다.
+    """
+    pairs = (
+        SimilarityPair.objects.filter(
+            code_submission=code_submission, similarity__gte=threshold
+        )
+        .select_related("record_a__user", "record_b__user")
+        .order_by("-similarity", "id")
+    )
+
+    parents = {}
+
+    def find(user_id):
+        parents.setdefault(user_id, user_id)
+        while parents[user_id] != user_id:
+            parents[user_id] = parents[parents[user_id]]
+            user_id = parents[user_id]
+        return user_id
+
+    usernames = {}
+    edges = []
+    for pair in pairs:
+        user_a, user_b = pair.record_a.user, pair.record_b.user
+        usernames[user_a.pk] = user_a.username
+        usernames[user_b.pk] = user_b.username
+        parents[find(user_a.pk)] = find(user_b.pk)
+        edges.append(
+            {
+                "record_a": pair.record_a_id,
+                "record_b": pair.record_b_id,
+                "user_a": user_a.username,
+                "user_b": user_b.username,
+                "shared_fingerprints": pair.shared_fingerprints,
+                "similarity": round(pair.similarity, 4),
+                "_root": user_a.pk,
+            }
+        )
+
+    clusters = {}
+    for user_id, username in usernames.items():
+        cluster = clusters.setdefault(
+            find(user_id), {"users": [], "max_similarity": 0.0, "pairs": []}
+        )
+        cluster["users"].append({"id": user_id, "username": username})
+    for edge in edges:
+        cluster = clusters[find(edge.pop("_root"))]
+        cluster["pairs"].append(edge)
+        cluster["max_similarity"] = max(cluster["max_similarity"], edge["similarity"])
+
+    return sorted(
+        clusters.values(),
+        key=lambda cluster: (-len(cluster["users"]), -cluster["max_similarity"]),
+    )
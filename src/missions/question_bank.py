@@ -0,0 +1,634 @@
+"""
+미션 문제 은행 파일(CSV, JSON, ZIP) 읽기/쓰기.
+
+- CSV: 헤더 행 뒤에 한 행에 문제 하나. 빈 칸인 선택 항목(id, 제한, 비교 방식)은 값이 없는 것으로
+  봅니다. 코드 제출형 문제의 테스트 케이스는 CSV로 주고받을 수 없습니다.
+- JSON: {"mission_type": ..., "questions": [...]} (5지선다형) 또는 {"mission_type": ...,
+  "problems": [...]} (코드 제출형, 문제마다 test_cases 목록 포함).
+- ZIP: JSON과 같은 형식의 bank.json과 테스트 케이스 입출력 파일. bank.json의 테스트 케이스는
+  input_data/expected_output 대신 input_path/expected_path로 ZIP 안의 파일을 가리키므로,
+  큰 입출력도 JSON 문자열로 이스케이프하지 않고 주고받을 수 있습니다.
+
+쓰기 함수는 모두 bytes 조각을 내보내는 제너레이터이므로, 문제 수와 입출력 크기에 관계없이
+스트리밍 응답으로 바로 보낼 수 있습니다. 가져오기는 파일 전체를 검증한 뒤 한 트랜잭션으로
+저장합니다.
+"""
+
+import csv
+import io
+import json
+import os
+import zipfile
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Prefetch
+
+from .models import CodeSubmission, Mission, MultipleChoiceQuestion, TestCase
+from .question_sets import QuestionSetService
+from .serializers import (
+    CodeSubmissionImportSerializer,
+    MultipleChoiceQuestionImportSerializer,
+)
+
+
+FORMAT_CSV = "csv"
+FORMAT_JSON = "json"
+FORMAT_ZIP = "zip"
+FORMATS = (FORMAT_CSV, FORMAT_JSON, FORMAT_ZIP)
+
+CONTENT_TYPES = {
+    FORMAT_CSV: "text/csv; charset=utf-8",
+    FORMAT_JSON: "application/json",
+    FORMAT_ZIP: "application/zip",
+}
+
+# ZIP 문제 은행의 목차 파일 이름
+MANIFEST_NAME = "bank.json"
+
+QUESTION_FIELDS = (
+    "id",
+    "question",
+    "option_1",
+    "option_2",
+    "option_3",
+    "option_4",
+    "option_5",
+    "correct_option",
+)
+PROBLEM_FIELDS = (
+    "id",
+    "problem_statement",
+    "example_input",
+    "example_output",
+    "time_limit",
+    "memory_limit",
+    "language",
+    "compare_mode",
+    "float_tolerance",
+)
+TEST_CASE_FIELDS = (
+    "input_data",
+    "expected_output",
+    "is_sample",
+    "time_limit",
+    "memory_limit",
+)
+# ZIP 목차에서 파일 경로로 대신하는 테스트 케이스 입출력 필드
+TEST_CASE_PATH_FIELDS = (
+    ("input_data", "input_path"),
+    ("expected_output", "expected_path"),
+)
+
+# CSV에서 빈 칸을 값 없음으로 보는 필드
+OPTIONAL_CSV_FIELDS = (
+    "id",
+    "time_limit",
+    "memory_limit",
+    "compare_mode",
+    "float_tolerance",
+)
+
+# 스트리밍 응답 조각 크기
+STREAM_CHUNK = 64 * 1024
+
+# 가져오기에서 한 쿼리로 저장하는 행 수와 내보내기에서 한 번에 읽는 문제 수
+QUESTION_BANK_BATCH_SIZE = 500
+QUESTION_BANK_EXPORT_CHUNK = 100
+
+
+class QuestionBankError(ValueError):
+    """
+    문제 은행 파일을 읽을 수 없거나 내용이 유효하지 않을 때 발생하는 예외.
+
+    Attributes:
+        errors (list): {"row": 문제 번호(1부터), "errors": 필드별 오류} 형식의 항목별 오류 목록.
+    """
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+def guess_format(filename):
+    """
+    파일 이름의 확장자로 문제 은행 형식을 추측합니다.
+
+    Args:
+        filename (str): 파일 이름.
+
+    Returns:
+        str | None: csv, json, zip 중 하나. 알 수 없으면 None.
+    """
+    extension = os.path.splitext(filename or "")[1].lstrip(".").lower()
+    return extension if extension in FORMATS else None
+
+
+def read_bank(file, file_format, items_key, max_size):
+    """
+    문제 은행 파일을 읽어 문제 딕셔너리 목록을 반환합니다.
+
+    Args:
+        file (BinaryIO): 읽을 파일. ZIP이면 임의 위치 읽기(seek)가 가능해야 합니다.
+        file_format (str): csv, json, zip 중 하나.
+        items_key (str): 문제 목록 키 ("questions" 또는 "problems").
+        max_size (int): ZIP 안의 파일 압축을 푼 크기 합계의 최댓값 (바이트).
+
+    Returns:
+        list: 문제 딕셔너리 목록. 검증은 하지 않습니다.
+
+    Raises:
+        QuestionBankError: 형식이 잘못되었거나 ZIP 압축을 푼 크기가 max_size를 넘는 경우 발생.
+    """
+    try:
+        if file_format == FORMAT_CSV:
+            return read_csv(file.read())
+        if file_format == FORMAT_JSON:
+            return get_items(json.loads(file.read()), items_key)
+        if file_format == FORMAT_ZIP:
+            return read_zip(file, items_key, max_size)
+    except QuestionBankError:
+        raise
+    except (ValueError, zipfile.BadZipFile, KeyError) as e:
+        raise QuestionBankError(f"문제 은행 파일을 읽을 수 없습니다: {e}")
+    raise QuestionBankError(f"지원하지 않는 형식입니다: {file_format}")
+
+
+def read_csv(data):
+    # 스프레드시트가 붙이는 BOM(utf-8-sig)을 제거합니다.
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig"), newline=""))
+    return [
+        {
+            key: value
+            for key, value in row.items()
+            if key is not None and not (value == "" and key in OPTIONAL_CSV_FIELDS)
+        }
+        for row in reader
+    ]
+
+
+def get_items(document, items_key):
+    if not isinstance(document, dict) or not isinstance(document.get(items_key), list):
+        raise QuestionBankError(f'"{items_key}" 목록이 없습니다.')
+    return document[items_key]
+
+
+def read_zip(file, items_key, max_size):
+    with zipfile.ZipFile(file) as archive:
+        if sum(info.file_size for info in archive.infolist()) > max_size:
+            raise QuestionBankError("압축을 푼 크기가 허용된 최대 크기를 넘습니다.")
+        items = get_items(json.loads(archive.read(MANIFEST_NAME)), items_key)
+        for item in items:
+            test_cases = item.get("test_cases") if isinstance(item, dict) else None
+            for test_case in test_cases if isinstance(test_cases, list) else ():
+                if not isinstance(test_case, dict):
+                    continue
+                for field, path_field in TEST_CASE_PATH_FIELDS:
+                    path = test_case.pop(path_field, None)
+                    if path is not None:
+                        test_case[field] = archive.read(path).decode("utf-8")
+        return items
+
+
+def iter_csv(fields, rows):
+    """
+    행 목록을 CSV bytes 조각으로 내보냅니다. 스프레드시트가 UTF-8로 열 수 있도록 BOM을 붙입니다.
+
+    Args:
+        fields (Iterable[str]): 열 이름 목록.
+        rows (Iterable[dict]): 행 딕셔너리 목록.
+
+    Yields:
+        bytes: CSV 조각.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow(["" if row[field] is None else row[field] for field in fields])
+        if buffer.tell() >= STREAM_CHUNK:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def iter_json(header, items_key, items):
+    """
+    {**header, items_key: items} JSON 문서를 bytes 조각으로 내보냅니다.
+
+    Args:
+        header (dict): 문서의 다른 항목.
+        items_key (str): 문제 목록 키.
+        items (Iterable[dict]): 문제 딕셔너리 목록.
+
+    Yields:
+        bytes: JSON 조각.
+    """
+    opening = json.dumps({**header, items_key: []}, ensure_ascii=False)[:-2]
+    chunk = [opening]
+    size = 0
+    for index, item in enumerate(items):
+        text = json.dumps(item, ensure_ascii=False)
+        chunk.append(f", {text}" if index else text)
+        size += len(text)
+        if size >= STREAM_CHUNK:
+            yield "".join(chunk).encode("utf-8")
+            chunk, size = [], 0
+    chunk.append("]}")
+    yield "".join(chunk).encode("utf-8")
+
+
+class _ZipStream(io.RawIOBase):
+    """
+    zipfile이 쓴 bytes를 모아 두었다가 꺼내 주는 쓰기 전용 스트림.
+
+    임의 위치 쓰기(seek)를 지원하지 않으므로 zipfile은 항목 크기를 데이터 뒤(data descriptor)에
+    기록하며, 전체 ZIP을 메모리나 디스크에 만들지 않고 스트리밍할 수 있습니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def pop(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def iter_zip(entries):
+    """
+    (ZIP 안의 경로, bytes 조각 목록) 항목들을 ZIP bytes 조각으로 내보냅니다.
+
+    Args:
+        entries (Iterable[tuple]): (경로, Iterable[bytes]) 튜플 목록.
+
+    Yields:
+        bytes: ZIP 조각.
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            with archive.open(name, "w", force_zip64=True) as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    data = stream.pop()
+                    if data:
+                        yield data
+            yield stream.pop()
+    yield stream.pop()
+
+
+def get_question_bank_key(mission: Mission) -> str:
+    """
+    미션 유형에 맞는 문제 은행 파일의 문제 목록 키를 반환합니다.
+
+    Args:
+        mission (Mission): 미션 인스턴스.
+
+    Returns:
+        str: 5지선다형 미션이면 "questions", 코드 제출형 미션이면 "problems".
+    """
+    return "questions" if mission.mission_type == "multiple_choice" else "problems"
+
+
+def validate_question_bank(serializer_class, items: list) -> list:
+    """
+    문제 은행 항목을 메모리에서 모두 검증하고 검증된 데이터 목록을 반환합니다.
+
+    Args:
+        serializer_class (type): 항목 하나를 검증할 시리얼라이저 클래스.
+        items (list): 파일에서 읽은 문제 딕셔너리 목록.
+
+    Returns:
+        list: 검증된 데이터 목록.
+
+    Raises:
+        QuestionBankError: 유효하지 않은 항목이 있거나 같은 id가 두 번 이상 나오는 경우 발생.
+    """
+    serializer = serializer_class(data=items, many=True)
+    if not serializer.is_valid():
+        if not isinstance(serializer.errors, list):  # 항목이 아닌 목록 자체의 오류
+            raise QuestionBankError(
+                "문제 목록이 유효하지 않습니다.", [{"errors": serializer.errors}]
+            )
+        raise QuestionBankError(
+            "유효하지 않은 문제가 있습니다.",
+            [
+                {"row": row, "errors": errors}
+                for row, errors in enumerate(serializer.errors, start=1)
+                if errors
+            ],
+        )
+
+    ids = [
+        data["id"] for data in serializer.validated_data if data.get("id") is not None
+    ]
+    duplicated = sorted({pk for pk, count in Counter(ids).items() if count > 1})
+    if duplicated:
+        raise QuestionBankError(f"같은 id가 여러 번 있습니다: {duplicated}")
+    return serializer.validated_data
+
+
+def load_existing_bank_items(queryset, rows: list) -> dict:
+    """
+    id가 있는 항목이 가리키는 미션의 기존 객체를 한 쿼리로 불러옵니다.
+
+    Args:
+        queryset (QuerySet): 미션의 문제 쿼리셋.
+        rows (list): 검증된 데이터 목록.
+
+    Returns:
+        dict: {id: 모델 인스턴스}.
+
+    Raises:
+        QuestionBankError: 미션에 없는 id가 있는 경우 발생.
+    """
+    ids = [row["id"] for row in rows if row.get("id") is not None]
+    existing = queryset.in_bulk(ids)
+    missing = sorted(set(ids) - existing.keys())
+    if missing:
+        raise QuestionBankError(f"미션에 없는 문제 id입니다: {missing}")
+    return existing
+
+
+def import_question_bank(mission: Mission, file, file_format: str) -> dict:
+    """
+    문제 은행 파일을 읽어 미션의 문제를 한 번에 추가하거나 수정합니다.
+
+    파일 전체를 메모리에서 검증한 뒤, 유효할 때만 한 트랜잭션 안에서 bulk_create/bulk_update로
+    저장합니다. id가 있는 항목은 기존 문제를 수정하고, 파일에 없는 기존 문제는 그대로 둡니다.
+    bulk 쿼리는 모델 시그널을 보내지 않으므로 문제 세트 캐시와 테스트 케이스 버전은
+    여기서 직접 무효화합니다.
+
+    Args:
+        mission (Mission): 문제를 가져올 미션.
+        file (BinaryIO): 문제 은행 파일.
+        file_format (str): csv, json, zip 중 하나.
+
+    Returns:
+        dict: {"created": 추가한 문제 수, "updated": 수정한 문제 수, "test_cases": 저장한 테스트 케이스 수}.
+
+    Raises:
+        QuestionBankError: 파일을 읽을 수 없거나 유효하지 않은 항목이 있는 경우 발생.
+    """
+    items = read_bank(
+        file,
+        file_format,
+        get_question_bank_key(mission),
+        settings.QUESTION_BANK_MAX_IMPORT_MB * 1024 * 1024,
+    )
+    if mission.mission_type == "multiple_choice":
+        return import_multiple_choice_questions(mission, items)
+    return import_code_problems(mission, items)
+
+
+def import_multiple_choice_questions(mission: Mission, items: list) -> dict:
+    """
+    5지선다형 문제 목록을 검증하고 한 트랜잭션으로 저장합니다.
+
+    Args:
+        mission (Mission): 5지선다형 미션.
+        items (list): 파일에서 읽은 문제 딕셔너리 목록.
+
+    Returns:
+        dict: {"created", "updated", "test_cases"} 저장 결과.
+    """
+    rows = validate_question_bank(MultipleChoiceQuestionImportSerializer, items)
+    existing = load_existing_bank_items(mission.multiple_choice_questions.all(), rows)
+    fields = QUESTION_FIELDS[1:]
+
+    created, updated = [], []
+    for row in rows:
+        pk = row.pop("id", None)
+        if pk is None:
+            created.append(MultipleChoiceQuestion(mission=mission, **row))
+            continue
+        question = existing[pk]
+        for field, value in row.items():
+            setattr(question, field, value)
+        updated.append(question)
+
+    with transaction.atomic():
+        MultipleChoiceQuestion.objects.bulk_create(
+            created, batch_size=QUESTION_BANK_BATCH_SIZE
+        )
+        MultipleChoiceQuestion.objects.bulk_update(
+            updated, fields, batch_size=QUESTION_BANK_BATCH_SIZE
+        )
+    QuestionSetService.invalidate(mission.pk)
+    return {"created": len(created), "updated": len(updated), "test_cases": 0}
+
+
+def import_code_problems(mission: Mission, items: list) -> dict:
+    """
+    코드 제출형 문제와 테스트 케이스 목록을 검증하고 한 트랜잭션으로 저장합니다.
+
+    test_cases가 있는 문제는 기존 테스트 케이스를 모두 지우고 파일의 테스트 케이스로 교체합니다.
+    인라인 한도를 넘는 입출력은 트랜잭션 전에 파일 저장소에 쓰고, 저장에 실패하면 삭제합니다.
+
+    Args:
+        mission (Mission): 코드 제출형 미션.
+        items (list): 파일에서 읽은 문제 딕셔너리 목록.
+
+    Returns:
+        dict: {"created", "updated", "test_cases"} 저장 결과.
+    """
+    rows = validate_question_bank(CodeSubmissionImportSerializer, items)
+    existing = load_existing_bank_items(mission.code_submissions.all(), rows)
+
+    created, updated, test_case_sets = [], [], []
+    for row in rows:
+        pk = row.pop("id", None)
+        test_cases = row.pop("test_cases", None)
+        if pk is None:
+            problem = CodeSubmission(mission=mission, **row)
+            created.append(problem)
+        else:
+            problem = existing[pk]
+            for field, value in row.items():
+                setattr(problem, field, value)
+            updated.append(problem)
+        if test_cases is not None:
+            test_case_sets.append((problem, test_cases))
+
+    new_test_cases = []
+    for problem, test_cases in test_case_sets:
+        for data in test_cases:
+            test_case = TestCase(code_submission=problem, **data)
+            test_case.store_payloads()
+            new_test_cases.append(test_case)
+
+    # 새 문제는 아직 pk가 없으므로 기존 문제의 테스트 케이스만 교체 대상입니다.
+    replaced = [problem.pk for problem, _ in test_case_sets if problem.pk is not None]
+    try:
+        with transaction.atomic():
+            CodeSubmission.objects.bulk_create(
+                created, batch_size=QUESTION_BANK_BATCH_SIZE
+            )
+            CodeSubmission.objects.bulk_update(
+                updated, PROBLEM_FIELDS[1:], batch_size=QUESTION_BANK_BATCH_SIZE
+            )
+            TestCase.objects.filter(code_submission_id__in=replaced).delete()
+            TestCase.objects.bulk_create(
+                new_test_cases, batch_size=QUESTION_BANK_BATCH_SIZE
+            )
+            # 입출력 예시나 테스트 케이스가 바뀌었을 수 있으므로 이전 채점 결과 캐시를 무효화합니다.
+            CodeSubmission.objects.filter(
+                pk__in=[problem.pk for problem in updated]
+            ).update(test_case_version=F("test_case_version") + 1)
+    except Exception:
+        for test_case in new_test_cases:
+            for stored in (test_case.input_file, test_case.expected_file):
+                if stored:
+                    stored.delete(save=False)
+        raise
+    return {
+        "created": len(created),
+        "updated": len(updated),
+        "test_cases": len(new_test_cases),
+    }
+
+
+def export_question_bank(mission: Mission, file_format: str):
+    """
+    미션의 문제를 문제 은행 파일로 내보내는 bytes 제너레이터를 반환합니다.
+
+    문제는 QUESTION_BANK_EXPORT_CHUNK개씩 읽으므로 문제 수와 관계없이 메모리 사용량이 일정하며,
+    ZIP 형식에서는 파일 저장소에 있는 큰 입출력도 조각 단위로 복사합니다.
+
+    Args:
+        mission (Mission): 내보낼 미션.
+        file_format (str): csv, json, zip 중 하나. 코드 제출형 문제의 CSV에는 테스트 케이스가
+            포함되지 않습니다.
+
+    Returns:
+        Iterator[bytes]: 파일 내용 조각.
+
+    Raises:
+        QuestionBankError: 지원하지 않는 형식인 경우 발생.
+    """
+    key = get_question_bank_key(mission)
+    header = {"mission": mission.pk, "mission_type": mission.mission_type}
+
+    if mission.mission_type == "multiple_choice":
+        fields = QUESTION_FIELDS
+        rows = (
+            mission.multiple_choice_questions.order_by("id")
+            .values(*fields)
+            .iterator(chunk_size=QUESTION_BANK_EXPORT_CHUNK)
+        )
+        if file_format == FORMAT_CSV:
+            return iter_csv(fields, rows)
+        if file_format == FORMAT_JSON:
+            return iter_json(header, key, rows)
+        return iter_zip([(MANIFEST_NAME, iter_json(header, key, rows))])
+
+    if file_format == FORMAT_CSV:
+        rows = (
+            mission.code_submissions.order_by("id")
+            .values(*PROBLEM_FIELDS)
+            .iterator(chunk_size=QUESTION_BANK_EXPORT_CHUNK)
+        )
+        return iter_csv(PROBLEM_FIELDS, rows)
+
+    problems = (
+        mission.code_submissions.order_by("id")
+        .prefetch_related(
+            Prefetch("test_cases", queryset=TestCase.objects.order_by("id"))
+        )
+        .iterator(chunk_size=QUESTION_BANK_EXPORT_CHUNK)
+    )
+    if file_format == FORMAT_JSON:
+        return iter_json(
+            header, key, (serialize_code_problem(problem) for problem in problems)
+        )
+    return iter_zip(iter_code_problem_entries(header, key, problems))
+
+
+def serialize_code_problem(
+    problem: CodeSubmission, test_case_paths: list = None
+) -> dict:
+    """
+    코드 제출형 문제를 문제 은행 항목으로 변환합니다.
+
+    Args:
+        problem (CodeSubmission): test_cases를 미리 불러온 코드 제출형 문제.
+        test_case_paths (list, optional): 테스트 케이스별 (입력 경로, 예상 출력 경로) 목록.
+            주어지면 입출력 대신 ZIP 안의 경로를 기록합니다.
+
+    Returns:
+        dict: 문제 필드와 test_cases 목록.
+    """
+    item = {field: getattr(problem, field) for field in PROBLEM_FIELDS}
+    item["test_cases"] = []
+    for index, test_case in enumerate(problem.test_cases.all()):
+        data = {field: getattr(test_case, field) for field in TEST_CASE_FIELDS[2:]}
+        if test_case_paths is None:
+            data["input_data"] = test_case.read_input()
+            data["expected_output"] = test_case.read_expected_output()
+        else:
+            data["input_path"], data["expected_path"] = test_case_paths[index]
+        item["test_cases"].append(data)
+    return item
+
+
+def iter_code_problem_entries(header: dict, key: str, problems):
+    """
+    코드 제출형 문제 ZIP의 항목(테스트 케이스 입출력 파일들과 bank.json)을 차례로 내보냅니다.
+
+    Args:
+        header (dict): bank.json의 미션 정보.
+        key (str): 문제 목록 키.
+        problems (Iterable[CodeSubmission]): test_cases를 미리 불러온 문제 목록.
+
+    Yields:
+        tuple: (ZIP 안의 경로, bytes 조각 목록) 튜플.
+    """
+    items = []
+    for problem in problems:
+        paths = []
+        for index, test_case in enumerate(problem.test_cases.all(), start=1):
+            input_path = f"problems/{problem.pk}/{index}.in"
+            expected_path = f"problems/{problem.pk}/{index}.out"
+            yield input_path, iter_payload(test_case.input_data, test_case.input_file)
+            yield (
+                expected_path,
+                iter_payload(test_case.expected_output, test_case.expected_file),
+            )
+            paths.append((input_path, expected_path))
+        items.append(serialize_code_problem(problem, paths))
+    yield MANIFEST_NAME, iter_json(header, key, items)
+
+
+def iter_payload(text: str, stored):
+    """
+    테스트 케이스 입출력을 bytes 조각으로 내보냅니다. 파일 저장소에 있으면 조각 단위로 읽습니다.
+
+    Args:
+        text (str): 인라인 데이터.
+        stored (FieldFile): 파일 저장소의 데이터.
+
+    Yields:
+        bytes: 데이터 조각.
+    """
+    if not stored:
+        yield text.encode("utf-8")
+        return
+    with stored.open("rb") as f:
+        yield from iter(lambda: f.read(STREAM_CHUNK), b"")
@@ -0,0 +1,334 @@
+"""
+시험 배포용 5지선다형 문제 세트 캐시와 답안지 채점.
+"""
+
+import random
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Mission, MultipleChoiceQuestion, MultipleChoiceSubmission
+from .results import update_mission_result
+from .serializers import MultipleChoiceQuestionSerializer
+
+
+def build_answer_sheet_result(
+    attempt_id, answer_key: dict, graded: list, replayed: bool = False
+) -> dict:
+    """
+    채점된 답안 목록으로 답안지 점수 요약을 만듭니다.
+
+    Args:
+        attempt_id (UUID): 응시 ID.
+        answer_key (dict): {문제 ID: 정답} 형식의 정답표.
+        graded (list): (문제 ID, 선택한 답안, 정답 여부) 튜플 목록.
+        replayed (bool): 이미 저장된 응시 결과를 다시 반환하는 경우 True.
+
+    Returns:
+        dict: 응시 ID, 전체/응답/정답 문항 수, 100점 만점 점수, 문항별 결과, 재전송 여부.
+    """
+    results = [
+        {
+            "question_id": question_id,
+            "selected_option": option,
+            "is_correct": is_correct,
+        }
+        for question_id, option, is_correct in sorted(graded)
+    ]
+    total = len(answer_key)
+    correct = sum(1 for result in results if result["is_correct"])
+    return {
+        "attempt_id": attempt_id,
+        "total": total,
+        "answered": len(results),
+        "correct": correct,
+        "score": round(correct * 100 / total, 2) if total else 0,
+        "results": results,
+        "replayed": replayed,
+    }
+
+
+def lock_user_submissions(user_id: int) -> None:
+    """
+    트랜잭션이 끝날 때까지 사용자 행을 잠가, 같은 사용자의 답안지 제출을 하나씩 처리합니다.
+
+    Args:
+        user_id (int): 사용자 ID.
+    """
+    list(
+        get_user_model()
+        .objects.select_for_update()
+        .filter(pk=user_id)
+        .values_list("pk", flat=True)
+    )
+
+
+def load_answer_sheet(user, mission: Mission, attempt_id) -> list:
+    """
+    저장된 응시 답안을 불러옵니다.
+
+    Args:
+        user (CustomUser): 제출한 사용자.
+        mission (Mission): 미션.
+        attempt_id (UUID): 응시 ID.
+
+    Returns:
+        list: (문제 ID, 선택한 답안, 정답 여부) 튜플 목록. 저장된 답안이 없으면 빈 목록.
+    """
+    return list(
+        MultipleChoiceSubmission.objects.filter(
+            user=user, attempt_id=attempt_id, question__mission=mission
+        ).values_list("question_id", "selected_option", "is_correct")
+    )
+
+
+def submit_answer_sheet(user, mission: Mission, attempt_id, answers: dict) -> dict:
+    """
+    미션 전체의 5지선다형 답안지를 한 번에 채점하고 저장합니다.
+
+    정답표는 쿼리 한 번으로 불러와 메모리에서 채점하고, 제출 기록은 bulk_create로 한 번에
+    저장합니다. 같은 attempt_id로 다시 제출하면 새로 저장하지 않고 처음 저장된 결과를 반환합니다.
+    같은 응시가 동시에 제출되면 사용자 행 잠금으로 하나씩 처리하므로, 먼저 저장한 요청만 미션 결과에
+    반영되고 나머지는 저장된 답안으로 채점한 결과(replayed)를 반환합니다.
+    답하지 않은 문제는 오답으로 계산합니다.
+
+    Args:
+        user (CustomUser): 제출한 사용자.
+        mission (Mission): 답안지를 제출할 미션.
+        attempt_id (UUID): 클라이언트가 응시마다 생성하는 응시 ID.
+        answers (dict): {문제 ID: 선택한 답안} 형식의 답안.
+
+    Returns:
+        dict: build_answer_sheet_result가 만든 점수 요약.
+
+    Raises:
+        ValueError: 미션에 속하지 않은 문제 ID가 포함된 경우 발생.
+    """
+    answer_key = dict(
+        MultipleChoiceQuestion.objects.filter(mission=mission).values_list(
+            "id", "correct_option"
+        )
+    )
+    unknown = sorted(set(answers) - set(answer_key))
+    if unknown:
+        raise ValueError(f"미션에 속하지 않은 문제입니다: {unknown}")
+
+    stored = load_answer_sheet(user, mission, attempt_id)
+    if stored:
+        return build_answer_sheet_result(attempt_id, answer_key, stored, replayed=True)
+
+    graded = [
+        (question_id, option, answer_key[question_id] == option)
+        for question_id, option in answers.items()
+    ]
+    with transaction.atomic():
+        lock_user_submissions(user.pk)
+        # 잠금을 기다리는 동안 같은 응시의 다른 요청이 먼저 저장했으면 그 답안을 반환합니다.
+        stored = load_answer_sheet(user, mission, attempt_id)
+        if stored:
+            return build_answer_sheet_result(
+                attempt_id, answer_key, stored, replayed=True
+            )
+
+        MultipleChoiceSubmission.objects.bulk_create(
+            [
+                MultipleChoiceSubmission(
+                    user=user,
+                    question_id=question_id,
+                    selected_option=option,
+                    is_correct=is_correct,
+                    attempt_id=attempt_id,
+                )
+                for question_id, option, is_correct in graded
+            ]
+        )
+        result = build_answer_sheet_result(attempt_id, answer_key, graded)
+        update_mission_result(
+            user.pk,
+            mission.pk,
+            result["score"],
+            result["score"] >= settings.MISSION_PASS_SCORE,
+        )
+    return result
+
+
+class QuestionSetService:
+    """
+    시험 배포용 5지선다형 문제 세트 캐시 서비스.
+
+    미션별 문제 세트를 직렬화된 튜플로 캐시하여, 많은 학생이 동시에 시험을 열어도 DB를 조회하지
+    않도록 합니다. 캐시 키에는 미션별 버전이 포함되며, 문제가 바뀌면 버전을 올려 이전 세트를
+    더 이상 사용하지 않습니다. 캐시된 세트는 수정하지 않고, 사용자별 응답은 항상 복사본으로 만듭니다.
+    """
+
+    CACHE_TIMEOUT = 60 * 60  # 1시간
+    OPTION_FIELDS = tuple(f"option_{number}" for number in range(1, 6))
+
+    @staticmethod
+    def version_cache_key(mission_id):
+        return f"question_set:version:{mission_id}"
+
+    @staticmethod
+    def set_cache_key(mission_id, version):
+        return f"question_set:{mission_id}:{version}"
+
+    @staticmethod
+    def exam_cache_key(minor_id, mid_or_final):
+        return f"question_set:exam:{minor_id}:{mid_or_final}"
+
+    @classmethod
+    def get_version(cls, mission_id):
+        """
+        미션 문제 세트의 현재 버전을 반환합니다.
+
+        버전 키가 없으면(처음 조회했거나 캐시에서 밀려난 경우) 이전에 쓰인 적 없는 값으로 새로 만듭니다.
+
+        Args:
+            mission_id (int): 미션 ID.
+
+        Returns:
+            int: 문제 세트 버전.
+        """
+        key = cls.version_cache_key(mission_id)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def invalidate(cls, mission_id):
+        """
+        미션 문제 세트의 버전을 올려 캐시된 세트를 무효화합니다.
+
+        Args:
+            mission_id (int): 미션 ID.
+        """
+        try:
+            cache.incr(cls.version_cache_key(mission_id))
+        except ValueError:
+            # 버전 키가 없으면 다음 조회에서 새 버전이 만들어집니다.
+            pass
+
+    @classmethod
+    def invalidate_exam(cls, minor_id):
+        """
+        소분류의 중간/기말 미션 ID 캐시를 제거합니다.
+
+        Args:
+            minor_id (int): 소분류 ID.
+        """
+        cache.delete_many(
+            [
+                cls.exam_cache_key(minor_id, mid_or_final)
+                for mid_or_final in ("mid", "final")
+            ]
+        )
+
+    @classmethod
+    def resolve_exam_mission_id(cls, minor_id, mid_or_final):
+        """
+        소분류의 중간 또는 기말 5지선다형 미션 ID를 반환합니다.
+
+        Args:
+            minor_id (int): 소분류 ID.
+            mid_or_final (str): "mid" 또는 "final".
+
+        Returns:
+            int | None: 미션 ID. 해당 미션이 없으면 None.
+        """
+        key = cls.exam_cache_key(minor_id, mid_or_final)
+        mission_id = cache.get(key)
+        if mission_id is None:
+            mission_id = (
+                Mission.objects.filter(
+                    minor_category_id=minor_id,
+                    mission_type="multiple_choice",
+                    is_midterm=mid_or_final == "mid",
+                    is_final=mid_or_final == "final",
+                )
+                .values_list("id", flat=True)
+                .first()
+            )
+            if mission_id is not None:
+                cache.set(key, mission_id, cls.CACHE_TIMEOUT)
+        return mission_id
+
+    @classmethod
+    def get_question_set(cls, mission_id):
+        """
+        미션의 문제 세트를 정답을 포함한 직렬화 형태로 반환합니다.
+
+        Args:
+            mission_id (int): 미션 ID.
+
+        Returns:
+            tuple: 문제 ID 순으로 정렬된 직렬화된 문제 목록. 반환값을 수정해서는 안 됩니다.
+        """
+        key = cls.set_cache_key(mission_id, cls.get_version(mission_id))
+        questions = cache.get(key)
+        if questions is None:
+            questions = tuple(
+                dict(question)
+                for question in MultipleChoiceQuestionSerializer(
+                    MultipleChoiceQuestion.objects.filter(
+                        mission_id=mission_id
+                    ).order_by("id"),
+                    many=True,
+                ).data
+            )
+            cache.set(key, questions, cls.CACHE_TIMEOUT)
+        return questions
+
+    @classmethod
+    def for_user(cls, questions, user, seed=""):
+        """
+        사용자에게 보낼 문제 목록을 만듭니다.
+
+        매니저와 관리자는 정답을 포함한 문제를 그대로 받습니다. 학생에게는 correct_option을 제거하고
+        선택지 순서를 (사용자, seed, 문제)마다 항상 같은 순서로 섞어 보냅니다.
+
+        Args:
+            questions (Iterable[dict]): 직렬화된 문제 목록.
+            user (CustomUser): 요청한 사용자.
+            seed (str): 선택지 섞기에 사용할 값. 같은 값이면 같은 순서가 나옵니다.
+
+        Returns:
+            list: 사용자에게 보낼 문제 목록.
+        """
+        if user.role in ["manager", "admin"]:
+            return [dict(question) for question in questions]
+        return [
+            cls.student_view(question, f"{user.pk}:{seed}") for question in questions
+        ]
+
+    @classmethod
+    def student_view(cls, question, seed):
+        """
+        정답을 제거하고 선택지 순서를 섞은 학생용 문제를 만듭니다.
+
+        option_1 ~ option_5에는 섞인 순서의 선택지가 들어가고, option_order[i]는 (i + 1)번째로
+        보이는 선택지의 원래 번호입니다. 답안은 원래 번호로 제출해야 합니다.
+
+        Args:
+            question (dict): 정답을 포함한 직렬화된 문제.
+            seed (str): 선택지 섞기에 사용할 값.
+
+        Returns:
+            dict: 학생용 문제.
+        """
+        order = list(range(1, len(cls.OPTION_FIELDS) + 1))
+        random.Random(f"{seed}:{question['id']}").shuffle(order)
+
+        view = {
+            field: value
+            for field, value in question.items()
+            if field != "correct_option" and field not in cls.OPTION_FIELDS
+        }
+        for field, number in zip(cls.OPTION_FIELDS, order):
+            view[field] = question[f"option_{number}"]
+        view["option_order"] = order
+        return view
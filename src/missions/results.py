@@ -0,0 +1,143 @@
+"""
+제출 결과를 사용자별 미션 결과(MissionResult)에 반영합니다.
+"""
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import DateTimeField, F, FloatField, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import (
+    CodeSubmission,
+    CodeSubmissionRecord,
+    MissionResult,
+    MultipleChoiceQuestion,
+    MultipleChoiceSubmission,
+)
+
+
+def update_mission_result(
+    user_id: int, mission_id: int, score: float, passed: bool, submitted_at=None
+) -> None:
+    """
+    제출 한 번의 결과를 사용자의 미션 결과에 반영합니다.
+
+    제출 횟수를 1 늘리고 최고 점수와 마지막 제출 시간은 더 큰 값으로 갱신하며, 한 번 통과하면
+    통과 상태를 유지합니다. 동시에 제출되어도 값이 유실되지 않도록 조건부 UPDATE로 갱신합니다.
+
+    Args:
+        user_id (int): 사용자 ID.
+        mission_id (int): 미션 ID.
+        score (float): 이번 제출의 점수 (0~100).
+        passed (bool): 이번 제출로 미션을 통과했는지 여부.
+        submitted_at (datetime, optional): 제출 시간. 없으면 현재 시간.
+    """
+    submitted_at = submitted_at or timezone.now()
+    changes = {
+        "attempts": F("attempts") + 1,
+        "best_score": Greatest("best_score", Value(score, output_field=FloatField())),
+        "last_submitted_at": Greatest(
+            "last_submitted_at", Value(submitted_at, output_field=DateTimeField())
+        ),
+    }
+    if passed:
+        changes["passed"] = True
+
+    results = MissionResult.objects.filter(user_id=user_id, mission_id=mission_id)
+    if results.update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            MissionResult.objects.create(
+                user_id=user_id,
+                mission_id=mission_id,
+                best_score=score,
+                attempts=1,
+                last_submitted_at=submitted_at,
+                passed=passed,
+            )
+    except IntegrityError:
+        # 다른 요청이 먼저 결과를 만든 경우
+        results.update(**changes)
+
+
+def get_multiple_choice_score(user_id: int, mission_id: int) -> float:
+    """
+    사용자가 문제별로 마지막에 제출한 답안으로 5지선다형 미션 점수를 계산합니다.
+
+    Args:
+        user_id (int): 사용자 ID.
+        mission_id (int): 미션 ID.
+
+    Returns:
+        float: 100점 만점 점수. 미션에 문제가 없으면 0.
+    """
+    total = MultipleChoiceQuestion.objects.filter(mission_id=mission_id).count()
+    if not total:
+        return 0
+    latest = dict(
+        MultipleChoiceSubmission.objects.filter(
+            user_id=user_id, question__mission_id=mission_id
+        )
+        .order_by("id")
+        .values_list("question_id", "is_correct")
+    )
+    return round(sum(latest.values()) * 100 / total, 2)
+
+
+def record_multiple_choice_result(submission: MultipleChoiceSubmission) -> None:
+    """
+    문제 하나의 5지선다형 답안 제출을 미션 결과에 반영합니다.
+
+    Args:
+        submission (MultipleChoiceSubmission): 저장된 답안 제출 기록.
+    """
+    mission_id = submission.question.mission_id
+    score = get_multiple_choice_score(submission.user_id, mission_id)
+    update_mission_result(
+        submission.user_id,
+        mission_id,
+        score,
+        score >= settings.MISSION_PASS_SCORE,
+        submission.submitted_at,
+    )
+
+
+def get_code_mission_score(user_id: int, mission_id: int) -> float:
+    """
+    코드 제출형 미션에서 통과한 문제의 비율로 점수를 계산합니다.
+
+    Args:
+        user_id (int): 사용자 ID.
+        mission_id (int): 미션 ID.
+
+    Returns:
+        float: 100점 만점 점수. 미션에 문제가 없으면 0.
+    """
+    total = CodeSubmission.objects.filter(mission_id=mission_id).count()
+    if not total:
+        return 0
+    solved = (
+        CodeSubmissionRecord.objects.filter(
+            user_id=user_id, code_submission__mission_id=mission_id, is_passed=True
+        )
+        .values("code_submission_id")
+        .distinct()
+        .count()
+    )
+    return round(solved * 100 / total, 2)
+
+
+def record_code_mission_result(record: CodeSubmissionRecord) -> None:
+    """
+    채점이 끝난 코드 제출 기록을 미션 결과에 반영합니다.
+
+    Args:
+        record (CodeSubmissionRecord): 채점 완료된 제출 기록.
+    """
+    mission_id = record.code_submission.mission_id
+    score = get_code_mission_score(record.user_id, mission_id)
+    update_mission_result(
+        record.user_id, mission_id, score, score >= 100, record.submission_time
+    )
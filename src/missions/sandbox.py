@@ -0,0 +1,979 @@
+"""
+제출 코드 실행에 사용하는 자원 제한 및 측정 유틸리티.
+
+채점 워커(judge_worker.py)가 독립 스크립트로 함께 사용하므로 표준 라이브러리만 사용하며,
+Django를 임포트하지 않습니다.
+
+실행 결과의 시간/메모리는 os.wait4로 얻은 자식 프로세스의 rusage로 측정하며,
+시간 초과와 메모리 초과 판정도 이 측정값을 기준으로 합니다.
+출력은 OutputSink가 조각 단위로 받아 비교하고 앞부분만 보관하므로, 제출 코드가 얼마나
+출력하든 실행당 메모리 사용량이 일정하게 유지됩니다.
+
+제출 코드는 샌드박스(RlimitSandbox 또는 CgroupSandbox) 안에서 실행됩니다. 자식 프로세스는 새
+세션(프로세스 그룹)의 리더가 되므로, 시간 초과나 실행 종료 시 제출 코드가 만든 손자 프로세스까지
+함께 종료합니다. host_slot은 같은 호스트의 모든 채점 프로세스가 동시에 실행하는 제출 수를 제한합니다.
+
+run_process는 여러 스레드에서 동시에 호출되므로 Popen의 preexec_fn을 사용하지 않습니다(스레드가
+있는 프로세스에서 fork한 자식이 exec 전에 파이썬 코드를 실행하면 교착될 수 있습니다). 대신 새
+세션은 start_new_session으로 만들고, 나머지 설정은 표준 라이브러리 몇 개만 임포트하는 작은 exec
+래퍼(EXEC_WRAPPER)가 적용한 뒤 명령을 exec합니다.
+"""
+
+import codecs
+import contextlib
+import ctypes
+import mmap
+import os
+import selectors
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+try:
+    import fcntl
+    import resource
+except ImportError:  # Windows
+    fcntl = None
+    resource = None
+
+
+READ_CHUNK = 65536
+
+# 실행당 표준 출력 최대 크기. 넘으면 실행을 중단하고 출력 초과로 판정합니다.
+DEFAULT_OUTPUT_LIMIT = 16 * 1024 * 1024
+# 결과에 담아 돌려줄 표준 출력/표준 에러의 최대 크기
+DEFAULT_CAPTURE_LIMIT = 64 * 1024
+
+# 작업 디렉터리 안에서 제출 코드가 만들 수 있는 파일의 최대 크기 기본값
+DEFAULT_FILE_SIZE_LIMIT = 1024 * 1024
+
+# 실행별 작업 디렉터리를 만들 메모리 기반 파일 시스템(tmpfs)
+SCRATCH_BASE_CANDIDATES = ("/dev/shm",)
+
+# 주소 공간 제한은 실제 사용 메모리(RSS)보다 넉넉하게 잡고, 메모리 초과는 측정한 최대 RSS로 판정합니다.
+ADDRESS_SPACE_SLACK_MB = 64
+
+# 자식 프로세스에서 처리되지 않은 MemoryError가 발생했을 때 사용하는 종료 코드
+MEMORY_ERROR_EXIT_CODE = 251
+# exec 래퍼가 샌드박스를 설정하지 못했거나 명령을 실행하지 못했을 때 사용하는 종료 코드
+SANDBOX_SETUP_EXIT_CODE = 252
+
+# 샌드박스 설정을 적용한 뒤 명령을 exec하는 래퍼. `python -I -S -c EXEC_WRAPPER <nice> <cgroup.procs 경로>
+# <unshare 플래그> <이름:soft:hard>... -- <명령>...` 형식으로 실행합니다. 실행마다 인터프리터가 한 번 더
+# 뜨므로 무거운 모듈(json, ctypes 등)은 꼭 필요할 때만 임포트합니다.
+EXEC_WRAPPER = (
+    """
+import os, resource, sys
+try:
+    separator = sys.argv.index("--")
+    nice, cgroup_procs, namespaces, *rlimits = sys.argv[1:separator]
+    command = sys.argv[separator + 1 :]
+    if cgroup_procs:
+        with open(cgroup_procs, "w") as f:
+            f.write("0")
+    if int(namespaces):
+        if hasattr(os, "unshare"):
+            os.unshare(int(namespaces))
+        else:
+            import ctypes
+            if ctypes.CDLL(None, use_errno=True).unshare(int(namespaces)) != 0:
+                raise OSError(ctypes.get_errno(), "unshare")
+    if int(nice):
+        os.nice(int(nice))
+    for limit in rlimits:
+        name, soft, hard = limit.split(":")
+        resource.setrlimit(getattr(resource, name), (int(soft), int(hard)))
+    os.execvp(command[0], command)
+except BaseException as e:
+    sys.stderr.write(f"sandbox: {type(e).__name__}: {e}\\n")
+    sys.stderr.flush()
+    os._exit(%d)
+"""
+    % SANDBOX_SETUP_EXIT_CODE
+)
+
+# 샌드박스 백엔드
+SANDBOX_AUTO = "auto"
+SANDBOX_RLIMIT = "rlimit"
+SANDBOX_CGROUP = "cgroup"
+
+# 제출 코드가 열 수 있는 파일 디스크립터 수 기본값
+DEFAULT_OPEN_FILES_LIMIT = 64
+# 제출 코드 프로세스의 스케줄링 우선순위를 낮추는 nice 값 기본값
+DEFAULT_NICE = 10
+
+# 실행별 cgroup을 만들 상위 cgroup(v2). 채점 프로세스에 쓰기 권한이 위임되어 있어야 합니다.
+DEFAULT_CGROUP_ROOT = "/sys/fs/cgroup/judge"
+# cgroup 백엔드에서 프로세스 수 제한을 따로 주지 않았을 때의 pids.max
+DEFAULT_CGROUP_PIDS = 64
+# cgroup 백엔드가 상위 cgroup에서 사용해야 하는 컨트롤러
+CGROUP_CONTROLLERS = ("memory", "pids")
+
+# unshare(2) 플래그 (linux/sched.h)
+CLONE_NEWIPC = 0x08000000
+CLONE_NEWUSER = 0x10000000
+CLONE_NEWNET = 0x40000000
+
+# 실행 슬롯을 기다릴 때 잠금 재시도 간격(초)
+SLOT_POLL_INTERVAL = 0.01
+
+# 출력 파이프가 닫힌 뒤 자식 프로세스의 종료를 확인하는 간격(초). 처음에는 짧게 확인하고 점점 늘립니다.
+REAP_POLL_MIN_INTERVAL = 0.001
+REAP_POLL_MAX_INTERVAL = 0.05
+
+# 경과 시간이 제한 시간의 이 배수를 넘으면, 강제 종료하지 못했더라도 시간 초과로 판정합니다.
+WALL_TIME_SLACK = 1.5
+
+# 실행 결과 상태
+STATUS_OK = "ok"
+STATUS_RUNTIME_ERROR = "runtime_error"
+STATUS_TIME_LIMIT = "time_limit"
+STATUS_MEMORY_LIMIT = "memory_limit"
+STATUS_OUTPUT_LIMIT = "output_limit"
+STATUS_WRONG_ANSWER = "wrong_answer"
+STATUS_INTERNAL_ERROR = "internal_error"
+
+
+class SandboxBusyError(RuntimeError):
+    """
+    호스트의 실행 슬롯을 제한 시간 안에 얻지 못했을 때 발생하는 예외.
+    """
+
+
+def get_rlimits(
+    time_limit,
+    memory_limit,
+    address_space=True,
+    file_size=None,
+    processes=None,
+    open_files=None,
+):
+    """
+    CPU 시간과 주소 공간, 파일 크기, 프로세스 수, 파일 디스크립터 수 제한 목록을 반환합니다.
+
+    Args:
+        time_limit (float): CPU 시간 제한 (초 단위).
+        memory_limit (int): 메모리 제한 (MB 단위).
+        address_space (bool): 주소 공간(RLIMIT_AS)을 제한할지 여부.
+            가상 메모리를 크게 예약하는 런타임(Node.js 등)에서는 False로 둡니다.
+        file_size (int, optional): 쓸 수 있는 파일의 최대 크기 (바이트). 없으면 제한하지 않습니다.
+        processes (int, optional): 실행 사용자(uid)가 가질 수 있는 최대 프로세스 수(RLIMIT_NPROC).
+            uid 단위로 계산되므로 채점 전용 사용자로 실행할 때만 지정합니다.
+        open_files (int, optional): 열 수 있는 파일 디스크립터 수(RLIMIT_NOFILE).
+
+    Returns:
+        list: (resource 모듈의 제한 이름, soft, hard) 튜플 목록.
+    """
+    cpu_seconds = max(int(time_limit + 0.999), 1)
+    limits = [("RLIMIT_CPU", cpu_seconds, cpu_seconds + 1)]
+    if file_size is not None:
+        limits.append(("RLIMIT_FSIZE", file_size, file_size))
+    if processes:
+        limits.append(("RLIMIT_NPROC", processes, processes))
+    if open_files:
+        limits.append(("RLIMIT_NOFILE", open_files, open_files))
+    if address_space:
+        memory_bytes = (memory_limit + ADDRESS_SPACE_SLACK_MB) * 1024 * 1024
+        limits.append(("RLIMIT_AS", memory_bytes, memory_bytes))
+    return limits
+
+
+def get_namespace_flags():
+    """
+    제출 코드를 새 네트워크/IPC 네임스페이스로 옮길 때 사용할 unshare(2) 플래그를 반환합니다.
+    root가 아니면 사용자 네임스페이스를 함께 만들어 권한 없이 분리합니다.
+
+    Returns:
+        int: unshare 플래그.
+    """
+    flags = CLONE_NEWNET | CLONE_NEWIPC
+    if os.geteuid() != 0:
+        flags |= CLONE_NEWUSER
+    return flags
+
+
+def get_scratch_base():
+    """
+    실행별 작업 디렉터리를 만들 상위 디렉터리를 반환합니다.
+
+    Returns:
+        str | None: 쓰기 가능한 tmpfs 경로. 없으면 None(시스템 임시 디렉터리).
+    """
+    for path in SCRATCH_BASE_CANDIDATES:
+        if os.path.isdir(path) and os.access(path, os.W_OK | os.X_OK):
+            return path
+    return None
+
+
+@contextlib.contextmanager
+def scratch_directory(base=None):
+    """
+    실행 하나만 사용하는 임시 작업 디렉터리를 만들고, 블록이 끝나면 내용과 함께 삭제합니다.
+
+    Args:
+        base (str, optional): 작업 디렉터리를 만들 상위 디렉터리. 없으면 get_scratch_base()를 사용합니다.
+
+    Yields:
+        str: 작업 디렉터리 경로.
+    """
+    path = tempfile.mkdtemp(prefix="judge-", dir=base or get_scratch_base())
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def open_input(input_data=None, input_path=None):
+    """
+    자식 프로세스에 넘길 입력 버퍼를 엽니다.
+
+    input_path가 주어지면 파일을 메모리 맵으로 열어, 입력 크기와 동시 실행 수에 비례하는
+    복사본을 만들지 않고 페이지 캐시에서 바로 파이프로 씁니다.
+
+    Args:
+        input_data (str, optional): 입력 문자열.
+        input_path (str, optional): 입력 파일 경로. 주어지면 input_data보다 우선합니다.
+
+    Yields:
+        bytes | mmap.mmap: 입력 버퍼.
+    """
+    if input_path is None:
+        yield (input_data or "").encode("utf-8")
+        return
+
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def unshare_namespaces():
+    """
+    현재 프로세스를 새 네트워크/IPC 네임스페이스로 옮겨 외부 네트워크와 호스트의 IPC 자원에서
+    분리합니다. root가 아니면 사용자 네임스페이스를 함께 만들어 권한 없이 분리합니다.
+
+    Raises:
+        OSError: 커널이 네임스페이스 생성을 허용하지 않는 경우 발생.
+    """
+    flags = get_namespace_flags()
+    if hasattr(os, "unshare"):  # Python 3.12+
+        os.unshare(flags)
+        return
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.unshare(flags) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+
+class RlimitSandbox:
+    """
+    rlimit과 프로세스 그룹으로 제출 코드를 격리하는 샌드박스.
+
+    자식 프로세스는 exec 전에 setup_child에서 새 세션의 리더가 되고 자원 제한을 겁니다.
+    run_process는 같은 설정을 exec 래퍼(wrap_command)로 적용합니다.
+    kill은 프로세스 그룹 전체에 SIGKILL을 보내므로, 제출 코드가 fork한 프로세스도 함께 종료되며,
+    with 블록을 벗어날 때 남아 있는 프로세스를 정리합니다. 제출 코드가 setsid로 그룹을 벗어나는
+    경우까지 막으려면 cgroup 백엔드를 사용합니다.
+
+    Attributes:
+        pid (int | None): 실행 중인 자식 프로세스(프로세스 그룹 리더) ID.
+    """
+
+    backend = SANDBOX_RLIMIT
+
+    def __init__(
+        self,
+        time_limit,
+        memory_limit,
+        address_space=True,
+        file_size=None,
+        processes=None,
+        open_files=None,
+        nice=DEFAULT_NICE,
+    ):
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.address_space = address_space
+        self.file_size = file_size
+        self.processes = processes
+        self.open_files = open_files
+        self.nice = nice
+        self.pid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.kill()
+
+    def setup_child(self):
+        """
+        fork된 자식 프로세스에서 제출 코드를 실행하기 전에 호출합니다.
+        """
+        os.setsid()
+        if self.nice:
+            os.nice(self.nice)
+        for name, soft, hard in self.get_rlimits():
+            resource.setrlimit(getattr(resource, name), (soft, hard))
+
+    def get_rlimits(self):
+        """
+        자식 프로세스에 걸 rlimit 목록을 반환합니다.
+
+        Returns:
+            list: (제한 이름, soft, hard) 튜플 목록.
+        """
+        return get_rlimits(
+            self.time_limit,
+            self.memory_limit,
+            self.address_space,
+            self.file_size,
+            self.processes,
+            self.open_files,
+        )
+
+    def wrap_command(self, args):
+        """
+        명령을 exec 래퍼(EXEC_WRAPPER)로 감싼 인자 목록을 반환합니다. 래퍼는 setup_child와 같은 설정을
+        적용한 뒤 명령을 exec합니다. 새 세션은 Popen(start_new_session=True)으로 만듭니다.
+
+        Args:
+            args (list): 실행할 명령과 인자.
+
+        Returns:
+            list: Popen에 넘길 인자 목록.
+        """
+        return [
+            sys.executable,
+            "-I",
+            "-S",
+            "-c",
+            EXEC_WRAPPER,
+            str(self.nice or 0),
+            *self.wrapper_namespace_args(),
+            *(f"{name}:{soft}:{hard}" for name, soft, hard in self.get_rlimits()),
+            "--",
+            *args,
+        ]
+
+    def wrapper_namespace_args(self):
+        """
+        exec 래퍼에 넘길 cgroup.procs 경로와 unshare 플래그를 반환합니다.
+
+        Returns:
+            tuple: rlimit 백엔드는 cgroup과 네임스페이스를 사용하지 않으므로 ("", "0").
+        """
+        return "", "0"
+
+    def attach(self, pid):
+        """
+        부모 프로세스에서 실행을 시작한 자식 프로세스 ID를 등록합니다.
+
+        Args:
+            pid (int): 자식 프로세스 ID.
+        """
+        self.pid = pid
+
+    def kill(self):
+        """
+        자식 프로세스 그룹 전체를 강제 종료합니다. 이미 종료되었으면 아무것도 하지 않습니다.
+        """
+        if self.pid is None:
+            return
+        try:
+            os.killpg(self.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def memory_exceeded(self):
+        """
+        커널이 메모리 제한으로 자식 프로세스를 종료했는지 반환합니다.
+
+        Returns:
+            bool: rlimit 백엔드는 항상 False (메모리 초과는 측정한 최대 RSS로 판정합니다).
+        """
+        return False
+
+
+class CgroupSandbox(RlimitSandbox):
+    """
+    cgroup v2와 Linux 네임스페이스로 제출 코드를 격리하는 샌드박스.
+
+    실행마다 cgroup_root 아래에 cgroup을 만들어 메모리(memory.max, 스왑 없음)와 프로세스 수
+    (pids.max)를 커널이 강제하도록 하고, 자식을 새 네트워크/IPC 네임스페이스로 옮깁니다.
+    rlimit 제한도 함께 적용하며, 종료 시에는 cgroup.kill로 cgroup 안의 모든 프로세스를 종료합니다.
+    """
+
+    backend = SANDBOX_CGROUP
+
+    def __init__(self, *args, cgroup_root=DEFAULT_CGROUP_ROOT, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cgroup_root = cgroup_root
+        self.path = None
+
+    @staticmethod
+    def available(cgroup_root=DEFAULT_CGROUP_ROOT):
+        """
+        cgroup_root에 실행별 cgroup을 만들 수 있는지 반환합니다.
+
+        Args:
+            cgroup_root (str): 상위 cgroup 경로.
+
+        Returns:
+            bool: cgroup v2이고, 쓰기 권한이 있으며, memory/pids 컨트롤러가 위임되어 있으면 True.
+        """
+        control = os.path.join(cgroup_root, "cgroup.subtree_control")
+        if not os.path.isfile(control) or not os.access(cgroup_root, os.W_OK):
+            return False
+        with open(control) as f:
+            enabled = set(f.read().split())
+        return all(controller in enabled for controller in CGROUP_CONTROLLERS)
+
+    def __enter__(self):
+        self.path = os.path.join(self.cgroup_root, f"run-{uuid.uuid4().hex}")
+        os.mkdir(self.path)
+        try:
+            memory_bytes = (self.memory_limit + ADDRESS_SPACE_SLACK_MB) * 1024 * 1024
+            self.write("memory.max", memory_bytes)
+            if os.path.exists(os.path.join(self.path, "memory.swap.max")):
+                self.write("memory.swap.max", 0)
+            self.write("pids.max", self.processes or DEFAULT_CGROUP_PIDS)
+        except OSError:
+            os.rmdir(self.path)
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        self.kill()
+        # 종료된 프로세스가 cgroup에서 빠질 때까지 잠시 기다린 뒤 cgroup을 삭제합니다.
+        deadline = time.monotonic() + 1
+        while True:
+            try:
+                os.rmdir(self.path)
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return
+                time.sleep(0.01)
+
+    def get_rlimits(self):
+        # 프로세스 수는 pids.max가 cgroup 단위로 제한하므로 uid 단위의 RLIMIT_NPROC는 걸지 않습니다.
+        return [limit for limit in super().get_rlimits() if limit[0] != "RLIMIT_NPROC"]
+
+    def wrapper_namespace_args(self):
+        return os.path.join(self.path, "cgroup.procs"), str(get_namespace_flags())
+
+    def write(self, name, value):
+        with open(os.path.join(self.path, name), "w") as f:
+            f.write(str(value))
+
+    def setup_child(self):
+        self.write("cgroup.procs", 0)
+        unshare_namespaces()
+        super().setup_child()
+
+    def kill(self):
+        if self.path is None:
+            super().kill()
+            return
+        kill_file = os.path.join(self.path, "cgroup.kill")
+        if os.path.exists(kill_file):  # Linux 5.14+
+            with contextlib.suppress(OSError):
+                self.write("cgroup.kill", 1)
+        else:
+            with (
+                contextlib.suppress(OSError),
+                open(os.path.join(self.path, "cgroup.procs")) as f,
+            ):
+                for pid in f.read().split():
+                    with contextlib.suppress(ProcessLookupError, PermissionError):
+                        os.kill(int(pid), signal.SIGKILL)
+        super().kill()
+
+    def memory_exceeded(self):
+        if self.path is None:
+            return False
+        with (
+            contextlib.suppress(OSError),
+            open(os.path.join(self.path, "memory.events")) as f,
+        ):
+            for line in f:
+                name, _, count = line.partition(" ")
+                if name == "oom_kill":
+                    return int(count) > 0
+        return False
+
+
+def create_sandbox(backend=SANDBOX_AUTO, cgroup_root=None, **limits):
+    """
+    설정된 백엔드의 샌드박스를 만듭니다.
+
+    Args:
+        backend (str): auto, rlimit, cgroup 중 하나. auto이면 cgroup v2를 사용할 수 있을 때
+            cgroup 백엔드를, 아니면 rlimit 백엔드를 사용합니다.
+        cgroup_root (str, optional): 실행별 cgroup을 만들 상위 cgroup 경로.
+        **limits: RlimitSandbox 생성자에 넘길 time_limit, memory_limit 등 자원 제한.
+
+    Returns:
+        RlimitSandbox: 샌드박스 객체.
+
+    Raises:
+        RuntimeError: cgroup 백엔드를 요청했지만 사용할 수 없거나, 알 수 없는 백엔드인 경우 발생.
+    """
+    backend = backend or SANDBOX_AUTO
+    cgroup_root = cgroup_root or DEFAULT_CGROUP_ROOT
+    if backend not in (SANDBOX_AUTO, SANDBOX_RLIMIT, SANDBOX_CGROUP):
+        raise RuntimeError(f"알 수 없는 샌드박스 백엔드입니다: {backend}")
+    if backend != SANDBOX_RLIMIT and CgroupSandbox.available(cgroup_root):
+        return CgroupSandbox(cgroup_root=cgroup_root, **limits)
+    if backend == SANDBOX_CGROUP:
+        raise RuntimeError(f"cgroup v2를 사용할 수 없습니다: {cgroup_root}")
+    return RlimitSandbox(**limits)
+
+
+def wait_for_lock(paths, deadline):
+    """
+    paths 중 하나의 잠금 파일에 배타적 flock을 걸 때까지 재시도합니다.
+
+    Args:
+        paths (list): 잠금 파일 경로 목록.
+        deadline (float): time.monotonic() 기준 대기 종료 시각.
+
+    Returns:
+        tuple: (잠근 파일의 인덱스, 파일 디스크립터) 튜플. 디스크립터를 닫으면 잠금이 풀립니다.
+
+    Raises:
+        SandboxBusyError: deadline까지 잠그지 못한 경우 발생.
+    """
+    while True:
+        for index, path in enumerate(paths):
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            return index, fd
+        if time.monotonic() >= deadline:
+            raise SandboxBusyError("제한 시간 안에 실행 슬롯을 얻지 못했습니다.")
+        time.sleep(SLOT_POLL_INTERVAL)
+
+
+@contextlib.contextmanager
+def host_slot(directory, slots, timeout):
+    """
+    호스트 전체에서 동시에 실행되는 제출 수를 slots개로 제한하는 실행 슬롯을 하나 잡습니다.
+
+    같은 directory를 사용하는 모든 프로세스(웹 워커, 채점 워커)가 slot-0 ~ slot-(slots-1)
+    잠금 파일을 나눠 씁니다. 슬롯을 기다리는 쪽은 먼저 queue 잠금을 잡은 뒤 슬롯을 확인하므로,
+    슬롯을 막 반납한 실행이 기다리던 실행보다 먼저 슬롯을 다시 가져가지 못합니다.
+    flock 잠금은 프로세스가 비정상 종료해도 자동으로 풀립니다.
+
+    Args:
+        directory (str): 잠금 파일을 둘 디렉터리.
+        slots (int): 동시 실행 한도. 0 이하이면 제한하지 않습니다.
+        timeout (float): 슬롯을 기다릴 최대 시간 (초 단위).
+
+    Yields:
+        int | None: 잡은 슬롯 번호. 제한하지 않으면 None.
+
+    Raises:
+        SandboxBusyError: timeout 안에 빈 슬롯을 얻지 못한 경우 발생.
+    """
+    if fcntl is None or slots <= 0:
+        yield None
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    _, queue_fd = wait_for_lock([os.path.join(directory, "queue")], deadline)
+    try:
+        index, slot_fd = wait_for_lock(
+            [os.path.join(directory, f"slot-{index}") for index in range(slots)],
+            deadline,
+        )
+    finally:
+        os.close(queue_fd)
+    try:
+        yield index
+    finally:
+        os.close(slot_fd)  # 잠금도 함께 풀립니다.
+
+
+class OutputSink:
+    """
+    자식 프로세스의 표준 출력을 조각 단위로 받아 크기를 제한하고, 앞부분만 보관하며,
+    비교기가 주어지면 예상 출력과 바로 비교합니다.
+
+    Attributes:
+        size (int): 지금까지 받은 출력 크기 (바이트).
+        captured (bytearray): 보관한 출력 앞부분.
+        truncated (bool): 보관 한도를 넘어 출력 일부를 버렸는지 여부.
+        control_fd (int | None): 실행 중에 중단 요청을 받을 파일 디스크립터. 있으면
+            communicate가 읽을 수 있을 때마다 control()을 호출합니다.
+    """
+
+    control_fd = None
+
+    def __init__(self, output_limit=None, capture_limit=None, comparator=None):
+        self.output_limit = output_limit or DEFAULT_OUTPUT_LIMIT
+        self.capture_limit = capture_limit or DEFAULT_CAPTURE_LIMIT
+        self.comparator = comparator
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.size = 0
+        self.captured = bytearray()
+        self.truncated = False
+
+    def feed(self, chunk):
+        """
+        출력 조각을 처리합니다.
+
+        Args:
+            chunk (bytes): 출력 조각.
+
+        Returns:
+            str | None: 실행을 중단해야 하면 그 사유(output_limit, wrong_answer), 아니면 None.
+        """
+        self.size += len(chunk)
+        if self.size > self.output_limit:
+            return STATUS_OUTPUT_LIMIT
+
+        room = self.capture_limit - len(self.captured)
+        if room > 0:
+            self.captured += chunk[:room]
+        self.truncated = self.truncated or len(chunk) > room
+
+        if self.comparator is not None and not self.comparator.feed(
+            self.decoder.decode(chunk)
+        ):
+            return STATUS_WRONG_ANSWER
+        return None
+
+    def finish(self):
+        """
+        출력이 끝났을 때 예상 출력과의 최종 일치 여부를 반환합니다.
+
+        Returns:
+            bool | None: 일치 여부. 비교기가 없으면 None.
+        """
+        if self.comparator is None:
+            return None
+        self.comparator.feed(self.decoder.decode(b"", final=True))
+        return self.comparator.finish()
+
+    def control(self):
+        """
+        control_fd로 들어온 요청을 처리합니다. 하위 클래스에서 구현합니다.
+
+        Returns:
+            str | None: 실행을 중단해야 하면 그 사유, 아니면 None.
+        """
+        return None
+
+
+def communicate(sandbox, stdin_fd, stdout_fd, stderr_fd, input_data, deadline, sink):
+    """
+    자식 프로세스에 입력을 쓰고 출력을 sink로 넘기며, 제한 시간이 지나거나 sink가
+    중단을 요청하면 샌드박스 안의 프로세스를 모두 강제 종료합니다. 표준 에러는 sink의
+    보관 한도까지만 모읍니다. sink에 control_fd가 있으면 실행 중에 들어오는 중단 요청도 처리합니다.
+
+    전달받은 stdin_fd는 이 함수 안에서 닫습니다.
+
+    Args:
+        sandbox (RlimitSandbox): 자식 프로세스가 등록된 샌드박스.
+        stdin_fd (int): 자식 표준 입력에 연결된 쓰기용 파일 디스크립터.
+        stdout_fd (int): 자식 표준 출력에 연결된 읽기용 파일 디스크립터.
+        stderr_fd (int): 자식 표준 에러에 연결된 읽기용 파일 디스크립터.
+        input_data (bytes | mmap.mmap): 자식에게 전달할 입력 버퍼.
+        deadline (float): time.monotonic() 기준 종료 시각.
+        sink (OutputSink): 표준 출력을 받을 OutputSink.
+
+    Returns:
+        tuple: (표준 에러 bytes, 시간 초과 여부, 중단 사유 또는 None) 튜플.
+    """
+    selector = selectors.DefaultSelector()
+    stderr = bytearray()
+    for fd in (stdout_fd, stderr_fd):
+        selector.register(fd, selectors.EVENT_READ)
+    control_fd = sink.control_fd
+    if control_fd is not None:
+        selector.register(control_fd, selectors.EVENT_READ)
+
+    pending = memoryview(input_data)
+    if pending:
+        os.set_blocking(stdin_fd, False)
+        selector.register(stdin_fd, selectors.EVENT_WRITE)
+    else:
+        os.close(stdin_fd)
+
+    timed_out = False
+    stopped = None
+    while len(selector.get_map()) > (control_fd is not None) and stopped is None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            timed_out = True
+            sandbox.kill()
+            break
+        for key, _ in selector.select(remaining):
+            fd = key.fd
+            if fd == stdin_fd:
+                try:
+                    written = os.write(fd, pending[:READ_CHUNK])
+                except BlockingIOError:
+                    continue
+                except BrokenPipeError:
+                    written = len(pending)  # 입력을 다 읽지 않고 종료한 경우
+                pending = pending[written:]
+                if not pending:
+                    selector.unregister(fd)
+                    os.close(fd)
+                continue
+            if fd == control_fd:
+                stopped = sink.control()
+                if stopped is not None:
+                    sandbox.kill()
+                    break
+                continue
+            chunk = os.read(fd, READ_CHUNK)
+            if not chunk:
+                selector.unregister(fd)
+            elif fd == stdout_fd:
+                stopped = sink.feed(chunk)
+                if stopped is not None:
+                    sandbox.kill()
+                    break
+            else:
+                stderr += chunk[: max(sink.capture_limit - len(stderr), 0)]
+
+    for key in list(selector.get_map().values()):
+        selector.unregister(key.fd)
+        if key.fd == stdin_fd:
+            os.close(key.fd)
+    selector.close()
+    pending.release()  # 메모리 맵 입력을 닫을 수 있도록 버퍼 참조를 해제합니다.
+    return bytes(stderr), timed_out, stopped
+
+
+def wait_for_exit(sandbox, pid, deadline):
+    """
+    자식 프로세스가 종료될 때까지 기다렸다가 회수합니다. deadline이 지나면 샌드박스 안의
+    프로세스를 모두 강제 종료한 뒤 회수합니다.
+
+    제출 코드가 표준 출력과 표준 에러를 닫으면 communicate는 제한 시간 전에 끝나므로,
+    회수할 때도 같은 제한 시간을 적용해야 실행이 실행 슬롯을 무기한 잡고 있지 않습니다.
+
+    Args:
+        sandbox (RlimitSandbox): 자식 프로세스가 등록된 샌드박스.
+        pid (int): 자식 프로세스 ID.
+        deadline (float): time.monotonic() 기준 종료 시각.
+
+    Returns:
+        tuple: (종료 상태, 자원 사용량 rusage, 시간 초과로 강제 종료했는지 여부) 튜플.
+    """
+    interval = REAP_POLL_MIN_INTERVAL
+    while True:
+        waited_pid, wait_status, rusage = os.wait4(pid, os.WNOHANG)
+        if waited_pid:
+            return wait_status, rusage, False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            sandbox.kill()
+            _, wait_status, rusage = os.wait4(pid, 0)
+            return wait_status, rusage, True
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, REAP_POLL_MAX_INTERVAL)
+
+
+def build_result(
+    sink,
+    stderr,
+    exit_code,
+    timed_out,
+    stopped,
+    wall_time,
+    rusage,
+    time_limit,
+    memory_limit,
+    oom_killed=False,
+):
+    """
+    측정값으로 실행 상태를 판정하고 실행 결과 딕셔너리를 만듭니다.
+
+    CPU 시간이 제한을 넘거나 경과 시간이 제한의 WALL_TIME_SLACK배를 넘거나 제한 시간이 지나
+    강제 종료되면 시간 초과, 최대 RSS가 제한을 넘거나
+    MemoryError 또는 cgroup 메모리 제한으로 종료되면 메모리 초과로 판정합니다. exec 래퍼가 샌드박스를
+    설정하지 못했으면 internal_error로 판정합니다. 출력 크기 초과나 예상 출력과의
+    불일치로 중단된 실행은 각각 output_limit, wrong_answer로 판정합니다.
+
+    Args:
+        sink (OutputSink): 표준 출력을 받은 OutputSink.
+        stderr (bytes): 표준 에러.
+        exit_code (int): 종료 코드. 시그널로 종료되었으면 음수 시그널 번호.
+        timed_out (bool): 제한 시간이 지나 강제 종료되었는지 여부.
+        stopped (str | None): communicate가 실행을 중단한 사유.
+        wall_time (float): 경과 시간 (초 단위).
+        rusage (resource.struct_rusage): os.wait4로 얻은 자식 프로세스의 자원 사용량.
+        time_limit (float): 실행 제한 시간 (초 단위).
+        memory_limit (int): 메모리 제한 (MB 단위).
+        oom_killed (bool): 커널이 메모리 제한으로 프로세스를 종료했는지 여부.
+
+    Returns:
+        dict: status, stdout, stderr, exit_code, wall_time, cpu_time, memory_kb와
+            matched(예상 출력 일치 여부, 비교기가 없으면 None), stdout_truncated를 담은 실행 결과.
+    """
+    cpu_time = rusage.ru_utime + rusage.ru_stime
+    memory_kb = rusage.ru_maxrss  # Linux에서 KB 단위
+    matched = None if timed_out or stopped else sink.finish()
+
+    if exit_code == SANDBOX_SETUP_EXIT_CODE:
+        status = STATUS_INTERNAL_ERROR
+    elif (
+        timed_out
+        or cpu_time > time_limit
+        or wall_time > time_limit * WALL_TIME_SLACK
+        or exit_code == -signal.SIGXCPU
+    ):
+        status = STATUS_TIME_LIMIT
+    elif stopped is not None:
+        status = stopped
+    elif (
+        oom_killed
+        or memory_kb > memory_limit * 1024
+        or exit_code == MEMORY_ERROR_EXIT_CODE
+    ):
+        status = STATUS_MEMORY_LIMIT
+    elif exit_code != 0:
+        status = STATUS_RUNTIME_ERROR
+    else:
+        status = STATUS_OK
+
+    return {
+        "status": status,
+        "stdout": bytes(sink.captured).decode("utf-8", errors="replace"),
+        "stderr": stderr.decode("utf-8", errors="replace"),
+        "exit_code": exit_code,
+        "wall_time": round(wall_time, 4),
+        "cpu_time": round(cpu_time, 4),
+        "memory_kb": memory_kb,
+        "matched": matched,
+        "stdout_truncated": sink.truncated,
+    }
+
+
+def run_process(
+    args,
+    input_data,
+    time_limit,
+    memory_limit,
+    cwd=None,
+    address_space=True,
+    comparator=None,
+    output_limit=None,
+    capture_limit=None,
+    file_size=None,
+    input_path=None,
+    sandbox=SANDBOX_AUTO,
+    processes=None,
+    open_files=None,
+    cgroup_root=None,
+    nice=DEFAULT_NICE,
+):
+    """
+    샌드박스 안의 새 프로세스에서 명령을 실행하고, 시간/메모리를 측정한 실행 결과를 반환합니다.
+
+    Args:
+        args (list): 실행할 명령과 인자.
+        input_data (str): 표준 입력으로 전달할 데이터.
+        time_limit (float): 실행 제한 시간 (초 단위).
+        memory_limit (int): 메모리 제한 (MB 단위).
+        cwd (str, optional): 작업 디렉터리.
+        address_space (bool): 주소 공간(RLIMIT_AS)을 제한할지 여부.
+        comparator (optional): 표준 출력을 비교할 comparator 모듈의 비교기.
+        output_limit (int, optional): 표준 출력 최대 크기 (바이트).
+        capture_limit (int, optional): 결과에 담을 출력 최대 크기 (바이트).
+        file_size (int, optional): 쓸 수 있는 파일의 최대 크기 (바이트).
+        input_path (str, optional): 표준 입력으로 전달할 파일 경로. 주어지면 input_data 대신 사용합니다.
+        sandbox (str): 샌드박스 백엔드 (auto, rlimit, cgroup).
+        processes (int, optional): 최대 프로세스 수.
+        open_files (int, optional): 열 수 있는 파일 디스크립터 수.
+        cgroup_root (str, optional): 실행별 cgroup을 만들 상위 cgroup 경로.
+        nice (int): 자식 프로세스의 nice 값.
+
+    Returns:
+        dict: build_result가 반환하는 실행 결과.
+    """
+    stdin_r, stdin_w = os.pipe()
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+
+    with create_sandbox(
+        sandbox,
+        cgroup_root,
+        time_limit=time_limit,
+        memory_limit=memory_limit,
+        address_space=address_space,
+        file_size=file_size,
+        processes=processes,
+        open_files=open_files,
+        nice=nice,
+    ) as box:
+        try:
+            process = subprocess.Popen(
+                box.wrap_command(args),
+                stdin=stdin_r,
+                stdout=stdout_w,
+                stderr=stderr_w,
+                cwd=cwd,
+                close_fds=True,
+                start_new_session=True,
+            )
+        except Exception:
+            for fd in (stdin_r, stdin_w, stdout_r, stdout_w, stderr_r, stderr_w):
+                os.close(fd)
+            raise
+        box.attach(process.pid)
+        started = time.monotonic()
+        deadline = started + time_limit
+        for fd in (stdin_r, stdout_w, stderr_w):
+            os.close(fd)
+
+        sink = OutputSink(output_limit, capture_limit, comparator)
+        try:
+            with open_input(input_data, input_path) as input_buffer:
+                stderr, timed_out, stopped = communicate(
+                    box,
+                    stdin_w,
+                    stdout_r,
+                    stderr_r,
+                    input_buffer,
+                    deadline,
+                    sink,
+                )
+        finally:
+            os.close(stdout_r)
+            os.close(stderr_r)
+        wait_status, rusage, reap_timed_out = wait_for_exit(box, process.pid, deadline)
+        timed_out = timed_out or reap_timed_out
+        wall_time = time.monotonic() - started
+        process.returncode = os.waitstatus_to_exitcode(wait_status)
+        oom_killed = box.memory_exceeded()
+
+    return build_result(
+        sink,
+        stderr,
+        process.returncode,
+        timed_out,
+        stopped,
+        wall_time,
+        rusage,
+        time_limit,
+        memory_limit,
+        oom_killed,
+    )
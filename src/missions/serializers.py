@@ -6,6 +6,8 @@ from .models import (
     MultipleChoiceQuestion,
     MultipleChoiceSubmission,
     Mission,
+    MissionResult,
+    TestCase,
 )
 
 
@@ -69,6 +71,37 @@ class MultipleChoiceSubmissionSerializer(serializers.ModelSerializer):
         return submission
 
 
+class MultipleChoiceAnswerSheetSerializer(serializers.Serializer):
+    """
+    미션 전체의 5지선다형 답안지를 검증하는 클래스.
+
+    answers는 {문제 ID: 선택한 답안} 형식이며, attempt_id는 응시마다 클라이언트가 생성합니다.
+    """
+
+    attempt_id = serializers.UUIDField()
+    answers = serializers.DictField(
+        child=serializers.IntegerField(min_value=1, max_value=5), allow_empty=False
+    )
+
+    def validate_answers(self, value):
+        """
+        JSON 객체의 문자열 키를 정수 문제 ID로 변환합니다.
+
+        Args:
+            value (dict): {문제 ID: 선택한 답안} 형식의 답안.
+
+        Returns:
+            dict: 키가 정수로 변환된 답안.
+
+        Raises:
+            ValidationError: 문제 ID가 정수가 아닌 경우 발생.
+        """
+        try:
+            return {int(question_id): option for question_id, option in value.items()}
+        except ValueError:
+            raise serializers.ValidationError("문제 ID는 정수여야 합니다.")
+
+
 class DetailMultipleChoiceSubmissionSerializer(serializers.ModelSerializer):
     """
     MultipleChoiceSubmission 시리얼라이저.
@@ -129,6 +162,8 @@ class CodeSubmissionSerializer(serializers.ModelSerializer):
             "time_limit",
             "memory_limit",
             "language",
+            "compare_mode",
+            "float_tolerance",
         )
 
 
@@ -145,3 +180,122 @@ class SimpleSubmissionSerializer(serializers.ModelSerializer):
             "submission_time",
             "is_passed",
         )
+
+
+class CodeSubmissionRecordStatusSerializer(serializers.ModelSerializer):
+    """
+    코드 제출 기록의 채점 상태와 결과를 직렬화하는 클래스.
+    """
+
+    class Meta:
+        model = CodeSubmissionRecord
+        fields = (
+            "id",
+            "code_submission",
+            "status",
+            "is_passed",
+            "result_summary",
+            "case_results",
+            "execution_time",
+            "memory_usage",
+            "cache_hit",
+            "submission_time",
+            "started_at",
+            "finished_at",
+        )
+
+
+class MissionResultSerializer(serializers.ModelSerializer):
+    """
+    사용자별 미션 결과를 직렬화하는 클래스.
+    """
+
+    user = serializers.CharField(source="user.username", read_only=True)
+    mission_title = serializers.CharField(source="mission.title", read_only=True)
+
+    class Meta:
+        model = MissionResult
+        fields = (
+            "id",
+            "user",
+            "mission",
+            "mission_title",
+            "best_score",
+            "attempts",
+            "last_submitted_at",
+            "passed",
+        )
+
+
+class MultipleChoiceQuestionImportSerializer(serializers.ModelSerializer):
+    """
+    문제 은행 가져오기 파일의 5지선다형 문제 하나를 검증하는 클래스.
+
+    id가 있으면 미션의 기존 문제를 수정하고, 없으면 새 문제를 만듭니다.
+    """
+
+    id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = MultipleChoiceQuestion
+        fields = (
+            "id",
+            "question",
+            "option_1",
+            "option_2",
+            "option_3",
+            "option_4",
+            "option_5",
+            "correct_option",
+        )
+
+
+class TestCaseImportSerializer(serializers.ModelSerializer):
+    """
+    문제 은행 가져오기 파일의 테스트 케이스 하나를 검증하는 클래스.
+    """
+
+    class Meta:
+        model = TestCase
+        fields = (
+            "input_data",
+            "expected_output",
+            "is_sample",
+            "time_limit",
+            "memory_limit",
+        )
+        extra_kwargs = {
+            "input_data": {"trim_whitespace": False},
+            "expected_output": {"trim_whitespace": False},
+        }
+
+
+class CodeSubmissionImportSerializer(serializers.ModelSerializer):
+    """
+    문제 은행 가져오기 파일의 코드 제출형 문제 하나를 검증하는 클래스.
+
+    id가 있으면 미션의 기존 문제를 수정하고, 없으면 새 문제를 만듭니다.
+    test_cases가 있으면 문제의 테스트 케이스를 이 목록으로 교체합니다.
+    """
+
+    id = serializers.IntegerField(required=False, allow_null=True)
+    test_cases = TestCaseImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = CodeSubmission
+        fields = (
+            "id",
+            "problem_statement",
+            "example_input",
+            "example_output",
+            "time_limit",
+            "memory_limit",
+            "language",
+            "compare_mode",
+            "float_tolerance",
+            "test_cases",
+        )
+        extra_kwargs = {
+            "example_input": {"trim_whitespace": False},
+            "example_output": {"trim_whitespace": False},
+        }
@@ -1,23 +1,212 @@
+import contextlib
+import hashlib
+import json
+import logging
 import os
+import shutil
 import subprocess
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
 
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .comparator import HASHABLE_MODES, compare_output, open_comparator
+from .judge_pool import JudgeWorkerError, get_worker_pool
 from .models import CodeSubmission, CodeSubmissionRecord
+from .results import record_code_mission_result
+from .sandbox import (
+    STATUS_INTERNAL_ERROR,
+    STATUS_MEMORY_LIMIT,
+    STATUS_OK,
+    STATUS_OUTPUT_LIMIT,
+    STATUS_RUNTIME_ERROR,
+    STATUS_TIME_LIMIT,
+    STATUS_WRONG_ANSWER,
+    SandboxBusyError,
+    host_slot,
+    run_process,
+    scratch_directory,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# 원격 저장소의 테스트 케이스 데이터를 내려받을 때 사용하는 조각 크기
+PAYLOAD_COPY_CHUNK = 1024 * 1024
+
+# 테스트 케이스 채점 결과 상태
+CASE_PASSED = "passed"
+CASE_WRONG_ANSWER = STATUS_WRONG_ANSWER
+CASE_SKIPPED = "skipped"
+
+# 호스트 부하나 실행 환경에 따라 달라질 수 있어 캐시로 재사용하지 않는 케이스 상태
+UNCACHEABLE_CASE_STATUSES = (
+    STATUS_INTERNAL_ERROR,
+    STATUS_TIME_LIMIT,
+    STATUS_MEMORY_LIMIT,
+)
+
+
+def format_run_output(result: dict) -> str:
+    """
+    구조화된 실행 결과를 기존 문자열 형식(출력, "시간 초과", "출력 초과", "실행 에러: ...")으로
+    변환합니다.
+
+    Args:
+        result (dict): execute가 반환한 실행 결과.
+
+    Returns:
+        str: 실행 결과 또는 에러 메시지.
+    """
+    if result["status"] == STATUS_TIME_LIMIT:
+        return "시간 초과"
+    if result["status"] == STATUS_OUTPUT_LIMIT:
+        return "출력 초과"
+    if result["status"] == STATUS_WRONG_ANSWER:  # 예상 출력과 달라 실행을 중단한 경우
+        return result["stdout"].strip()
+    if result["status"] != STATUS_OK or result["stderr"]:
+        return f"실행 에러: {result['stderr'].strip()}"
+    return result["stdout"].strip()
+
+
+def get_run_options() -> dict:
+    """
+    실행 요청에 함께 넘길 출력 크기와 파일 크기 제한, 샌드박스 설정을 설정에서 읽어 반환합니다.
+
+    Returns:
+        dict: output_limit, capture_limit, file_size (바이트 단위)와 sandbox, cgroup_root,
+            processes, open_files, nice.
+    """
+    return {
+        "output_limit": settings.JUDGE_OUTPUT_LIMIT_KB * 1024,
+        "capture_limit": settings.JUDGE_OUTPUT_CAPTURE_KB * 1024,
+        "file_size": settings.JUDGE_FILE_SIZE_LIMIT_KB * 1024,
+        "sandbox": settings.JUDGE_SANDBOX_BACKEND,
+        "cgroup_root": settings.JUDGE_CGROUP_ROOT,
+        "processes": settings.JUDGE_PROCESS_LIMIT or None,
+        "open_files": settings.JUDGE_OPEN_FILES_LIMIT or None,
+        "nice": settings.JUDGE_NICE,
+    }
+
+
+def judge_slot():
+    """
+    호스트 전체의 동시 실행 한도(JUDGE_HOST_CONCURRENCY, 0이면 CPU 수) 안에서 실행 슬롯을
+    하나 잡는 컨텍스트 매니저를 반환합니다. 같은 호스트의 웹 워커와 채점 워커가 슬롯을 나눠 쓰므로,
+    채점 부하가 몰려도 API 요청을 처리할 CPU가 남습니다.
+
+    Returns:
+        contextlib.AbstractContextManager: 실행 슬롯 컨텍스트 매니저.
+    """
+    return host_slot(
+        settings.JUDGE_SLOT_DIR or os.path.join(tempfile.gettempdir(), "judge-slots"),
+        settings.JUDGE_HOST_CONCURRENCY or os.cpu_count() or 1,
+        settings.JUDGE_SLOT_TIMEOUT,
+    )
+
+
+def run_without_limits(
+    args: list,
+    input_data: str,
+    time_limit: int,
+    cwd: str = None,
+    input_path: str = None,
+) -> dict:
+    """
+    rlimit을 사용할 수 없는 환경(Windows)에서 경과 시간 제한만 두고 명령을 실행합니다.
+
+    Args:
+        args (list): 실행할 명령과 인자.
+        input_data (str): 표준 입력으로 전달할 데이터.
+        time_limit (int): 실행 제한 시간 (초 단위).
+        cwd (str, optional): 작업 디렉터리.
+        input_path (str, optional): 표준 입력으로 전달할 파일 경로.
+
+    Returns:
+        dict: 실행 결과. CPU 시간과 메모리는 측정하지 않습니다.
+    """
+    if input_path is not None:
+        with open(input_path, encoding="utf-8", errors="replace", newline="") as f:
+            input_data = f.read()
+    started = time.monotonic()
+    try:
+        result = subprocess.run(
+            args,
+            input=input_data,
+            capture_output=True,
+            text=True,
+            timeout=time_limit,
+            cwd=cwd,
+        )
+    except subprocess.TimeoutExpired:
+        status, stdout, stderr = STATUS_TIME_LIMIT, "", ""
+    else:
+        stdout, stderr = result.stdout, result.stderr
+        if "MemoryError" in stderr:
+            status = STATUS_MEMORY_LIMIT
+        elif result.returncode != 0:
+            status = STATUS_RUNTIME_ERROR
+        else:
+            status = STATUS_OK
+    return {
+        "status": status,
+        "stdout": stdout,
+        "stderr": stderr,
+        "wall_time": round(time.monotonic() - started, 4),
+        "cpu_time": None,
+        "memory_kb": None,
+    }
 
 
 # 채점 인터페이스
 class CodeJudgeInterface:
     """
     코드 채점 인터페이스.
-    
+
     각 언어별로 구현해야 할 기본 채점 로직을 정의합니다.
-    모든 하위 클래스는 이 인터페이스의 `run_code` 메서드를 구현해야 합니다.
+    모든 하위 클래스는 이 인터페이스의 `execute` 메서드를 구현해야 합니다.
     """
 
+    def execute(
+        self,
+        code: str,
+        input_data: str,
+        time_limit: int,
+        memory_limit: int,
+        compare: dict = None,
+        input_path: str = None,
+    ) -> dict:
+        """
+        제출된 코드를 실행하고 구조화된 결과를 반환하는 메서드. 하위 클래스에서 구현됩니다.
+
+        compare가 주어지면 출력을 실행 중에 예상 출력과 비교하여, 불일치가 확인되는 즉시
+        실행을 중단하고 wrong_answer로 판정합니다. 출력은 설정된 크기까지만 보관합니다.
+
+        Args:
+            code (str): 실행할 코드.
+            input_data (str): 코드에 제공할 입력 데이터.
+            time_limit (int): 실행 제한 시간 (초 단위).
+            memory_limit (int): 메모리 제한 (MB 단위).
+            compare (dict, optional): expected(또는 expected_path), mode, tolerance를 담은 출력 비교 조건.
+            input_path (str, optional): 표준 입력으로 전달할 파일 경로. 주어지면 input_data 대신
+                파일을 메모리 맵으로 읽어 전달합니다.
+
+        Returns:
+            dict: status(ok, wrong_answer, runtime_error, time_limit, memory_limit, output_limit,
+                internal_error), stdout, stderr, matched(예상 출력 일치 여부)와 측정한 wall_time(초), cpu_time(초), memory_kb(KB)를 담은
+                실행 결과. 측정하지 못한 값은 None입니다.
+        """
+        raise NotImplementedError("이 메서드는 서브클래스에서 구현되어야 합니다.")
+
     def run_code(
         self, code: str, input_data: str, time_limit: int, memory_limit: int
     ) -> str:
         """
-        제출된 코드를 실행하는 메서드. 하위 클래스에서 구현됩니다.
+        제출된 코드를 실행하는 메서드.
 
         Args:
             code (str): 실행할 코드.
@@ -28,7 +217,9 @@ class CodeJudgeInterface:
         Returns:
             str: 실행 결과 또는 에러 메시지.
         """
-        raise NotImplementedError("이 메서드는 서브클래스에서 구현되어야 합니다.")
+        return format_run_output(
+            self.execute(code, input_data, time_limit, memory_limit)
+        )
 
 
 class PythonCodeJudge(CodeJudgeInterface):
@@ -38,66 +229,130 @@ class PythonCodeJudge(CodeJudgeInterface):
     제출된 파이썬 코드를 주어진 시간과 메모리 제한 내에서 실행합니다.
     """
 
-    def run_code(
-        self, code: str, input_data: str, time_limit: int, memory_limit: int
-    ) -> str:
+    def execute(
+        self,
+        code: str,
+        input_data: str,
+        time_limit: int,
+        memory_limit: int,
+        compare: dict = None,
+        input_path: str = None,
+    ) -> dict:
         """
         제출된 파이썬 코드를 실행하고, 결과를 반환합니다.
 
-        Windows와 Linux 환경에 따라 메모리 제한을 다르게 적용합니다.
+        채점 워커 풀을 사용할 수 있으면 미리 띄워 둔 워커에서 실행하고,
+        그렇지 않으면 실행마다 인터프리터를 새로 띄웁니다.
 
         Args:
             code (str): 실행할 파이썬 코드.
             input_data (str): 코드에 제공할 입력 데이터.
             time_limit (int): 실행 제한 시간.
             memory_limit (int): 메모리 제한 (MB 단위).
+            compare (dict, optional): 출력 비교 조건.
+            input_path (str, optional): 입력 파일 경로.
 
         Returns:
-            str: 실행 결과 또는 에러 메시지.
+            dict: 실행 결과.
         """
+        pool = get_worker_pool("python")
+        if pool is None:
+            return self.execute_in_subprocess(
+                code, input_data, time_limit, memory_limit, compare, input_path
+            )
+
         try:
-            if os.name == "nt":
-                result = subprocess.run(
-                    ["python", "-c", code],  # Windows 환경일 경우 'python'으로 변경
-                    input=input_data,
-                    capture_output=True,
-                    text=True,
-                    timeout=time_limit,
+            with judge_slot():
+                return pool.run(
+                    code,
+                    input_data,
+                    time_limit,
+                    memory_limit,
+                    compare=compare,
+                    input_path=input_path,
+                    **get_run_options(),
                 )
-            else:
-                import resource
+        except (JudgeWorkerError, SandboxBusyError) as e:
+            return {"status": STATUS_INTERNAL_ERROR, "stdout": "", "stderr": str(e)}
 
-                def set_memory_limit():
-                    resource.setrlimit(
-                        resource.RLIMIT_AS,
-                        (memory_limit * 1024 * 1024, memory_limit * 1024 * 1024),
-                    )
+    def run_code_in_subprocess(
+        self, code: str, input_data: str, time_limit: int, memory_limit: int
+    ) -> str:
+        """
+        새 파이썬 인터프리터를 띄워 제출된 코드를 실행하고, 결과 문자열을 반환합니다.
 
-                result = subprocess.run(
-                    ["python3", "-c", code],
-                    input=input_data,
-                    capture_output=True,
-                    text=True,
-                    timeout=time_limit,
-                    preexec_fn=set_memory_limit,
-                )
+        Args:
+            code (str): 실행할 파이썬 코드.
+            input_data (str): 코드에 제공할 입력 데이터.
+            time_limit (int): 실행 제한 시간.
+            memory_limit (int): 메모리 제한 (MB 단위).
 
-            # 디버깅을 위해 실행 결과를 로그에 출력
-            stdout = result.stdout.strip()
-            stderr = result.stderr.strip() if result.stderr else "No errors"
-            print(f"STDOUT: {stdout}")
-            print(f"STDERR: {stderr}")
+        Returns:
+            str: 실행 결과 또는 에러 메시지.
+        """
+        return format_run_output(
+            self.execute_in_subprocess(code, input_data, time_limit, memory_limit)
+        )
 
-            if result.stderr:
-                return f"실행 에러: {stderr}"
+    def execute_in_subprocess(
+        self,
+        code: str,
+        input_data: str,
+        time_limit: int,
+        memory_limit: int,
+        compare: dict = None,
+        input_path: str = None,
+    ) -> dict:
+        """
+        새 파이썬 인터프리터를 띄워 제출된 코드를 실행하고, 결과를 반환합니다.
 
-            return stdout
+        Linux에서는 샌드박스(rlimit 또는 cgroup)로 CPU 시간과 메모리, 프로세스를 제한하고 사용량을 측정하며,
+        Windows에서는 경과 시간 제한만 적용합니다. 실행마다 별도의 임시 작업 디렉터리를 사용합니다.
 
-        except subprocess.TimeoutExpired:
-            return "시간 초과"
+        Args:
+            code (str): 실행할 파이썬 코드.
+            input_data (str): 코드에 제공할 입력 데이터.
+            time_limit (int): 실행 제한 시간.
+            memory_limit (int): 메모리 제한 (MB 단위).
+            compare (dict, optional): 출력 비교 조건. Windows에서는 실행 후 비교합니다.
+            input_path (str, optional): 입력 파일 경로.
+
+        Returns:
+            dict: 실행 결과.
+        """
+        try:
+            with scratch_directory(settings.JUDGE_SCRATCH_DIR or None) as workspace:
+                if os.name == "nt":
+                    # Windows 환경일 경우 'python'으로 변경
+                    result = run_without_limits(
+                        ["python", "-c", code],
+                        input_data,
+                        time_limit,
+                        cwd=workspace,
+                        input_path=input_path,
+                    )
+                else:
+                    with judge_slot(), open_comparator(compare) as comparator:
+                        result = run_process(
+                            ["python3", "-c", code],
+                            input_data,
+                            time_limit,
+                            memory_limit,
+                            cwd=workspace,
+                            comparator=comparator,
+                            input_path=input_path,
+                            **get_run_options(),
+                        )
+            logger.debug(
+                "status=%s stdout=%r stderr=%r",
+                result["status"],
+                result["stdout"],
+                result["stderr"],
+            )
+            return result
         except Exception as e:
-            print(f"실행 에러: {e}")
-            return f"실행 에러: {e}"
+            logger.exception("코드 실행 에러")
+            return {"status": STATUS_INTERNAL_ERROR, "stdout": "", "stderr": str(e)}
 
 
 class JavaScriptCodeJudge(CodeJudgeInterface):
@@ -107,65 +362,67 @@ class JavaScriptCodeJudge(CodeJudgeInterface):
     제출된 자바스크립트 코드를 주어진 시간과 메모리 제한 내에서 실행합니다.
     """
 
-    def run_code(
-        self, code: str, input_data: str, time_limit: int, memory_limit: int
-    ) -> str:
+    def execute(
+        self,
+        code: str,
+        input_data: str,
+        time_limit: int,
+        memory_limit: int,
+        compare: dict = None,
+        input_path: str = None,
+    ) -> dict:
         """
         제출된 자바스크립트 코드를 실행하고, 결과를 반환합니다.
 
-        Windows와 Linux 환경에 따라 메모리 제한을 다르게 적용합니다.
+        Node.js는 가상 메모리를 크게 예약하므로 주소 공간(RLIMIT_AS) 대신 V8 힙 크기를
+        제한하며, 메모리 초과는 측정한 최대 RSS로 판정합니다.
+        코드는 실행마다 새로 만든 임시 작업 디렉터리(가능하면 tmpfs)에 저장하므로
+        동시에 채점되는 제출끼리 파일을 공유하지 않으며, 실행이 끝나면 디렉터리를 삭제합니다.
 
         Args:
             code (str): 실행할 자바스크립트 코드.
             input_data (str): 코드에 제공할 입력 데이터.
             time_limit (int): 실행 제한 시간.
             memory_limit (int): 메모리 제한 (MB 단위).
+            compare (dict, optional): 출력 비교 조건. Windows에서는 실행 후 비교합니다.
+            input_path (str, optional): 입력 파일 경로.
 
         Returns:
-            str: 실행 결과 또는 에러 메시지.
+            dict: 실행 결과.
         """
         try:
-            with open("temp.js", "w") as f:
-                f.write(code)
-
-            if os.name == "nt":
-                result = subprocess.run(
-                    ["node", "temp.js"],
-                    input=input_data.encode(),
-                    capture_output=True,
-                    text=True,
-                    timeout=time_limit,
-                )
-            else:
-                import resource
-
-                def set_memory_limit():
-                    resource.setrlimit(
-                        resource.RLIMIT_AS,
-                        (memory_limit * 1024 * 1024, memory_limit * 1024 * 1024),
+            with scratch_directory(settings.JUDGE_SCRATCH_DIR or None) as workspace:
+                with open(os.path.join(workspace, "main.js"), "w") as f:
+                    f.write(code)
+
+                if os.name == "nt":
+                    return run_without_limits(
+                        ["node", "main.js"],
+                        input_data,
+                        time_limit,
+                        cwd=workspace,
+                        input_path=input_path,
+                    )
+                with judge_slot(), open_comparator(compare) as comparator:
+                    return run_process(
+                        ["node", f"--max-old-space-size={memory_limit}", "main.js"],
+                        input_data,
+                        time_limit,
+                        memory_limit,
+                        cwd=workspace,
+                        address_space=False,
+                        comparator=comparator,
+                        input_path=input_path,
+                        **get_run_options(),
                     )
-
-                result = subprocess.run(
-                    ["node", "temp.js"],
-                    input=input_data.encode(),
-                    capture_output=True,
-                    text=True,
-                    timeout=time_limit,
-                    preexec_fn=set_memory_limit,
-                )
-
-            return result.stdout.strip()
-
-        except subprocess.TimeoutExpired:
-            return "시간 초과"
         except Exception as e:
-            return f"실행 에러: {e}"
+            return {"status": STATUS_INTERNAL_ERROR, "stdout": "", "stderr": str(e)}
 
 
 class CodeJudgeFactory:
     """
     프로그래밍 언어에 따른 채점 클래스를 반환하는 팩토리 클래스.
-    
+
     파이썬 또는 자바스크립트 코드 채점 클래스를 생성합니다.
     """
 
@@ -191,15 +448,436 @@ class CodeJudgeFactory:
             raise ValueError(f"지원하지 않는 언어입니다: {language}")
 
 
+@contextlib.contextmanager
+def local_payload_path(stored):
+    """
+    파일 저장소에 있는 테스트 케이스 데이터의 로컬 파일 경로를 제공합니다.
+
+    로컬 파일 시스템 저장소면 파일 경로를 그대로 사용하고, 원격 저장소면 실행별 임시
+    디렉터리에 조각 단위로 내려받은 뒤 블록이 끝나면 삭제합니다.
+
+    Args:
+        stored (FieldFile): TestCase의 input_file 또는 expected_file.
+
+    Yields:
+        str: 로컬 파일 경로.
+    """
+    try:
+        path = stored.path
+    except NotImplementedError:
+        path = None
+    if path is not None:
+        yield path
+        return
+
+    with scratch_directory(settings.JUDGE_SCRATCH_DIR or None) as workspace:
+        path = os.path.join(workspace, "payload")
+        with stored.open("rb") as source, open(path, "wb") as target:
+            shutil.copyfileobj(source, target, PAYLOAD_COPY_CHUNK)
+        yield path
+
+
+def get_test_cases(
+    code_submission: CodeSubmission, time_limit: int, memory_limit: int
+) -> list:
+    """
+    채점에 사용할 테스트 케이스 목록을 반환합니다.
+
+    등록된 TestCase가 없으면 문제의 입출력 예시를 샘플 케이스로 사용합니다.
+    케이스별 제한이 비어 있으면 문제의 제한을 사용합니다.
+    파일 저장소에 있는 입출력은 읽지 않고 파일(input_file, expected_file)로 넘기며,
+    결과에 입출력을 보여 주는 샘플 케이스만 내용을 읽습니다.
+    비교 모드를 해시로 비교할 수 있으면 샘플이 아닌 케이스의 예상 출력은 DB에서도 읽지 않고,
+    저장할 때 계산해 둔 정규형 해시와 길이만 비교 조건(compare)에 넣습니다.
+
+    Args:
+        code_submission (CodeSubmission): 코드 제출형 문제.
+        time_limit (int): 기본 실행 시간 제한 (초 단위).
+        memory_limit (int): 기본 메모리 제한 (MB 단위).
+
+    Returns:
+        list: id, input, expected, input_file, expected_file, is_sample, time_limit, memory_limit과
+            출력 비교 조건(compare)을 담은 딕셔너리 목록.
+    """
+    mode = code_submission.compare_mode
+    base_compare = {"mode": mode, "tolerance": code_submission.float_tolerance}
+    queryset = code_submission.test_cases.order_by("id")
+    if mode in HASHABLE_MODES:
+        queryset = queryset.defer("expected_output")
+
+    test_cases = []
+    for test_case in queryset:
+        compare = dict(base_compare)
+        digest = (
+            test_case.expected_digests.get(mode) if mode in HASHABLE_MODES else None
+        )
+        if test_case.is_sample:
+            expected = test_case.read_expected_output()
+            expected_file = None
+        elif digest:
+            compare["expected_digest"], compare["expected_length"] = digest
+            expected = None
+            expected_file = None
+        else:
+            expected = test_case.expected_output
+            expected_file = test_case.expected_file or None
+        test_cases.append(
+            {
+                "id": test_case.id,
+                "input": test_case.read_input()
+                if test_case.is_sample
+                else test_case.input_data,
+                "expected": expected,
+                "input_file": None
+                if test_case.is_sample
+                else (test_case.input_file or None),
+                "expected_file": expected_file,
+                "is_sample": test_case.is_sample,
+                "time_limit": test_case.time_limit or time_limit,
+                "memory_limit": test_case.memory_limit or memory_limit,
+                "compare": compare,
+            }
+        )
+    if not test_cases:
+        test_cases.append(
+            {
+                "id": None,
+                "input": code_submission.example_input,
+                "expected": code_submission.example_output,
+                "input_file": None,
+                "expected_file": None,
+                "is_sample": True,
+                "time_limit": time_limit,
+                "memory_limit": memory_limit,
+                "compare": base_compare,
+            }
+        )
+    return test_cases
+
+
+def judge_test_case(judge: CodeJudgeInterface, code: str, test_case: dict) -> dict:
+    """
+    테스트 케이스 하나를 실행하고 채점 결과를 반환합니다.
+
+    파일 저장소에 있는 입력은 파일 경로로 넘겨 자식 프로세스의 표준 입력으로 바로 흘려보내고,
+    예상 출력도 파일 경로로 비교기에 넘겨 비교하면서 조각 단위로 읽게 합니다. 비교 조건에 정규형 해시가 있으면 예상 출력 없이
+    해시로 비교합니다.
+    샘플 케이스가 아니면 입력과 예상 출력을 결과에 포함하지 않습니다.
+
+    Args:
+        judge (CodeJudgeInterface): 사용할 채점 클래스.
+        code (str): 제출된 코드.
+        test_case (dict): get_test_cases가 반환한 테스트 케이스.
+
+    Returns:
+        dict: test_case_id, status, passed, 측정한 wall_time, cpu_time, memory_kb와
+            (샘플 케이스의 경우) input, expected, actual을 담은 결과.
+    """
+    with contextlib.ExitStack() as stack:
+        input_path = None
+        if test_case["input_file"] is not None:
+            input_path = stack.enter_context(
+                local_payload_path(test_case["input_file"])
+            )
+        compare = dict(test_case["compare"])
+        if test_case["expected_file"] is not None:
+            compare["expected_path"] = stack.enter_context(
+                local_payload_path(test_case["expected_file"])
+            )
+        elif "expected_digest" not in compare:
+            compare["expected"] = test_case["expected"]
+
+        run = judge.execute(
+            code,
+            test_case["input"],
+            test_case["time_limit"],
+            test_case["memory_limit"],
+            compare=compare,
+            input_path=input_path,
+        )
+        if run["status"] == STATUS_OK:
+            passed = run.get("matched")
+            if passed is None:  # 실행 중에 비교하지 못한 경우 (Windows)
+                passed = compare_output(run["stdout"], **compare)
+            status = CASE_PASSED if passed else CASE_WRONG_ANSWER
+        else:
+            passed = False
+            status = run["status"]
+
+    result = {
+        "test_case_id": test_case["id"],
+        "status": status,
+        "passed": passed,
+        "wall_time": run.get("wall_time"),
+        "cpu_time": run.get("cpu_time"),
+        "memory_kb": run.get("memory_kb"),
+    }
+    if test_case["is_sample"]:
+        result.update(
+            {
+                "input": test_case["input"],
+                "expected": test_case["expected"],
+                "actual": format_run_output(run),
+            }
+        )
+    return result
+
+
+def run_test_cases(
+    judge: CodeJudgeInterface, code: str, test_cases: list, fail_fast: bool = False
+) -> list:
+    """
+    테스트 케이스들을 제한된 수만큼 동시에 실행하고, 케이스 순서대로 결과를 반환합니다.
+
+    실제 실행은 채점 워커(또는 하위 프로세스)에서 이루어지므로 스레드는 실행을 기다리는
+    역할만 하며, 동시 실행 수는 JUDGE_MAX_PARALLEL_CASES로 제한됩니다.
+    fail_fast 모드에서는 첫 실패 이후 새 케이스를 실행하지 않고 skipped로 기록합니다.
+
+    Args:
+        judge (CodeJudgeInterface): 사용할 채점 클래스.
+        code (str): 제출된 코드.
+        test_cases (list): get_test_cases가 반환한 테스트 케이스 목록.
+        fail_fast (bool): 첫 실패 이후 남은 케이스를 건너뛸지 여부.
+
+    Returns:
+        list: 케이스별 채점 결과 목록.
+    """
+    results = [None] * len(test_cases)
+    max_workers = max(min(settings.JUDGE_MAX_PARALLEL_CASES, len(test_cases)), 1)
+    pending_cases = iter(enumerate(test_cases))
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+
+        def schedule():
+            for index, test_case in pending_cases:
+                running[executor.submit(judge_test_case, judge, code, test_case)] = (
+                    index
+                )
+                if len(running) >= max_workers:
+                    break
+
+        schedule()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                results[index] = future.result()
+                failed = failed or not results[index]["passed"]
+            if not (fail_fast and failed):
+                schedule()
+
+    for index, test_case in enumerate(test_cases):
+        if results[index] is None:
+            results[index] = {
+                "test_case_id": test_case["id"],
+                "status": CASE_SKIPPED,
+                "passed": False,
+            }
+    return results
+
+
+def normalize_code(code: str) -> str:
+    """
+    실행 결과에 영향을 주지 않는 공백 차이를 없앤 코드를 반환합니다.
+
+    줄바꿈을 LF로 통일하고, 줄 끝 공백과 앞뒤 빈 줄을 제거합니다.
+    들여쓰기는 의미가 있으므로 그대로 둡니다.
+
+    Args:
+        code (str): 제출된 코드.
+
+    Returns:
+        str: 정규화한 코드.
+    """
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def get_judge_cache_key(
+    code_submission: CodeSubmission,
+    code: str,
+    time_limit: int,
+    memory_limit: int,
+    fail_fast: bool = False,
+) -> str:
+    """
+    채점 결과 캐시 키를 계산합니다.
+
+    정규화한 코드, 언어, 테스트 케이스 버전, 출력 비교 방식, 시간/메모리 제한, 채점 모드를
+    해시하므로 테스트 케이스나 제한이 바뀌면 키도 바뀌어 이전 결과가 자동으로 무효화됩니다.
+
+    Args:
+        code_submission (CodeSubmission): 코드 제출형 문제.
+        code (str): 제출된 코드.
+        time_limit (int): 실행 시간 제한 (초 단위).
+        memory_limit (int): 메모리 제한 (MB 단위).
+        fail_fast (bool): 첫 실패 이후 남은 테스트 케이스를 건너뛰는지 여부.
+
+    Returns:
+        str: SHA-256 16진수 문자열.
+    """
+    payload = json.dumps(
+        [
+            code_submission.pk,
+            code_submission.language,
+            code_submission.test_case_version,
+            code_submission.compare_mode,
+            code_submission.float_tolerance,
+            time_limit,
+            memory_limit,
+            fail_fast,
+            normalize_code(code),
+        ]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def find_cached_record(cache_key: str):
+    """
+    같은 캐시 키로 채점이 끝난 가장 최근의 제출 기록을 반환합니다.
+
+    Args:
+        cache_key (str): get_judge_cache_key가 반환한 키.
+
+    Returns:
+        CodeSubmissionRecord | None: 재사용할 제출 기록. 캐시를 끈 경우나 없으면 None.
+    """
+    if not settings.JUDGE_RESULT_CACHE:
+        return None
+    return (
+        CodeSubmissionRecord.objects.filter(cache_key=cache_key, status="done")
+        .only(
+            "case_results",
+            "result_summary",
+            "is_passed",
+            "execution_time",
+            "memory_usage",
+        )
+        .order_by("-id")
+        .first()
+    )
+
+
+def cached_result_fields(source: CodeSubmissionRecord) -> dict:
+    """
+    캐시된 제출 기록에서 새 기록에 복사할 채점 결과 필드를 반환합니다.
+
+    Args:
+        source (CodeSubmissionRecord): 재사용할 제출 기록.
+
+    Returns:
+        dict: 모델 필드 이름과 값의 딕셔너리.
+    """
+    return {
+        "case_results": source.case_results,
+        "result_summary": source.result_summary,
+        "is_passed": source.is_passed,
+        "execution_time": source.execution_time,
+        "memory_usage": source.memory_usage,
+        "cache_hit": True,
+        "status": "done",
+        "finished_at": timezone.now(),
+    }
+
+
+def judge_submission_record(
+    record: CodeSubmissionRecord, time_limit: int = None, memory_limit: int = None
+) -> dict:
+    """
+    제출 기록의 코드를 모든 테스트 케이스로 채점하고, 결과를 기록에 저장합니다.
+
+    실행 시간과 메모리 사용량은 케이스별 측정값 중 최댓값을 기록합니다.
+    같은 캐시 키로 채점된 기록이 있으면 코드를 실행하지 않고 그 결과를 재사용합니다.
+    시간 초과, 메모리 초과, 내부 오류가 있는 결과는 캐시 키 없이 저장되어 재사용되지 않습니다.
+
+    Args:
+        record (CodeSubmissionRecord): 채점할 제출 기록.
+        time_limit (int, optional): 실행 시간 제한. 없으면 문제의 제한을 사용합니다.
+        memory_limit (int, optional): 메모리 제한. 없으면 문제의 제한을 사용합니다.
+
+    Returns:
+        dict: 채점 결과 (전체 통과 여부, 각 테스트 케이스 결과, 제출 기록 ID, 캐시 재사용 여부).
+    """
+    code_submission = record.code_submission
+    time_limit = time_limit or code_submission.time_limit
+    memory_limit = memory_limit or code_submission.memory_limit
+    record.cache_key = get_judge_cache_key(
+        code_submission,
+        record.submitted_code,
+        time_limit,
+        memory_limit,
+        record.fail_fast,
+    )
+
+    source = find_cached_record(record.cache_key)
+    if source is not None:
+        fields = cached_result_fields(source)
+        for name, value in fields.items():
+            setattr(record, name, value)
+        record.save(update_fields=[*fields, "cache_key"])
+        record_code_mission_result(record)
+        return {
+            "all_passed": record.is_passed,
+            "results": record.case_results,
+            "record_id": record.id,
+            "cache_hit": True,
+        }
+
+    judge = CodeJudgeFactory.get_judge(code_submission.language)
+    test_cases = get_test_cases(code_submission, time_limit, memory_limit)
+    results = run_test_cases(
+        judge, record.submitted_code, test_cases, fail_fast=record.fail_fast
+    )
+
+    passed_count = sum(result["passed"] for result in results)
+    all_passed = passed_count == len(results)
+    wall_times = [r["wall_time"] for r in results if r.get("wall_time") is not None]
+    memory_usages = [r["memory_kb"] for r in results if r.get("memory_kb") is not None]
+
+    # 실행 환경이나 부하에 따라 달라지는 결과는 다른 제출에 재사용하지 않도록 캐시 키를 남기지 않습니다.
+    if any(result["status"] in UNCACHEABLE_CASE_STATUSES for result in results):
+        record.cache_key = ""
+    record.case_results = results
+    record.execution_time = max(wall_times, default=None)
+    record.memory_usage = max(memory_usages, default=None)
+    record.result_summary = f"{passed_count}/{len(results)} 통과"
+    record.is_passed = all_passed
+    record.status = "done"
+    record.finished_at = timezone.now()
+    record.save(
+        update_fields=[
+            "case_results",
+            "result_summary",
+            "is_passed",
+            "execution_time",
+            "memory_usage",
+            "status",
+            "finished_at",
+            "cache_key",
+        ]
+    )
+    record_code_mission_result(record)
+
+    return {
+        "all_passed": all_passed,
+        "results": results,
+        "record_id": record.id,
+        "cache_hit": False,
+    }
+
+
 def evaluate_code_submission(
     code_submission: CodeSubmission,
     submitted_code: str,
     user,
     time_limit: int,
     memory_limit: int,
+    fail_fast: bool = False,
 ) -> dict:
     """
-    제출된 코드를 채점하고, 채점 결과를 반환하는 함수.
+    제출된 코드를 모든 테스트 케이스로 즉시 채점하고, 채점 결과를 반환하는 함수.
 
     Args:
         code_submission (CodeSubmission): 채점할 코드 제출 정보.
@@ -207,41 +885,137 @@ def evaluate_code_submission(
         user (User): 제출한 사용자.
         time_limit (int): 실행 시간 제한.
         memory_limit (int): 메모리 제한.
+        fail_fast (bool): 첫 실패 이후 남은 테스트 케이스를 건너뛸지 여부.
 
     Returns:
-        dict: 채점 결과 (전체 통과 여부 및 각 테스트 케이스 결과).
+        dict: 채점 결과 (전체 통과 여부, 각 테스트 케이스 결과, 제출 기록 ID).
     """
-    judge = CodeJudgeFactory.get_judge(code_submission.language)
-    test_cases = [(code_submission.example_input, code_submission.example_output)]
+    record = CodeSubmissionRecord.objects.create(
+        user=user,
+        code_submission=code_submission,
+        submitted_code=submitted_code,
+        fail_fast=fail_fast,
+        status="running",
+        started_at=timezone.now(),
+    )
+    return judge_submission_record(record, time_limit, memory_limit)
 
-    results = []
-    all_passed = True
 
-    for input_data, expected_output in test_cases:
-        actual_output = judge.run_code(
-            code=submitted_code,
-            input_data=input_data,
-            time_limit=time_limit,
-            memory_limit=memory_limit,
-        )
-        passed = actual_output == expected_output
-        results.append(
-            {
-                "input": input_data,
-                "expected": expected_output,
-                "actual": actual_output,
-                "passed": passed,
-            }
-        )
-        if not passed:
-            all_passed = False
+def enqueue_code_submission(
+    code_submission: CodeSubmission, submitted_code: str, user, fail_fast: bool = False
+) -> CodeSubmissionRecord:
+    """
+    제출된 코드를 채점 대기열에 추가합니다. 채점은 run_judge_worker 명령어가 수행합니다.
+
+    같은 캐시 키로 채점된 기록이 있으면 대기열을 거치지 않고 채점 완료 상태로 생성합니다.
+    공정 대기열 순번(queue_round)은 사용자의 대기 중인 제출 수로 정하므로, 한 사용자가 여러 번
+    제출해도 다른 사용자의 첫 제출보다 먼저 채점되지 않습니다.
 
-    CodeSubmissionRecord.objects.create(
+    Args:
+        code_submission (CodeSubmission): 채점할 코드 제출 정보.
+        submitted_code (str): 제출된 코드.
+        user (User): 제출한 사용자.
+        fail_fast (bool): 첫 실패 이후 남은 테스트 케이스를 건너뛸지 여부.
+
+    Returns:
+        CodeSubmissionRecord: queued(또는 캐시 재사용 시 done) 상태로 생성된 제출 기록.
+    """
+    cache_key = get_judge_cache_key(
+        code_submission,
+        submitted_code,
+        code_submission.time_limit,
+        code_submission.memory_limit,
+        fail_fast,
+    )
+    source = find_cached_record(cache_key)
+    if source is None:
+        fields = {
+            "status": "queued",
+            "queue_round": CodeSubmissionRecord.objects.filter(
+                user=user, status="queued"
+            ).count(),
+        }
+    else:
+        fields = cached_result_fields(source)
+    record = CodeSubmissionRecord.objects.create(
         user=user,
         code_submission=code_submission,
         submitted_code=submitted_code,
-        test_results=str(results),
-        is_passed=all_passed,
+        fail_fast=fail_fast,
+        cache_key=cache_key,
+        **fields,
     )
+    if source is not None:
+        record_code_mission_result(record)
+    return record
+
+
+def claim_next_submission():
+    """
+    공정 대기열 순번(queue_round)이 가장 낮은 기록 중 가장 오래된 채점 대기 기록 하나를
+    running 상태로 바꾸고 반환합니다. 여러 사용자의 제출이 한 번씩 번갈아 채점됩니다.
+
+    SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 잡고 있는 행을 건너뛰며,
+    행 잠금을 지원하지 않는 DB에서도 상태 조건부 UPDATE로 중복 할당을 막습니다.
+
+    Returns:
+        CodeSubmissionRecord | None: 할당된 제출 기록. 대기 중인 기록이 없으면 None.
+    """
+    while True:
+        with transaction.atomic():
+            record = (
+                CodeSubmissionRecord.objects.select_for_update(skip_locked=True)
+                .filter(status="queued")
+                .order_by("queue_round", "id")
+                .first()
+            )
+            if record is None:
+                return None
+            started_at = timezone.now()
+            claimed = CodeSubmissionRecord.objects.filter(
+                pk=record.pk, status="queued"
+            ).update(status="running", started_at=started_at)
+        if claimed:
+            record.status = "running"
+            record.started_at = started_at
+            return record
+
+
+def process_next_submission() -> bool:
+    """
+    채점 대기열에서 기록 하나를 가져와 채점합니다.
+
+    채점 중 예외가 발생하면 기록을 failed 상태로 남깁니다.
+
+    Returns:
+        bool: 채점할 기록이 있었으면 True.
+    """
+    record = claim_next_submission()
+    if record is None:
+        return False
+
+    try:
+        judge_submission_record(record)
+    except Exception as e:
+        logger.exception("제출 기록 %s 채점 실패", record.pk)
+        CodeSubmissionRecord.objects.filter(pk=record.pk).update(
+            status="failed",
+            result_summary=f"채점 실패: {e}"[:255],
+            finished_at=timezone.now(),
+        )
+    return True
 
-    return {"all_passed": all_passed, "results": results}
+
+def requeue_stale_submissions(older_than: timedelta) -> int:
+    """
+    워커가 비정상 종료되어 running 상태로 남은 기록을 다시 대기열에 넣습니다.
+
+    Args:
+        older_than (timedelta): 채점 시작 후 이 시간이 지난 running 기록을 대상으로 합니다.
+
+    Returns:
+        int: 다시 대기열에 넣은 기록 수.
+    """
+    return CodeSubmissionRecord.objects.filter(
+        status="running", started_at__lt=timezone.now() - older_than
+    ).update(status="queued", started_at=None)
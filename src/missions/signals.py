@@ -0,0 +1,125 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import CodeSubmission, Mission, MultipleChoiceQuestion, TestCase
+from .question_sets import QuestionSetService
+
+
+# 테스트 케이스가 없을 때 샘플 케이스로 사용하는 필드
+EXAMPLE_FIELDS = ("example_input", "example_output")
+
+
+def bump_test_case_version(code_submission_id):
+    """
+    코드 제출형 문제의 테스트 케이스 버전을 올려 이전 채점 결과 캐시를 무효화합니다.
+
+    Args:
+        code_submission_id (int): 코드 제출형 문제 ID.
+    """
+    CodeSubmission.objects.filter(pk=code_submission_id).update(
+        test_case_version=F("test_case_version") + 1
+    )
+
+
+@receiver(post_save, sender=TestCase)
+@receiver(post_delete, sender=TestCase)
+def invalidate_judge_cache_on_test_case_change(sender, instance, **kwargs):
+    """
+    테스트 케이스가 생성, 수정, 삭제되면 문제의 테스트 케이스 버전을 올립니다.
+
+    Args:
+        sender (type): TestCase 모델.
+        instance (TestCase): 변경된 테스트 케이스 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    bump_test_case_version(instance.code_submission_id)
+
+
+@receiver(post_delete, sender=TestCase)
+def delete_test_case_files(sender, instance, **kwargs):
+    """
+    테스트 케이스가 삭제되면 파일 저장소에 있는 입출력 파일도 삭제합니다.
+
+    삭제가 롤백되면 행이 파일을 계속 가리키므로, 파일은 트랜잭션이 커밋된 뒤에 삭제합니다.
+
+    Args:
+        sender (type): TestCase 모델.
+        instance (TestCase): 삭제된 테스트 케이스 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    storage = instance.input_file.storage
+    names = [
+        stored.name
+        for stored in (instance.input_file, instance.expected_file)
+        if stored
+    ]
+
+    def delete_files():
+        for name in names:
+            storage.delete(name)
+
+    if names:
+        transaction.on_commit(delete_files)
+
+
+@receiver(pre_save, sender=CodeSubmission)
+def invalidate_judge_cache_on_example_change(
+    sender, instance, update_fields=None, **kwargs
+):
+    """
+    입출력 예시가 바뀌면 테스트 케이스 버전을 올립니다.
+
+    저장될 인스턴스의 test_case_version도 함께 올려 save()가 이전 값으로 덮어쓰지 않도록 합니다.
+    시간/메모리 제한과 언어는 캐시 키에 직접 포함되므로 여기서 다루지 않습니다.
+
+    Args:
+        sender (type): CodeSubmission 모델.
+        instance (CodeSubmission): 저장될 코드 제출형 문제 인스턴스.
+        update_fields (frozenset, optional): 저장 대상 필드 목록.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    if instance.pk is None:
+        return
+    if update_fields is not None and not set(update_fields) & set(EXAMPLE_FIELDS):
+        return
+
+    previous = sender.objects.filter(pk=instance.pk).values(*EXAMPLE_FIELDS).first()
+    if previous is None:
+        return
+    if any(previous[field] != getattr(instance, field) for field in EXAMPLE_FIELDS):
+        bump_test_case_version(instance.pk)
+        instance.test_case_version = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("test_case_version", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=MultipleChoiceQuestion)
+@receiver(post_delete, sender=MultipleChoiceQuestion)
+def invalidate_question_set(sender, instance, **kwargs):
+    """
+    5지선다형 문제가 생성, 수정, 삭제되면 미션의 문제 세트 캐시를 무효화합니다.
+
+    Args:
+        sender (type): MultipleChoiceQuestion 모델.
+        instance (MultipleChoiceQuestion): 변경된 문제 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    QuestionSetService.invalidate(instance.mission_id)
+
+
+@receiver(post_save, sender=Mission)
+@receiver(post_delete, sender=Mission)
+def invalidate_exam_mission(sender, instance, **kwargs):
+    """
+    미션이 생성, 수정, 삭제되면 소분류의 중간/기말 미션 ID 캐시를 제거합니다.
+
+    Args:
+        sender (type): Mission 모델.
+        instance (Mission): 변경된 미션 인스턴스.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    QuestionSetService.invalidate_exam(instance.minor_category_id)
@@ -0,0 +1,148 @@
+import pytest
+
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.admission import AdmissionController
+from missions.models import CodeSubmission
+from missions.services import claim_next_submission, enqueue_code_submission
+
+
+@pytest.fixture
+def student(db):
+    return CustomUser.objects.create_user(
+        email="student@example.com", username="student", password="password"
+    )
+
+
+@pytest.fixture
+def client(student):
+    client = APIClient()
+    client.force_authenticate(user=student)
+    return client
+
+
+@pytest.fixture
+def code_submission(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    minor_category = MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+    return CodeSubmission.objects.create(
+        mission=minor_category.missions.get(
+            mission_type="code_submission", is_midterm=True
+        ),
+        problem_statement="두 수의 합",
+        example_input="1 2",
+        example_output="3",
+        language="python",
+    )
+
+
+@pytest.mark.django_db
+class TestAdmissionControl:
+    @pytest.fixture(autouse=True)
+    def limits(self, settings):
+        settings.MISSION_ADMISSION_LIMITS = {"mission_read": 0, "mission_submit": 1}
+        settings.MISSION_ADMISSION_RETRY_AFTER = 3
+
+    def submit(self, client):
+        return client.post(
+            reverse("multiple-choice-question-submit"), {}, format="json"
+        )
+
+    def test_overloaded_scope_is_rejected_with_retry_after(self, client):
+        # GIVEN
+        controller = AdmissionController("mission_submit")
+        lease = controller.acquire()
+
+        # WHEN
+        response = self.submit(client)
+
+        # THEN
+        assert response.status_code == 503
+        assert 3 <= int(response["Retry-After"]) <= 6
+
+        # WHEN: 처리 중이던 요청이 끝나 슬롯이 반환된 뒤
+        controller.release(lease)
+        response = self.submit(client)
+
+        # THEN
+        assert response.status_code == 400  # 한도 안에서 정상 처리
+        assert controller.in_flight() == 0
+
+    def test_metrics_report_admitted_and_rejected_requests(self, client):
+        # GIVEN
+        self.submit(client)
+        lease = AdmissionController("mission_submit").acquire()
+        self.submit(client)
+        manager = CustomUser.objects.create_user(
+            email="manager@example.com",
+            username="manager",
+            password="password",
+            role="manager",
+        )
+        manager_client = APIClient()
+        manager_client.force_authenticate(user=manager)
+
+        # WHEN
+        response = manager_client.get(reverse("mission-admission-metrics"))
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data["scopes"]["mission_submit"] == {
+            "capacity": 1,
+            "in_flight": 1,
+            "admitted": 2,
+            "rejected": 1,
+        }
+        AdmissionController.release(lease)
+
+
+@pytest.mark.django_db
+class TestFairJudgeQueue:
+    def test_users_are_interleaved(self, student, code_submission):
+        # GIVEN
+        other = CustomUser.objects.create_user(
+            email="other@example.com", username="other", password="password"
+        )
+        first, second, third = [
+            enqueue_code_submission(code_submission, f"print({i})", student)
+            for i in range(3)
+        ]
+        other_record = enqueue_code_submission(code_submission, "print(9)", other)
+
+        # WHEN
+        claimed = [claim_next_submission() for _ in range(4)]
+
+        # THEN
+        assert [record.pk for record in claimed] == [
+            first.pk,
+            other_record.pk,
+            second.pk,
+            third.pk,
+        ]
+
+    def test_user_queue_limit_returns_429(
+        self, settings, client, student, code_submission
+    ):
+        # GIVEN
+        settings.JUDGE_ASYNC = True
+        settings.JUDGE_MAX_QUEUED_PER_USER = 2
+        url = reverse(
+            "code-submission-evaluate",
+            kwargs={"code_submission_id": code_submission.pk},
+        )
+        for i in range(2):
+            client.post(url, {"submitted_code": f"print({i})"}, format="json")
+
+        # WHEN
+        response = client.post(url, {"submitted_code": "print(3)"}, format="json")
+
+        # THEN
+        assert response.status_code == 429
+        assert "Retry-After" in response
+        assert student.code_submission_records.count() == 2
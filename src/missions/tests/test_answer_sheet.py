@@ -0,0 +1,166 @@
+import uuid
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.models import MultipleChoiceQuestion, MultipleChoiceSubmission
+
+
+@pytest.fixture
+def manager(db):
+    return CustomUser.objects.create_user(
+        email="manager@example.com",
+        username="manager",
+        password="password",
+        role="manager",
+    )
+
+
+@pytest.fixture
+def mission(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    minor_category = MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+    return minor_category.missions.get(mission_type="multiple_choice", is_midterm=True)
+
+
+@pytest.fixture
+def questions(mission):
+    return MultipleChoiceQuestion.objects.bulk_create(
+        [
+            MultipleChoiceQuestion(
+                mission=mission,
+                question=f"문제 {i}",
+                option_1="1",
+                option_2="2",
+                option_3="3",
+                option_4="4",
+                option_5="5",
+                correct_option=i,
+            )
+            for i in range(1, 5)
+        ]
+    )
+
+
+def post_answer_sheet(user, mission, data):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client.post(
+        reverse("multiple-choice-answer-sheet", kwargs={"mission_id": mission.pk}),
+        data,
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+class TestMultipleChoiceAnswerSheet:
+    def test_answer_sheet_is_graded_in_one_request(self, manager, mission, questions):
+        # GIVEN: 4문제 중 3문제에 답하고 2문제를 맞힌 답안지
+        answers = {
+            str(questions[0].pk): 1,
+            str(questions[1].pk): 2,
+            str(questions[2].pk): 5,
+        }
+
+        # WHEN
+        with CaptureQueriesContext(connection) as context:
+            response = post_answer_sheet(
+                manager, mission, {"attempt_id": str(uuid.uuid4()), "answers": answers}
+            )
+
+        # THEN
+        assert response.status_code == 201
+        assert response.data["total"] == 4
+        assert response.data["answered"] == 3
+        assert response.data["correct"] == 2
+        assert response.data["score"] == 50
+        assert [result["is_correct"] for result in response.data["results"]] == [
+            True,
+            True,
+            False,
+        ]
+        assert MultipleChoiceSubmission.objects.filter(user=manager).count() == 3
+        # 정답표 조회와 제출 기록 저장은 문항 수와 관계없이 각각 한 번
+        statements = [query["sql"] for query in context.captured_queries]
+        assert sum("correct_option" in sql for sql in statements) == 1
+        assert (
+            sum(
+                sql.startswith("INSERT") and "missions_multiplechoicesubmission" in sql
+                for sql in statements
+            )
+            == 1
+        )
+
+    def test_same_attempt_returns_first_result(self, manager, mission, questions):
+        # GIVEN
+        attempt_id = str(uuid.uuid4())
+        post_answer_sheet(
+            manager,
+            mission,
+            {"attempt_id": attempt_id, "answers": {questions[0].pk: 1}},
+        )
+
+        # WHEN: 같은 응시 ID로 다른 답안을 다시 전송
+        response = post_answer_sheet(
+            manager,
+            mission,
+            {"attempt_id": attempt_id, "answers": {questions[0].pk: 3}},
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data["replayed"] is True
+        assert response.data["results"][0]["selected_option"] == 1
+        assert MultipleChoiceSubmission.objects.filter(user=manager).count() == 1
+
+    def test_question_from_other_mission_is_rejected(self, manager, mission, questions):
+        # GIVEN
+        other_mission = mission.minor_category.missions.get(
+            mission_type="multiple_choice", is_final=True
+        )
+        other_question = MultipleChoiceQuestion.objects.create(
+            mission=other_mission,
+            question="다른 문제",
+            option_1="1",
+            option_2="2",
+            option_3="3",
+            option_4="4",
+            option_5="5",
+            correct_option=1,
+        )
+
+        # WHEN
+        response = post_answer_sheet(
+            manager,
+            mission,
+            {"attempt_id": str(uuid.uuid4()), "answers": {other_question.pk: 1}},
+        )
+
+        # THEN
+        assert response.status_code == 400
+        assert not MultipleChoiceSubmission.objects.exists()
+
+    def test_student_without_enrollment_is_denied(self, mission, questions):
+        # GIVEN
+        student = CustomUser.objects.create_user(
+            email="student@example.com", username="student", password="password"
+        )
+
+        # WHEN
+        response = post_answer_sheet(
+            student,
+            mission,
+            {"attempt_id": str(uuid.uuid4()), "answers": {questions[0].pk: 1}},
+        )
+
+        # THEN
+        assert response.status_code == 403
@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from django.core.management import CommandError, call_command
+
+from missions.benchmark import compare_reports, percentile
+
+
+def test_percentile_interpolates_between_values():
+    values = [10, 20, 30, 40, 50]
+
+    assert percentile(values, 50) == 30
+    assert percentile(values, 95) == 48
+    assert percentile([], 50) is None
+
+
+def test_compare_reports_detects_regressions():
+    # GIVEN
+    baseline = {"total": {"throughput": 100, "latency_ms": {"p95": 50, "p99": 80}}}
+    report = {
+        "total": {"throughput": 70, "latency_ms": {"p95": 55, "p99": 120}},
+        "cases": [
+            {
+                "name": "python-sum",
+                "runs": 2,
+                "correct": 1,
+                "expected_status": "passed",
+                "statuses": {"passed": 1, "runtime_error": 1},
+            }
+        ],
+    }
+
+    # WHEN
+    problems = compare_reports(report, baseline, tolerance=0.2)
+
+    # THEN
+    assert len(problems) == 3
+    assert problems[0].startswith("python-sum")
+
+
+def test_benchmark_command_reports_json(tmp_path):
+    # GIVEN
+    output = tmp_path / "report.json"
+
+    # WHEN
+    call_command(
+        "benchmark_judge_suite",
+        "--runs=2",
+        "--concurrency=2",
+        "--language=python",
+        "--category=trivial",
+        "--category=memory",
+        f"--output={output}",
+        stdout=io.StringIO(),
+    )
+
+    # THEN
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["total"]["runs"] == 6
+    assert report["total"]["accuracy"] == 1
+    assert report["total"]["latency_ms"]["p99"] >= report["total"]["latency_ms"]["p50"]
+    assert {case["name"] for case in report["cases"]} == {
+        "python-sum",
+        "python-list",
+        "python-memory-limit",
+    }
+
+    # WHEN: 처리량이 비현실적으로 높은 기준과 비교
+    report["total"]["throughput"] *= 100
+    output.write_text(json.dumps(report), encoding="utf-8")
+    with pytest.raises(CommandError):
+        call_command(
+            "benchmark_judge_suite",
+            "--runs=1",
+            "--warmup=0",
+            "--language=python",
+            "--category=trivial",
+            f"--baseline={output}",
+            stdout=io.StringIO(),
+        )
@@ -0,0 +1,377 @@
+import pytest
+
+from django.core.management import call_command
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.models import CodeSubmission, CodeSubmissionRecord
+from missions.models import TestCase as MissionTestCase
+from missions.services import (
+    claim_next_submission,
+    enqueue_code_submission,
+    evaluate_code_submission,
+)
+
+
+SUM_CODE = "print(sum(map(int, input().split())))"
+
+
+@pytest.fixture
+def user(db):
+    return CustomUser.objects.create_user(
+        email="judge@example.com", username="judge", password="password"
+    )
+
+
+@pytest.fixture
+def code_submission(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    minor_category = MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+    code_submission = CodeSubmission.objects.create(
+        mission=minor_category.missions.get(
+            mission_type="code_submission", is_midterm=True
+        ),
+        problem_statement="두 수의 합",
+        example_input="1 2",
+        example_output="3",
+        time_limit=2,
+        memory_limit=256,
+        language="python",
+    )
+    MissionTestCase.objects.bulk_create(
+        [
+            MissionTestCase(
+                code_submission=code_submission,
+                input_data=input_data,
+                expected_output=expected_output,
+                is_sample=is_sample,
+            )
+            for input_data, expected_output, is_sample in (
+                ("1 2", "3", True),
+                ("10 20", "30", False),
+                ("5 5", "11", False),
+            )
+        ]
+    )
+    return code_submission
+
+
+@pytest.mark.django_db
+class TestEvaluateCodeSubmission:
+    def test_all_cases_are_judged(self, user, code_submission):
+        # WHEN
+        result = evaluate_code_submission(code_submission, SUM_CODE, user, 2, 256)
+
+        # THEN
+        assert [case["status"] for case in result["results"]] == [
+            "passed",
+            "passed",
+            "wrong_answer",
+        ]
+        assert result["all_passed"] is False
+        assert result["results"][0]["actual"] == "3"
+        assert "input" not in result["results"][1]
+        record = CodeSubmissionRecord.objects.get(pk=result["record_id"])
+        assert record.result_summary == "2/3 통과"
+        assert record.case_results == result["results"]
+        assert record.execution_time == max(
+            case["wall_time"] for case in result["results"]
+        )
+        assert record.memory_usage == max(
+            case["memory_kb"] for case in result["results"]
+        )
+        assert record.memory_usage > 0
+
+    def test_fail_fast_skips_remaining_cases(self, settings, user, code_submission):
+        # GIVEN
+        settings.JUDGE_MAX_PARALLEL_CASES = 1
+
+        # WHEN
+        result = evaluate_code_submission(
+            code_submission, "print(0)", user, 2, 256, fail_fast=True
+        )
+
+        # THEN
+        assert [case["status"] for case in result["results"]] == [
+            "wrong_answer",
+            "skipped",
+            "skipped",
+        ]
+
+    def test_per_case_time_limit(self, user, code_submission):
+        # GIVEN
+        code_submission.test_cases.exclude(is_sample=True).update(time_limit=1)
+        code = "a, b = map(int, input().split())\nwhile a > 1:\n    pass\nprint(a + b)"
+
+        # WHEN
+        result = evaluate_code_submission(code_submission, code, user, 2, 256)
+
+        # THEN
+        assert [case["status"] for case in result["results"]] == [
+            "passed",
+            "time_limit",
+            "time_limit",
+        ]
+
+
+@pytest.mark.django_db
+def test_evaluation_view_returns_record(settings, user, code_submission):
+    # GIVEN
+    settings.JUDGE_ASYNC = False
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    # WHEN
+    response = client.post(
+        reverse(
+            "code-submission-evaluate",
+            kwargs={"code_submission_id": code_submission.pk},
+        ),
+        {"submitted_code": SUM_CODE, "mode": "fail_fast"},
+        format="json",
+    )
+
+    # THEN
+    assert response.status_code == 200
+    assert response.data["is_passed"] is False
+    assert CodeSubmissionRecord.objects.filter(pk=response.data["record_id"]).exists()
+
+
+@pytest.mark.django_db
+class TestJudgeQueue:
+    def test_submission_is_queued_and_judged_by_worker(
+        self, settings, user, code_submission
+    ):
+        # GIVEN
+        settings.JUDGE_ASYNC = True
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        # WHEN
+        response = client.post(
+            reverse(
+                "code-submission-evaluate",
+                kwargs={"code_submission_id": code_submission.pk},
+            ),
+            {"submitted_code": SUM_CODE},
+            format="json",
+        )
+        status_url = reverse(
+            "code-submission-record-status",
+            kwargs={"record_id": response.data["record_id"]},
+        )
+        queued = client.get(status_url)
+        call_command("run_judge_worker", "--once")
+        done = client.get(status_url, {"wait": 1})
+
+        # THEN
+        assert response.status_code == 202
+        assert queued.data["status"] == "queued"
+        assert done.data["status"] == "done"
+        assert done.data["result_summary"] == "2/3 통과"
+        assert done.data["finished_at"] is not None
+
+    def test_other_user_cannot_view_record(self, user, code_submission):
+        # GIVEN
+        record = enqueue_code_submission(code_submission, "print(3)", user)
+        other = CustomUser.objects.create_user(
+            email="other@example.com", username="other", password="password"
+        )
+        client = APIClient()
+        client.force_authenticate(user=other)
+
+        # WHEN
+        response = client.get(
+            reverse("code-submission-record-status", kwargs={"record_id": record.pk})
+        )
+
+        # THEN
+        assert response.status_code == 403
+
+    def test_claim_skips_claimed_records(self, user, code_submission):
+        # GIVEN
+        first = enqueue_code_submission(code_submission, "print(3)", user)
+        second = enqueue_code_submission(code_submission, "print(3)", user)
+
+        # WHEN
+        claimed = [
+            claim_next_submission(),
+            claim_next_submission(),
+            claim_next_submission(),
+        ]
+
+        # THEN
+        assert [record.pk if record else None for record in claimed] == [
+            first.pk,
+            second.pk,
+            None,
+        ]
+        assert CodeSubmissionRecord.objects.filter(status="running").count() == 2
+
+
+@pytest.mark.django_db
+class TestJudgeResultCache:
+    @pytest.fixture
+    def judged(self, user, code_submission):
+        return evaluate_code_submission(code_submission, SUM_CODE, user, 2, 256)
+
+    def test_identical_resubmission_reuses_result(
+        self, monkeypatch, user, code_submission, judged
+    ):
+        # GIVEN: 줄바꿈과 줄 끝 공백만 다른 코드
+        monkeypatch.setattr(
+            "missions.services.run_test_cases",
+            lambda *args, **kwargs: pytest.fail("캐시된 제출을 다시 실행했습니다."),
+        )
+
+        # WHEN
+        result = evaluate_code_submission(
+            code_submission, SUM_CODE + "   \r\n\r\n", user, 2, 256
+        )
+
+        # THEN
+        assert result["cache_hit"] is True
+        assert result["results"] == judged["results"]
+        record = CodeSubmissionRecord.objects.get(pk=result["record_id"])
+        assert record.cache_hit is True
+        assert record.result_summary == "2/3 통과"
+
+    def test_test_case_change_invalidates_cache(self, user, code_submission, judged):
+        # GIVEN
+        test_case = code_submission.test_cases.get(expected_output="11")
+        test_case.expected_output = "10"
+        test_case.save()
+        code_submission.refresh_from_db()
+
+        # WHEN
+        result = evaluate_code_submission(code_submission, SUM_CODE, user, 2, 256)
+
+        # THEN
+        assert result["cache_hit"] is False
+        assert result["all_passed"] is True
+
+    def test_limit_change_invalidates_cache(self, user, code_submission, judged):
+        # WHEN
+        result = evaluate_code_submission(code_submission, SUM_CODE, user, 3, 256)
+
+        # THEN
+        assert result["cache_hit"] is False
+
+    @pytest.mark.parametrize("status", ["time_limit", "memory_limit"])
+    def test_resubmission_after_load_dependent_failure_is_rejudged(
+        self, monkeypatch, user, code_submission, status
+    ):
+        # GIVEN: 부하로 한 케이스가 시간/메모리 초과로 채점된 제출
+        monkeypatch.setattr(
+            "missions.services.run_test_cases",
+            lambda judge, code, test_cases, fail_fast=False: [
+                {"test_case_id": case["id"], "status": status, "passed": False}
+                for case in test_cases
+            ],
+        )
+        failed = evaluate_code_submission(code_submission, SUM_CODE, user, 2, 256)
+        monkeypatch.undo()
+
+        # WHEN
+        result = evaluate_code_submission(code_submission, SUM_CODE, user, 2, 256)
+
+        # THEN
+        assert CodeSubmissionRecord.objects.get(pk=failed["record_id"]).cache_key == ""
+        assert result["cache_hit"] is False
+        assert [case["status"] for case in result["results"]] == [
+            "passed",
+            "passed",
+            "wrong_answer",
+        ]
+
+    def test_async_resubmission_returns_result_immediately(
+        self, settings, user, code_submission
+    ):
+        # GIVEN
+        settings.JUDGE_ASYNC = True
+        evaluate_code_submission(code_submission, SUM_CODE, user, 2, 256)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        # WHEN
+        response = client.post(
+            reverse(
+                "code-submission-evaluate",
+                kwargs={"code_submission_id": code_submission.pk},
+            ),
+            {"submitted_code": SUM_CODE},
+            format="json",
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data["cache_hit"] is True
+        assert not CodeSubmissionRecord.objects.filter(status="queued").exists()
+
+
+@pytest.mark.django_db
+class TestFileBackedTestCases:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.TEST_CASE_INLINE_LIMIT_KB = 1
+
+    def test_large_payload_is_moved_to_storage(self, code_submission):
+        # GIVEN
+        input_data = "\n".join(str(i) for i in range(1000))
+
+        # WHEN
+        test_case = MissionTestCase.objects.create(
+            code_submission=code_submission, input_data=input_data, expected_output="1"
+        )
+
+        # THEN
+        test_case.refresh_from_db()
+        assert test_case.input_data == ""
+        assert test_case.input_size == len(input_data.encode())
+        assert len(test_case.input_sha256) == 64
+        assert test_case.read_input() == input_data
+        assert test_case.expected_output == "1"
+        assert not test_case.expected_file
+
+    def test_expected_output_is_compared_by_hash(self, user, code_submission):
+        # GIVEN
+        expected_output = "\n".join(str(i) for i in range(1000))
+        test_case = MissionTestCase.objects.create(
+            code_submission=code_submission,
+            input_data="",
+            expected_output=expected_output,
+        )
+        assert test_case.expected_digests["trim_trailing"][1] == len(expected_output)
+        test_case.expected_file.storage.delete(
+            test_case.expected_file.name
+        )  # 읽으면 실패
+        code = "for i in range(1000):\n    print(i, end='  \\n')"
+
+        # WHEN
+        result = evaluate_code_submission(code_submission, code, user, 5, 256)
+
+        # THEN
+        case = next(r for r in result["results"] if r["test_case_id"] == test_case.pk)
+        assert case["status"] == "passed"
+
+    def test_large_input_is_streamed_from_file(self, user, code_submission):
+        # GIVEN
+        code = "import sys\nprint(sum(map(int, sys.stdin.read().split())))"
+        test_case = MissionTestCase.objects.create(
+            code_submission=code_submission,
+            input_data="\n".join(str(i) for i in range(100000)),
+            expected_output=str(sum(range(100000))),
+        )
+
+        # WHEN
+        result = evaluate_code_submission(code_submission, code, user, 5, 256)
+
+        # THEN
+        case = next(r for r in result["results"] if r["test_case_id"] == test_case.pk)
+        assert case["status"] == "passed"
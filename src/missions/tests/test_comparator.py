@@ -0,0 +1,184 @@
+import pytest
+
+from missions import comparator as comparator_module
+from missions.comparator import compare_output, create_comparator, normalized_digests
+from missions.judge_pool import JudgeWorkerPool
+
+
+def feed_in_chunks(comparator, text, size):
+    for start in range(0, len(text), size):
+        if not comparator.feed(text[start : start + size]):
+            return False
+    return comparator.finish()
+
+
+@pytest.mark.parametrize(
+    "mode, actual, expected, matched",
+    [
+        ("exact", "1 2\n3\n", "1 2\r\n3\r\n", True),
+        ("exact", "1 2 \n3\n", "1 2\n3\n", False),
+        ("exact", "1 2\n3", "1 2\n3\n", False),
+        ("trim_trailing", "1 2  \n3\n\n\n", "1 2\n3", True),
+        ("trim_trailing", "1 2\n\n3\n", "1 2\n3\n", False),
+        ("trim_trailing", "1 2\n3\n4\n", "1 2\n3\n", False),
+        ("token", "1\n2   3\n", "1 2 3", True),
+        ("token", "1 23", "1 2 3", False),
+        ("float", "0.3333333 1e3 yes", "0.333333333 1000 yes", True),
+        ("float", "0.334", "0.333333333", False),
+    ],
+)
+def test_compare_modes(mode, actual, expected, matched):
+    # WHEN / THEN
+    assert compare_output(actual, expected, mode) is matched
+    for size in (1, 2, 7):
+        assert (
+            feed_in_chunks(create_comparator(expected, mode), actual, size) is matched
+        )
+
+
+def test_mismatch_is_reported_before_output_ends():
+    # GIVEN
+    comparator = create_comparator("1\n2\n3\n", "trim_trailing")
+
+    # WHEN / THEN
+    assert comparator.feed("1\n") is True
+    assert comparator.feed("5\n") is False
+
+
+def test_unterminated_line_longer_than_expected_is_mismatch():
+    # GIVEN
+    comparator = create_comparator("abc\n", "trim_trailing")
+
+    # WHEN / THEN
+    assert comparator.feed("a" * 4096) is False
+
+
+@pytest.mark.parametrize(
+    "mode, actual, expected, matched",
+    [
+        ("exact", "1 2\r\n3\n", "1 2\n3\n", True),
+        ("exact", "1 2\n3", "1 2\n3\n", False),
+        ("trim_trailing", "\n1 2  \n\n3\n\n", "\n1 2\n\n3", True),
+        ("trim_trailing", "1 2\n3\n", "1 2\n\n3\n", False),
+        ("token", "1\n2   3\n", "1 2 3", True),
+        ("token", "1 23", "1 2 3", False),
+    ],
+)
+def test_hash_comparison_matches_full_comparison(mode, actual, expected, matched):
+    # GIVEN
+    digest, length = normalized_digests(expected)[mode]
+
+    # WHEN / THEN
+    for size in (1, 2, 7):
+        comparator = create_comparator(
+            mode=mode, expected_digest=digest, expected_length=length
+        )
+        assert feed_in_chunks(comparator, actual, size) is matched
+
+
+def test_hash_comparison_stops_when_output_is_longer_than_expected():
+    # GIVEN
+    digest, length = normalized_digests("1\n2\n")["trim_trailing"]
+    comparator = create_comparator(expected_digest=digest, expected_length=length)
+
+    # WHEN / THEN
+    assert comparator.feed("1\n2\n   \n\n") is True
+    assert comparator.feed("3") is False
+
+
+@pytest.mark.parametrize("mode", ["exact", "trim_trailing", "token", "float"])
+def test_expected_file_is_read_incrementally(monkeypatch, tmp_path, mode):
+    # GIVEN: 예상 출력 조각보다 훨씬 큰 예상 출력 파일
+    lines = [f"{i} 0.5" for i in range(200000)]
+    expected_path = tmp_path / "expected.out"
+    expected_path.write_text("\n".join(lines) + "\n")
+    read_sizes = []
+    original_read = comparator_module.ExpectedSource.read
+
+    def counting_read(self):
+        chunk = original_read(self)
+        read_sizes.append(len(chunk))
+        return chunk
+
+    monkeypatch.setattr(comparator_module.ExpectedSource, "read", counting_read)
+    comparator = create_comparator(mode=mode, expected_path=str(expected_path))
+
+    # WHEN: 앞부분은 맞고 그 뒤가 틀린 출력
+    assert comparator.feed("\n".join(lines[:10]) + "\n") is True
+    matched = comparator.feed("wrong\n")
+
+    # THEN: 불일치를 알리기까지 앞부분 조각만 읽고 파일을 닫습니다.
+    assert matched is False
+    assert sum(read_sizes) <= 2 * comparator_module.EXPECTED_CHUNK_SIZE
+    assert comparator.source.file is None
+
+
+def test_expected_file_matches_across_chunks(monkeypatch, tmp_path):
+    # GIVEN
+    monkeypatch.setattr(comparator_module, "EXPECTED_CHUNK_SIZE", 3)
+    expected_path = tmp_path / "expected.out"
+    expected_path.write_bytes(b"1 2  \r\n\r\n3\r\n\r\n")
+
+    # WHEN / THEN
+    for mode, actual in [
+        ("exact", "1 2  \n\n3\n\n"),
+        ("trim_trailing", "1 2\n\n3"),
+        ("token", "1 2 3"),
+        ("float", "1.0 2 3"),
+    ]:
+        for size in (1, 2, 7):
+            comparator = create_comparator(mode=mode, expected_path=str(expected_path))
+            assert feed_in_chunks(comparator, actual, size) is True
+
+
+@pytest.fixture
+def pool():
+    pool = JudgeWorkerPool(size=1, max_runs=10)
+    yield pool
+    pool.close()
+
+
+class TestStreamingJudge:
+    def test_infinite_output_hits_output_limit(self, pool):
+        # WHEN
+        result = pool.run(
+            "while True:\n    print('x' * 1000)",
+            "",
+            5,
+            256,
+            output_limit=1024 * 1024,
+            capture_limit=1024,
+        )
+
+        # THEN
+        assert result["status"] == "output_limit"
+        assert len(result["stdout"]) == 1024
+        assert result["stdout_truncated"] is True
+        assert result["wall_time"] < 5
+
+    def test_wrong_output_stops_run_early(self, pool):
+        # GIVEN
+        code = "import time\nprint(1, flush=True)\ntime.sleep(10)"
+
+        # WHEN
+        result = pool.run(
+            code, "", 5, 256, compare={"expected": "2\n", "mode": "trim_trailing"}
+        )
+
+        # THEN
+        assert result["status"] == "wrong_answer"
+        assert result["wall_time"] < 5
+
+    def test_matching_output(self, pool):
+        # WHEN
+        result = pool.run(
+            "print('0.50000001')",
+            "",
+            2,
+            256,
+            compare={"expected": "0.5", "mode": "float", "tolerance": 1e-6},
+        )
+
+        # THEN
+        assert result["status"] == "ok"
+        assert result["matched"] is True
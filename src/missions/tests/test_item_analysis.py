@@ -0,0 +1,119 @@
+import pytest
+
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.item_analysis import analyze_items
+from missions.models import MultipleChoiceQuestion, MultipleChoiceSubmission
+
+
+def test_analyze_items():
+    # GIVEN: 학생 1의 첫 답안(5번)은 이후 제출로 바뀝니다.
+    answer_key = {1: 1, 2: 2}
+    responses = [
+        (1, 1, 5),
+        (1, 1, 1),
+        (1, 2, 2),
+        (2, 1, 1),
+        (2, 2, 3),
+        (3, 1, 4),
+        (3, 2, 3),
+    ]
+
+    # WHEN
+    result = analyze_items(answer_key, responses)
+
+    # THEN
+    first, second = result["items"]
+    assert result["students"] == 3
+    assert result["mean_score"] == 1
+    assert result["cronbach_alpha"] == pytest.approx(0.6667)
+    assert first["difficulty"] == pytest.approx(0.6667)
+    assert first["discrimination"] == pytest.approx(0.5)
+    assert [option["count"] for option in first["options"]] == [2, 0, 0, 1, 0]
+    assert second["difficulty"] == pytest.approx(0.3333)
+    assert "misleading_distractor" in second["flags"]
+
+
+@pytest.mark.django_db
+class TestMissionItemAnalysisAPI:
+    @pytest.fixture
+    def mission(self):
+        major_category = MajorCategory.objects.create(name="Python", price=0)
+        minor_category = MinorCategory.objects.create(
+            name="기초", major_category=major_category, content="기초", order=1
+        )
+        return minor_category.missions.get(
+            mission_type="multiple_choice", is_midterm=True
+        )
+
+    @pytest.fixture
+    def question(self, mission):
+        return MultipleChoiceQuestion.objects.create(
+            mission=mission,
+            question="문제",
+            option_1="1",
+            option_2="2",
+            option_3="3",
+            option_4="4",
+            option_5="5",
+            correct_option=1,
+        )
+
+    @pytest.fixture
+    def client(self):
+        manager = CustomUser.objects.create_user(
+            email="manager@example.com",
+            username="manager",
+            password="password",
+            role="manager",
+        )
+        client = APIClient()
+        client.force_authenticate(user=manager)
+        return client
+
+    def submit(self, question, username, option):
+        user = CustomUser.objects.create_user(
+            email=f"{username}@example.com", username=username, password="password"
+        )
+        return MultipleChoiceSubmission.objects.create(
+            user=user,
+            question=question,
+            selected_option=option,
+            is_correct=option == question.correct_option,
+        )
+
+    def test_new_submission_refreshes_cached_analysis(self, client, mission, question):
+        # GIVEN
+        url = reverse("mission-item-analysis", kwargs={"mission_id": mission.pk})
+        self.submit(question, "alice", 1)
+        first = client.get(url)
+
+        # WHEN
+        self.submit(question, "bob", 2)
+        second = client.get(url)
+
+        # THEN
+        assert first.status_code == 200
+        assert first.data["items"][0]["difficulty"] == 1
+        assert second.data["students"] == 2
+        assert second.data["items"][0]["difficulty"] == 0.5
+
+    def test_answer_key_change_refreshes_cached_analysis(
+        self, client, mission, question
+    ):
+        # GIVEN
+        url = reverse("mission-item-analysis", kwargs={"mission_id": mission.pk})
+        self.submit(question, "alice", 2)
+        client.get(url)
+
+        # WHEN
+        question.correct_option = 2
+        question.save()
+        response = client.get(url)
+
+        # THEN
+        assert response.data["items"][0]["difficulty"] == 1
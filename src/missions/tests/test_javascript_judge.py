@@ -0,0 +1,60 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from missions.services import JavaScriptCodeJudge
+
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node가 없습니다.")
+
+
+@pytest.fixture
+def judge():
+    return JavaScriptCodeJudge()
+
+
+def test_each_run_gets_its_own_workspace(judge):
+    # WHEN
+    results = [
+        judge.execute("console.log(process.cwd())", "", 5, 256) for _ in range(2)
+    ]
+
+    # THEN
+    workspaces = [result["stdout"].strip() for result in results]
+    assert workspaces[0] != workspaces[1]
+    assert not any(os.path.exists(path) for path in workspaces)
+
+
+def test_file_size_limit(settings, judge):
+    # GIVEN
+    settings.JUDGE_FILE_SIZE_LIMIT_KB = 64
+    code = "require('fs').writeFileSync('out.bin', Buffer.alloc(1024 * 1024))"
+
+    # WHEN
+    result = judge.execute(code, "", 5, 256)
+
+    # THEN
+    assert result["status"] == "runtime_error"
+
+
+def test_parallel_submissions_get_their_own_results(judge):
+    # GIVEN
+    code = (
+        "const n = {n};\n"
+        "const line = require('fs').readFileSync(0, 'utf8');\n"
+        "console.log(n * 1000 + Number(line));"
+    )
+
+    def submit(n):
+        return judge.execute(code.replace("{n}", str(n)), str(n), 30, 256)
+
+    # WHEN
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(submit, range(100)))
+
+    # THEN
+    assert [result["stdout"].strip() for result in results] == [
+        str(n * 1000 + n) for n in range(100)
+    ]
@@ -0,0 +1,115 @@
+import pytest
+
+from missions.judge_pool import JudgeWorkerPool
+
+
+@pytest.fixture
+def pool():
+    pool = JudgeWorkerPool(size=1, max_runs=3)
+    yield pool
+    pool.close()
+
+
+class TestJudgeWorkerPool:
+    def test_run_code_with_input(self, pool):
+        # WHEN
+        result = pool.run("print(sum(map(int, input().split())))", "1 2 3\n", 2, 256)
+
+        # THEN
+        assert result["status"] == "ok"
+        assert result["stdout"] == "6\n"
+        assert result["wall_time"] >= result["cpu_time"] >= 0
+        assert 0 < result["memory_kb"] < 256 * 1024
+
+    def test_large_input_is_streamed(self, pool):
+        # GIVEN
+        input_data = "\n".join(str(i) for i in range(200000)) + "\n"
+        code = "import sys\nprint(sum(int(line) for line in sys.stdin))"
+
+        # WHEN
+        result = pool.run(code, input_data, 5, 256)
+
+        # THEN
+        assert result["stdout"].strip() == str(sum(range(200000)))
+
+    def test_time_limit_recycles_worker(self, pool):
+        # GIVEN
+        worker = pool._idle.queue[0]
+
+        # WHEN
+        result = pool.run("while True:\n    pass", "", 1, 256)
+
+        # THEN
+        assert result["status"] == "time_limit"
+        assert not worker.alive
+        assert pool.run("print('ok')", "", 2, 256)["stdout"] == "ok\n"
+
+    def test_time_limit_reports_cpu_time(self, pool):
+        # WHEN
+        result = pool.run("while True:\n    pass", "", 0.5, 256)
+
+        # THEN
+        assert result["status"] == "time_limit"
+        assert result["cpu_time"] > 0.3
+
+    def test_memory_limit(self, pool):
+        # WHEN
+        result = pool.run("data = bytearray(512 * 1024 * 1024)", "", 2, 128)
+
+        # THEN
+        assert result["status"] == "memory_limit"
+
+    def test_worker_recycled_after_max_runs(self, pool):
+        # GIVEN
+        worker = pool._idle.queue[0]
+
+        # WHEN
+        for _ in range(3):
+            pool.run("print(1)", "", 2, 256)
+
+        # THEN
+        assert not worker.alive
+        assert pool._idle.queue[0] is not worker
+
+    def test_runs_are_isolated(self, pool):
+        # WHEN
+        pool.run("import math\nmath.pi = 3", "", 2, 256)
+        result = pool.run("import math\nprint(math.pi)", "", 2, 256)
+
+        # THEN
+        assert result["stdout"].startswith("3.14")
+
+    def test_expected_output_is_not_visible_to_submission(self, pool, tmp_path):
+        # GIVEN: 호출 스택을 거슬러 올라가 워커가 받은 채점 요청을 찾아 출력하는 코드
+        code = (
+            "import sys\n"
+            "frame = sys._getframe()\n"
+            "while 'request' not in frame.f_locals:\n"
+            "    frame = frame.f_back\n"
+            "request = frame.f_locals['request']\n"
+            "print(repr({key: value for key, value in request.items() if key != 'code'}))\n"
+        )
+        expected_path = tmp_path / "secret.out"
+        expected_path.write_text("hidden-answer-7319\n")
+
+        # WHEN
+        results = [
+            pool.run(
+                code,
+                "",
+                2,
+                256,
+                compare={"expected": "hidden-answer-7319\n", "mode": mode},
+            )
+            for mode in ("exact", "float")
+        ]
+        results.append(
+            pool.run(code, "", 2, 256, compare={"expected_path": str(expected_path)})
+        )
+
+        # THEN
+        for result in results:
+            assert "time_limit" in result["stdout"]  # 채점 요청은 찾았지만
+            assert "hidden-answer" not in result["stdout"]  # 예상 출력과
+            assert "secret.out" not in result["stdout"]  # 그 경로는 없습니다.
+            assert result["matched"] is False
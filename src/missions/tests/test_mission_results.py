@@ -0,0 +1,250 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.models import (
+    CodeSubmission,
+    MissionResult,
+    MultipleChoiceQuestion,
+)
+from missions import question_sets
+from missions.question_sets import submit_answer_sheet
+from missions.services import evaluate_code_submission
+
+
+@pytest.fixture
+def student(db):
+    return CustomUser.objects.create_user(
+        email="student@example.com", username="student", password="password"
+    )
+
+
+@pytest.fixture
+def minor_category(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    return MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+
+
+@pytest.fixture
+def mission(minor_category):
+    return minor_category.missions.get(mission_type="multiple_choice", is_midterm=True)
+
+
+@pytest.fixture
+def questions(mission):
+    return MultipleChoiceQuestion.objects.bulk_create(
+        [
+            MultipleChoiceQuestion(
+                mission=mission,
+                question=f"문제 {i}",
+                option_1="1",
+                option_2="2",
+                option_3="3",
+                option_4="4",
+                option_5="5",
+                correct_option=1,
+            )
+            for i in range(4)
+        ]
+    )
+
+
+@pytest.mark.django_db
+class TestMissionResultUpdates:
+    def test_answer_sheets_keep_best_score(self, student, mission, questions):
+        # WHEN: 100점, 25점 순서로 두 번 응시
+        submit_answer_sheet(
+            student, mission, uuid.uuid4(), {q.pk: 1 for q in questions}
+        )
+        submit_answer_sheet(student, mission, uuid.uuid4(), {questions[0].pk: 1})
+
+        # THEN
+        result = MissionResult.objects.get(user=student, mission=mission)
+        assert result.best_score == 100
+        assert result.attempts == 2
+        assert result.passed is True
+
+    def test_concurrent_duplicate_attempt_is_counted_once(
+        self, monkeypatch, student, mission, questions
+    ):
+        # GIVEN: 잠금을 기다리는 동안 같은 응시의 다른 요청(25점)이 먼저 저장된 상황
+        attempt_id = uuid.uuid4()
+        lock_user_submissions = question_sets.lock_user_submissions
+
+        def lock_after_other_request(user_id):
+            monkeypatch.setattr(
+                question_sets, "lock_user_submissions", lock_user_submissions
+            )
+            submit_answer_sheet(student, mission, attempt_id, {questions[0].pk: 1})
+            lock_user_submissions(user_id)
+
+        monkeypatch.setattr(
+            question_sets, "lock_user_submissions", lock_after_other_request
+        )
+
+        # WHEN: 같은 응시를 다른 답안(100점)으로 제출
+        response = submit_answer_sheet(
+            student, mission, attempt_id, {q.pk: 1 for q in questions}
+        )
+
+        # THEN: 저장되지 않은 답안은 채점/반영되지 않습니다.
+        assert response["replayed"] is True
+        assert response["score"] == 25
+        result = MissionResult.objects.get(user=student, mission=mission)
+        assert result.attempts == 1
+        assert result.best_score == 25
+        assert student.multiple_choice_submissions.count() == 1
+
+    def test_single_question_submission_updates_result(
+        self, student, mission, questions
+    ):
+        # GIVEN
+        client = APIClient()
+        client.force_authenticate(user=student)
+
+        # WHEN
+        for question, option in ((questions[0], 1), (questions[1], 2)):
+            client.post(
+                reverse("multiple-choice-question-submit"),
+                {"question": question.pk, "selected_option": option},
+                format="json",
+            )
+
+        # THEN
+        result = MissionResult.objects.get(user=student, mission=mission)
+        assert result.best_score == 25
+        assert result.attempts == 2
+        assert result.passed is False
+
+    def test_code_submission_updates_result(self, student, minor_category):
+        # GIVEN
+        code_submission = CodeSubmission.objects.create(
+            mission=minor_category.missions.get(
+                mission_type="code_submission", is_midterm=True
+            ),
+            problem_statement="두 수의 합",
+            example_input="1 2",
+            example_output="3",
+            language="python",
+        )
+
+        # WHEN
+        evaluate_code_submission(
+            code_submission, "print(sum(map(int, input().split())))", student, 2, 256
+        )
+
+        # THEN
+        result = MissionResult.objects.get(
+            user=student, mission=code_submission.mission
+        )
+        assert result.best_score == 100
+        assert result.passed is True
+
+    def test_rebuild_command_matches_incremental_results(
+        self, student, mission, questions
+    ):
+        # GIVEN
+        submit_answer_sheet(student, mission, uuid.uuid4(), {questions[0].pk: 1})
+        expected = list(
+            MissionResult.objects.values("user", "mission", "best_score", "attempts")
+        )
+
+        # WHEN
+        call_command("rebuild_mission_results")
+
+        # THEN
+        assert (
+            list(
+                MissionResult.objects.values(
+                    "user", "mission", "best_score", "attempts"
+                )
+            )
+            == expected
+        )
+
+
+@pytest.mark.django_db
+class TestMissionResultEndpoints:
+    def test_scoreboard_pages_through_ties_with_cursor(self, mission):
+        # GIVEN: 동점자를 포함한 5명의 결과
+        now = timezone.now()
+        for index, score in enumerate((50, 100, 50, 50, 75)):
+            user = CustomUser.objects.create_user(
+                email=f"user{index}@example.com",
+                username=f"user{index}",
+                password="password",
+            )
+            MissionResult.objects.create(
+                user=user,
+                mission=mission,
+                best_score=score,
+                attempts=1,
+                last_submitted_at=now,
+            )
+        manager = CustomUser.objects.create_user(
+            email="manager@example.com",
+            username="manager",
+            password="password",
+            role="manager",
+        )
+        client = APIClient()
+        client.force_authenticate(user=manager)
+
+        # WHEN
+        pages = []
+        url = (
+            reverse("mission-scoreboard", kwargs={"mission_id": mission.pk})
+            + "?page_size=2"
+        )
+        while url:
+            response = client.get(url)
+            pages.append(response.data["results"])
+            url = response.data["next"]
+
+        # THEN
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [row["user"] for page in pages for row in page] == [
+            "user1",
+            "user4",
+            "user0",
+            "user2",
+            "user3",
+        ]
+
+    def test_my_results_are_ordered_by_last_submission(self, student, minor_category):
+        # GIVEN
+        now = timezone.now()
+        for days, mission in enumerate(minor_category.missions.order_by("id")):
+            MissionResult.objects.create(
+                user=student,
+                mission=mission,
+                best_score=0,
+                attempts=1,
+                last_submitted_at=now - timedelta(days=days),
+            )
+        client = APIClient()
+        client.force_authenticate(user=student)
+
+        # WHEN
+        first = client.get(reverse("user-mission-results"), {"page_size": 3})
+        second = client.get(first.data["next"])
+
+        # THEN
+        missions = list(
+            minor_category.missions.order_by("id").values_list("id", flat=True)
+        )
+        assert [
+            row["mission"] for row in first.data["results"] + second.data["results"]
+        ] == (missions)
+        assert second.data["next"] is None
@@ -0,0 +1,172 @@
+import pytest
+
+from django.core.management import call_command
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.models import CodeSubmission, CodeSubmissionRecord, SimilarityPair
+from missions.plagiarism import (
+    fingerprint_code,
+    jaccard_similarity,
+    tokenize_code,
+    winnow,
+)
+
+
+ORIGINAL = """
+n = int(input())
+numbers = list(map(int, input().split()))
+best = numbers[0]
+for value in numbers:
+    if value > best:
+        best = value  # 최댓값 갱신
+total = 0
+for value in numbers:
+    total += value * 2
+print(best, total)
+"""
+
+RENAMED = """
+size = int(input())
+arr = list(map(int, input().split()))
+m = arr[0]
+for x in arr:
+    if x > m:
+        m = x
+s = 0
+for x in arr:
+    s += x * 3
+print(m, s)
+"""
+
+DIFFERENT = """
+import sys
+words = sys.stdin.read().split()
+counts = {}
+while words:
+    word = words.pop()
+    counts[word] = counts.get(word, 0) + 1
+print(sorted(counts.items(), key=lambda item: -item[1]))
+"""
+
+
+class TestFingerprint:
+    def test_identifiers_comments_and_literals_are_normalized(self):
+        assert tokenize_code(ORIGINAL, "python") == tokenize_code(RENAMED, "python")
+        assert tokenize_code("let a = 'x'; // c", "javascript") == [
+            "let",
+            "v",
+            "=",
+            '"',
+            ";",
+        ]
+
+    def test_renamed_copy_shares_fingerprints(self):
+        original = fingerprint_code(ORIGINAL, "python")
+        different = fingerprint_code(DIFFERENT, "python")
+
+        assert original == fingerprint_code(RENAMED, "python")
+        assert (
+            jaccard_similarity(len(original & different), len(original), len(different))
+            < 0.2
+        )
+
+    def test_winnow_selects_rightmost_minimum_per_window(self):
+        assert winnow([5, 3, 3, 7, 9, 1], window=3) == {3, 1}
+
+
+@pytest.mark.django_db
+class TestSimilarityClusters:
+    @pytest.fixture
+    def code_submission(self):
+        major_category = MajorCategory.objects.create(name="Python", price=0)
+        minor_category = MinorCategory.objects.create(
+            name="기초", major_category=major_category, content="기초", order=1
+        )
+        return CodeSubmission.objects.create(
+            mission=minor_category.missions.get(
+                mission_type="code_submission", is_midterm=True
+            ),
+            problem_statement="최댓값과 합",
+            example_input="",
+            example_output="",
+            language="python",
+        )
+
+    def submit(self, code_submission, username, code):
+        user, _ = CustomUser.objects.get_or_create(
+            username=username, defaults={"email": f"{username}@example.com"}
+        )
+        return CodeSubmissionRecord.objects.create(
+            user=user, code_submission=code_submission, submitted_code=code
+        )
+
+    def test_copied_submissions_are_clustered(self, code_submission):
+        # GIVEN
+        original = self.submit(code_submission, "alice", ORIGINAL)
+        self.submit(code_submission, "alice", ORIGINAL)  # 같은 사용자의 재제출
+        copied = self.submit(code_submission, "bob", RENAMED)
+        self.submit(code_submission, "carol", DIFFERENT)
+        manager = CustomUser.objects.create_user(
+            email="manager@example.com",
+            username="manager",
+            password="password",
+            role="manager",
+        )
+        client = APIClient()
+        client.force_authenticate(user=manager)
+
+        # WHEN
+        call_command("index_code_fingerprints")
+        response = client.get(
+            reverse(
+                "code-submission-similarity-clusters",
+                kwargs={"code_submission_id": code_submission.pk},
+            )
+        )
+
+        # THEN
+        assert not CodeSubmissionRecord.objects.filter(
+            fingerprint_count__isnull=True
+        ).exists()
+        assert SimilarityPair.objects.filter(
+            record_a=original, record_b=copied
+        ).exists()
+        assert response.status_code == 200
+        [cluster] = response.data["clusters"]
+        assert sorted(user["username"] for user in cluster["users"]) == ["alice", "bob"]
+        assert cluster["max_similarity"] == 1.0
+        assert len(cluster["pairs"]) == 2
+
+    def test_new_submission_is_indexed_incrementally(self, code_submission):
+        # GIVEN
+        self.submit(code_submission, "alice", ORIGINAL)
+        call_command("index_code_fingerprints")
+
+        # WHEN
+        self.submit(code_submission, "bob", RENAMED)
+        call_command("index_code_fingerprints")
+
+        # THEN
+        assert SimilarityPair.objects.count() == 1
+
+    def test_students_cannot_view_clusters(self, code_submission):
+        # GIVEN
+        client = APIClient()
+        client.force_authenticate(
+            user=self.submit(code_submission, "alice", ORIGINAL).user
+        )
+
+        # WHEN
+        response = client.get(
+            reverse(
+                "code-submission-similarity-clusters",
+                kwargs={"code_submission_id": code_submission.pk},
+            )
+        )
+
+        # THEN
+        assert response.status_code == 403
@@ -0,0 +1,281 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.models import CodeSubmission, MultipleChoiceQuestion
+from missions.models import TestCase as MissionTestCase
+from missions.question_sets import QuestionSetService
+
+
+def make_question(index, **overrides):
+    return {
+        "question": f"문제 {index}",
+        "option_1": "1",
+        "option_2": "2",
+        "option_3": "3",
+        "option_4": "4",
+        "option_5": "5",
+        "correct_option": 1 + index % 5,
+        **overrides,
+    }
+
+
+@pytest.fixture
+def minor_category(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    return MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+
+
+@pytest.fixture
+def mission(minor_category):
+    return minor_category.missions.get(mission_type="multiple_choice", is_midterm=True)
+
+
+@pytest.fixture
+def client(db):
+    manager = CustomUser.objects.create_user(
+        email="manager@example.com",
+        username="manager",
+        password="password",
+        role="manager",
+    )
+    client = APIClient()
+    client.force_authenticate(user=manager)
+    return client
+
+
+def import_file(client, mission, name, content):
+    return client.post(
+        reverse("mission-question-bank-import", kwargs={"mission_id": mission.pk}),
+        {"file": SimpleUploadedFile(name, content)},
+        format="multipart",
+    )
+
+
+def without_ids(exported_zip):
+    """다른 미션에 새 문제로 복사하도록 ZIP 목차에서 문제 id를 지웁니다."""
+    output = io.BytesIO()
+    with (
+        zipfile.ZipFile(io.BytesIO(exported_zip)) as source,
+        zipfile.ZipFile(output, "w") as copy,
+    ):
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == "bank.json":
+                document = json.loads(data)
+                for problem in document["problems"]:
+                    problem.pop("id")
+                data = json.dumps(document).encode()
+            copy.writestr(info.filename, data)
+    return output.getvalue()
+
+
+def export_file(client, mission, file_format):
+    response = client.get(
+        reverse("mission-question-bank-export", kwargs={"mission_id": mission.pk}),
+        {"file_format": file_format},
+    )
+    assert response.status_code == 200
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestMultipleChoiceQuestionBank:
+    def test_large_bank_is_imported_with_bulk_queries(self, client, mission):
+        # GIVEN
+        QuestionSetService.get_question_set(mission.pk)  # 빈 문제 세트를 캐시
+        content = json.dumps({"questions": [make_question(i) for i in range(1000)]})
+
+        # WHEN
+        with CaptureQueriesContext(connection) as queries:
+            response = import_file(client, mission, "bank.json", content.encode())
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data == {"created": 1000, "updated": 0, "test_cases": 0}
+        inserts = [
+            q
+            for q in queries
+            if q["sql"].startswith('INSERT INTO "missions_multiplechoicequestion"')
+        ]
+        assert len(inserts) < 10  # 문제마다가 아니라 묶음 단위로 저장합니다.
+        assert len(QuestionSetService.get_question_set(mission.pk)) == 1000
+
+    def test_csv_round_trip_updates_existing_questions(self, client, mission):
+        # GIVEN
+        questions = MultipleChoiceQuestion.objects.bulk_create(
+            [
+                MultipleChoiceQuestion(mission=mission, **make_question(i))
+                for i in range(3)
+            ]
+        )
+        exported = export_file(client, mission, "csv").decode("utf-8-sig")
+        edited = (
+            exported.replace("문제 1,", "수정된 문제,") + ",새 문제,a,b,c,d,e,2\r\n"
+        )
+
+        # WHEN
+        response = import_file(client, mission, "bank.csv", edited.encode("utf-8-sig"))
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data == {"created": 1, "updated": 3, "test_cases": 0}
+        questions[1].refresh_from_db()
+        assert questions[1].question == "수정된 문제"
+        assert mission.multiple_choice_questions.count() == 4
+
+    def test_invalid_rows_are_reported_and_nothing_is_saved(self, client, mission):
+        # GIVEN
+        rows = [make_question(0), make_question(1, correct_option=9), make_question(2)]
+
+        # WHEN
+        response = import_file(
+            client, mission, "bank.json", json.dumps({"questions": rows}).encode()
+        )
+
+        # THEN
+        assert response.status_code == 400
+        assert [error["row"] for error in response.data["errors"]] == [2]
+        assert "correct_option" in response.data["errors"][0]["errors"]
+        assert not mission.multiple_choice_questions.exists()
+
+    def test_students_cannot_import(self, mission):
+        # GIVEN
+        student = CustomUser.objects.create_user(
+            email="student@example.com", username="student", password="password"
+        )
+        client = APIClient()
+        client.force_authenticate(user=student)
+
+        # WHEN
+        response = import_file(client, mission, "bank.json", b'{"questions": []}')
+
+        # THEN
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestCodeProblemBank:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.TEST_CASE_INLINE_LIMIT_KB = 1
+
+    def test_zip_round_trip_copies_problems_and_test_cases(
+        self, client, minor_category
+    ):
+        # GIVEN
+        source, target = minor_category.missions.filter(mission_type="code_submission")
+        problem = CodeSubmission.objects.create(
+            mission=source,
+            problem_statement="합 구하기",
+            example_input="1 2\n",
+            example_output="3\n",
+            language="python",
+        )
+        large_input = "\n".join(str(i) for i in range(1000))
+        MissionTestCase.objects.create(
+            code_submission=problem, input_data=large_input, expected_output="499500\n"
+        )
+        MissionTestCase.objects.create(
+            code_submission=problem,
+            input_data="1 2\n",
+            expected_output="3\n",
+            is_sample=True,
+        )
+
+        # WHEN
+        exported = export_file(client, source, "zip")
+        response = import_file(client, target, "bank.zip", without_ids(exported))
+
+        # THEN
+        assert zipfile.ZipFile(io.BytesIO(exported)).testzip() is None
+        assert response.status_code == 200
+        assert response.data == {"created": 1, "updated": 0, "test_cases": 2}
+        copied = target.code_submissions.get()
+        assert copied.example_input == "1 2\n"
+        test_cases = list(copied.test_cases.order_by("id"))
+        assert test_cases[
+            0
+        ].input_file  # 인라인 한도를 넘는 입력은 파일 저장소로 옮겨집니다.
+        assert test_cases[0].read_input() == large_input
+        assert (
+            test_cases[0].input_sha256
+            == problem.test_cases.order_by("id")[0].input_sha256
+        )
+        assert test_cases[1].is_sample is True
+
+    def test_update_replaces_test_cases_and_bumps_version(self, client, minor_category):
+        # GIVEN
+        mission = minor_category.missions.filter(mission_type="code_submission").first()
+        problem = CodeSubmission.objects.create(
+            mission=mission,
+            problem_statement="합 구하기",
+            example_input="1 2",
+            example_output="3",
+            language="python",
+        )
+        MissionTestCase.objects.create(
+            code_submission=problem, input_data="1 1", expected_output="2"
+        )
+        problem.refresh_from_db()
+        version = problem.test_case_version
+        document = json.loads(export_file(client, mission, "json"))
+        document["problems"][0]["time_limit"] = 3
+        document["problems"][0]["test_cases"] = [
+            {"input_data": "2 2", "expected_output": "4"},
+            {"input_data": "3 3", "expected_output": "6"},
+        ]
+
+        # WHEN
+        response = import_file(
+            client, mission, "bank.json", json.dumps(document).encode()
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data == {"created": 0, "updated": 1, "test_cases": 2}
+        problem.refresh_from_db()
+        assert problem.time_limit == 3
+        assert problem.test_case_version > version
+        assert list(problem.test_cases.values_list("input_data", flat=True)) == [
+            "2 2",
+            "3 3",
+        ]
+
+    def test_unknown_problem_id_is_rejected(self, client, minor_category):
+        # GIVEN
+        mission = minor_category.missions.filter(mission_type="code_submission").first()
+        document = {
+            "problems": [
+                {
+                    "id": 999,
+                    "problem_statement": "없는 문제",
+                    "example_input": "",
+                    "example_output": "",
+                    "language": "python",
+                }
+            ]
+        }
+
+        # WHEN
+        response = import_file(
+            client, mission, "bank.json", json.dumps(document).encode()
+        )
+
+        # THEN
+        assert response.status_code == 400
+        assert not mission.code_submissions.exists()
@@ -0,0 +1,143 @@
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import MajorCategory, MinorCategory
+from missions.models import MultipleChoiceQuestion
+
+
+@pytest.fixture
+def student(db):
+    return CustomUser.objects.create_user(
+        email="student@example.com", username="student", password="password"
+    )
+
+
+@pytest.fixture
+def minor_category(db):
+    major_category = MajorCategory.objects.create(name="Python", price=0)
+    return MinorCategory.objects.create(
+        name="기초", major_category=major_category, content="기초", order=1
+    )
+
+
+@pytest.fixture
+def questions(minor_category):
+    mission = minor_category.missions.get(
+        mission_type="multiple_choice", is_midterm=True
+    )
+    return [
+        MultipleChoiceQuestion.objects.create(
+            mission=mission,
+            question=f"문제 {i}",
+            option_1=f"{i}-1",
+            option_2=f"{i}-2",
+            option_3=f"{i}-3",
+            option_4=f"{i}-4",
+            option_5=f"{i}-5",
+            correct_option=i,
+        )
+        for i in range(1, 4)
+    ]
+
+
+def get_midterm_questions(user, minor_category, **params):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client.get(
+        reverse(
+            "multiple-choice-question-list",
+            kwargs={
+                "major_id": minor_category.major_category_id,
+                "minor_id": minor_category.pk,
+                "mid_or_final": "mid",
+            },
+        ),
+        params,
+    )
+
+
+@pytest.mark.django_db
+class TestQuestionSetDelivery:
+    def test_student_receives_shuffled_questions_without_answer(
+        self, student, minor_category, questions
+    ):
+        # WHEN
+        first = get_midterm_questions(student, minor_category)
+        second = get_midterm_questions(student, minor_category)
+
+        # THEN
+        assert first.status_code == 200
+        assert first.data == second.data
+        for question, delivered in zip(questions, first.data):
+            assert "correct_option" not in delivered
+            assert sorted(delivered["option_order"]) == [1, 2, 3, 4, 5]
+            for position, number in enumerate(delivered["option_order"], start=1):
+                assert delivered[f"option_{position}"] == getattr(
+                    question, f"option_{number}"
+                )
+
+    def test_seed_changes_option_order(self, student, minor_category, questions):
+        # WHEN
+        orders = {
+            tuple(tuple(q["option_order"]) for q in response.data)
+            for response in (
+                get_midterm_questions(student, minor_category, seed=seed)
+                for seed in ("a", "b", "c")
+            )
+        }
+
+        # THEN
+        assert len(orders) > 1
+
+    def test_cached_set_skips_database(self, student, minor_category, questions):
+        # GIVEN
+        get_midterm_questions(student, minor_category)
+
+        # WHEN
+        with CaptureQueriesContext(connection) as context:
+            response = get_midterm_questions(student, minor_category)
+
+        # THEN
+        assert response.status_code == 200
+        assert not any(
+            "missions_multiplechoicequestion" in query["sql"]
+            or "missions_mission" in query["sql"]
+            for query in context.captured_queries
+        )
+
+    def test_question_change_invalidates_set(self, student, minor_category, questions):
+        # GIVEN
+        get_midterm_questions(student, minor_category)
+
+        # WHEN
+        questions[0].question = "바뀐 문제"
+        questions[0].save()
+        questions[2].delete()
+        response = get_midterm_questions(student, minor_category)
+
+        # THEN
+        assert [q["question"] for q in response.data] == ["바뀐 문제", "문제 2"]
+
+    def test_manager_receives_answers_in_original_order(
+        self, minor_category, questions
+    ):
+        # GIVEN
+        manager = CustomUser.objects.create_user(
+            email="manager@example.com",
+            username="manager",
+            password="password",
+            role="manager",
+        )
+
+        # WHEN
+        response = get_midterm_questions(manager, minor_category)
+
+        # THEN
+        assert [q["correct_option"] for q in response.data] == [1, 2, 3]
+        assert response.data[0]["option_1"] == "1-1"
@@ -0,0 +1,197 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from missions.judge_pool import JudgeWorkerPool
+from missions.sandbox import (
+    RlimitSandbox,
+    SandboxBusyError,
+    create_sandbox,
+    host_slot,
+    run_process,
+)
+
+
+# 손자 프로세스를 만들어 PID를 출력한 뒤, 표준 입출력을 닫고 계속 CPU를 사용하는 코드
+ORPHAN_BUSY_LOOP = """
+import os
+pid = os.fork()
+if pid == 0:
+    for fd in (0, 1, 2):
+        os.close(fd)
+    while True:
+        pass
+print(pid)
+"""
+
+# 자식과 손자가 모두 표준 출력을 연 채로 CPU를 사용하는 코드
+GROUP_BUSY_LOOP = """
+import os
+pid = os.fork()
+if pid == 0:
+    while True:
+        pass
+print(pid, flush=True)
+while True:
+    pass
+"""
+
+
+def is_running(pid, timeout=1):
+    """
+    timeout 안에 종료되지 않으면 True를 반환합니다. 회수되지 않은 좀비 프로세스는 종료된 것으로 봅니다.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                state = f.read().rsplit(")", 1)[1].split()[0]
+        except FileNotFoundError:
+            return False
+        if state in ("Z", "X"):
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestProcessGroupKill:
+    def test_orphaned_grandchild_is_killed_after_run(self):
+        # WHEN
+        result = run_process(["python3", "-c", ORPHAN_BUSY_LOOP], "", 2, 256)
+
+        # THEN
+        assert result["status"] == "ok"
+        assert not is_running(int(result["stdout"]))
+
+    def test_timeout_kills_whole_process_group(self):
+        # WHEN
+        result = run_process(["python3", "-c", GROUP_BUSY_LOOP], "", 1, 256)
+
+        # THEN
+        assert result["status"] == "time_limit"
+        assert not is_running(int(result["stdout"]))
+
+    def test_worker_pool_kills_grandchildren(self):
+        # GIVEN
+        pool = JudgeWorkerPool(size=1, max_runs=3)
+
+        # WHEN
+        try:
+            result = pool.run(ORPHAN_BUSY_LOOP, "", 2, 256)
+        finally:
+            pool.close()
+
+        # THEN
+        assert result["status"] == "ok"
+        assert not is_running(int(result["stdout"]))
+
+
+class TestWallTimeLimit:
+    CLOSED_OUTPUT_SLEEP = "import os, time\nos.close(1)\nos.close(2)\ntime.sleep(8)"
+    SLEEP = "import time\ntime.sleep(8)"
+
+    @pytest.mark.parametrize("code", [CLOSED_OUTPUT_SLEEP, SLEEP])
+    def test_run_process(self, code):
+        # WHEN
+        result = run_process(["python3", "-c", code], "", 1, 256)
+
+        # THEN
+        assert result["status"] == "time_limit"
+        assert result["wall_time"] < 3
+
+    @pytest.mark.parametrize("code", [CLOSED_OUTPUT_SLEEP, SLEEP])
+    def test_worker_pool(self, code):
+        # GIVEN
+        pool = JudgeWorkerPool(size=1, max_runs=3)
+
+        # WHEN
+        try:
+            result = pool.run(code, "", 1, 256)
+        finally:
+            pool.close()
+
+        # THEN
+        assert result["status"] == "time_limit"
+        assert result["wall_time"] < 3
+
+
+class TestLimits:
+    def test_open_files_limit(self):
+        # GIVEN
+        code = "files = [open('/dev/null') for _ in range(64)]"
+
+        # WHEN
+        result = run_process(["python3", "-c", code], "", 2, 256, open_files=16)
+
+        # THEN
+        assert result["status"] == "runtime_error"
+        assert "Too many open files" in result["stderr"]
+
+    def test_limits_are_applied_to_runs_started_from_threads(self):
+        # GIVEN: 새 세션의 리더인지, nice 값과 파일 디스크립터 제한을 출력하는 코드
+        code = (
+            "import os, resource\n"
+            "print(os.getsid(0) == os.getpid(), os.nice(0), "
+            "resource.getrlimit(resource.RLIMIT_NOFILE)[0])"
+        )
+
+        # WHEN
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: run_process(
+                        ["python3", "-c", code], "", 2, 256, open_files=16
+                    ),
+                    range(16),
+                )
+            )
+
+        # THEN
+        assert [result["stdout"] for result in results] == ["True 10 16\n"] * 16
+
+    def test_sandbox_setup_failure_is_internal_error(self):
+        # WHEN
+        result = run_process(["missing-judge-command"], "", 2, 256)
+
+        # THEN
+        assert result["status"] == "internal_error"
+        assert result["stderr"].startswith("sandbox:")
+
+    def test_unavailable_cgroup_backend(self, tmp_path):
+        limits = {"time_limit": 1, "memory_limit": 64}
+
+        assert isinstance(
+            create_sandbox("auto", str(tmp_path), **limits), RlimitSandbox
+        )
+        with pytest.raises(RuntimeError):
+            create_sandbox("cgroup", str(tmp_path), **limits)
+
+
+class TestHostSlot:
+    def test_slots_are_shared_and_released(self, tmp_path):
+        # GIVEN
+        directory = str(tmp_path)
+
+        # WHEN / THEN
+        with host_slot(directory, 1, timeout=1) as slot:
+            assert slot == 0
+            with pytest.raises(SandboxBusyError):
+                with host_slot(directory, 1, timeout=0.05):
+                    pass
+        with host_slot(directory, 1, timeout=0.05) as slot:
+            assert slot == 0
+
+    def test_slot_is_released_when_holder_dies(self, tmp_path):
+        # GIVEN: 슬롯을 잡은 채로 종료하는 자식 프로세스
+        directory = str(tmp_path)
+        pid = os.fork()
+        if pid == 0:
+            with host_slot(directory, 1, timeout=1):
+                os._exit(0)
+        os.waitpid(pid, 0)
+
+        # WHEN / THEN
+        with host_slot(directory, 1, timeout=0.05) as slot:
+            assert slot == 0
@@ -8,8 +8,17 @@ from .views import (
     MissionViewSet,
     MultipleChoiceQuestionViewSet,
     MultipleChoiceQuestionSubmissionAPIView,
+    MultipleChoiceAnswerSheetAPIView,
+    MissionAdmissionMetricsAPIView,
+    MissionItemAnalysisAPIView,
+    MissionQuestionBankExportAPIView,
+    MissionQuestionBankImportAPIView,
+    MissionScoreboardAPIView,
+    UserMissionResultListAPIView,
     CodeSubmissionViewSet,
     CodeSubmissionEvaluationAPIView,
+    CodeSubmissionRecordStatusAPIView,
+    CodeSubmissionSimilarityClusterAPIView,
     UserCodeSubmissionListAPIView,
     UserSubmissionListAPIView,
 )
@@ -49,12 +58,65 @@ urlpatterns = [
         MultipleChoiceQuestionSubmissionAPIView.as_view(),
         name="multiple-choice-question-submit",
     ),
+    # 미션 전체 5지선다형 답안지 제출 및 채점 API
+    path(
+        "<int:mission_id>/answer-sheet/",
+        MultipleChoiceAnswerSheetAPIView.as_view(),
+        name="multiple-choice-answer-sheet",
+    ),
+    # 5지선다형 미션 문항 분석 API
+    path(
+        "<int:mission_id>/item-analysis/",
+        MissionItemAnalysisAPIView.as_view(),
+        name="mission-item-analysis",
+    ),
+    # 미션 문제 은행 가져오기/내보내기 API
+    path(
+        "<int:mission_id>/question-bank/import/",
+        MissionQuestionBankImportAPIView.as_view(),
+        name="mission-question-bank-import",
+    ),
+    path(
+        "<int:mission_id>/question-bank/export/",
+        MissionQuestionBankExportAPIView.as_view(),
+        name="mission-question-bank-export",
+    ),
+    # 미션 요청 수용 제어 지표 API
+    path(
+        "admission/metrics/",
+        MissionAdmissionMetricsAPIView.as_view(),
+        name="mission-admission-metrics",
+    ),
+    # 미션 점수판 API
+    path(
+        "<int:mission_id>/scoreboard/",
+        MissionScoreboardAPIView.as_view(),
+        name="mission-scoreboard",
+    ),
+    # 로그인한 사용자의 미션 결과 API
+    path(
+        "results/me/",
+        UserMissionResultListAPIView.as_view(),
+        name="user-mission-results",
+    ),
     # 코드 제출형 문제 채점 API
     path(
         "code-submissions/<int:code_submission_id>/evaluate/",
         CodeSubmissionEvaluationAPIView.as_view(),
         name="code-submission-evaluate",
     ),
+    # 코드 제출형 문제 표절 의심 클러스터 조회 API
+    path(
+        "code-submissions/<int:code_submission_id>/similarity-clusters/",
+        CodeSubmissionSimilarityClusterAPIView.as_view(),
+        name="code-submission-similarity-clusters",
+    ),
+    # 코드 제출 채점 상태 조회 API
+    path(
+        "code-submission-records/<int:record_id>/",
+        CodeSubmissionRecordStatusAPIView.as_view(),
+        name="code-submission-record-status",
+    ),
     path("", include(router.urls)),
     path(
         "submissions/user/mcqs/",
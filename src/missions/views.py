@@ -1,4 +1,11 @@
+import time
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+
 from rest_framework.generics import ListAPIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -7,11 +14,36 @@ from rest_framework import viewsets
 
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
-from .permissions import IsActiveOrCompletedEnrollmentOrManagerAdmin, IsManagerOrAdmin
+from .admission import (
+    SCOPE_READ,
+    SCOPE_SUBMIT,
+    AdmissionControlMixin,
+    check_judge_queue,
+    get_admission_metrics,
+)
+from .pagination import KeysetPagination
+from .item_analysis import get_item_analysis
+from .plagiarism import find_similarity_clusters
+from .question_bank import (
+    CONTENT_TYPES,
+    FORMATS,
+    QuestionBankError,
+    export_question_bank,
+    guess_format,
+    import_question_bank,
+)
+from .question_sets import QuestionSetService, submit_answer_sheet
+from .results import record_multiple_choice_result
+from .permissions import (
+    IsActiveOrCompletedEnrollmentOrManagerAdmin,
+    IsManagerOrAdmin,
+    IsRecordOwnerOrManagerAdmin,
+)
 
 from .models import (
     CodeSubmissionRecord,
     Mission,
+    MissionResult,
     MultipleChoiceQuestion,
     MultipleChoiceSubmission,
     CodeSubmission,
@@ -19,14 +51,17 @@ from .models import (
 
 from .serializers import (
     DetailMultipleChoiceSubmissionSerializer,
+    MissionResultSerializer,
     MissionSerializer,
+    MultipleChoiceAnswerSheetSerializer,
     MultipleChoiceQuestionSerializer,
     CodeSubmissionSerializer,
+    CodeSubmissionRecordStatusSerializer,
     MultipleChoiceSubmissionSerializer,
     SimpleSubmissionSerializer,
 )
 
-from .services import evaluate_code_submission
+from .services import enqueue_code_submission, evaluate_code_submission
 
 
 class MissionViewSet(viewsets.ModelViewSet):
@@ -111,7 +146,7 @@ class MissionViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
+class MultipleChoiceQuestionViewSet(AdmissionControlMixin, viewsets.ModelViewSet):
     """
     5지선다형 문제에 대한 CRUD 기능을 제공하는 ViewSet.
 
@@ -119,6 +154,7 @@ class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
     특정 미션에 속한 문제들을 필터링하여 목록을 제공하며, 문제의 생성, 수정, 삭제를 지원합니다.
     """
 
+    admission_scope = SCOPE_READ
     queryset = MultipleChoiceQuestion.objects.all()
     serializer_class = MultipleChoiceQuestionSerializer
 
@@ -158,8 +194,14 @@ class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
                 required=False,
                 type=int,
             ),
+            OpenApiParameter(
+                name="seed",
+                description="학생용 선택지 순서를 섞을 때 사용할 값. 같은 학생과 seed에는 항상 같은 순서가 나옵니다.",
+                required=False,
+                type=str,
+            ),
         ],
-        responses={200: OpenApiResponse(MissionSerializer(many=True))},
+        responses={200: OpenApiResponse(MultipleChoiceQuestionSerializer(many=True))},
     )
     def list(self, request, *args, **kwargs):
         """
@@ -167,6 +209,8 @@ class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
 
         URL 쿼리 파라미터로 `mission_id`를 받아, 해당 미션에 속한 문제들을 필터링하여 반환합니다.
         또는, URL 경로 파라미터로 `minor_id`, `mid_or_final`을 받아 필터링할 수 있습니다.
+        미션을 지정하면 캐시된 문제 세트를 사용하며, 학생에게는 정답(correct_option)을 제거하고
+        선택지 순서를 섞어 반환합니다. 섞인 선택지의 원래 번호는 option_order에 담깁니다.
 
         Args:
             request (Request): HTTP 요청 객체.
@@ -175,6 +219,7 @@ class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
 
         Returns:
             Response: 직렬화된 MultipleChoiceQuestion 데이터를 포함하는 응답 객체.
+                      mission_id가 정수가 아니면 400 상태 코드를 반환합니다.
 
         Example:
             GET /multiplechoicequestions/?mission_id=5  # mission_id=5인 문제만 반환.
@@ -183,29 +228,50 @@ class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
         Raises:
             Mission.DoesNotExist: 요청된 mission_id에 해당하는 미션이 존재하지 않으면 빈 결과를 반환합니다.
         """
-        queryset = self.get_queryset()
-
         # URL 경로 파라미터로 minor_id와 mid_or_final을 받음
         minor_id = kwargs.get("minor_id")
         mid_or_final = kwargs.get("mid_or_final")
+        seed = request.query_params.get("seed", "")
 
         # mission_id 쿼리 파라미터로 필터링
-        mission_id = self.request.query_params.get("mission_id", None)
+        mission_id = request.query_params.get("mission_id", None)
         if mission_id:
-            queryset = queryset.filter(mission_id=mission_id)
+            try:
+                mission_id = int(mission_id)
+            except ValueError:
+                return Response(
+                    {"error": "mission_id는 정수여야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
         # minor_id와 mid_or_final 파라미터로 필터링
         elif minor_id and mid_or_final:
-            mission_filter = {
-                "minor_category_id": minor_id,
-                "is_midterm": (mid_or_final == "mid"),
-                "is_final": (mid_or_final == "final"),
-            }
-            missions = Mission.objects.filter(**mission_filter)
-            queryset = queryset.filter(mission__in=missions)
+            mission_id = QuestionSetService.resolve_exam_mission_id(
+                minor_id, mid_or_final
+            )
+            if mission_id is None:
+                return Response([])
 
-        # 시리얼라이저를 사용해 데이터 반환
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        if mission_id:
+            questions = QuestionSetService.get_question_set(mission_id)
+        else:
+            questions = self.get_serializer(self.get_queryset(), many=True).data
+
+        return Response(QuestionSetService.for_user(questions, request.user, seed))
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        5지선다형 문제 하나를 반환합니다. 학생에게는 목록과 같은 방식으로 정답을 제거하고
+        선택지 순서를 섞어 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+
+        Returns:
+            Response: 직렬화된 MultipleChoiceQuestion 데이터를 포함하는 응답 객체.
+        """
+        question = self.get_serializer(self.get_object()).data
+        seed = request.query_params.get("seed", "")
+        return Response(QuestionSetService.for_user([question], request.user, seed)[0])
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -237,7 +303,7 @@ class MultipleChoiceQuestionViewSet(viewsets.ModelViewSet):
             )
 
 
-class MultipleChoiceQuestionSubmissionAPIView(APIView):
+class MultipleChoiceQuestionSubmissionAPIView(AdmissionControlMixin, APIView):
     """
     5지선다형 문제에 대한 답안을 제출하고 채점하는 API 뷰.
 
@@ -245,6 +311,8 @@ class MultipleChoiceQuestionSubmissionAPIView(APIView):
     제출된 답안이 유효한 경우, 답안이 맞았는지 여부를 포함하여 응답을 반환합니다.
     """
 
+    admission_scope = SCOPE_SUBMIT
+
     def post(self, request, *args, **kwargs):
         """
         5지선다형 문제의 답안을 제출하고 채점합니다.
@@ -270,6 +338,7 @@ class MultipleChoiceQuestionSubmissionAPIView(APIView):
 
         if serializer.is_valid():
             submission = serializer.save()
+            record_multiple_choice_result(submission)
             return Response(
                 {"message": "제출 완료", "is_correct": submission.is_correct},
                 status=status.HTTP_201_CREATED,
@@ -278,6 +347,234 @@ class MultipleChoiceQuestionSubmissionAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class MultipleChoiceAnswerSheetAPIView(AdmissionControlMixin, APIView):
+    """
+    미션 전체의 5지선다형 답안지를 한 번에 제출하고 채점하는 API 뷰.
+
+    문제마다 요청을 보내는 대신 {문제 ID: 선택한 답안} 답안지를 한 번에 받아 채점하고,
+    점수 요약과 문항별 결과를 반환합니다. 같은 attempt_id로 다시 보내면 처음 결과를 반환합니다.
+    """
+
+    admission_scope = SCOPE_SUBMIT
+    permission_classes = [IsAuthenticated, IsActiveOrCompletedEnrollmentOrManagerAdmin]
+
+    @extend_schema(request=MultipleChoiceAnswerSheetSerializer)
+    def post(self, request, mission_id, *args, **kwargs):
+        """
+        답안지를 채점하고 점수 요약을 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체, {"attempt_id": UUID, "answers": {문제 ID: 답안}}을 포함.
+            mission_id (int): 답안지를 제출할 5지선다형 미션의 ID.
+
+        Returns:
+            Response: {"attempt_id", "total", "answered", "correct", "score", "results", "replayed"}
+                      형식의 응답. 새로 채점하면 201, 이미 제출된 응시이면 200 상태 코드를 반환.
+                      답안지가 유효하지 않거나 미션에 속하지 않은 문제가 있으면 400 상태 코드를 반환.
+
+        Raises:
+            Http404: 해당 5지선다형 미션이 존재하지 않을 때 발생.
+            PermissionDenied: 미션에 접근할 권한이 없을 때 발생.
+        """
+        mission = get_object_or_404(
+            Mission, pk=mission_id, mission_type="multiple_choice"
+        )
+        self.check_object_permissions(request, mission)
+
+        serializer = MultipleChoiceAnswerSheetSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            result = submit_answer_sheet(
+                user=request.user,
+                mission=mission,
+                attempt_id=serializer.validated_data["attempt_id"],
+                answers=serializer.validated_data["answers"],
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            result,
+            status=status.HTTP_200_OK
+            if result["replayed"]
+            else status.HTTP_201_CREATED,
+        )
+
+
+class MissionAdmissionMetricsAPIView(APIView):
+    """
+    미션 요청 수용 제어 지표를 조회하는 API 뷰.
+
+    요청 종류별 처리 한도와 처리 중인 요청 수, 허용/거절 횟수, 채점 대기열 길이를 반환합니다.
+    매니저와 관리자만 조회할 수 있습니다.
+    """
+
+    permission_classes = [IsAuthenticated, IsManagerOrAdmin]
+
+    def get(self, request, *args, **kwargs):
+        """
+        수용 제어 지표를 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+
+        Returns:
+            Response: {"scopes": {요청 종류: {"capacity", "in_flight", "admitted", "rejected"}},
+                      "judge_queue": {"queued", "running", "max_per_user", "rejected"}} 형식의 응답.
+        """
+        return Response(get_admission_metrics())
+
+
+class MissionItemAnalysisAPIView(APIView):
+    """
+    5지선다형 미션의 문항 분석 결과를 조회하는 API 뷰.
+
+    문항별 난이도, 변별도, 선택지별 선택 비율과 미션의 신뢰도(Cronbach's alpha)를 반환하며,
+    너무 쉽거나 어렵거나 오답 선택지가 정답보다 많이 선택된 문항에는 flags를 표시합니다.
+    매니저와 관리자만 조회할 수 있습니다.
+    """
+
+    permission_classes = [IsAuthenticated, IsManagerOrAdmin]
+
+    def get(self, request, mission_id, *args, **kwargs):
+        """
+        미션의 문항 분석 결과를 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+            mission_id (int): 분석할 5지선다형 미션의 ID.
+
+        Returns:
+            Response: {"mission", "students", "mean_score", "cronbach_alpha", "items"} 형식의 응답.
+
+        Raises:
+            Http404: 해당 5지선다형 미션이 존재하지 않을 때 발생.
+        """
+        mission = get_object_or_404(
+            Mission, pk=mission_id, mission_type="multiple_choice"
+        )
+        return Response(get_item_analysis(mission))
+
+
+class MissionQuestionBankImportAPIView(APIView):
+    """
+    미션의 문제 은행 파일(CSV, JSON, ZIP)을 가져오는 API 뷰.
+
+    5지선다형 미션은 문제를, 코드 제출형 미션은 문제와 테스트 케이스를 한 요청으로 추가하거나
+    수정합니다. 파일 전체가 유효할 때만 저장합니다. 매니저와 관리자만 사용할 수 있습니다.
+    """
+
+    permission_classes = [IsAuthenticated, IsManagerOrAdmin]
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(
+        request={
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {
+                    "file": {"type": "string", "format": "binary"},
+                    "file_format": {"type": "string", "enum": list(FORMATS)},
+                },
+                "required": ["file"],
+            }
+        },
+    )
+    def post(self, request, mission_id, *args, **kwargs):
+        """
+        업로드한 문제 은행 파일로 미션의 문제를 추가하거나 수정합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체, file과 선택적으로 file_format(csv, json, zip)을 포함.
+                file_format이 없으면 파일 확장자로 형식을 정합니다.
+            mission_id (int): 문제를 가져올 미션의 ID.
+
+        Returns:
+            Response: {"created", "updated", "test_cases"} 형식의 응답.
+                      파일이 없거나 형식을 알 수 없거나 유효하지 않은 문제가 있으면
+                      {"error", "errors"} 형식으로 400 상태 코드를 반환.
+
+        Raises:
+            Http404: 해당 미션이 존재하지 않을 때 발생.
+        """
+        mission = get_object_or_404(Mission, pk=mission_id)
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": "file이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        file_format = request.data.get("file_format") or guess_format(upload.name)
+        if file_format not in FORMATS:
+            return Response(
+                {"error": "file_format은 csv, json, zip 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            result = import_question_bank(mission, upload, file_format)
+        except QuestionBankError as e:
+            return Response(
+                {"error": str(e), "errors": e.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(result)
+
+
+class MissionQuestionBankExportAPIView(APIView):
+    """
+    미션의 문제 은행을 CSV, JSON, ZIP 파일로 내려받는 API 뷰.
+
+    응답은 문제를 나눠 읽으며 스트리밍하므로 문제 은행 크기와 관계없이 바로 전송을 시작합니다.
+    매니저와 관리자만 사용할 수 있습니다.
+    """
+
+    permission_classes = [IsAuthenticated, IsManagerOrAdmin]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="file_format",
+                description="내보낼 형식(csv, json, zip). 기본값은 json이며, 코드 제출형 문제의 CSV에는 테스트 케이스가 포함되지 않습니다.",
+                required=False,
+                type=str,
+                enum=list(FORMATS),
+            )
+        ],
+        responses={200: OpenApiResponse(description="문제 은행 파일")},
+    )
+    def get(self, request, mission_id, *args, **kwargs):
+        """
+        미션의 문제 은행 파일을 스트리밍 응답으로 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+            mission_id (int): 내보낼 미션의 ID.
+
+        Returns:
+            StreamingHttpResponse: 첨부 파일 응답. file_format이 잘못되었으면 400 상태 코드를 반환.
+
+        Raises:
+            Http404: 해당 미션이 존재하지 않을 때 발생.
+        """
+        mission = get_object_or_404(Mission, pk=mission_id)
+        file_format = request.query_params.get("file_format", "json")
+        if file_format not in FORMATS:
+            return Response(
+                {"error": "file_format은 csv, json, zip 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        response = StreamingHttpResponse(
+            export_question_bank(mission, file_format),
+            content_type=CONTENT_TYPES[file_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="mission_{mission.pk}_bank.{file_format}"'
+        )
+        return response
+
+
 class UserSubmissionListAPIView(ListAPIView):
     """
     현재 로그인한 사용자의 제출 내역을 반환하는 API 뷰.
@@ -287,7 +584,9 @@ class UserSubmissionListAPIView(ListAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return MultipleChoiceSubmission.objects.filter(user=self.request.user)
+        return MultipleChoiceSubmission.objects.filter(
+            user=self.request.user
+        ).select_related("user", "question")
 
 
 class AllSubmissionListAPIView(ListAPIView):
@@ -297,15 +596,55 @@ class AllSubmissionListAPIView(ListAPIView):
 
     serializer_class = DetailMultipleChoiceSubmissionSerializer
     permission_classes = [IsManagerOrAdmin]
-    queryset = MultipleChoiceSubmission.objects.all()
+    queryset = MultipleChoiceSubmission.objects.select_related("user", "question")
 
 
-class CodeSubmissionViewSet(viewsets.ModelViewSet):
+class MissionScoreboardAPIView(ListAPIView):
+    """
+    미션의 점수판을 반환하는 API 뷰.
+
+    사용자별 미션 결과(MissionResult)를 최고 점수 순으로 반환하며, cursor 쿼리 파라미터로
+    다음 페이지를 조회합니다. 미션에 접근할 수 있는 사용자만 조회할 수 있습니다.
+    """
+
+    serializer_class = MissionResultSerializer
+    permission_classes = [IsAuthenticated, IsActiveOrCompletedEnrollmentOrManagerAdmin]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("-best_score", "id")
+
+    def get_queryset(self):
+        mission = get_object_or_404(Mission, pk=self.kwargs["mission_id"])
+        self.check_object_permissions(self.request, mission)
+        return MissionResult.objects.filter(mission=mission).select_related(
+            "user", "mission"
+        )
+
+
+class UserMissionResultListAPIView(ListAPIView):
+    """
+    로그인한 사용자의 미션 결과를 최근 제출 순으로 반환하는 API 뷰.
+
+    cursor 쿼리 파라미터로 다음 페이지를 조회합니다.
+    """
+
+    serializer_class = MissionResultSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("-last_submitted_at", "-id")
+
+    def get_queryset(self):
+        return MissionResult.objects.filter(user=self.request.user).select_related(
+            "user", "mission"
+        )
+
+
+class CodeSubmissionViewSet(AdmissionControlMixin, viewsets.ModelViewSet):
     """
     사용자는 특정 미션에 속한 코드 제출형 문제들을 필터링하여 조회할 수 있으며,
     문제의 생성, 수정, 삭제를 지원합니다.
     """
 
+    admission_scope = SCOPE_READ
     queryset = CodeSubmission.objects.all()
     serializer_class = CodeSubmissionSerializer
 
@@ -423,28 +762,35 @@ class CodeSubmissionViewSet(viewsets.ModelViewSet):
             )
 
 
-class CodeSubmissionEvaluationAPIView(APIView):
+class CodeSubmissionEvaluationAPIView(AdmissionControlMixin, APIView):
     """
     제출된 코드를 채점하고 결과를 반환하는 API.
 
-    사용자가 제출한 코드를 받아서 미리 정의된 시간 및 메모리 제한 내에서 채점을 수행하고,
-    채점 결과를 반환합니다.
+    JUDGE_ASYNC 설정이 켜져 있으면 제출을 채점 대기열에 넣고 제출 기록 ID를 바로 반환하며,
+    꺼져 있으면 요청 안에서 채점을 수행하고 채점 결과를 반환합니다.
+    제출 요청의 동시 처리 한도를 넘으면 503, 사용자의 채점 대기 제출이 너무 많으면 429를
+    Retry-After 헤더와 함께 반환합니다.
     """
 
+    admission_scope = SCOPE_SUBMIT
+
     def post(self, request, code_submission_id, *args, **kwargs):
         """
         제출된 코드를 채점하는 POST 메서드.
 
-        사용자가 제출한 코드를 주어진 시간 및 메모리 제한 내에서 실행하고,
+        사용자가 제출한 코드를 주어진 시간 및 메모리 제한 내에서 모든 테스트 케이스로 실행하고,
         테스트 결과와 함께 채점 통과 여부를 반환합니다.
+        `mode`가 "fail_fast"이면 첫 실패 이후의 테스트 케이스는 실행하지 않습니다.
 
         Args:
-            request (Request): HTTP 요청 객체, 제출된 코드를 포함.
+            request (Request): HTTP 요청 객체, 제출된 코드와 채점 모드(mode)를 포함.
             code_submission_id (int): 채점할 코드 제출형 문제의 ID.
 
         Returns:
             Response: 채점 결과 및 통과 여부를 포함한 응답 객체.
-                      {"message": "채점 완료", "test_results": list, "is_passed": bool} 형식의 JSON 응답.
+                      비동기 채점이면 {"message": "채점 대기", "record_id": int, "status": "queued"} 형식의 202 응답.
+                      {"message": "채점 완료", "record_id": int, "test_results": list, "is_passed": bool, "cache_hit": bool} 형식의 JSON 응답.
+                      비동기 채점이라도 이전 채점 결과를 재사용하면 채점 완료 응답을 바로 반환.
                       제출된 코드가 없을 경우 400 상태 코드, 문제 ID가 잘못되었을 경우 404 상태 코드를 반환.
 
         Raises:
@@ -466,8 +812,43 @@ class CodeSubmissionEvaluationAPIView(APIView):
                 {"error": "제출된 코드가 없습니다."}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        mode = request.data.get("mode", "all")
+        if mode not in ("all", "fail_fast"):
+            return Response(
+                {"error": "mode는 all 또는 fail_fast여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         user = request.user
 
+        if settings.JUDGE_ASYNC:
+            check_judge_queue(user)
+            record = enqueue_code_submission(
+                code_submission=code_submission,
+                submitted_code=submitted_code,
+                user=user,
+                fail_fast=mode == "fail_fast",
+            )
+            if record.status == "done":  # 이전 채점 결과를 재사용한 경우
+                return Response(
+                    {
+                        "message": "채점 완료",
+                        "record_id": record.id,
+                        "test_results": record.case_results,
+                        "is_passed": record.is_passed,
+                        "cache_hit": True,
+                    },
+                    status=status.HTTP_200_OK,
+                )
+            return Response(
+                {
+                    "message": "채점 대기",
+                    "record_id": record.id,
+                    "status": record.status,
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
         # 코드 실행 시 시간 및 메모리 제한
         time_limit = code_submission.time_limit
         memory_limit = code_submission.memory_limit
@@ -479,18 +860,136 @@ class CodeSubmissionEvaluationAPIView(APIView):
             user=user,
             time_limit=time_limit,
             memory_limit=memory_limit,
+            fail_fast=mode == "fail_fast",
         )
 
         return Response(
             {
                 "message": "채점 완료",
+                "record_id": result["record_id"],
                 "test_results": result["results"],
                 "is_passed": result["all_passed"],
+                "cache_hit": result["cache_hit"],
             },
             status=status.HTTP_200_OK,
         )
 
 
+class CodeSubmissionSimilarityClusterAPIView(APIView):
+    """
+    코드 제출형 문제의 표절 의심 클러스터를 조회하는 API.
+
+    채점 워커가 제출 기록의 winnowing 지문을 색인하면서 찾은 유사 제출 쌍을 사용자 단위로 묶어
+    반환합니다. 매니저와 관리자만 조회할 수 있습니다.
+    """
+
+    permission_classes = [IsAuthenticated, IsManagerOrAdmin]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="threshold",
+                description="클러스터에 포함할 최소 유사도(0~1). 기본값은 PLAGIARISM_SIMILARITY_THRESHOLD이며, 그보다 낮은 유사도의 쌍은 저장되지 않습니다.",
+                required=False,
+                type=float,
+            )
+        ],
+    )
+    def get(self, request, code_submission_id, *args, **kwargs):
+        """
+        유사도가 기준 이상인 제출 클러스터 목록을 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+            code_submission_id (int): 코드 제출형 문제 ID.
+
+        Returns:
+            Response: {"code_submission": int, "threshold": float, "clusters": list} 형식의 응답.
+                      threshold가 0~1 사이의 숫자가 아니면 400 상태 코드를 반환.
+
+        Raises:
+            Http404: 해당 코드 제출형 문제가 존재하지 않을 때 발생.
+        """
+        code_submission = get_object_or_404(CodeSubmission, pk=code_submission_id)
+
+        try:
+            threshold = float(
+                request.query_params.get(
+                    "threshold", settings.PLAGIARISM_SIMILARITY_THRESHOLD
+                )
+            )
+        except ValueError:
+            threshold = -1
+        if not 0 <= threshold <= 1:
+            return Response(
+                {"error": "threshold는 0과 1 사이의 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "code_submission": code_submission.pk,
+                "threshold": threshold,
+                "clusters": find_similarity_clusters(code_submission, threshold),
+            }
+        )
+
+
+class CodeSubmissionRecordStatusAPIView(APIView):
+    """
+    코드 제출 기록의 채점 상태와 결과를 조회하는 API.
+
+    `wait` 쿼리 파라미터(초)를 주면 채점이 끝나거나 대기 시간이 지날 때까지 응답을 미룹니다(long-poll).
+    """
+
+    permission_classes = [IsAuthenticated, IsRecordOwnerOrManagerAdmin]
+    max_wait = 20
+    poll_interval = 0.5
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="wait",
+                description="채점 완료를 기다릴 최대 시간(초, 최대 20)",
+                required=False,
+                type=float,
+            )
+        ],
+        responses={200: CodeSubmissionRecordStatusSerializer},
+    )
+    def get(self, request, record_id, *args, **kwargs):
+        """
+        제출 기록의 채점 상태와 결과를 반환합니다.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+            record_id (int): 조회할 제출 기록 ID.
+
+        Returns:
+            Response: 채점 상태, 통과 여부, 케이스별 결과를 포함한 응답 객체.
+        """
+        record = get_object_or_404(CodeSubmissionRecord, pk=record_id)
+        self.check_object_permissions(request, record)
+
+        try:
+            wait = min(
+                max(float(request.query_params.get("wait", 0)), 0), self.max_wait
+            )
+        except ValueError:
+            return Response(
+                {"error": "wait는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        deadline = time.monotonic() + wait
+        while record.status in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            record.refresh_from_db()
+
+        return Response(
+            CodeSubmissionRecordStatusSerializer(record).data, status=status.HTTP_200_OK
+        )
+
+
 class UserCodeSubmissionListAPIView(ListAPIView):
     """
     로그인된 사용자의 코드 제출 내역을 반환하는 API 뷰.
@@ -501,7 +1000,9 @@ class UserCodeSubmissionListAPIView(ListAPIView):
 
     def get_queryset(self):
         # 로그인된 사용자에 해당하는 제출 내역만 필터링
-        return CodeSubmissionRecord.objects.filter(user=self.request.user)
+        return CodeSubmissionRecord.objects.filter(
+            user=self.request.user
+        ).select_related("user", "code_submission")
 
 
 class AllCodeSubmissionListAPIView(ListAPIView):
@@ -511,4 +1012,4 @@ class AllCodeSubmissionListAPIView(ListAPIView):
 
     serializer_class = SimpleSubmissionSerializer
     permission_classes = [IsManagerOrAdmin]
-    queryset = CodeSubmissionRecord.objects.all()
+    queryset = CodeSubmissionRecord.objects.select_related("user", "code_submission")
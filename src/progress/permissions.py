@@ -1,6 +1,6 @@
 from rest_framework import permissions
 
-from .models import Enrollment
+from courses.services import EntitlementService
 
 
 class CanViewUserProgress(permissions.BasePermission):
@@ -39,10 +39,7 @@ class CanViewUserProgress(permissions.BasePermission):
                 "UserOverallProgressView",
             ]:
                 # 사용자의 모든 활성 수강 신청을 확인
-                active_enrollments = Enrollment.objects.filter(
-                    user=request.user, status__in=["active", "completed"]
-                ).exists()
-                return active_enrollments
+                return EntitlementService.has_any_access(request.user)
 
             # UserProgressDetailView나 UserProgressUpdateView의 경우
             elif view.__class__.__name__ in [
@@ -54,12 +51,10 @@ class CanViewUserProgress(permissions.BasePermission):
                     return False
 
                 # 해당 비디오의 대분류에 대한 활성 수강 신청이 있는지 확인
-                active_enrollment = Enrollment.objects.filter(
-                    user=request.user,
-                    major_category__minor_categories__videos__id=video_id,
-                    status__in=["active", "completed"],
-                ).exists()
-                return active_enrollment
+                return EntitlementService.has_access(
+                    request.user,
+                    EntitlementService.get_video_major_category_id(video_id),
+                )
 
         return False
 
@@ -81,13 +76,8 @@ class CanViewUserProgress(permissions.BasePermission):
 
         # 학생의 경우, 자신의 진행률 객체에 대해서만 권한이 있음
         if request.user.role == "student":
-            if obj.user == request.user:
+            if obj.user_id == request.user.id:
                 # 해당 비디오의 대분류에 대한 활성 수강 신청이 있는지 확인
-                active_enrollment = Enrollment.objects.filter(
-                    user=request.user,
-                    major_category=obj.video.minor_category.major_category,
-                    status__in=["active", "completed"],
-                ).exists()
-                return active_enrollment
+                return EntitlementService.can_access(request.user, obj)
 
         return False
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from .models import SearchDocument
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    """
+    Admin 화면에서 SearchDocument 모델을 관리하기 위한 클래스.
+
+    Attributes:
+        list_display (tuple): SearchDocument 리스트에서 표시할 필드들.
+        search_fields (tuple): 검색 가능 필드들.
+        list_filter (tuple): 필터로 사용할 필드들.
+    """
+
+    list_display = ("document_type", "object_id", "title", "updated_at")
+    search_fields = ("title",)
+    list_filter = ("document_type",)
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from search.services import rebuild_index
+
+
+class Command(BaseCommand):
+    """
+    대분류, 소분류, 동영상, 미션 전체를 다시 색인하는 명령어.
+
+    검색 기능 도입 이전에 생성된 데이터나 fixture로 로드된 데이터를 색인할 때 사용합니다.
+    """
+
+    help = "검색 인덱스를 전체 재생성합니다."
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"{count}개의 문서를 색인했습니다."))
@@ -0,0 +1,59 @@
+# Generated by Django 5.1.1 on 2026-10-19 12:33
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "document_type",
+                    models.CharField(
+                        choices=[
+                            ("major_category", "대분류"),
+                            ("minor_category", "소분류"),
+                            ("video", "동영상"),
+                            ("mission", "미션"),
+                        ],
+                        max_length=20,
+                        verbose_name="문서 유형",
+                    ),
+                ),
+                ("object_id", models.PositiveBigIntegerField(verbose_name="객체 ID")),
+                ("title", models.CharField(max_length=255, verbose_name="제목")),
+                ("body", models.TextField(blank=True, verbose_name="본문")),
+                ("tokens", models.TextField(blank=True, verbose_name="검색 토큰")),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        editable=False, null=True
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="색인 시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "검색 문서",
+                "verbose_name_plural": "검색 문서 목록",
+                "unique_together": {("document_type", "object_id")},
+            },
+        ),
+    ]
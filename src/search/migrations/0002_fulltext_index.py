@@ -0,0 +1,74 @@
+from django.db import migrations
+
+
+POSTGRESQL_FORWARD = [
+    "CREATE INDEX search_searchdocument_vector_gin "
+    "ON search_searchdocument USING gin (search_vector)",
+    "CREATE TRIGGER search_searchdocument_vector_update "
+    "BEFORE INSERT OR UPDATE OF tokens ON search_searchdocument "
+    "FOR EACH ROW EXECUTE FUNCTION "
+    "tsvector_update_trigger(search_vector, 'pg_catalog.simple', tokens)",
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_searchdocument_vector_update ON search_searchdocument",
+    "DROP INDEX IF EXISTS search_searchdocument_vector_gin",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE search_searchdocument_fts USING fts5("
+    "tokens, content='search_searchdocument', content_rowid='id')",
+    "CREATE TRIGGER search_searchdocument_ai AFTER INSERT ON search_searchdocument BEGIN "
+    "INSERT INTO search_searchdocument_fts(rowid, tokens) VALUES (new.id, new.tokens); END",
+    "CREATE TRIGGER search_searchdocument_ad AFTER DELETE ON search_searchdocument BEGIN "
+    "INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, tokens) "
+    "VALUES ('delete', old.id, old.tokens); END",
+    "CREATE TRIGGER search_searchdocument_au AFTER UPDATE ON search_searchdocument BEGIN "
+    "INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, tokens) "
+    "VALUES ('delete', old.id, old.tokens); "
+    "INSERT INTO search_searchdocument_fts(rowid, tokens) VALUES (new.id, new.tokens); END",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_searchdocument_au",
+    "DROP TRIGGER IF EXISTS search_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS search_searchdocument_ai",
+    "DROP TABLE IF EXISTS search_searchdocument_fts",
+]
+
+
+def run_statements(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    """
+    DB 종류에 맞는 전문 검색 인덱스와 동기화 트리거를 생성합니다.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        run_statements(schema_editor, POSTGRESQL_FORWARD)
+    elif vendor == "sqlite":
+        run_statements(schema_editor, SQLITE_FORWARD)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    """
+    전문 검색 인덱스와 동기화 트리거를 제거합니다.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        run_statements(schema_editor, POSTGRESQL_BACKWARD)
+    elif vendor == "sqlite":
+        run_statements(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,47 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    검색 인덱스 문서 모델
+
+    대분류, 소분류, 동영상, 미션을 하나의 테이블에 색인하여 통합 검색을 제공합니다.
+    tokens 필드에는 한국어 n-gram으로 분해된 토큰이 공백으로 구분되어 저장되며,
+    실제 전문 검색 인덱스는 DB 트리거가 관리합니다.
+    (PostgreSQL: search_vector + GIN 인덱스, SQLite: FTS5 가상 테이블)
+
+    Attributes:
+        document_type (str): 원본 객체의 유형.
+        object_id (int): 원본 객체의 ID.
+        title (str): 검색 결과에 표시할 제목.
+        body (str): 검색 결과에 표시할 본문 요약.
+        tokens (str): n-gram 토큰 문자열.
+        search_vector (SearchVectorField): PostgreSQL tsvector 컬럼.
+        updated_at (datetime): 마지막 색인 시간.
+    """
+
+    DOCUMENT_TYPE_CHOICES = [
+        ("major_category", "대분류"),
+        ("minor_category", "소분류"),
+        ("video", "동영상"),
+        ("mission", "미션"),
+    ]
+
+    document_type = models.CharField(
+        max_length=20, choices=DOCUMENT_TYPE_CHOICES, verbose_name="문서 유형"
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name="객체 ID")
+    title = models.CharField(max_length=255, verbose_name="제목")
+    body = models.TextField(blank=True, verbose_name="본문")
+    tokens = models.TextField(blank=True, verbose_name="검색 토큰")
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="색인 시간")
+
+    class Meta:
+        verbose_name = "검색 문서"
+        verbose_name_plural = "검색 문서 목록"
+        unique_together = ["document_type", "object_id"]
+
+    def __str__(self):
+        return f"[{self.document_type}] {self.title}"
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from .models import SearchDocument
+
+
+class SearchDocumentSerializer(serializers.ModelSerializer):
+    """
+    검색 결과 문서를 직렬화하는 Serializer 클래스.
+
+    원본 객체의 유형과 ID, 제목, 본문 일부, 관련도 점수를 반환합니다.
+    """
+
+    body = serializers.SerializerMethodField()
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = SearchDocument
+        fields = ("document_type", "object_id", "title", "body", "rank")
+
+    def get_body(self, obj):
+        """
+        본문을 최대 200자로 잘라 반환합니다.
+
+        Args:
+            obj (SearchDocument): 검색 문서 객체.
+
+        Returns:
+            str: 잘린 본문.
+        """
+        return obj.body[:200]
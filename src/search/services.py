@@ -0,0 +1,343 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from courses.services import EntitlementService
+
+from .models import SearchDocument
+
+
+FTS_TABLE = "search_searchdocument_fts"
+
+WORD_PATTERN = re.compile(r"\w+")
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def tokenize_word(word):
+    """
+    소문자로 변환된 단어 하나를 검색용 토큰으로 분해합니다.
+
+    Args:
+        word (str): 분해할 단어.
+
+    Returns:
+        list: 한글이 포함된 3글자 이상의 단어는 2-gram 목록, 그 외에는 단어 자체.
+    """
+    if HANGUL_PATTERN.search(word) and len(word) > 2:
+        return [word[i : i + 2] for i in range(len(word) - 1)]
+    return [word]
+
+
+def tokenize(text):
+    """
+    텍스트를 색인용 토큰 목록으로 분해합니다.
+
+    한글이 포함된 단어는 부분 문자열로도 검색될 수 있도록 2-gram으로 분해하고,
+    그 외 단어는 소문자로 변환하여 그대로 사용합니다.
+
+    Args:
+        text (str): 분해할 텍스트.
+
+    Returns:
+        list: 중복이 제거된 토큰 목록 (등장 순서 유지).
+    """
+    tokens = []
+    for word in WORD_PATTERN.findall((text or "").lower()):
+        tokens.extend(tokenize_word(word))
+    return list(dict.fromkeys(tokens))
+
+
+def tokenize_query(query):
+    """
+    검색어를 단어별 토큰 그룹으로 분해합니다.
+
+    색인과 같은 방식으로 2-gram을 만들되, 검색 시 한 단어의 2-gram은 OR로 묶습니다.
+    조사/어미가 붙은 단어("파이썬을")는 본문에 없는 2-gram("썬을")을 포함하므로,
+    모두 일치해야 하는 AND로는 검색되지 않기 때문입니다. 더 많은 2-gram이 일치할수록
+    관련도가 높아집니다.
+
+    Args:
+        query (str): 검색어.
+
+    Returns:
+        list: 단어별 토큰 목록의 목록. 중복된 그룹은 제거됩니다.
+    """
+    groups = []
+    for word in WORD_PATTERN.findall((query or "").lower()):
+        group = list(dict.fromkeys(tokenize_word(word)))
+        if group not in groups:
+            groups.append(group)
+    return groups
+
+
+def get_document_fields(instance):
+    """
+    색인 대상 객체에서 문서 유형, 제목, 본문을 추출합니다.
+
+    Args:
+        instance (Model): MajorCategory, MinorCategory, Video, Mission 중 하나의 객체.
+
+    Returns:
+        tuple: (문서 유형, 제목, 본문) 튜플.
+
+    Raises:
+        ValueError: 색인 대상이 아닌 모델인 경우 발생합니다.
+    """
+    model_name = instance._meta.model_name
+    if model_name == "majorcategory":
+        return "major_category", instance.name, ""
+    if model_name == "minorcategory":
+        return "minor_category", instance.name, instance.content
+    if model_name == "video":
+        return "video", instance.name, instance.description
+    if model_name == "mission":
+        return "mission", instance.title, instance.description
+    raise ValueError(f"색인 대상이 아닌 모델입니다: {model_name}")
+
+
+def index_instance(instance):
+    """
+    객체를 검색 인덱스에 추가하거나 갱신합니다.
+
+    tokens가 변경되면 DB 트리거가 전문 검색 인덱스를 함께 갱신합니다.
+
+    Args:
+        instance (Model): 색인할 객체.
+
+    Returns:
+        SearchDocument: 저장된 검색 문서.
+    """
+    document_type, title, body = get_document_fields(instance)
+    document, _ = SearchDocument.objects.update_or_create(
+        document_type=document_type,
+        object_id=instance.pk,
+        defaults={
+            "title": title[:255],
+            "body": body,
+            "tokens": " ".join(tokenize(f"{title} {body}")),
+        },
+    )
+    return document
+
+
+def remove_instance(instance):
+    """
+    객체를 검색 인덱스에서 제거합니다.
+
+    Args:
+        instance (Model): 제거할 객체.
+    """
+    document_type, _, _ = get_document_fields(instance)
+    SearchDocument.objects.filter(
+        document_type=document_type, object_id=instance.pk
+    ).delete()
+
+
+def get_visible_mission_ids(user):
+    """
+    사용자가 검색 결과에서 볼 수 있는 미션 ID 목록을 반환합니다.
+
+    미션 상세 조회와 같은 기준으로, 매니저/관리자는 모든 미션을, 그 외 사용자는 유효한 수강
+    권한이 있는 대분류의 미션만 볼 수 있습니다.
+
+    Args:
+        user (CustomUser): 검색하는 사용자.
+
+    Returns:
+        list | None: 볼 수 있는 미션 ID 목록. 제한이 없으면 None.
+    """
+    if user.role in ["manager", "admin"]:
+        return None
+    major_category_ids = {
+        major_category_id
+        for major_category_id in EntitlementService.get_entitlements(user)
+        if EntitlementService.has_access(user, major_category_id)
+    }
+    if not major_category_ids:
+        return []
+    return [
+        mission_id
+        for mission_id, major_category_id in EntitlementService.get_catalog()[
+            "mission"
+        ].items()
+        if major_category_id in major_category_ids
+    ]
+
+
+def search_documents(query, document_type=None, limit=20, offset=0, mission_ids=None):
+    """
+    검색어와 일치하는 문서를 관련도 순으로 조회합니다.
+
+    검색어의 모든 단어에 대해 그 단어의 토큰 중 하나 이상을 포함하는 문서를 반환하며,
+    DB 종류에 따라 PostgreSQL tsvector(GIN) 또는 SQLite FTS5 인덱스를 사용합니다.
+
+    Args:
+        query (str): 검색어.
+        document_type (str, optional): 특정 문서 유형으로 결과를 제한합니다.
+        limit (int): 반환할 최대 문서 수.
+        offset (int): 건너뛸 문서 수.
+        mission_ids (list, optional): 결과에 포함할 수 있는 미션 ID 목록. None이면 제한하지 않습니다.
+
+    Returns:
+        tuple: (전체 결과 수, 검색 문서 목록) 튜플.
+    """
+    groups = tokenize_query(query)
+    if not groups:
+        return 0, []
+
+    if connection.vendor == "postgresql":
+        return _search_postgresql(groups, document_type, limit, offset, mission_ids)
+    if connection.vendor == "sqlite":
+        return _search_sqlite(groups, document_type, limit, offset, mission_ids)
+    return _search_fallback(groups, document_type, limit, offset, mission_ids)
+
+
+def filter_documents(queryset, document_type, mission_ids):
+    """
+    검색 문서 쿼리셋을 문서 유형과 볼 수 있는 미션으로 제한합니다.
+
+    Args:
+        queryset (QuerySet): SearchDocument 쿼리셋.
+        document_type (str | None): 특정 문서 유형.
+        mission_ids (list | None): 볼 수 있는 미션 ID 목록. None이면 제한하지 않습니다.
+
+    Returns:
+        QuerySet: 제한된 쿼리셋.
+    """
+    if document_type:
+        queryset = queryset.filter(document_type=document_type)
+    if mission_ids is not None:
+        queryset = queryset.filter(
+            ~Q(document_type="mission") | Q(object_id__in=mission_ids)
+        )
+    return queryset
+
+
+def _search_postgresql(groups, document_type, limit, offset, mission_ids):
+    """
+    PostgreSQL의 tsvector GIN 인덱스를 사용하여 검색합니다.
+    """
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    search_query = None
+    for group in groups:
+        group_query = None
+        for token in group:
+            token_query = SearchQuery(token, config="simple")
+            group_query = (
+                token_query if group_query is None else group_query | token_query
+            )
+        search_query = (
+            group_query if search_query is None else search_query & group_query
+        )
+    queryset = filter_documents(
+        SearchDocument.objects.filter(search_vector=search_query),
+        document_type,
+        mission_ids,
+    )
+
+    total = queryset.count()
+    documents = list(
+        queryset.annotate(rank=SearchRank("search_vector", search_query)).order_by(
+            "-rank", "id"
+        )[offset : offset + limit]
+    )
+    return total, documents
+
+
+def _search_sqlite(groups, document_type, limit, offset, mission_ids):
+    """
+    SQLite의 FTS5 가상 테이블을 사용하여 검색합니다.
+    """
+    match = " AND ".join(
+        "({})".format(
+            " OR ".join('"{}"'.format(token.replace('"', '""')) for token in group)
+        )
+        for group in groups
+    )
+    where = f"{FTS_TABLE} MATCH %s"
+    params = [match]
+    if document_type:
+        where += " AND d.document_type = %s"
+        params.append(document_type)
+    if mission_ids is not None:
+        where += " AND (d.document_type <> %s"
+        params.append("mission")
+        if mission_ids:
+            where += " OR d.object_id IN ({})".format(
+                ", ".join(["%s"] * len(mission_ids))
+            )
+            params.extend(mission_ids)
+        where += ")"
+
+    join = (
+        f"FROM {FTS_TABLE} JOIN {SearchDocument._meta.db_table} d "
+        f"ON d.id = {FTS_TABLE}.rowid WHERE {where}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) {join}", params)
+        total = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT d.id, bm25({FTS_TABLE}) AS rank {join} "
+            "ORDER BY rank, d.id LIMIT %s OFFSET %s",
+            params + [limit, offset],
+        )
+        rows = cursor.fetchall()
+
+    documents = SearchDocument.objects.in_bulk([row[0] for row in rows])
+    results = []
+    for document_id, rank in rows:
+        document = documents[document_id]
+        document.rank = -rank  # bm25는 값이 작을수록 관련도가 높음
+        results.append(document)
+    return total, results
+
+
+def _search_fallback(groups, document_type, limit, offset, mission_ids):
+    """
+    전문 검색 인덱스를 지원하지 않는 DB에서 LIKE 검색으로 대체합니다.
+    """
+    queryset = SearchDocument.objects.all()
+    for group in groups:
+        condition = Q()
+        for token in group:
+            condition |= Q(tokens__contains=token)
+        queryset = queryset.filter(condition)
+    queryset = filter_documents(queryset, document_type, mission_ids)
+
+    total = queryset.count()
+    documents = list(queryset.order_by("id")[offset : offset + limit])
+    for document in documents:
+        document.rank = 0
+    return total, documents
+
+
+def rebuild_index():
+    """
+    모든 색인 대상 객체로 검색 인덱스를 다시 생성합니다.
+
+    Returns:
+        int: 색인된 문서 수.
+    """
+    from courses.models import MajorCategory, MinorCategory
+    from missions.models import Mission
+    from videos.models import Video
+
+    SearchDocument.objects.all().delete()
+
+    documents = []
+    for model in (MajorCategory, MinorCategory, Video, Mission):
+        for instance in model.objects.iterator():
+            document_type, title, body = get_document_fields(instance)
+            documents.append(
+                SearchDocument(
+                    document_type=document_type,
+                    object_id=instance.pk,
+                    title=title[:255],
+                    body=body,
+                    tokens=" ".join(tokenize(f"{title} {body}")),
+                )
+            )
+    SearchDocument.objects.bulk_create(documents, batch_size=1000)
+    return len(documents)
@@ -0,0 +1,42 @@
+from django.db.models.signals import post_delete, post_save
+
+from courses.models import MajorCategory, MinorCategory
+from missions.models import Mission
+from videos.models import Video
+
+from .services import index_instance, remove_instance
+
+
+INDEXED_MODELS = (MajorCategory, MinorCategory, Video, Mission)
+
+
+def update_search_document(sender, instance, raw=False, **kwargs):
+    """
+    색인 대상 객체가 저장되면 해당 검색 문서를 갱신합니다.
+
+    Args:
+        sender (type): 저장된 모델 클래스.
+        instance (Model): 저장된 객체.
+        raw (bool): fixture 로딩 여부. True이면 색인하지 않습니다.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    if not raw:
+        index_instance(instance)
+
+
+def delete_search_document(sender, instance, **kwargs):
+    """
+    색인 대상 객체가 삭제되면 해당 검색 문서를 제거합니다.
+
+    Args:
+        sender (type): 삭제된 모델 클래스.
+        instance (Model): 삭제된 객체.
+        **kwargs: 추가적인 키워드 인자.
+    """
+    remove_instance(instance)
+
+
+# 모든 모델의 저장/삭제마다 호출되지 않도록 색인 대상 모델에만 연결합니다.
+for model in INDEXED_MODELS:
+    post_save.connect(update_search_document, sender=model)
+    post_delete.connect(delete_search_document, sender=model)
@@ -0,0 +1,223 @@
+import pytest
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import CustomUser
+from courses.models import Enrollment, MajorCategory, MinorCategory
+from search.models import SearchDocument
+from search.services import tokenize, tokenize_query
+from videos.models import Video
+
+
+@pytest.mark.django_db
+class TestSearchViews:
+    """
+    통합 검색 API와 검색 인덱스 갱신을 테스트하는 클래스입니다.
+    """
+
+    @pytest.fixture
+    def api_client(self):
+        """매니저로 인증된 테스트용 API 클라이언트를 생성하는 fixture입니다."""
+        manager = CustomUser.objects.create_user(
+            email="manager@example.com",
+            username="manager",
+            password="password",
+            role="manager",
+        )
+        client = APIClient()
+        client.force_authenticate(user=manager)
+        return client
+
+    @pytest.fixture
+    def student_client(self):
+        """수강생으로 인증된 테스트용 API 클라이언트를 생성하는 fixture입니다."""
+        student = CustomUser.objects.create_user(
+            email="student@example.com", username="student", password="password"
+        )
+        client = APIClient()
+        client.force_authenticate(user=student)
+        client.user = student
+        return client
+
+    @pytest.fixture
+    def major_category(self):
+        """테스트용 MajorCategory(대분류)를 생성하는 fixture입니다."""
+        return MajorCategory.objects.create(name="웹 개발 부트캠프", price=50000)
+
+    @pytest.fixture
+    def minor_category(self, major_category):
+        """테스트용 MinorCategory(소분류)를 생성하는 fixture입니다."""
+        return MinorCategory.objects.create(
+            name="자바스크립트 기초",
+            major_category=major_category,
+            content="변수와 함수를 배웁니다.",
+            order=1,
+        )
+
+    @pytest.fixture
+    def video(self, minor_category):
+        """테스트용 Video를 생성하는 fixture입니다."""
+        return Video.objects.create(
+            name="Closure 이해하기",
+            description="클로저와 스코프",
+            video_url="https://example.com/closure.mp4",
+            minor_category=minor_category,
+            duration=timedelta(minutes=10),
+        )
+
+    def test_tokenize_korean_ngram(self):
+        """
+        한글 단어는 2-gram으로, 영문 단어는 소문자로 분해되는지 테스트합니다.
+        """
+        assert tokenize("자바스크립트 Python") == [
+            "자바",
+            "바스",
+            "스크",
+            "크립",
+            "립트",
+            "python",
+        ]
+
+    def test_index_updated_on_save_and_delete(self, minor_category, video):
+        """
+        색인 대상 객체의 생성, 수정, 삭제가 검색 문서에 반영되는지 테스트합니다.
+        """
+        assert SearchDocument.objects.filter(
+            document_type="video", object_id=video.id
+        ).exists()
+        # MinorCategory 생성 시 기본 미션 4개가 함께 색인됩니다.
+        assert SearchDocument.objects.filter(document_type="mission").count() == 4
+
+        video.name = "Promise 이해하기"
+        video.save()
+        assert (
+            SearchDocument.objects.get(document_type="video", object_id=video.id).title
+            == "Promise 이해하기"
+        )
+
+        video_id = video.id
+        video.delete()
+        assert not SearchDocument.objects.filter(
+            document_type="video", object_id=video_id
+        ).exists()
+
+    def test_search_matches_korean_substring(self, api_client, minor_category, video):
+        """
+        한글 단어의 일부로 검색해도 결과가 반환되는지 테스트합니다.
+        """
+        response = api_client.get(reverse("search"), {"q": "스크립트"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["document_type"] == "minor_category"
+        assert response.data["results"][0]["object_id"] == minor_category.id
+
+    def test_tokenize_query_groups_ngrams_by_word(self):
+        """
+        검색어는 색인과 같은 2-gram으로 분해되고 단어별로 묶이는지 테스트합니다.
+        """
+        assert tokenize_query("클로저를 Python python") == [
+            ["클로", "로저", "저를"],
+            ["python"],
+        ]
+
+    def test_search_matches_word_with_particle(self, api_client, minor_category, video):
+        """
+        조사가 붙은 검색어로도 결과가 반환되고, 더 많이 일치하는 문서가 먼저 오는지 테스트합니다.
+        """
+        MinorCategory.objects.create(
+            name="자바 입문",
+            major_category=minor_category.major_category,
+            content="자바 문법",
+            order=2,
+        )
+
+        response = api_client.get(
+            reverse("search"), {"q": "자바스크립트를", "type": "minor_category"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
+        assert response.data["results"][0]["object_id"] == minor_category.id
+
+        response = api_client.get(
+            reverse("search"), {"q": "클로저를 스코프", "type": "video"}
+        )
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["object_id"] == video.id
+
+    def test_search_filter_and_pagination(self, api_client, minor_category, video):
+        """
+        문서 유형 필터와 페이지 크기가 적용되는지 테스트합니다.
+        """
+        response = api_client.get(
+            reverse("search"), {"q": "미션", "type": "mission", "page_size": 3}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 4
+        assert len(response.data["results"]) == 3
+
+        response = api_client.get(reverse("search"), {"q": "클로저", "type": "video"})
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["title"] == "Closure 이해하기"
+
+    def test_search_does_not_return_deleted_objects(self, api_client, video):
+        """
+        삭제된 객체가 FTS 인덱스에서도 제거되는지 테스트합니다.
+        """
+        video.delete()
+        response = api_client.get(reverse("search"), {"q": "closure"})
+        assert response.data["count"] == 0
+
+    def test_search_requires_authentication(self, minor_category, video):
+        """
+        인증하지 않은 사용자는 검색할 수 없는지 테스트합니다.
+        """
+        response = APIClient().get(reverse("search"), {"q": "미션"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_missions_require_enrollment(self, student_client, minor_category, video):
+        """
+        수강 권한이 없는 사용자에게는 미션 문서가 검색되지 않는지 테스트합니다.
+        """
+        response = student_client.get(reverse("search"), {"q": "미션"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 0
+
+        response = student_client.get(reverse("search"), {"q": "클로저"})
+        assert response.data["count"] == 1
+
+        Enrollment.objects.create(
+            user=student_client.user,
+            major_category=minor_category.major_category,
+            expiry_date=timezone.now() + timedelta(days=30),
+            status="active",
+        )
+        student_client.force_authenticate(
+            user=CustomUser.objects.get(pk=student_client.user.pk)
+        )
+        response = student_client.get(
+            reverse("search"), {"q": "미션", "type": "mission"}
+        )
+        assert response.data["count"] == 4
+
+    def test_search_requires_query(self, api_client):
+        """
+        검색어가 없으면 400 응답을 반환하는지 테스트합니다.
+        """
+        response = api_client.get(reverse("search"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_rebuild_index(self, minor_category, video):
+        """
+        전체 재색인이 모든 색인 대상 객체를 포함하는지 테스트합니다.
+        """
+        from search.services import rebuild_index
+
+        SearchDocument.objects.all().delete()
+        # 대분류 1 + 소분류 1 + 동영상 1 + 미션 4
+        assert rebuild_index() == 7
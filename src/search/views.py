@@ -0,0 +1,101 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from .models import SearchDocument
+from .serializers import SearchDocumentSerializer
+from .services import get_visible_mission_ids, search_documents
+
+
+class SearchAPIView(APIView):
+    """
+    대분류, 소분류, 동영상, 미션을 통합 검색하는 API 뷰.
+
+    검색어를 n-gram 토큰으로 분해하여 전문 검색 인덱스에서 조회하고,
+    관련도 순으로 정렬된 결과를 페이지 단위로 반환합니다.
+    로그인한 사용자만 검색할 수 있으며, 미션 문서는 미션 상세 조회와 같이 수강 권한이 있는
+    사용자나 매니저/관리자에게만 반환됩니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+    page_size = 20
+    max_page_size = 100
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name="q", description="검색어", required=True, type=str),
+            OpenApiParameter(
+                name="type",
+                description="문서 유형 (major_category, minor_category, video, mission)",
+                required=False,
+                type=str,
+            ),
+            OpenApiParameter(
+                name="page", description="페이지 번호", required=False, type=int
+            ),
+            OpenApiParameter(
+                name="page_size",
+                description="페이지 크기 (최대 100)",
+                required=False,
+                type=int,
+            ),
+        ],
+        responses={200: SearchDocumentSerializer(many=True)},
+        tags=["search"],
+    )
+    def get(self, request):
+        """
+        검색 결과를 반환합니다.
+
+        Args:
+            request (Request): `q`, `type`, `page`, `page_size` 쿼리 파라미터를 포함한 요청.
+
+        Returns:
+            Response: 전체 결과 수와 현재 페이지의 검색 결과.
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"error": "검색어(q)가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        document_type = request.query_params.get("type")
+        valid_types = dict(SearchDocument.DOCUMENT_TYPE_CHOICES)
+        if document_type and document_type not in valid_types:
+            return Response(
+                {"error": "유효하지 않은 문서 유형입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            page = max(int(request.query_params.get("page", 1)), 1)
+            page_size = min(
+                max(int(request.query_params.get("page_size", self.page_size)), 1),
+                self.max_page_size,
+            )
+        except ValueError:
+            return Response(
+                {"error": "page와 page_size는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        total, documents = search_documents(
+            query,
+            document_type=document_type,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            mission_ids=get_visible_mission_ids(request.user),
+        )
+
+        return Response(
+            {
+                "count": total,
+                "page": page,
+                "page_size": page_size,
+                "results": SearchDocumentSerializer(documents, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
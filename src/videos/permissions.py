@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission
 
+from courses.services import EntitlementService
+
 
 class IsManagerOrAdmin(BasePermission):
     """
@@ -42,8 +44,30 @@ class IsEnrolledOrAdminOrManager(BasePermission):
         Returns:
             bool: 사용자가 video에 대한 유효한 수강 상태 또는 관리자 역할일 경우 True, 그렇지 않으면 False.
         """
-        enrollment = getattr(request.user, "enrollments", None)
-        enrollment = enrollment.get(user=request.user.id)
-        return (
-            enrollment and enrollment.status in ["completed", "active"]
-        ) or request.user.role in ["manager", "admin"]
+        if not request.user or not request.user.is_authenticated:
+            return False
+        if request.user.role in ["manager", "admin"]:
+            return True
+
+        video_id = view.kwargs.get("video_id")
+        if video_id is not None:
+            return EntitlementService.has_access(
+                request.user, EntitlementService.get_video_major_category_id(video_id)
+            )
+        return EntitlementService.has_any_access(request.user)
+
+    def has_object_permission(self, request, view, obj):
+        """
+        사용자가 접근하려는 video가 속한 대분류에 유효한 수강 권한이 있는지 확인.
+
+        Args:
+            request (Request): HTTP 요청 객체.
+            view (View): 현재 뷰 객체.
+            obj (Video): 접근하려는 video 객체.
+
+        Returns:
+            bool: 사용자가 해당 video의 대분류를 수강 중이거나 관리자 역할일 경우 True, 그렇지 않으면 False.
+        """
+        if request.user.role in ["manager", "admin"]:
+            return True
+        return EntitlementService.can_access(request.user, obj)
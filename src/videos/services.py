@@ -2,6 +2,8 @@ from urllib.parse import urlparse
 from uuid import uuid4
 
 from django.conf import settings
+from django.db.models import IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 
 import boto3
 from botocore.exceptions import ClientError
@@ -129,17 +131,18 @@ def complete_multipart_upload(upload_id, filename, parts):
         raise e
 
 
-def get_presigned_url(s3_url):
+def get_presigned_url(s3_url, s3_client=None):
     """
     S3 객체에 대한 presigned URL을 생성하는 함수.
 
     Args:
         s3_url (str): S3 객체 URL.
+        s3_client (boto3.client, optional): 재사용할 S3 클라이언트. 없으면 새로 생성합니다.
 
     Returns:
         presigned_url (str): presigned URL.
     """
-    s3_client = get_s3_client()
+    s3_client = s3_client or get_s3_client()
 
     bucket_name = settings.AWS_STORAGE_BUCKET_NAME
     parsed_url = urlparse(s3_url)
@@ -154,3 +157,87 @@ def get_presigned_url(s3_url):
         return presigned_url
     except ClientError as e:
         raise e
+
+
+def get_player_bundle(user, video_id, count):
+    """
+    강의 플레이어가 미리 불러올 현재 동영상과 다음 동영상 목록을 조회하는 함수.
+
+    같은 대분류 안에서 (소분류 순서, 동영상 순서)로 정렬했을 때 현재 동영상 뒤에 오는
+    동영상을 최대 count개까지 가져오며, 각 동영상에 사용자의 마지막 시청 위치를 함께 담습니다.
+    현재 동영상 조회와 시퀀스 조회, 두 번의 쿼리로 처리합니다.
+
+    Args:
+        user (CustomUser): 요청한 사용자.
+        video_id (int): 현재 동영상 ID.
+        count (int): 가져올 다음 동영상 수.
+
+    Returns:
+        tuple: (현재 동영상, [현재 동영상, 다음 동영상...]) 튜플.
+            목록의 각 동영상에는 last_position 속성이 추가됩니다.
+
+    Raises:
+        Video.DoesNotExist: 동영상이 존재하지 않는 경우 발생합니다.
+    """
+    from progress.models import UserProgress
+    from .models import Video
+
+    video = Video.objects.select_related("minor_category").get(pk=video_id)
+    minor_category = video.minor_category
+
+    after_current = (
+        Q(minor_category__order__gt=minor_category.order)
+        | Q(
+            minor_category__order=minor_category.order,
+            minor_category_id__gt=minor_category.pk,
+        )
+        | Q(minor_category_id=minor_category.pk, order__gt=video.order)
+        | Q(minor_category_id=minor_category.pk, order=video.order, pk__gt=video.pk)
+    )
+    last_position = UserProgress.objects.filter(
+        user_id=user.pk, video_id=OuterRef("pk")
+    ).values("last_position")[:1]
+
+    sequence = list(
+        Video.objects.filter(
+            minor_category__major_category_id=minor_category.major_category_id
+        )
+        .filter(Q(pk=video.pk) | after_current)
+        .annotate(
+            last_position=Coalesce(
+                Subquery(last_position, output_field=IntegerField()), Value(0)
+            )
+        )
+        .order_by("minor_category__order", "minor_category_id", "order", "pk")[
+            : count + 1
+        ]
+    )
+    return video, sequence
+
+
+def build_player_bundle(sequence, s3_client=None):
+    """
+    동영상 시퀀스에 presigned URL을 붙여 플레이어 응답 데이터로 변환하는 함수.
+
+    Args:
+        sequence (list): get_player_bundle이 반환한 동영상 목록.
+        s3_client (boto3.client, optional): 재사용할 S3 클라이언트.
+
+    Returns:
+        dict: current(현재 동영상)와 next(다음 동영상 목록)를 담은 딕셔너리.
+    """
+    s3_client = s3_client or get_s3_client()
+    items = [
+        {
+            "video_id": video.pk,
+            "name": video.name,
+            "minor_category_id": video.minor_category_id,
+            "duration": video.duration.total_seconds(),
+            "video_url": get_presigned_url(video.video_url, s3_client),
+            "last_position": video.last_position,
+        }
+        for video in sequence
+    ]
+    current = items[0]
+    current["description"] = sequence[0].description
+    return {"current": current, "next": items[1:]}
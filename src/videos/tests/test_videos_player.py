@@ -0,0 +1,127 @@
+import pytest
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import CustomUser
+from courses.models import MinorCategory
+from progress.models import UserProgress
+from videos.models import Video
+
+
+@pytest.fixture
+def normal_user(db):
+    return CustomUser.objects.create_user(
+        email="user@example.com", username="user", password="password"
+    )
+
+
+@pytest.fixture
+def student_user(db):
+    return CustomUser.objects.create_user(
+        email="student@example.com", username="student", password="password"
+    )
+
+
+@pytest.fixture
+def mock_presign():
+    with patch("videos.services.get_s3_client") as mock_s3:
+        mock_s3.return_value.generate_presigned_url.side_effect = (
+            lambda operation, Params, ExpiresIn: f"https://signed/{Params['Key']}"
+        )
+        yield mock_s3
+
+
+@pytest.fixture
+def course_videos(major_category, minor_category):
+    second_minor = MinorCategory.objects.create(
+        name="JavaScript", major_category=major_category, content="Learn JS", order=2
+    )
+    videos = []
+    for minor, orders in ((second_minor, (1, 2)), (minor_category, (2, 1))):
+        for order in orders:
+            videos.append(
+                Video.objects.create(
+                    name=f"{minor.name} {order}",
+                    description="desc",
+                    video_url=f"https://bucket.s3.amazonaws.com/{minor.pk}-{order}.mp4",
+                    minor_category=minor,
+                    duration=timedelta(minutes=10),
+                    order=order,
+                )
+            )
+    return videos
+
+
+@pytest.mark.django_db
+class TestVideoPlayerBundle:
+    def test_player_bundle_returns_next_videos_in_sequence(
+        self, api_client, normal_user, enrollment, course_videos, mock_presign
+    ):
+        # GIVEN: HTML/CSS 1 -> HTML/CSS 2 -> JavaScript 1 -> JavaScript 2 순서
+        js_1, js_2, html_2, html_1 = course_videos
+        UserProgress.objects.create(
+            user=normal_user, video=html_2, enrollment=enrollment, last_position=42
+        )
+        api_client.force_authenticate(user=normal_user)
+
+        # WHEN
+        response = api_client.get(
+            reverse("video-player", kwargs={"pk": html_1.pk}), {"next": 2}
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.data["current"]["video_id"] == html_1.pk
+        assert response.data["current"]["last_position"] == 0
+        assert [item["video_id"] for item in response.data["next"]] == [
+            html_2.pk,
+            js_1.pk,
+        ]
+        assert response.data["next"][0]["last_position"] == 42
+        assert response.data["next"][0]["video_url"].startswith("https://signed/")
+        assert mock_presign.call_count == 1
+
+    def test_player_bundle_uses_two_queries(
+        self, api_client, normal_user, enrollment, course_videos, mock_presign
+    ):
+        # GIVEN
+        api_client.force_authenticate(user=normal_user)
+        url = reverse("video-player", kwargs={"pk": course_videos[3].pk})
+        api_client.get(url)  # 방문 추적 미들웨어 및 권한 캐시 쿼리 제외
+
+        # WHEN
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"next": 3})
+
+        # THEN
+        assert response.status_code == 200
+        assert len(response.data["next"]) == 3
+        video_queries = [
+            query
+            for query in queries.captured_queries
+            if "videos_video" in query["sql"]
+        ]
+        assert len(video_queries) == 2
+        assert not any(
+            "progress_userprogress" in query["sql"] and query not in video_queries
+            for query in queries.captured_queries
+        )
+
+    def test_player_bundle_requires_enrollment(
+        self, api_client, student_user, course_videos, mock_presign
+    ):
+        # GIVEN
+        api_client.force_authenticate(user=student_user)
+
+        # WHEN
+        response = api_client.get(
+            reverse("video-player", kwargs={"pk": course_videos[0].pk})
+        )
+
+        # THEN
+        assert response.status_code == 403
@@ -6,6 +6,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -31,6 +32,8 @@ from .services import (
     generate_presigned_urls_for_parts,
     complete_multipart_upload,
     get_presigned_url,
+    get_player_bundle,
+    build_player_bundle,
 )
 
 
@@ -135,12 +138,15 @@ from .services import (
 class VideoViewSet(viewsets.ModelViewSet):
     """
     Video 리소스에 대한 CRUD API를 제공하는 뷰셋.
-    
+
     동영상 목록을 조회하고, 개별 동영상에 대한 정보를 가져오거나,
     새로운 동영상을 업로드하며, 동영상을 업데이트하거나 삭제하는 기능을 제공합니다.
     """
+
     queryset = Video.objects.all()
     serializer_class = VideoSerializer
+    player_default_count = 3
+    player_max_count = 10
 
     def get_permissions(self):
         """
@@ -150,7 +156,7 @@ class VideoViewSet(viewsets.ModelViewSet):
             return [AllowAny()]
         if self.action in ["update", "destroy", "create"]:
             return [IsManagerOrAdmin()]
-        elif self.action in ["retrieve"]:
+        elif self.action in ["retrieve", "player"]:
             return [IsEnrolledOrAdminOrManager()]
         return super().get_permissions()
 
@@ -163,7 +169,9 @@ class VideoViewSet(viewsets.ModelViewSet):
             upload_id, filename = initiate_multipart_upload()
 
             total_parts = int(request.data.get("total_parts"))
-            presigned_urls = generate_presigned_urls_for_parts(upload_id, filename, total_parts)
+            presigned_urls = generate_presigned_urls_for_parts(
+                upload_id, filename, total_parts
+            )
 
             duration_in_seconds = request.data.get("duration", 0)
             duration_timedelta = timedelta(seconds=duration_in_seconds)
@@ -227,6 +235,78 @@ class VideoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @extend_schema(
+        summary="Retrieve the current video and the next videos for gapless playback",
+        parameters=[
+            OpenApiParameter(
+                name="next",
+                description="Number of next videos to include (max 10)",
+                required=False,
+                type=int,
+            )
+        ],
+        responses={
+            200: OpenApiResponse(
+                description="Current video and next videos with presigned URLs and last positions",
+                examples=[
+                    {
+                        "current": {
+                            "video_id": 1,
+                            "video_url": "https://s3.amazonaws.com/example/video1.mp4",
+                            "last_position": 120,
+                        },
+                        "next": [
+                            {
+                                "video_id": 2,
+                                "video_url": "https://s3.amazonaws.com/example/video2.mp4",
+                                "last_position": 0,
+                            }
+                        ],
+                    }
+                ],
+            ),
+            404: OpenApiResponse(description="Video not found"),
+            500: OpenApiResponse(description="Failed to generate presigned URL"),
+        },
+        tags=["videos"],
+    )
+    @action(detail=True, methods=["get"])
+    def player(self, request, pk=None):
+        """
+        현재 동영상과 이어서 재생할 다음 동영상들의 재생 정보를 한 번에 반환합니다.
+
+        클라이언트는 다음 동영상의 presigned URL과 마지막 시청 위치를 미리 받아
+        강의 사이의 끊김 없이 재생할 수 있습니다.
+        """
+        try:
+            count = min(
+                max(
+                    int(request.query_params.get("next", self.player_default_count)), 0
+                ),
+                self.player_max_count,
+            )
+        except ValueError:
+            return Response(
+                {"detail": "next는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            video, sequence = get_player_bundle(request.user, pk, count)
+        except (Video.DoesNotExist, ValueError):
+            return Response(
+                {"detail": "Video not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        self.check_object_permissions(request, video)
+
+        try:
+            return Response(build_player_bundle(sequence), status=status.HTTP_200_OK)
+        except ClientError as e:
+            return Response(
+                {"detail": f"Failed to generate presigned URL: {e}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @transaction.atomic
     def update(self, request, *args, **kwargs):
         """
@@ -258,7 +338,9 @@ class VideoViewSet(viewsets.ModelViewSet):
         try:
             upload_id, filename = initiate_multipart_upload()
             total_parts = int(request.data.get("total_parts"))
-            presigned_urls = generate_presigned_urls_for_parts(upload_id, filename, total_parts)
+            presigned_urls = generate_presigned_urls_for_parts(
+                upload_id, filename, total_parts
+            )
 
             video.video_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/{filename}"
             video.save()
@@ -305,6 +387,7 @@ class VideoViewSet(viewsets.ModelViewSet):
             {"detail": "Video deleted successfully"}, status=status.HTTP_204_NO_CONTENT
         )
 
+
 @extend_schema(
     summary="Complete multipart upload",
     description="This endpoint completes a multipart upload by verifying the parts and finalizing the upload in S3.",
@@ -356,6 +439,7 @@ class CompleteUploadAPIView(APIView):
     Attributes:
         permission_classes (list): 이 API에 접근할 수 있는 권한 목록.
     """
+
     permission_classes = [IsManagerOrAdmin]
 
     def post(self, request, *args, **kwargs):
@@ -466,6 +550,7 @@ class UpdateUserProgressAPIView(APIView):
         permission_classes (list): 이 API에 접근할 수 있는 권한 목록.
         throttle_scope (str): 요청 제한을 위한 스코프.
     """
+
     permission_classes = [IsEnrolledOrAdminOrManager]
     throttle_scope = "progress"
 
@@ -485,7 +570,12 @@ class UpdateUserProgressAPIView(APIView):
         time_spent = request.data.get("time_spent")
         last_position = request.data.get("last_position")
 
-        if not video_id or progress_percent is None or time_spent is None or last_position is None:
+        if (
+            not video_id
+            or progress_percent is None
+            or time_spent is None
+            or last_position is None
+        ):
             return Response(
                 {"detail": "요청 데이터가 누락되었습니다."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -507,7 +597,9 @@ class UpdateUserProgressAPIView(APIView):
         try:
             video = Video.objects.get(id=video_id)
             major_category = video.minor_category.major_category
-            enrollment = Enrollment.objects.get(user=user, major_category=major_category)
+            enrollment = Enrollment.objects.get(
+                user=user, major_category=major_category
+            )
 
             user_progress, created = UserProgress.objects.get_or_create(
                 user=user, video=video, enrollment=enrollment
@@ -535,4 +627,3 @@ class UpdateUserProgressAPIView(APIView):
                 {"detail": "Enrollment not found for this user and course."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-